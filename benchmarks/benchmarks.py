@@ -1,7 +1,13 @@
 # Write the benchmarking functions here.
 # See "Writing benchmarks" in the asv docs for more information.
 
-from skbio import DNA, RNA
+from io import BytesIO, StringIO
+
+import skbio.io
+from skbio import DNA, RNA, GeneticCode
+from skbio.sequence import SequenceBatch, PackedSequence, MinHashSketch, \
+    PatternMatcher, FMIndex, dereplicate, kmer_count_matrix
+from skbio.sequence.distance import sketch_distances
 import numpy as np
 
 num_bases = 1000000
@@ -14,6 +20,7 @@ rna_template_bytes = [ord(x) for x in 'ACGU']
 
 dna_bytes = np.array(dna_template_bytes * size, dtype=np.uint8)
 dna_bytes_short = dna_bytes[:short_len]
+dna_bytes_lowercase = dna_bytes | 32
 dna_bytes_gapped = np.array(dna_template_bytes_gapped * size, dtype=np.uint8)
 rna_bytes = np.array(rna_template_bytes * size, dtype=np.uint8)
 
@@ -21,9 +28,58 @@ dna_seq = DNA(dna_bytes)
 dna_seq_short = DNA(dna_bytes_short)
 dna_gapped = DNA(dna_bytes_gapped)
 rna_seq = RNA(rna_bytes)
+dna_packed = PackedSequence(dna_seq)
+region_starts = np.arange(0, num_bases - 1000, 1000)
+region_strands = np.where(region_starts % 2000 == 0, '+', '-')
+dna_contigs = [dna_seq[i:i + 1000] for i in range(0, num_bases, 1000)]
+dna_sketches = [MinHashSketch.from_sequence(dna_seq[i:i + 10000], k=15)
+                for i in range(0, 1000000, 10000)]
+dna_quality_short = DNA(dna_bytes_short, positional_metadata={
+    'quality': np.arange(short_len, dtype=np.uint8) % 41})
+dna_random = DNA(np.random.RandomState(0).choice(dna_bytes[:4], num_bases))
+dna_index = FMIndex(dna_random)
+dna_probes = [str(dna_random[i:i + 20]) for i in range(0, num_bases, 100)]
+dna_batch = SequenceBatch(dna_bytes, np.arange(0, num_bases + 1, short_len),
+                          dtype=DNA)
+dna_batch_quality = SequenceBatch(
+    dna_bytes, np.arange(0, num_bases + 1, short_len), dtype=DNA,
+    quality=np.random.RandomState(0).randint(0, 41, num_bases))
+dna_fasta = ''.join(
+    '>contig%d\n%s\n' % (i, '\n'.join(
+        str(dna_random[j:j + 60])
+        for j in range(i, i + 100000, 60)))
+    for i in range(0, num_bases, 100000))
+dna_fasta_bytes = dna_fasta.encode('ascii')
+dna_fasta_index = skbio.io.FASTAIndex.from_fasta(BytesIO(dna_fasta_bytes))
+dna_fastq = ''.join(
+    '@read%d\n%s\n+\n%s\n' % (i, dna_random[i:i + short_len], 'I' * short_len)
+    for i in range(0, num_bases, short_len))
+dna_fastq_records = list(skbio.io.read(
+    StringIO(dna_fastq), format='fastq', variant='sanger',
+    constructor=skbio.io.SequenceRecord))
+
+
+def compress(objs, format, compression, **kwargs):
+    fh = BytesIO()
+    skbio.io.write((obj for obj in objs), format=format, into=fh,
+                   compression=compression, **kwargs)
+    return fh.getvalue()
+
+
+dna_fastq_gzip = compress(dna_fastq_records, 'fastq', 'gzip',
+                          variant='sanger')
+dna_fastq_bgzf = compress(dna_fastq_records, 'fastq', 'bgzf',
+                          variant='sanger')
+dna_fasta_bgzf = compress(
+    (DNA(dna_random[i:i + 100000], metadata={'id': 'contig%d' % i})
+     for i in range(0, num_bases, 100000)), 'fasta', 'bgzf')
+dna_fasta_bgzf_index = skbio.io.FASTAIndex.from_fasta(BytesIO(dna_fasta_bgzf))
 
 motif_1 = "GGTGCAAGCCGGTGGAAACA"
 motif_1_regex = '(' + motif_1 + ')'
+primers = PatternMatcher([motif_1, "GTGCCAGCMGCCGCGGTAA",
+                          "GGACTACHVGGGTWTCTAAT", "AGAGTTTGATCMTGGCTCAG",
+                          "ACGT"], dtype=DNA)
 
 
 def consume_iterator(iterator):
@@ -39,6 +95,75 @@ class BenchmarkSuite:
     def time_object_creation_validate(self):
         DNA(dna_bytes)
 
+    def time_object_creation_validate_lowercase(self):
+        DNA(dna_bytes_lowercase, lowercase=True)
+
+    def time_object_creation_from_buffer(self):
+        DNA.from_buffer(dna_bytes)
+
+    def time_read_fasta(self):
+        consume_iterator(skbio.io.read(StringIO(dna_fasta), format='fasta',
+                                       constructor=DNA))
+
+    def time_read_fasta_line_by_line(self):
+        consume_iterator(skbio.io.read(StringIO(dna_fasta), format='fasta',
+                                       constructor=DNA, block_size=None))
+
+    def time_index_fasta(self):
+        skbio.io.FASTAIndex.from_fasta(BytesIO(dna_fasta_bytes))
+
+    def time_fetch_last_record_indexed(self):
+        dna_fasta_index.fetch(BytesIO(dna_fasta_bytes),
+                              dna_fasta_index.ids[-1], constructor=DNA)
+
+    def time_read_last_record_seq_num(self):
+        skbio.io.read(StringIO(dna_fasta), format='fasta', into=DNA,
+                      seq_num=len(dna_fasta_index))
+
+    def time_fetch_last_record_indexed_bgzf(self):
+        dna_fasta_bgzf_index.fetch(BytesIO(dna_fasta_bgzf),
+                                   dna_fasta_bgzf_index.ids[-1],
+                                   constructor=DNA)
+
+    def time_decompress_fastq_gzip(self):
+        skbio.io.open(BytesIO(dna_fastq_gzip), encoding='binary').read()
+
+    def time_decompress_fastq_bgzf(self):
+        skbio.io.open(BytesIO(dna_fastq_bgzf), encoding='binary').read()
+
+    def time_compress_fastq_bgzf(self):
+        compress(dna_fastq_records, 'fastq', 'bgzf', variant='sanger')
+
+    def time_read_fastq_batch(self):
+        skbio.io.read(StringIO(dna_fastq), format='fastq', variant='sanger',
+                      constructor=DNA, into=SequenceBatch)
+
+    def time_read_fastq_batch_line_by_line(self):
+        skbio.io.read(StringIO(dna_fastq), format='fastq', variant='sanger',
+                      constructor=DNA, into=SequenceBatch, block_size=None)
+
+    def time_convert_fastq_to_fasta_records(self):
+        records = skbio.io.read(StringIO(dna_fastq), format='fastq',
+                                variant='sanger',
+                                constructor=skbio.io.SequenceRecord)
+        skbio.io.write(records, format='fasta', into=StringIO())
+
+    def time_convert_fastq_to_fasta_sequences(self):
+        seqs = skbio.io.read(StringIO(dna_fastq), format='fastq',
+                             variant='sanger', constructor=DNA)
+        skbio.io.write(seqs, format='fasta', into=StringIO())
+
+    def time_slice_with_quality(self):
+        for i in range(short_len - 10):
+            dna_quality_short[i:i + 10]
+
+    def time_concat_contigs(self):
+        DNA.concat(dna_contigs)
+
+    def time_extract_regions(self):
+        dna_seq.extract_regions(region_starts, region_starts + 900,
+                                region_strands, as_batch=True)
+
     def time_reverse_complement(self):
         dna_seq.reverse_complement()
 
@@ -57,9 +182,116 @@ class BenchmarkSuite:
     def time_kmer_count_25(self):
         dna_seq_short.kmer_frequencies(25)
 
+    def time_kmer_count_5_long(self):
+        dna_seq.kmer_frequencies(5)
+
+    def time_kmer_count_25_long(self):
+        dna_seq.kmer_frequencies(25)
+
+    def time_kmer_windows_25_long(self):
+        dna_seq.kmer_windows(25)
+
+    def time_kmer_codes_25_long(self):
+        dna_seq.kmer_codes(25)
+
+    def time_kmer_count_5_canonical(self):
+        dna_seq.kmer_frequencies(5, canonical=True)
+
+    def time_kmer_count_vector_8(self):
+        dna_seq.kmer_counts(8)
+
+    def time_kmer_count_vector_25_sparse(self):
+        dna_seq.kmer_counts(25, sparse=True)
+
     def time_gc_content(self):
         dna_seq.gc_content()
 
+    def time_window_gc_content(self):
+        dna_seq.window_gc_content(1000, step=100)
+
     def time_search_for_motif_in_gapped(self):
         consume_iterator(
             dna_seq.find_with_regex(motif_1_regex, ignore=dna_seq.gaps()))
+
+    def time_batch_gc_content(self):
+        dna_batch.gc_content()
+
+    def time_batch_reverse_complement(self):
+        dna_batch.reverse_complement()
+
+    def time_batch_filter_by_length(self):
+        dna_batch.filter_by_length(min_length=short_len)
+
+    def time_batch_translate(self):
+        GeneticCode.from_ncbi().translate_batch(dna_batch, start='optional',
+                                                stop='optional')
+
+    def time_batch_translate_six_frames(self):
+        consume_iterator(
+            GeneticCode.from_ncbi().translate_six_frames_batch(dna_batch))
+
+    def time_find_orfs(self):
+        GeneticCode.from_ncbi().find_orfs(dna_seq)
+
+    def time_batch_find_orfs(self):
+        GeneticCode.from_ncbi().find_orfs(dna_batch)
+
+    def time_minhash_sketch(self):
+        MinHashSketch.from_sequence(dna_seq)
+
+    def time_minhash_distance_matrix(self):
+        sketch_distances(dna_sketches)
+
+    def time_pattern_matcher_search(self):
+        primers.search(dna_seq)
+
+    def time_batch_pattern_matcher_search(self):
+        primers.search(dna_batch)
+
+    def time_degenerate_search(self):
+        consume_iterator(dna_seq.find_degenerate_matches(
+            "GTGCCAGCMGCCGCGGTAA"))
+
+    def time_degenerate_search_2_mismatches(self):
+        consume_iterator(dna_seq.find_degenerate_matches(
+            "GTGCCAGCMGCCGCGGTAA", max_mismatches=2))
+
+    def time_dereplicate_batch(self):
+        dereplicate(dna_batch)
+
+    def time_dereplicate_batch_reverse_complement(self):
+        dereplicate(dna_batch, reverse_complement=True)
+
+    def time_batch_kmer_count_matrix_4(self):
+        kmer_count_matrix(dna_batch, 4)
+
+    def time_batch_kmer_count_matrix_12_sparse(self):
+        kmer_count_matrix(dna_batch, 12, sparse=True)
+
+    def time_batch_codon_usage(self):
+        GeneticCode.from_ncbi().codon_usage(dna_batch)
+
+    def time_batch_quality_control(self):
+        dna_batch_quality.trim_sliding_window(4, 20).trim_ends(
+            trailing=20).filter_by_expected_errors(1).filter_by_length(50)
+
+    def time_fm_index_creation(self):
+        FMIndex(dna_random)
+
+    def time_fm_index_count_many(self):
+        dna_index.count_many(dna_probes)
+
+    def time_fm_index_locate_many(self):
+        dna_index.locate_many(dna_probes)
+
+    def time_packed_creation(self):
+        PackedSequence(dna_seq)
+
+    def time_packed_reverse_complement(self):
+        dna_packed.reverse_complement()
+
+    def time_packed_gc_content(self):
+        dna_packed.gc_content()
+
+    def time_packed_kmer_count_5(self):
+        dna_packed.kmer_frequencies(5)
@@ -18,9 +18,12 @@ see the associated documentation.
    blast6
    blast7
    clustal
+   fai
    fasta
    fastq
+   fmindex
    lsmat
+   minhash
    newick
    ordination
    phylip
@@ -44,6 +47,15 @@ User functions
 
 .. currentmodule:: skbio.io
 
+User classes
+------------
+
+.. autosummary::
+   :toctree: generated/
+
+   SequenceRecord
+   FASTAIndex
+
 User exceptions and warnings
 ----------------------------
 
@@ -57,9 +69,12 @@ User exceptions and warnings
    FileFormatError
    BLAST7FormatError
    ClustalFormatError
+   FAIFormatError
    FASTAFormatError
    FASTQFormatError
+   FMIndexFormatError
    LSMatFormatError
+   MinHashFormatError
    NewickFormatError
    OrdinationFormatError
    PhylipFormatError
@@ -198,17 +213,22 @@ from importlib import import_module
 from skbio.util import TestRunner
 
 from ._warning import FormatIdentificationWarning, ArgumentOverrideWarning
+from ._record import SequenceRecord
 from ._exception import (UnrecognizedFormatError, FileFormatError,
-                         BLAST7FormatError, ClustalFormatError,
+                         BLAST7FormatError, ClustalFormatError, FAIFormatError,
                          FASTAFormatError, GenBankFormatError, IOSourceError,
-                         FASTQFormatError, LSMatFormatError, NewickFormatError,
+                         FASTQFormatError, FMIndexFormatError,
+                         LSMatFormatError,
+                         MinHashFormatError, NewickFormatError,
                          OrdinationFormatError, PhylipFormatError,
                          QSeqFormatError, QUALFormatError,
                          StockholmFormatError, GFF3FormatError)
 from .registry import write, read, sniff, create_format, io_registry
 from .util import open
+from ._fasta_index import FASTAIndex
 
 __all__ = ['write', 'read', 'sniff', 'open', 'io_registry', 'create_format',
+           'SequenceRecord', 'FASTAIndex',
 
            'FormatIdentificationWarning', 'ArgumentOverrideWarning',
            'UnrecognizedFormatError', 'IOSourceError',
@@ -216,11 +236,14 @@ __all__ = ['write', 'read', 'sniff', 'open', 'io_registry', 'create_format',
            'FileFormatError',
            'BLAST7FormatError',
            'ClustalFormatError',
+           'FAIFormatError',
            'FASTAFormatError',
            'FASTQFormatError',
+           'FMIndexFormatError',
            'GenBankFormatError',
            'GFF3FormatError',
            'LSMatFormatError',
+           'MinHashFormatError',
            'NewickFormatError',
            'OrdinationFormatError',
            'PhylipFormatError',
@@ -235,9 +258,12 @@ __all__ = ['write', 'read', 'sniff', 'open', 'io_registry', 'create_format',
 import_module('skbio.io.format.blast6')
 import_module('skbio.io.format.blast7')
 import_module('skbio.io.format.clustal')
+import_module('skbio.io.format.fai')
 import_module('skbio.io.format.fasta')
 import_module('skbio.io.format.fastq')
+import_module('skbio.io.format.fmindex')
 import_module('skbio.io.format.lsmat')
+import_module('skbio.io.format.minhash')
 import_module('skbio.io.format.newick')
 import_module('skbio.io.format.ordination')
 import_module('skbio.io.format.phylip')
@@ -0,0 +1,393 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+# BGZF (blocked GNU zip format, as written by ``bgzip`` and used by SAMtools)
+# is a series of gzip members, each holding at most 64 KiB of uncompressed
+# data and recording its own compressed size in a ``BC`` extra subfield. As
+# the blocks are independent they can be inflated and deflated in parallel,
+# and a position in the uncompressed data can be reached by seeking to the
+# start of its block.
+
+import io
+import os
+import struct
+import zlib
+import collections
+from array import array
+from bisect import bisect_right, bisect_left
+from concurrent.futures import ThreadPoolExecutor
+
+
+_magic = b'\x1f\x8b\x08\x04'
+_header = struct.Struct('<4BI2BH')
+_subfield = struct.Struct('<2BH')
+_trailer = struct.Struct('<II')
+_bgzf_header = struct.Struct('<4BI2BH2BHH')
+# Uncompressed data per block written, leaving room for the header, trailer
+# and deflate overhead of incompressible data within the 64 KiB block limit.
+_block_data_size = 0xff00
+# Empty block marking the end of a BGZF file.
+_eof_block = (b'\x1f\x8b\x08\x04\x00\x00\x00\x00\x00\xff\x06\x00\x42\x43'
+              b'\x02\x00\x1b\x00\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00')
+
+
+def _num_threads(threads):
+    if threads is None:
+        threads = os.cpu_count() or 1
+    if threads < 1:
+        raise ValueError("`threads` must be at least 1, not %r." % threads)
+    return threads
+
+
+def _not_bgzf(message, header):
+    # Files made by concatenating a BGZF file and a plain gzip file are
+    # detected as BGZF from their first block, but are only readable as gzip.
+    if header[:3] == _magic[:3]:
+        message += (" It is the start of an ordinary gzip member: read the "
+                    "file with compression='gzip' instead.")
+    return OSError(message)
+
+
+def _inflate(block, data_start):
+    data = zlib.decompress(memoryview(block)[data_start:-8], -15)
+    crc, size = _trailer.unpack(block[-8:])
+    if size != len(data):
+        raise OSError("Incorrect length of data produced by BGZF block.")
+    if crc != zlib.crc32(data) & 0xffffffff:
+        raise OSError("CRC check failed for BGZF block.")
+    return data
+
+
+def _deflate(data, compresslevel):
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -15)
+    cdata = compressor.compress(data) + compressor.flush()
+    return b''.join([
+        _bgzf_header.pack(31, 139, 8, 4, 0, 0, 255, 6, 66, 67, 2,
+                          len(cdata) + 25),
+        cdata,
+        _trailer.pack(zlib.crc32(data) & 0xffffffff, len(data))])
+
+
+class BGZFBlocks:
+    """Offsets of the blocks of a BGZF file read so far.
+
+    Offsets are in the compressed and uncompressed data, from the start of
+    the file. The table always covers the file from its start up to `end`, so
+    seeking only has to scan block headers past the last block read. A table
+    can be passed to several readers of the same file, which then extend it
+    together.
+
+    """
+    def __init__(self):
+        self.coffsets = array('q')
+        self.uoffsets = array('q')
+        self.end = (0, 0)
+        self.complete = False
+
+
+class BGZFReader(io.RawIOBase):
+    """Raw reader of the uncompressed data of a BGZF file.
+
+    Blocks are read ahead and inflated on a pool of `threads` threads (the
+    number of CPUs by default). Positions used by `seek` and `tell` are in the
+    uncompressed data, and ``to_virtual``/``from_virtual`` convert them to and
+    from BGZF virtual offsets. Seeking requires `fileobj` to be seekable.
+    Reading starts at the beginning of `fileobj`, whatever its position.
+    Closing the reader does not close `fileobj`. The offsets of the blocks
+    read are kept in `blocks`, which can be passed to a later reader of the
+    same file so that it seeks without scanning the blocks again.
+
+    """
+    def __init__(self, fileobj, threads=None, blocks=None):
+        super(BGZFReader, self).__init__()
+        self._fileobj = fileobj
+        self._threads = _num_threads(threads)
+        self._executor = None
+        self._pending = collections.deque()
+        self.blocks = BGZFBlocks() if blocks is None else blocks
+
+        self._file_pos = fileobj.tell() if fileobj.seekable() else 0
+        self._next = (0, 0)
+        self._block = b''
+        self._block_uoffset = 0
+        self._within = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return self._fileobj.seekable()
+
+    def tell(self):
+        self._checkClosed()
+        return self._block_uoffset + self._within
+
+    def readinto(self, b):
+        self._checkClosed()
+        with memoryview(b) as view, view.cast('B') as view:
+            while self._within >= len(self._block):
+                if not self._next_block():
+                    return 0
+            n = min(len(view), len(self._block) - self._within)
+            view[:n] = self._block[self._within:self._within + n]
+            self._within += n
+            return n
+
+    def readall(self):
+        self._checkClosed()
+        chunks = [self._block[self._within:]]
+        self._within = len(self._block)
+        while self._next_block():
+            chunks.append(self._block)
+            self._within = len(self._block)
+        return b''.join(chunks)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        self._checkClosed()
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self.tell() + offset
+        elif whence == io.SEEK_END:
+            self._scan(lambda: False)
+            pos = self.blocks.end[1] + offset
+        else:
+            raise ValueError("Invalid whence (%r)." % whence)
+        if pos < 0:
+            raise ValueError("Negative seek position %d." % pos)
+
+        if not (self._block_uoffset <= pos <=
+                self._block_uoffset + len(self._block)):
+            blocks = self.blocks
+            self._scan(lambda: blocks.end[1] > pos)
+            i = bisect_right(blocks.uoffsets, pos) - 1
+            if i < 0:
+                # The file is empty.
+                return self.tell()
+            self._reset((blocks.coffsets[i], blocks.uoffsets[i]))
+            # Only the block sought is inflated, as reads after a seek are
+            # often short.
+            self._next_block(read_ahead=False)
+        self._within = min(pos - self._block_uoffset, len(self._block))
+        return self.tell()
+
+    def to_virtual(self, pos):
+        """Return the BGZF virtual offset of a position in the data."""
+        self._checkClosed()
+        blocks = self.blocks
+        self._scan(lambda: blocks.end[1] > pos)
+        i = bisect_right(blocks.uoffsets, pos) - 1
+        if pos < 0 or i < 0 or pos > self._uoffset_end(i):
+            raise ValueError("Position %d is not in the file." % pos)
+        return blocks.coffsets[i] << 16 | (pos - blocks.uoffsets[i])
+
+    def from_virtual(self, voffset):
+        """Return the position in the data of a BGZF virtual offset."""
+        self._checkClosed()
+        coffset, within = voffset >> 16, voffset & 0xffff
+        blocks = self.blocks
+        self._scan(lambda: blocks.end[0] > coffset)
+        i = bisect_left(blocks.coffsets, coffset)
+        if i == len(blocks.coffsets) or blocks.coffsets[i] != coffset:
+            raise ValueError("Virtual offset %d does not point to the start "
+                             "of a BGZF block." % voffset)
+        if blocks.uoffsets[i] + within > self._uoffset_end(i):
+            raise ValueError("Virtual offset %d is past the end of its BGZF "
+                             "block." % voffset)
+        return blocks.uoffsets[i] + within
+
+    def close(self):
+        if not self.closed:
+            self._reset(self._next)
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+        super(BGZFReader, self).close()
+
+    def _uoffset_end(self, i):
+        if i + 1 < len(self.blocks.uoffsets):
+            return self.blocks.uoffsets[i + 1]
+        return self.blocks.end[1]
+
+    def _next_block(self, read_ahead=True):
+        """Make the next block current, returning False at the end of file.
+
+        Up to twice as many blocks as there are threads are inflated ahead of
+        the current one, unless `read_ahead` is False.
+
+        """
+        if self._threads > 1 and read_ahead:
+            while len(self._pending) < 2 * self._threads:
+                block = self._read_block()
+                if block is None:
+                    break
+                uoffset, raw, data_start = block
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(self._threads)
+                self._pending.append((uoffset, self._executor.submit(
+                    _inflate, raw, data_start)))
+            if not self._pending:
+                return False
+            uoffset, future = self._pending.popleft()
+            data = future.result()
+        else:
+            block = self._read_block()
+            if block is None:
+                return False
+            uoffset, raw, data_start = block
+            data = _inflate(raw, data_start)
+
+        self._block = data
+        self._block_uoffset = uoffset
+        self._within = 0
+        return True
+
+    def _reset(self, next_):
+        for _, future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._next = next_
+        self._block = b''
+        self._block_uoffset = next_[1]
+        self._within = 0
+
+    def _read(self, coffset, size):
+        if self._file_pos != coffset:
+            self._fileobj.seek(coffset)
+        data = self._fileobj.read(size)
+        self._file_pos = coffset + len(data)
+        if len(data) != size:
+            raise EOFError("Compressed file ended before the end of a BGZF "
+                           "block was reached.")
+        return data
+
+    def _read_header(self, coffset):
+        """Return the header and size of the block at `coffset`, or None."""
+        if self.blocks.complete and coffset == self.blocks.end[0]:
+            return None
+        try:
+            header = self._read(coffset, _header.size)
+        except EOFError:
+            if self._file_pos == coffset:
+                self.blocks.complete = coffset == self.blocks.end[0]
+                return None
+            raise
+        if header[:4] != _magic:
+            raise _not_bgzf("Not a BGZF block at compressed offset %d."
+                            % coffset, header)
+        extra = self._read(coffset + _header.size, _header.unpack(header)[-1])
+        i = 0
+        while i + _subfield.size <= len(extra):
+            si1, si2, length = _subfield.unpack_from(extra, i)
+            i += _subfield.size
+            if (si1, si2, length) == (66, 67, 2):
+                size = struct.unpack_from('<H', extra, i)[0] + 1
+                return header + extra, size
+            i += length
+        raise _not_bgzf("BGZF block at compressed offset %d has no block "
+                        "size." % coffset, header)
+
+    def _add_block(self, coffset, csize, usize):
+        blocks = self.blocks
+        if coffset == blocks.end[0]:
+            blocks.coffsets.append(coffset)
+            blocks.uoffsets.append(blocks.end[1])
+            blocks.end = (coffset + csize, blocks.end[1] + usize)
+
+    def _read_block(self):
+        coffset, uoffset = self._next
+        header = self._read_header(coffset)
+        if header is None:
+            return None
+        header, size = header
+        raw = header + self._read(coffset + len(header), size - len(header))
+        usize = _trailer.unpack(raw[-8:])[1]
+        self._add_block(coffset, size, usize)
+        self._next = (coffset + size, uoffset + usize)
+        return uoffset, raw, len(header)
+
+    def _scan(self, done):
+        """Extend the block table from block headers until `done()`."""
+        while not done():
+            coffset = self.blocks.end[0]
+            header = self._read_header(coffset)
+            if header is None:
+                break
+            size = header[1]
+            usize = _trailer.unpack(self._read(coffset + size - 8, 8))[1]
+            self._add_block(coffset, size, usize)
+
+
+class BGZFWriter(io.RawIOBase):
+    """Raw writer compressing data into BGZF blocks.
+
+    Full blocks are deflated on a pool of `threads` threads (the number of CPUs
+    by default). Flushing writes the data buffered so far as a block, and
+    closing the writer also writes the end-of-file block. Closing the writer
+    does not close `fileobj`.
+
+    """
+    def __init__(self, fileobj, compresslevel=9, threads=None):
+        super(BGZFWriter, self).__init__()
+        self._fileobj = fileobj
+        self._compresslevel = compresslevel
+        self._threads = _num_threads(threads)
+        self._executor = None
+        self._pending = collections.deque()
+        self._buffer = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self._checkClosed()
+        self._buffer += b
+        if len(self._buffer) >= _block_data_size:
+            n = len(self._buffer) - len(self._buffer) % _block_data_size
+            for i in range(0, n, _block_data_size):
+                self._write_block(bytes(self._buffer[i:i + _block_data_size]))
+            del self._buffer[:n]
+        with memoryview(b) as view:
+            return view.nbytes
+
+    def flush(self):
+        self._checkClosed()
+        if self._buffer:
+            self._write_block(bytes(self._buffer))
+            self._buffer = bytearray()
+        while self._pending:
+            self._fileobj.write(self._pending.popleft().result())
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if not self._fileobj.closed:
+                self.flush()
+                self._fileobj.write(_eof_block)
+        finally:
+            # Nothing can be written once `fileobj` is closed.
+            for future in self._pending:
+                future.cancel()
+            self._pending.clear()
+            self._buffer = bytearray()
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+            super(BGZFWriter, self).close()
+
+    def _write_block(self, data):
+        if self._threads == 1:
+            self._fileobj.write(_deflate(data, self._compresslevel))
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self._threads)
+        self._pending.append(self._executor.submit(
+            _deflate, data, self._compresslevel))
+        while len(self._pending) > 2 * self._threads:
+            self._fileobj.write(self._pending.popleft().result())
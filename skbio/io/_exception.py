@@ -62,6 +62,21 @@ class OrdinationFormatError(FileFormatError):
     pass
 
 
+class FAIFormatError(FileFormatError):
+    """Raised when a ``fai`` formatted file cannot be parsed."""
+    pass
+
+
+class FMIndexFormatError(FileFormatError):
+    """Raised when an ``fmindex`` formatted file cannot be parsed."""
+    pass
+
+
+class MinHashFormatError(FileFormatError):
+    """Raised when a ``minhash`` formatted file cannot be parsed."""
+    pass
+
+
 class NewickFormatError(FileFormatError):
     """Raised when a ``newick`` formatted file cannot be parsed."""
     pass
@@ -0,0 +1,507 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+import os
+import weakref
+from functools import partial
+
+import numpy as np
+
+from skbio._base import SkbioObject, ElasticLines
+from skbio.io._bgzf import BGZFReader
+from skbio.io._exception import FASTAFormatError
+from skbio.io.util import open_file
+from skbio.sequence import Sequence
+from skbio.util._decorator import experimental
+
+# Number of bytes read at a time when indexing a FASTA file.
+_block_size = 2 ** 22
+
+
+class FASTAIndex(SkbioObject):
+    """Index of the records of a FASTA file for random access.
+
+    A ``FASTAIndex`` stores the length of each record of a FASTA file and
+    where its sequence starts in the file, so that a record, or a region of
+    it, can be read by seeking directly to its position instead of parsing
+    the file from the start. The index is compatible with the ``.fai`` files
+    created by ``samtools faidx`` [1]_, and can be written to and read from
+    them with the ``fai`` format.
+
+    Parameters
+    ----------
+    ids : iterable of str
+        ID of each record (i.e., the header line up to the first whitespace).
+        IDs must be unique.
+    lengths : 1D array_like (int)
+        Number of characters in the sequence of each record.
+    offsets : 1D array_like (int)
+        Position in the file (in bytes) of the first character of the
+        sequence of each record.
+    line_bases : 1D array_like (int)
+        Number of sequence characters in each line of each record (except
+        possibly the last one).
+    line_widths : 1D array_like (int)
+        Number of bytes in each line of each record, including the newline
+        characters.
+
+    Raises
+    ------
+    ValueError
+        If the arguments do not have the same length, if the IDs are not
+        unique, or if the positions and line lengths are invalid.
+
+    See Also
+    --------
+    skbio.io.format.fasta
+    skbio.io.format.fai
+
+    Notes
+    -----
+    Use ``FASTAIndex.from_fasta`` to index a FASTA file. As with
+    ``samtools faidx``, the sequence lines of a record must all have the
+    same length, except the last one, which may be shorter. The file is read
+    in large blocks and the lines of all records in a block are located and
+    checked together.
+
+    Regions are fetched by reading only the lines that contain them. The
+    index must match the FASTA file exactly: it is not updated when the file
+    changes. For files compressed with ``bgzip`` (see ``skbio.io.open``), the
+    index also keeps the positions of the compressed blocks of each file it
+    has read or fetched from, so that later fetches seek directly to the
+    block containing a region.
+
+    References
+    ----------
+    .. [1] Li, H., Handsaker, B., Wysoker, A., Fennell, T., Ruan, J., Homer,
+       N., ... & Durbin, R. (2009). The Sequence Alignment/Map format and
+       SAMtools. Bioinformatics, 25(16), 2078-2079.
+
+    Examples
+    --------
+    >>> from io import BytesIO
+    >>> from skbio import DNA
+    >>> from skbio.io import FASTAIndex
+    >>> fasta = BytesIO(b'>chr1 first\\nACGTA\\nCGTAC\\nGT\\n>chr2\\nTTTGG\\n')
+    >>> index = FASTAIndex.from_fasta(fasta)
+    >>> index.ids
+    ['chr1', 'chr2']
+    >>> index.lengths
+    array([12,  5])
+
+    Fetch a record, or a region of a record, by its ID:
+
+    >>> index.fetch(fasta, 'chr2', constructor=DNA)
+    DNA
+    --------------------------
+    Metadata:
+        'id': 'chr2'
+    Stats:
+        length: 5
+        has gaps: False
+        has degenerates: False
+        has definites: True
+        GC-content: 40.00%
+    --------------------------
+    0 TTTGG
+    >>> str(index.fetch(fasta, 'chr1', 3, 11))
+    'TACGTACG'
+
+    """
+    default_write_format = 'fai'
+    __hash__ = None
+
+    @experimental(as_of='0.5.2')
+    def __init__(self, ids, lengths, offsets, line_bases, line_widths):
+        self._ids = list(ids)
+        columns = [np.asarray(values, dtype=np.int64) for values in
+                   (lengths, offsets, line_bases, line_widths)]
+        if any(column.shape != (len(self._ids),) for column in columns):
+            raise ValueError(
+                "`lengths`, `offsets`, `line_bases`, and `line_widths` must "
+                "be 1D and have one value per ID.")
+        self._rows = {id_: row for row, id_ in enumerate(self._ids)}
+        if len(self._rows) != len(self._ids):
+            raise ValueError("IDs must be unique.")
+        lengths, offsets, line_bases, line_widths = columns
+        if (lengths < 0).any() or (offsets < 0).any():
+            raise ValueError("Lengths and offsets must not be negative.")
+        if ((line_bases < 1) | (line_widths < line_bases))[lengths > 0].any():
+            raise ValueError(
+                "Records with sequence characters must have at least one "
+                "character per line, and line widths must not be less than "
+                "the number of characters per line.")
+        for column in columns:
+            column.flags.writeable = False
+        self._lengths, self._offsets, self._line_bases, self._line_widths = \
+            columns
+        # BGZF block tables of the files read, by file identity, or by
+        # filehandle for in-memory files.
+        self._bgzf_blocks = {}
+        self._bgzf_handle_blocks = weakref.WeakKeyDictionary()
+
+    @classmethod
+    @experimental(as_of='0.5.2')
+    def from_fasta(cls, fasta):
+        """Index the records of a FASTA file.
+
+        Parameters
+        ----------
+        fasta : filepath or filehandle
+            FASTA file to index. Filehandles must be opened in binary mode.
+
+        Returns
+        -------
+        FASTAIndex
+            Index of the records in `fasta`.
+
+        Raises
+        ------
+        FASTAFormatError
+            If there are sequence characters before the first header, if the
+            sequence lines of a record do not all have the same length
+            (except the last one), or if IDs are not unique.
+
+        """
+        records = []
+        current = None
+        position = 0
+        with open_file(fasta, encoding='binary') as fh:
+            bgzf_raw = getattr(fh, 'raw', None)
+            parts = []
+            for block in iter(partial(fh.read, _block_size), b''):
+                end = block.rfind(b'\n') + 1
+                if not end:
+                    parts.append(block)
+                    continue
+                parts.append(block[:end])
+                data = b''.join(parts)
+                current = _index_lines(data, position, current, records)
+                position += len(data)
+                parts = [block[end:]]
+            data = b''.join(parts)
+            if data:
+                current = _index_lines(data, position, current, records)
+        if current is not None:
+            records.append(_finish_record(current))
+
+        if not records:
+            index = cls([], [], [], [], [])
+        else:
+            try:
+                index = cls(*zip(*records))
+            except ValueError as e:
+                raise FASTAFormatError(str(e))
+        if isinstance(bgzf_raw, BGZFReader):
+            # The whole file was read, so its block table is complete.
+            index._share_bgzf_blocks(fasta, bgzf_raw)
+        return index
+
+    @property
+    @experimental(as_of='0.5.2')
+    def ids(self):
+        """IDs of the indexed records, in the order of the file.
+
+        Returns
+        -------
+        list of str
+            ID of each record.
+
+        """
+        return list(self._ids)
+
+    @property
+    @experimental(as_of='0.5.2')
+    def lengths(self):
+        """Sequence lengths of the indexed records.
+
+        Returns
+        -------
+        1D np.ndarray (int)
+            Number of characters in the sequence of each record, in the order
+            of ``ids``.
+
+        """
+        return self._lengths
+
+    @experimental(as_of='0.5.2')
+    def __len__(self):
+        """Return the number of indexed records."""
+        return len(self._ids)
+
+    @experimental(as_of='0.5.2')
+    def __contains__(self, id):
+        """Determine if a record is in the index.
+
+        Parameters
+        ----------
+        id : str
+            ID of the record.
+
+        Returns
+        -------
+        bool
+            Indicates whether a record with ID `id` is indexed.
+
+        """
+        return id in self._rows
+
+    @experimental(as_of='0.5.2')
+    def fetch(self, fasta, id, start=None, stop=None, constructor=Sequence,
+              **kwargs):
+        """Read a record, or a region of a record, from an indexed file.
+
+        Parameters
+        ----------
+        fasta : filepath or filehandle
+            The indexed FASTA file. Filehandles must be opened in binary mode
+            and be seekable. Pass an open filehandle to fetch many regions
+            without opening the file each time. The filehandle is rewound
+            with ``seek(0)`` before reading, and is left at an unspecified
+            position.
+        id : str
+            ID of the record to read.
+        start : int, optional
+            Position of the first character to read (zero-based). Defaults to
+            the start of the record.
+        stop : int, optional
+            Position after the last character to read (i.e., the region is
+            ``[start, stop)``, as with slicing). Defaults to the end of the
+            record.
+        constructor : subclass of Sequence, optional
+            Type of the returned sequence.
+        kwargs : dict, optional
+            Keyword arguments passed to `constructor` (e.g., ``lowercase``).
+
+        Returns
+        -------
+        Sequence
+            Characters of the record in ``[start, stop)``, with the ID of the
+            record as its ``'id'`` metadata.
+
+        Raises
+        ------
+        KeyError
+            If there is no record with ID `id` in the index.
+        ValueError
+            If ``[start, stop)`` is not within the record.
+        FASTAFormatError
+            If the file does not match the index.
+
+        """
+        data = self._read(fasta, id, start, stop)
+        return constructor(data, metadata={'id': id}, **kwargs)
+
+    def _read(self, fasta, id, start, stop):
+        if id not in self._rows:
+            raise KeyError("There is no record with ID %r in the index." % id)
+        row = self._rows[id]
+        length = int(self._lengths[row])
+        start = 0 if start is None else start
+        stop = length if stop is None else stop
+        if not 0 <= start <= stop <= length:
+            raise ValueError(
+                "Region [%d, %d) is not within record %r, which has %d "
+                "characters." % (start, stop, id, length))
+        if start == stop:
+            return b''
+
+        offset = int(self._offsets[row])
+        line_bases = int(self._line_bases[row])
+        line_width = int(self._line_widths[row])
+        first = offset + start // line_bases * line_width + start % line_bases
+        last = (offset + (stop - 1) // line_bases * line_width +
+                (stop - 1) % line_bases + 1)
+        if hasattr(fasta, 'seek'):
+            # Compression is detected, and BGZF blocks are located, from the
+            # start of the file, wherever an earlier fetch left the handle.
+            fasta.seek(0)
+        with open_file(fasta, encoding='binary') as fh:
+            if isinstance(getattr(fh, 'raw', None), BGZFReader):
+                self._share_bgzf_blocks(fasta, fh.raw)
+            fh.seek(first)
+            data = fh.read(last - first)
+        if line_width != line_bases:
+            data = data.translate(None, b'\r\n')
+        if len(data) != stop - start:
+            raise FASTAFormatError(
+                "Could not read %d characters of record %r from the FASTA "
+                "file. Is the index up to date?" % (stop - start, id))
+        return data
+
+    def _share_bgzf_blocks(self, fasta, reader):
+        """Make `reader` use the block table kept for `fasta`, if any.
+
+        Otherwise the table of `reader` is kept for later readers of `fasta`.
+        Files are identified by device, inode, size and modification time, so
+        that a table is not used for a file that has been rewritten.
+
+        """
+        try:
+            if isinstance(fasta, str):
+                stat = os.stat(fasta)
+            else:
+                stat = os.fstat(fasta.fileno())
+        except (AttributeError, OSError):
+            tables, key = self._bgzf_handle_blocks, fasta
+        else:
+            tables = self._bgzf_blocks
+            key = (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        reader.blocks = tables.setdefault(key, reader.blocks)
+
+    @experimental(as_of='0.5.2')
+    def __eq__(self, other):
+        """Determine if the index is equal to another.
+
+        Parameters
+        ----------
+        other : FASTAIndex
+            Index to test for equality against.
+
+        Returns
+        -------
+        bool
+            Indicates whether the indexes are of the same type and index the
+            same records at the same positions.
+
+        """
+        if self.__class__ != other.__class__:
+            return False
+        return self._ids == other._ids and all(
+            np.array_equal(a, b) for a, b in zip(self._columns(),
+                                                 other._columns()))
+
+    @experimental(as_of='0.5.2')
+    def __ne__(self, other):
+        """Determine if the index is not equal to another."""
+        return not (self == other)
+
+    @experimental(as_of='0.5.2')
+    def __repr__(self):
+        """Return a string summary of the index."""
+        lines = ElasticLines()
+        lines.add_line(self.__class__.__name__)
+        lines.add_separator()
+        lines.add_line('Stats:')
+        lines.add_line('    records: %d' % len(self))
+        lines.add_line('    total length: %d' % self._lengths.sum())
+        return lines.to_str()
+
+    @experimental(as_of='0.5.2')
+    def __str__(self):
+        return repr(self)
+
+    def _columns(self):
+        return (self._lengths, self._offsets, self._line_bases,
+                self._line_widths)
+
+
+def _index_lines(data, position, current, records):
+    """Index the lines of a block of a FASTA file.
+
+    The block starts at byte `position` of the file and contains only complete
+    lines. `current` is the record being indexed when the block starts, as a
+    list of its ID, offset, length, line bases, line width, and whether its
+    last sequence line has been read (``None`` before the first header).
+    Records completed in the block are appended to `records`. Returns the
+    record being indexed at the end of the block.
+
+    """
+    buf = np.frombuffer(data, dtype=np.uint8)
+    ends = np.flatnonzero(buf == ord('\n'))
+    if not len(ends) or ends[-1] != len(buf) - 1:
+        # The last line of the file does not end with a newline.
+        ends = np.append(ends, len(buf))
+    starts = np.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+    widths = np.minimum(ends + 1, len(buf)) - starts
+    sizes = ends - starts
+    sizes -= (sizes > 0) & (buf[np.maximum(ends - 1, 0)] == ord('\r'))
+    is_header = (sizes > 0) & (buf[starts] == ord('>'))
+    headers = np.flatnonzero(is_header)
+
+    # Sequence lines are grouped by record: group 0 continues `current`, and
+    # group `i` follows the `i`-th header of the block.
+    num_groups = len(headers) + 1
+    is_sequence = ~is_header
+    groups = np.cumsum(is_header)[is_sequence]
+    seq_sizes, seq_widths = sizes[is_sequence], widths[is_sequence]
+    nonblank = seq_sizes > 0
+
+    # The first sequence line of a record sets its line length.
+    line_bases = np.zeros(num_groups, dtype=np.int64)
+    line_widths = np.zeros(num_groups, dtype=np.int64)
+    found, first = np.unique(groups[nonblank], return_index=True)
+    line_bases[found] = seq_sizes[nonblank][first]
+    line_widths[found] = seq_widths[nonblank][first]
+    if current is not None and current[3]:
+        line_bases[0], line_widths[0] = current[3], current[4]
+
+    # Any other line that differs from the first one (e.g., a shorter or blank
+    # line) must be the last sequence line of its record.
+    is_last = ((seq_sizes != line_bases[groups]) |
+               (seq_widths != line_widths[groups])).astype(np.int64)
+    after_last = np.cumsum(is_last) - is_last
+    after_last -= after_last[np.searchsorted(groups, groups)]
+    invalid = nonblank & ((after_last > 0) |
+                          (seq_sizes > line_bases[groups]))
+    if current is None or current[5]:
+        invalid |= nonblank & (groups == 0)
+    if invalid.any():
+        group = groups[np.argmax(invalid)]
+        if current is None and group == 0:
+            raise FASTAFormatError(
+                "Found sequence data before the first header in FASTA file.")
+        if group == 0:
+            id_ = current[0]
+        else:
+            header = headers[group - 1]
+            id_ = _header_id(data, starts[header], starts[header] +
+                             sizes[header])
+        raise FASTAFormatError(
+            "The sequence lines of record %r do not all have the same length "
+            "(except the last one), which is required to index it." % id_)
+
+    lengths = np.bincount(groups, weights=seq_sizes,
+                          minlength=num_groups).astype(np.int64).tolist()
+    has_last = (np.bincount(groups, weights=is_last,
+                            minlength=num_groups) > 0).tolist()
+    line_bases, line_widths = line_bases.tolist(), line_widths.tolist()
+
+    if current is not None:
+        current[2] += lengths[0]
+        current[3], current[4] = line_bases[0], line_widths[0]
+        current[5] = current[5] or has_last[0]
+    for group, (start, size, width) in enumerate(zip(
+            starts[headers].tolist(), sizes[headers].tolist(),
+            widths[headers].tolist()), 1):
+        if current is not None:
+            records.append(_finish_record(current))
+        current = [_header_id(data, start, start + size),
+                   position + start + width, lengths[group],
+                   line_bases[group], line_widths[group], has_last[group]]
+    return current
+
+
+def _header_id(data, start, end):
+    """Return the ID of the header line in ``data[start:end]``."""
+    fields = data[start + 1:end].split(None, 1)
+    return fields[0].decode('utf-8') if fields else ''
+
+
+def _finish_record(record):
+    """Return the index entry of a record."""
+    id_, offset, length, line_bases, line_width, _ = record
+    if not length:
+        line_bases = line_width = 0
+    elif line_width == line_bases:
+        # The record is a single line at the end of the file, without a
+        # newline.
+        line_width += 1
+    return id_, length, offset, line_bases, line_width
@@ -56,7 +56,19 @@ class CompressedMixin(FlushDestructorMixin):
 
 
 class CompressedBufferedReader(CompressedMixin, io.BufferedReader):
-    pass
+    def tell_virtual(self):
+        """Return the BGZF virtual offset of the current position."""
+        return self._bgzf_raw().to_virtual(self.tell())
+
+    def seek_virtual(self, voffset):
+        """Move to a BGZF virtual offset, returning the new position."""
+        return self.seek(self._bgzf_raw().from_virtual(voffset))
+
+    def _bgzf_raw(self):
+        if not hasattr(self.raw, 'from_virtual'):
+            raise io.UnsupportedOperation(
+                "Virtual offsets are only supported by BGZF files.")
+        return self.raw
 
 
 class CompressedBufferedWriter(CompressedMixin, io.BufferedWriter):
@@ -19,6 +19,7 @@ from cachecontrol.caches import FileCache
 from skbio.io import IOSourceError
 from ._fileobject import (IterableStringWriterIO, IterableStringReaderIO,
                           WrappedBufferedRandom)
+from ._bgzf import BGZFReader, BGZFWriter
 
 
 # NamedTemporaryFile isn't an actual file class, it is a function which
@@ -44,6 +45,8 @@ def get_io_sources():
 
 def _compressors():
     return (
+        # BGZF files are also gzip files, so BGZF must be detected first
+        BGZFCompressor,
         GzipCompressor,
         BZ2Compressor
     )
@@ -230,6 +233,25 @@ class GzipCompressor(Compressor):
                              compresslevel=self.options['compresslevel'])
 
 
+class BGZFCompressor(Compressor):
+    name = 'bgzf'
+    # Data is only compressed once a block is full, so the last block is
+    # written when the file is closed.
+    streamable = False
+
+    def can_read(self):
+        header = self.file.peek(16)[:16]
+        return (header[:4] == b'\x1f\x8b\x08\x04' and
+                header[12:] == b'BC\x02\x00')
+
+    def get_reader(self):
+        return BGZFReader(self.file)
+
+    def get_writer(self):
+        return BGZFWriter(self.file,
+                          compresslevel=self.options['compresslevel'])
+
+
 class BZ2Compressor(Compressor):
     name = 'bz2'
     streamable = False
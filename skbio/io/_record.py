@@ -0,0 +1,69 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+import collections
+
+
+class SequenceRecord(collections.namedtuple(
+        'SequenceRecord', ['id', 'description', 'sequence', 'quality'])):
+    """A raw sequence record, without a ``Sequence`` object.
+
+    Pass ``constructor=SequenceRecord`` to the FASTA, FASTQ, or QSeq generator
+    readers to stream the raw fields of each record instead of constructing a
+    ``Sequence`` object (with its metadata and positional metadata) for each
+    one. The FASTA and FASTQ generator writers accept ``SequenceRecord``
+    objects too, so that files can be converted (e.g., from FASTQ to FASTA),
+    counted, or hashed without parsing the sequences any further.
+
+    Attributes
+    ----------
+    id : str
+        ID of the record (an empty string if the record has no ID).
+    description : str
+        Description of the record (an empty string if it has none).
+    sequence : str
+        Characters of the sequence, as read from the file. They are not
+        validated nor converted (e.g., lowercase characters are kept).
+    quality : 1D np.ndarray (np.uint8) or None
+        Phred quality score of each character of the sequence, or ``None``
+        for records without quality scores.
+
+    See Also
+    --------
+    skbio.io.format.fasta
+    skbio.io.format.fastq
+    skbio.io.format.qseq
+
+    Examples
+    --------
+    >>> from io import StringIO
+    >>> import skbio.io
+    >>> from skbio.io import SequenceRecord
+    >>> fastq = '@r1 sample A\\nACGT\\n+\\nIII#\\n@r2\\nGGa\\n+\\n#I5\\n'
+    >>> records = skbio.io.read(StringIO(fastq), format='fastq',
+    ...                         variant='sanger', constructor=SequenceRecord)
+    >>> for record in records:
+    ...     print(record.id, record.description, record.sequence,
+    ...           record.quality)
+    r1 sample A ACGT [40 40 40  2]
+    r2  GGa [ 2 40 20]
+
+    Convert a FASTQ file to FASTA:
+
+    >>> records = skbio.io.read(StringIO(fastq), format='fastq',
+    ...                         variant='sanger', constructor=SequenceRecord)
+    >>> print(skbio.io.write(records, format='fasta',
+    ...                      into=StringIO()).getvalue())
+    >r1 sample A
+    ACGT
+    >r2
+    GGa
+    <BLANKLINE>
+
+    """
+    __slots__ = ()
@@ -6,16 +6,21 @@
 # The full license is in the file COPYING.txt, distributed with this software.
 # ----------------------------------------------------------------------------
 
+import itertools
 import re
 import warnings
 
 import numpy as np
 
+from skbio.io._record import SequenceRecord
 from skbio.util import cardinal_to_ordinal
 
 _whitespace_regex = re.compile(r'\s')
 _newline_regex = re.compile(r'\n')
 
+# Number of characters of consecutive records validated together by readers.
+_validation_block_size = 2 ** 16
+
 
 def _decode_qual_to_phred(qual_str, variant=None, phred_offset=None):
     phred_offset, phred_range = _get_phred_offset_and_range(
@@ -46,19 +51,29 @@ def _encode_phred_to_qual(phred, variant=None, phred_offset=None):
          "on this:\n\t"
          "https://github.com/biocore/scikit-bio/issues/719"])
 
-    qual_chars = []
-    for score in phred:
+    phred = np.asarray(phred)
+    if phred.size and phred.dtype.kind not in 'iu':
+        # Casting would write missing (NaN) scores as NUL characters and
+        # truncate fractional scores.
+        if phred.dtype.kind == 'f' and not np.isfinite(phred).all():
+            raise TypeError(
+                "Phred scores must be finite integers, not NaN or infinity "
+                "(e.g., from concatenating sequences with and without "
+                "quality scores).")
+        raise TypeError("Phred scores must be integers, not %s."
+                        % phred.dtype)
+    # only the scores that are out of range are checked one at a time
+    out_of_range = (phred < phred_range[0]) | (phred > phred_range[1])
+    for score in phred[out_of_range].tolist():
         if score < phred_range[0]:
             raise ValueError("Phred score %d is out of range [%d, %d]."
                              % (score, phred_range[0], phred_range[1]))
-        if score > phred_range[1]:
-            warnings.warn(
-                "Phred score %d is out of targeted range [%d, %d]. Converting "
-                "to %d." % (score, phred_range[0], phred_range[1],
-                            phred_range[1]), UserWarning)
-            score = phred_range[1]
-        qual_chars.append(chr(score + phred_offset))
-    return ''.join(qual_chars)
+        warnings.warn(
+            "Phred score %d is out of targeted range [%d, %d]. Converting "
+            "to %d." % (score, phred_range[0], phred_range[1],
+                        phred_range[1]), UserWarning)
+    phred = np.minimum(phred, phred_range[1]) + phred_offset
+    return phred.astype(np.uint8).tobytes().decode('ascii')
 
 
 def _get_phred_offset_and_range(variant, phred_offset, errors):
@@ -114,6 +129,137 @@ def _get_nth_sequence(generator, seq_num):
                      % cardinal_to_ordinal(seq_num))
 
 
+def _records_to_sequences(records, constructor, **kwargs):
+    """Construct a sequence from each raw (seq, id, description, qual) record.
+
+    If `constructor` is ``SequenceRecord``, the raw records are yielded as
+    ``SequenceRecord`` objects instead.
+
+    If `constructor` validates its characters, the characters of consecutive
+    records are validated (and uppercased, with ``lowercase=True``) together in
+    blocks of about `_validation_block_size` characters. Each sequence is then
+    constructed from its already validated characters with ``validate=False``.
+
+    """
+    from skbio.sequence import GrammaredSequence
+
+    if constructor is SequenceRecord:
+        _check_sequence_record_kwargs(kwargs)
+        for seq, id_, desc, qual in records:
+            yield SequenceRecord(id_, desc, seq, qual)
+        return
+
+    lowercase = kwargs.get('lowercase', False)
+    if not (issubclass(constructor, GrammaredSequence) and
+            kwargs.get('validate', True) and
+            (lowercase is False or lowercase is True)):
+        for record in records:
+            yield _record_to_sequence(record, constructor, kwargs)
+        return
+
+    validated_kwargs = dict(kwargs, validate=False, lowercase=False)
+    records = iter(records)
+    while True:
+        block, size = [], 0
+        try:
+            for record in records:
+                block.append(record)
+                size += len(record[0])
+                if size >= _validation_block_size:
+                    break
+        except Exception:
+            # A later record could not be parsed. Construct the records read
+            # before it one at a time so that they are yielded before the
+            # error is raised.
+            for record in block:
+                yield _record_to_sequence(record, constructor, kwargs)
+            raise
+        if not block:
+            return
+
+        try:
+            data = np.frombuffer(''.join(
+                record[0] for record in block).encode('ascii'), dtype=np.uint8)
+            data = constructor._validate_bytes(data, lowercase=lowercase)
+        except ValueError:
+            # Construct the records one at a time so that the records before
+            # the first invalid one are yielded before the error is raised.
+            for record in block:
+                yield _record_to_sequence(record, constructor, kwargs)
+            raise
+
+        start = 0
+        for seq, id_, desc, qual in block:
+            stop = start + len(seq)
+            yield _record_to_sequence((data[start:stop], id_, desc, qual),
+                                      constructor, validated_kwargs)
+            start = stop
+
+
+def _check_sequence_record_kwargs(kwargs):
+    if kwargs:
+        raise TypeError(
+            "Cannot pass keyword arguments (%s) to the constructor when "
+            "reading SequenceRecord objects."
+            % ', '.join(map(repr, sorted(kwargs))))
+
+
+def _record_to_sequence(record, constructor, kwargs):
+    seq, id_, desc, qual = record
+    positional_metadata = None
+    if qual is not None:
+        positional_metadata = {'quality': qual}
+    # sequence and quality scores lengths are checked in constructor
+    return constructor(seq, metadata={'id': id_, 'description': desc},
+                       positional_metadata=positional_metadata, **kwargs)
+
+
+def _records_to_sequence_batch(records, constructor, **kwargs):
+    """Pack raw (seq, id, description, qual) records into a SequenceBatch.
+
+    `qual` is either ``None`` for every record or an array of quality scores
+    for every record.
+
+    """
+    from skbio.sequence import SequenceBatch
+
+    seqs, ids, descriptions, quals = [], [], [], []
+    for seq, id_, desc, qual in records:
+        if qual is not None and len(qual) != len(seq):
+            raise ValueError(
+                "Number of quality scores (%d) must match the number of "
+                "characters in the sequence (%d) for record %r."
+                % (len(qual), len(seq), str(id_)))
+        seqs.append(seq)
+        ids.append(id_)
+        descriptions.append(desc)
+        quals.append(qual)
+
+    offsets = np.zeros(len(seqs) + 1, dtype=np.int64)
+    np.cumsum([len(seq) for seq in seqs], out=offsets[1:])
+    data = np.frombuffer(''.join(seqs).encode('ascii'), dtype=np.uint8)
+
+    quality = None
+    if quals and quals[0] is not None:
+        quality = np.concatenate(quals)
+    return SequenceBatch(data, offsets, dtype=constructor, ids=ids,
+                         descriptions=descriptions, quality=quality, **kwargs)
+
+
+def _records_to_sequence_batches(records, constructor, batch_size,
+                                 **kwargs):
+    """Pack raw records into SequenceBatch objects of up to `batch_size`."""
+    if batch_size < 1:
+        raise ValueError("`batch_size` must be greater than 0, not %r."
+                         % batch_size)
+    records = iter(records)
+    while True:
+        chunk = list(itertools.islice(records, batch_size))
+        if not chunk:
+            return
+        yield _records_to_sequence_batch(chunk, constructor, **kwargs)
+
+
 def _parse_fasta_like_header(line):
     id_ = ''
     desc = ''
@@ -144,6 +290,11 @@ def _format_fasta_like_records(generator, id_whitespace_replacement,
             "sequence IDs, nor to replace newlines in sequence descriptions.")
 
     for idx, seq in enumerate(generator):
+        if isinstance(seq, SequenceRecord):
+            yield _format_sequence_record(
+                seq, idx, id_whitespace_replacement,
+                description_newline_replacement, require_qual, lowercase)
+            continue
 
         if len(seq) < 1:
             raise ValueError(
@@ -188,6 +339,44 @@ def _format_fasta_like_records(generator, id_whitespace_replacement,
         yield header, "%s" % seq_str, qual
 
 
+def _format_sequence_record(record, idx, id_whitespace_replacement,
+                            description_newline_replacement, require_qual,
+                            lowercase):
+    """Format a ``SequenceRecord`` like a sequence with the same fields."""
+    if lowercase is not None:
+        raise TypeError(
+            "Cannot use `lowercase` to write SequenceRecord objects, which "
+            "are written as is.")
+    id_, desc, seq_str, qual = record
+    if isinstance(seq_str, bytes):
+        seq_str = seq_str.decode('ascii')
+    if len(seq_str) < 1:
+        raise ValueError(
+            "%s sequence does not contain any characters (i.e., it is an "
+            "empty/blank sequence). Writing empty sequences is not "
+            "supported." % cardinal_to_ordinal(idx + 1))
+
+    id_ = '' if id_ is None else '%s' % id_
+    if id_whitespace_replacement is not None:
+        id_ = _whitespace_regex.sub(id_whitespace_replacement, id_)
+    desc = '' if desc is None else '%s' % desc
+    if description_newline_replacement is not None:
+        desc = _newline_regex.sub(description_newline_replacement, desc)
+    header = '%s %s' % (id_, desc) if desc else id_
+
+    if qual is None:
+        if require_qual:
+            raise ValueError(
+                "Cannot write %s sequence because it does not have quality "
+                "scores associated with it." % cardinal_to_ordinal(idx + 1))
+    elif len(qual) != len(seq_str):
+        raise ValueError(
+            "Number of quality scores (%d) must match the number of "
+            "characters in the sequence (%d) for record %r."
+            % (len(qual), len(seq_str), id_))
+    return header, seq_str, qual
+
+
 def _line_generator(fh, skip_blanks=False, strip=True):
     for line in fh:
         if strip:
@@ -0,0 +1,142 @@
+"""
+FASTA index format (:mod:`skbio.io.format.fai`)
+===============================================
+
+.. currentmodule:: skbio.io.format.fai
+
+The FASTA index format (``fai``) stores an ``skbio.io.FASTAIndex``, which
+records where each sequence starts in a FASTA file so that records and regions
+can be read from the file without parsing it. It is the format of the
+``.fai`` files created by ``samtools faidx`` [1]_, so indexes can be shared
+with other tools.
+
+Format Support
+--------------
+**Has Sniffer: Yes**
+
++------+------+---------------------------------------------------------------+
+|Reader|Writer|                          Object Class                         |
++======+======+===============================================================+
+|Yes   |Yes   |:mod:`skbio.io.FASTAIndex`                                     |
++------+------+---------------------------------------------------------------+
+
+Format Specification
+--------------------
+An ``fai`` file contains one line per record of the indexed FASTA file, in the
+order of the FASTA file. Each line has five tab-separated fields:
+
+1. ID of the record (i.e., its header line up to the first whitespace).
+2. Number of characters in the sequence of the record.
+3. Position in the FASTA file (in bytes, starting at zero) of the first
+   character of the sequence.
+4. Number of sequence characters per line.
+5. Number of bytes per line, including the newline characters.
+
+For example, the index of the FASTA file::
+
+    >chr1 first chromosome
+    ACGTA
+    CGTAC
+    GT
+    >chr2
+    TTTGG
+
+is::
+
+    chr1	12	23	5	6
+    chr2	5	44	5	6
+
+Indexes of FASTQ files created by ``samtools fqidx``, which have a sixth
+field, are not supported.
+
+Examples
+--------
+Index a FASTA file and write the index:
+
+>>> from io import BytesIO, StringIO
+>>> import skbio.io
+>>> from skbio.io import FASTAIndex
+>>> fasta = BytesIO(b'>chr1 first chromosome\\nACGTA\\nCGTAC\\nGT\\n'
+...                 b'>chr2\\nTTTGG\\n')
+>>> index = FASTAIndex.from_fasta(fasta)
+>>> print(index.write(StringIO()).getvalue())
+... # doctest: +NORMALIZE_WHITESPACE
+chr1	12	23	5	6
+chr2	5	44	5	6
+<BLANKLINE>
+
+Read the index back and fetch a region:
+
+>>> fai = StringIO('chr1\\t12\\t23\\t5\\t6\\nchr2\\t5\\t44\\t5\\t6\\n')
+>>> index = FASTAIndex.read(fai)
+>>> str(index.fetch(fasta, 'chr1', 4, 7))
+'ACG'
+
+References
+----------
+.. [1] Li, H., Handsaker, B., Wysoker, A., Fennell, T., Ruan, J., Homer, N.,
+   ... & Durbin, R. (2009). The Sequence Alignment/Map format and SAMtools.
+   Bioinformatics, 25(16), 2078-2079.
+
+"""
+
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+from skbio.io import create_format, FAIFormatError, FASTAIndex
+
+
+fai = create_format('fai')
+
+_num_fields = 5
+
+
+@fai.sniffer()
+def _fai_sniffer(fh):
+    # Check the first few lines.
+    num_lines = 0
+    for line in fh:
+        try:
+            _parse_line(line)
+        except FAIFormatError:
+            return False, {}
+        num_lines += 1
+        if num_lines == 10:
+            break
+    return num_lines > 0, {}
+
+
+@fai.reader(FASTAIndex)
+def _fai_to_fasta_index(fh):
+    entries = [_parse_line(line) for line in fh]
+    columns = list(zip(*entries)) if entries else [[]] * _num_fields
+    try:
+        return FASTAIndex(*columns)
+    except ValueError as e:
+        raise FAIFormatError(str(e))
+
+
+@fai.writer(FASTAIndex)
+def _fasta_index_to_fai(obj, fh):
+    columns = [obj.ids] + [column.tolist() for column in obj._columns()]
+    for entry in zip(*columns):
+        fh.write('%s\t%d\t%d\t%d\t%d\n' % entry)
+
+
+def _parse_line(line):
+    fields = line.rstrip('\n').split('\t')
+    if len(fields) != _num_fields:
+        raise FAIFormatError(
+            "Lines must have %d tab-separated fields, not %d: %r"
+            % (_num_fields, len(fields), line))
+    try:
+        values = [int(field) for field in fields[1:]]
+    except ValueError:
+        raise FAIFormatError(
+            "Lengths and positions must be integers: %r" % line)
+    return [fields[0]] + values
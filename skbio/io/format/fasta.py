@@ -35,6 +35,8 @@ Format Support
 +------+------+---------------------------------------------------------------+
 |Yes   |Yes   |:mod:`skbio.alignment.TabularMSA`                              |
 +------+------+---------------------------------------------------------------+
+|Yes   |Yes   |:mod:`skbio.sequence.SequenceBatch`                            |
++------+------+---------------------------------------------------------------+
 |Yes   |Yes   |:mod:`skbio.sequence.Sequence`                                 |
 +------+------+---------------------------------------------------------------+
 |Yes   |Yes   |:mod:`skbio.sequence.DNA`                                      |
@@ -191,21 +193,31 @@ Reader-specific Parameters
 ^^^^^^^^^^^^^^^^^^^^^^^^^^
 The available reader parameters differ depending on which reader is used.
 
-Generator and TabularMSA Reader Parameters
-~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-The ``constructor`` parameter can be used with the ``Sequence`` generator and
-``TabularMSA`` FASTA readers. ``constructor`` specifies the type of in-memory
-sequence object to read each sequence into. For example, if you know that the
-FASTA file you're reading contains protein sequences, you would pass
-``constructor=Protein`` to the reader call.
+Generator, TabularMSA, and SequenceBatch Reader Parameters
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+The ``constructor`` parameter can be used with the ``Sequence`` generator,
+``TabularMSA``, and ``SequenceBatch`` FASTA readers. ``constructor`` specifies
+the type of in-memory sequence object to read each sequence into. For example,
+if you know that the FASTA file you're reading contains protein sequences, you
+would pass ``constructor=Protein`` to the reader call.
 
 When reading into a ``Sequence`` generator, ``constructor`` defaults to
-``Sequence`` and must be a subclass of ``Sequence`` if supplied.
+``Sequence`` and must be a subclass of ``Sequence`` if supplied. It can also be
+``skbio.io.SequenceRecord``, in which case the generator yields the raw ID,
+description, sequence characters, and quality scores (if ``qual`` is provided)
+of each record as a ``SequenceRecord``, without constructing a sequence object.
+This is much faster if only these fields are needed (e.g., to convert, count,
+or hash records).
 
 When reading into a ``TabularMSA``, ``constructor`` is a required format
 parameter and must be a subclass of ``GrammaredSequence`` (e.g., ``DNA``,
 ``RNA``, ``Protein``).
 
+When reading into a ``SequenceBatch``, ``constructor`` defaults to
+``Sequence`` and determines the batch's ``dtype``. All sequence data are
+packed into a single buffer without creating a ``Sequence`` object for each
+record.
+
 .. note:: The FASTA sniffer will not attempt to guess the ``constructor``
    parameter.
 
@@ -216,6 +228,21 @@ The ``seq_num`` parameter can be used with the ``Sequence``,
 sequence to read from the FASTA file (and optional QUAL file), and defaults to
 1 (i.e., such that the first sequence is read). For example, to read the 50th
 sequence from a FASTA file, you would pass ``seq_num=50`` to the reader call.
+The file is parsed from the start up to the requested sequence on every call.
+To read many individual records or regions from a large file (e.g., contigs
+of a reference genome), index the file with ``skbio.io.FASTAIndex`` instead
+(see the example below).
+
+Block Size Parameter
+~~~~~~~~~~~~~~~~~~~~
+The ``block_size`` parameter is available to all FASTA format readers. By
+default, FASTA files are read 4194304 (``2 ** 22``) characters at a time and
+split into records with string operations, which avoids creating a string for
+each line of a record (e.g., the many short lines of a chromosome). Records
+containing blank lines or whitespace within lines are parsed line by line, so
+the result is always the same as reading the file line by line. Pass
+``block_size=None`` to read the file line by line instead. QUAL files are
+always read line by line.
 
 Writer-specific Parameters
 ^^^^^^^^^^^^^^^^^^^^^^^^^^
@@ -260,6 +287,9 @@ The following parameters are available to all FASTA format writers:
   corresponding to `True` values will be written in lowercase. The boolean
   array must be the same length as the sequence.
 
+The generator writer also accepts ``skbio.io.SequenceRecord`` objects, whose
+sequence characters are written as is (i.e., ``lowercase`` cannot be used).
+
 .. note:: The FASTA format writers will have noticeably better runtime
    performance if ``id_whitespace_replacement`` and/or
    ``description_newline_replacement`` are set to ``None`` so that whitespace
@@ -483,6 +513,42 @@ Individual sequence objects can also be written in FASTA format:
 AAACCCTTGCCGGTACGCTTAAACCATTGCCGGTACGCTTAA
 <BLANKLINE>
 
+Reading Records from an Indexed FASTA File
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+A ``skbio.io.FASTAIndex`` records where the sequence of each record starts in
+a FASTA file, so that records and regions can be read by seeking to them
+instead of parsing the file. Indexes are compatible with the ``.fai`` files
+created by ``samtools faidx`` and can be stored with the ``fai`` format (see
+:mod:`skbio.io.format.fai`). The sequence lines of each record must all have
+the same length, except the last one:
+
+>>> from io import BytesIO
+>>> from skbio.io import FASTAIndex
+>>> genome = BytesIO(b'>chr1\\nACGTACGTAC\\nGGGTTTAAAC\\nTT\\n'
+...                  b'>chr2 plasmid\\nAAACCCGGGT\\nT\\n')
+>>> index = FASTAIndex.from_fasta(genome)
+>>> index.ids
+['chr1', 'chr2']
+>>> index.lengths
+array([22, 11])
+
+Fetch the characters of ``chr1`` from position 8 up to (but not including)
+position 14, reading only the lines that contain them:
+
+>>> index.fetch(genome, 'chr1', 8, 14, constructor=DNA)
+DNA
+--------------------------
+Metadata:
+    'id': 'chr1'
+Stats:
+    length: 6
+    has gaps: False
+    has degenerates: False
+    has definites: True
+    GC-content: 66.67%
+--------------------------
+0 ACGGGT
+
 Reading and Writing FASTA/QUAL Files
 ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
 In addition to reading and writing standalone FASTA files, scikit-bio supports
@@ -615,12 +681,17 @@ import numpy as np
 from skbio.io import create_format, FASTAFormatError, QUALFormatError
 from skbio.io.registry import FileSentinel
 from skbio.io.format._base import (_get_nth_sequence,
+                                   _records_to_sequences,
+                                   _records_to_sequence_batch,
                                    _parse_fasta_like_header,
                                    _format_fasta_like_records, _line_generator,
                                    _too_many_blanks)
 from skbio.util._misc import chunk_str
 from skbio.alignment import TabularMSA
-from skbio.sequence import Sequence, DNA, RNA, Protein
+from skbio.sequence import Sequence, DNA, RNA, Protein, SequenceBatch
+
+# Default number of characters read at a time by the block-oriented parser.
+_block_size = 2 ** 22
 
 
 fasta = create_format('fasta')
@@ -644,7 +715,7 @@ def _fasta_sniffer(fh):
     num_records = 10
     empty = True
     try:
-        parser = _parse_fasta_raw(fh, _sniffer_data_parser, FASTAFormatError)
+        parser = _parse_fasta_blocks(fh, _block_size, _sniffer_data_parser)
         for _ in zip(range(num_records), parser):
             empty = False
     except FASTAFormatError:
@@ -669,44 +740,10 @@ def _sniffer_data_parser(chunks):
 
 
 @fasta.reader(None)
-def _fasta_to_generator(fh, qual=FileSentinel, constructor=Sequence, **kwargs):
-    if qual is None:
-        for seq, id_, desc in _parse_fasta_raw(fh, _parse_sequence_data,
-                                               FASTAFormatError):
-            yield constructor(seq, metadata={'id': id_, 'description': desc},
-                              **kwargs)
-    else:
-        fasta_gen = _parse_fasta_raw(fh, _parse_sequence_data,
-                                     FASTAFormatError)
-        qual_gen = _parse_fasta_raw(qual, _parse_quality_scores,
-                                    QUALFormatError)
-
-        for fasta_rec, qual_rec in itertools.zip_longest(fasta_gen, qual_gen,
-                                                         fillvalue=None):
-            if fasta_rec is None:
-                raise FASTAFormatError(
-                    "QUAL file has more records than FASTA file.")
-            if qual_rec is None:
-                raise FASTAFormatError(
-                    "FASTA file has more records than QUAL file.")
-
-            fasta_seq, fasta_id, fasta_desc = fasta_rec
-            qual_scores, qual_id, qual_desc = qual_rec
-
-            if fasta_id != qual_id:
-                raise FASTAFormatError(
-                    "IDs do not match between FASTA and QUAL records: %r != %r"
-                    % (str(fasta_id), str(qual_id)))
-            if fasta_desc != qual_desc:
-                raise FASTAFormatError(
-                    "Descriptions do not match between FASTA and QUAL "
-                    "records: %r != %r" % (str(fasta_desc), str(qual_desc)))
-
-            # sequence and quality scores lengths are checked in constructor
-            yield constructor(
-                fasta_seq,
-                metadata={'id': fasta_id, 'description': fasta_desc},
-                positional_metadata={'quality': qual_scores}, **kwargs)
+def _fasta_to_generator(fh, qual=FileSentinel, constructor=Sequence,
+                        block_size=_block_size, **kwargs):
+    yield from _records_to_sequences(
+        _parse_fasta_qual_raw(fh, qual, block_size), constructor, **kwargs)
 
 
 @fasta.reader(Sequence)
@@ -749,6 +786,13 @@ def _fasta_to_tabular_msa(fh, qual=FileSentinel, constructor=None, **kwargs):
         _fasta_to_generator(fh, qual=qual, constructor=constructor, **kwargs))
 
 
+@fasta.reader(SequenceBatch)
+def _fasta_to_sequence_batch(fh, qual=FileSentinel, constructor=Sequence,
+                             block_size=_block_size, **kwargs):
+    return _records_to_sequence_batch(
+        _parse_fasta_qual_raw(fh, qual, block_size), constructor, **kwargs)
+
+
 @fasta.writer(None)
 def _generator_to_fasta(obj, fh, qual=FileSentinel,
                         id_whitespace_replacement='_',
@@ -827,6 +871,60 @@ def _tabular_msa_to_fasta(obj, fh, qual=FileSentinel,
                         description_newline_replacement, max_width, lowercase)
 
 
+@fasta.writer(SequenceBatch)
+def _sequence_batch_to_fasta(obj, fh, qual=FileSentinel,
+                             id_whitespace_replacement='_',
+                             description_newline_replacement=' ',
+                             max_width=None, lowercase=None):
+    _sequences_to_fasta(obj, fh, qual, id_whitespace_replacement,
+                        description_newline_replacement, max_width, lowercase)
+
+
+def _parse_fasta_qual_raw(fh, qual, block_size=None):
+    """Raw parser for FASTA files with optional QUAL files.
+
+    Returns raw values (seq, id, description, qual) for each record, where
+    qual is ``None`` if `qual` is ``None``. The FASTA file is parsed line by
+    line if `block_size` is ``None``, and in blocks otherwise.
+
+    """
+    if block_size is None:
+        fasta_gen = _parse_fasta_raw(fh, _parse_sequence_data,
+                                     FASTAFormatError)
+    else:
+        fasta_gen = _parse_fasta_blocks(fh, block_size)
+
+    if qual is None:
+        for seq, id_, desc in fasta_gen:
+            yield seq, id_, desc, None
+        return
+
+    qual_gen = _parse_fasta_raw(qual, _parse_quality_scores, QUALFormatError)
+
+    for fasta_rec, qual_rec in itertools.zip_longest(fasta_gen, qual_gen,
+                                                     fillvalue=None):
+        if fasta_rec is None:
+            raise FASTAFormatError(
+                "QUAL file has more records than FASTA file.")
+        if qual_rec is None:
+            raise FASTAFormatError(
+                "FASTA file has more records than QUAL file.")
+
+        fasta_seq, fasta_id, fasta_desc = fasta_rec
+        qual_scores, qual_id, qual_desc = qual_rec
+
+        if fasta_id != qual_id:
+            raise FASTAFormatError(
+                "IDs do not match between FASTA and QUAL records: %r != %r"
+                % (str(fasta_id), str(qual_id)))
+        if fasta_desc != qual_desc:
+            raise FASTAFormatError(
+                "Descriptions do not match between FASTA and QUAL "
+                "records: %r != %r" % (str(fasta_desc), str(qual_desc)))
+
+        yield fasta_seq, fasta_id, fasta_desc, qual_scores
+
+
 def _parse_fasta_raw(fh, data_parser, error_type):
     """Raw parser for FASTA or QUAL files.
 
@@ -868,6 +966,100 @@ def _parse_fasta_raw(fh, data_parser, error_type):
     yield data_parser(data_chunks), id_, desc
 
 
+def _parse_fasta_blocks(fh, block_size, data_parser=None):
+    """Block-oriented parser for FASTA files.
+
+    Returns the same raw values (seq, id, description) as ``_parse_fasta_raw``,
+    but reads the file `block_size` characters at a time and splits it into
+    records with ``str.split`` instead of creating a string per line. Records
+    containing whitespace other than line breaks (e.g., blank lines or
+    trailing spaces) are parsed line by line so that they are handled exactly
+    as by ``_parse_fasta_raw``.
+
+    The data of the other records is joined directly, so `data_parser` (by
+    default ``_parse_sequence_data``) is only called for records parsed line
+    by line. If `data_parser` is provided, records whose data could be quality
+    scores (i.e., only digits and signs) are always parsed line by line.
+
+    """
+    if block_size < 1:
+        raise ValueError("`block_size` must be greater than 0, not %r."
+                         % block_size)
+
+    # Skip any blank or whitespace-only lines at beginning of file, and check
+    # the first header before reading any blocks
+    for line in fh:
+        if line.strip():
+            break
+    else:
+        return
+    line = line.lstrip()
+    if not line.startswith('>'):
+        raise FASTAFormatError(
+            "Found non-header line when attempting to read the 1st record:"
+            "\n%s" % line.strip())
+
+    for text in _split_fasta_records(fh, block_size, line[1:]):
+        record = _parse_fasta_record(text)
+        if record is None or (data_parser is not None and
+                              not record[0].strip('0123456789+-')):
+            yield from _parse_fasta_raw(iter(('>' + text).split('\n')),
+                                        data_parser or _parse_sequence_data,
+                                        FASTAFormatError)
+        else:
+            yield record
+
+
+def _split_fasta_records(fh, block_size, text):
+    """Split a FASTA file at each line starting with '>'.
+
+    `text` is the beginning of the first record, which continues with the rest
+    of the file. Yields the text of each record without its leading '>'.
+
+    """
+    pieces = [text]
+    while True:
+        block = fh.read(block_size)
+        if not block:
+            break
+        if block[0] == '>' and pieces and pieces[-1].endswith('\n'):
+            # the previous block ended at a record boundary
+            pieces[-1] = pieces[-1][:-1]
+            yield ''.join(pieces)
+            pieces = []
+            block = block[1:]
+        records = block.split('\n>')
+        if len(records) > 1:
+            pieces.append(records[0])
+            yield ''.join(pieces)
+            yield from records[1:-1]
+            pieces = []
+        if records[-1]:
+            pieces.append(records[-1])
+    yield ''.join(pieces)
+
+
+def _parse_fasta_record(text):
+    """Parse the text of a record (without its leading '>').
+
+    Returns ``None`` if the record must be parsed line by line.
+
+    """
+    header, _, seq = text.partition('\n')
+    if '\n' in seq:
+        seq = seq.rstrip('\n')
+        # the sequence data is only joined directly if stripping each line
+        # and checking for blank lines would not change it
+        if seq.startswith('\n') or '\n\n' in seq:
+            return None
+        seq = seq.replace('\n', '')
+    words = seq.split(None, 1)
+    if len(words) != 1 or len(words[0]) != len(seq):
+        return None
+    id_, desc = _parse_fasta_like_header('>' + header)
+    return seq, id_, desc
+
+
 def _parse_sequence_data(chunks):
     if not chunks:
         raise FASTAFormatError("Found header without sequence data.")
@@ -42,6 +42,8 @@ Format Support
 +------+------+---------------------------------------------------------------+
 |Yes   |Yes   |:mod:`skbio.alignment.TabularMSA`                              |
 +------+------+---------------------------------------------------------------+
+|Yes   |Yes   |:mod:`skbio.sequence.SequenceBatch`                            |
++------+------+---------------------------------------------------------------+
 |Yes   |Yes   |:mod:`skbio.sequence.Sequence`                                 |
 +------+------+---------------------------------------------------------------+
 |Yes   |Yes   |:mod:`skbio.sequence.DNA`                                      |
@@ -167,6 +169,28 @@ The following additional parameters are the same as in FASTA format
 
 - ``lowercase``: see ``lowercase`` parameter in FASTA format
 
+The generator reader also accepts a ``batch_size`` parameter (default
+``None``). If provided, the generator yields ``SequenceBatch`` objects of up to
+``batch_size`` records each (of type ``constructor``) instead of individual
+sequences. Records are packed into batches directly, without creating a
+sequence object per record, so files of any size can be processed (e.g.,
+quality trimmed and filtered) one batch at a time.
+
+As with FASTA, the generator reader accepts ``constructor=SequenceRecord`` (see
+``skbio.io.SequenceRecord``) to yield the raw fields of each record without
+constructing a sequence object, and the generator writer accepts
+``SequenceRecord`` objects. For example, a FASTQ file can be converted to FASTA
+by reading it into ``SequenceRecord`` objects and writing them as FASTA.
+
+All FASTQ readers accept a ``block_size`` parameter (default 4194304, i.e.,
+``2 ** 22``). The file is read ``block_size`` characters at a time, and records
+made of exactly four lines (header, sequence, ``+`` header, and quality scores)
+are located in bulk, with the quality scores of all of these records decoded
+at once. From the first record with any other layout (e.g., a sequence split
+across multiple lines, or blank lines), the rest of the file is read line by
+line, so the result is always the same as reading the whole file line by line.
+Pass ``block_size=None`` to read the file line by line instead.
+
 Examples
 --------
 Suppose we have the following FASTQ file with two DNA sequences::
@@ -262,6 +286,25 @@ scores each only occur on a single line and the sequence header line is
 not repeated in the quality header line. Note also that the quality scores are
 different because they have been encoded using a different variant.
 
+To quality control the reads of a large file without loading all of them into
+memory, read them in batches, trimming and filtering each batch with
+vectorized ``SequenceBatch`` methods before writing it:
+
+>>> import skbio.io
+>>> fh = StringIO(fs)
+>>> out = StringIO()
+>>> for batch in skbio.io.read(fh, format='fastq', variant='sanger',
+...                            constructor=DNA, batch_size=1000):
+...     batch = batch.trim_sliding_window(4, 20).trim_ends(trailing=20)
+...     batch = batch.filter_by_expected_errors(1).filter_by_length(10)
+...     _ = batch.write(out, format='fastq', variant='sanger')
+>>> print(out.getvalue())
+@seq2 description 2
+TATGTATATAT
++
+]KZ[PY]_[YY
+<BLANKLINE>
+
 References
 ----------
 .. [1] Peter J. A. Cock, Christopher J. Fields, Naohisa Goto, Michael L. Heuer,
@@ -283,6 +326,8 @@ References
 # The full license is in the file COPYING.txt, distributed with this software.
 # ----------------------------------------------------------------------------
 
+import io
+import itertools
 import re
 
 import numpy as np
@@ -290,13 +335,18 @@ import numpy as np
 from skbio.io import create_format, FASTQFormatError
 from skbio.io.format._base import (
     _decode_qual_to_phred, _encode_phred_to_qual, _get_nth_sequence,
+    _get_phred_offset_and_range,
     _parse_fasta_like_header, _format_fasta_like_records, _line_generator,
-    _too_many_blanks)
+    _too_many_blanks, _records_to_sequences, _records_to_sequence_batch,
+    _records_to_sequence_batches)
 from skbio.alignment import TabularMSA
-from skbio.sequence import Sequence, DNA, RNA, Protein
+from skbio.sequence import Sequence, DNA, RNA, Protein, SequenceBatch
 
 _whitespace_regex = re.compile(r'\s')
 
+# Default number of characters read at a time by the block-oriented parser.
+_block_size = 2 ** 22
+
 
 fastq = create_format('fastq')
 
@@ -313,7 +363,8 @@ def _fastq_sniffer(fh):
 
     try:
         not_empty = False
-        for _, seq in zip(range(10), _fastq_to_generator(fh, phred_offset=33)):
+        for _, seq in zip(range(10), _fastq_to_generator(fh, phred_offset=33,
+                                                         block_size=None)):
             split_length = len((seq.metadata['id'] +
                                 seq.metadata['description']).split(':'))
             description = seq.metadata['description'].split(':')
@@ -327,34 +378,14 @@ def _fastq_sniffer(fh):
 
 @fastq.reader(None)
 def _fastq_to_generator(fh, variant=None, phred_offset=None,
-                        constructor=Sequence, **kwargs):
-    # Skip any blank or whitespace-only lines at beginning of file
-    try:
-        seq_header = next(_line_generator(fh, skip_blanks=True))
-    except StopIteration:
+                        constructor=Sequence, batch_size=None,
+                        block_size=_block_size, **kwargs):
+    records = _parse_fastq_records(fh, variant, phred_offset, block_size)
+    if batch_size is not None:
+        yield from _records_to_sequence_batches(records, constructor,
+                                                batch_size, **kwargs)
         return
-
-    if not seq_header.startswith('@'):
-        raise FASTQFormatError(
-            "Expected sequence (@) header line at start of file: %r"
-            % str(seq_header))
-
-    while seq_header is not None:
-        id_, desc = _parse_fasta_like_header(seq_header)
-        seq, qual_header = _parse_sequence_data(fh, seq_header)
-
-        if qual_header != '+' and qual_header[1:] != seq_header[1:]:
-            raise FASTQFormatError(
-                "Sequence (@) and quality (+) header lines do not match: "
-                "%r != %r" % (str(seq_header[1:]), str(qual_header[1:])))
-
-        phred_scores, seq_header = _parse_quality_scores(fh, len(seq),
-                                                         variant,
-                                                         phred_offset,
-                                                         qual_header)
-        yield constructor(seq, metadata={'id': id_, 'description': desc},
-                          positional_metadata={'quality': phred_scores},
-                          **kwargs)
+    yield from _records_to_sequences(records, constructor, **kwargs)
 
 
 @fastq.reader(Sequence)
@@ -403,6 +434,15 @@ def _fastq_to_tabular_msa(fh, variant=None, phred_offset=None,
                             constructor=constructor, **kwargs))
 
 
+@fastq.reader(SequenceBatch)
+def _fastq_to_sequence_batch(fh, variant=None, phred_offset=None,
+                             constructor=Sequence, block_size=_block_size,
+                             **kwargs):
+    return _records_to_sequence_batch(
+        _parse_fastq_records(fh, variant, phred_offset, block_size),
+        constructor, **kwargs)
+
+
 @fastq.writer(None)
 def _generator_to_fastq(obj, fh, variant=None, phred_offset=None,
                         id_whitespace_replacement='_',
@@ -467,6 +507,185 @@ def _tabular_msa_to_fastq(obj, fh, variant=None, phred_offset=None,
                         description_newline_replacement, lowercase=lowercase)
 
 
+@fastq.writer(SequenceBatch)
+def _sequence_batch_to_fastq(obj, fh, variant=None, phred_offset=None,
+                             id_whitespace_replacement='_',
+                             description_newline_replacement=' ',
+                             lowercase=None):
+    _sequences_to_fastq(obj, fh, variant, phred_offset,
+                        id_whitespace_replacement,
+                        description_newline_replacement, lowercase=lowercase)
+
+
+def _parse_fastq_records(fh, variant, phred_offset, block_size):
+    """Parse raw FASTQ records line by line or in blocks.
+
+    Records are parsed line by line if `block_size` is ``None``, and in blocks
+    of about `block_size` characters otherwise.
+
+    """
+    if block_size is None:
+        return _parse_fastq_raw(fh, variant, phred_offset)
+    return _parse_fastq_blocks(fh, variant, phred_offset, block_size)
+
+
+def _parse_fastq_blocks(fh, variant, phred_offset, block_size):
+    """Block-oriented parser for FASTQ files.
+
+    Returns the same raw values (seq, id, description, phred scores) as
+    ``_parse_fastq_raw``. The file is read `block_size` characters at a time,
+    records made of exactly four lines (header, sequence, '+' header, and
+    quality scores) are located with NumPy, and their quality scores are
+    decoded all at once.
+
+    From the first record without this layout (e.g., a record split across
+    more lines, blank lines, or non-ASCII characters), the rest of the file is
+    parsed line by line, so that records and errors are exactly the same as
+    with ``_parse_fastq_raw``. For the same reason, a record is only yielded
+    once the record after it has been checked.
+
+    """
+    if block_size < 1:
+        raise ValueError("`block_size` must be greater than 0, not %r."
+                         % block_size)
+    text = pending = ''
+    while True:
+        block = fh.read(block_size)
+        if block:
+            text += block
+            stop = text.rfind('\n') + 1
+            if not stop:
+                continue
+            text, pending = text[:stop], text[stop:]
+        elif not text.strip():
+            return
+        elif not text.endswith('\n'):
+            text += '\n'
+
+        try:
+            buf = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+            offset, phred_range = _get_phred_offset_and_range(
+                variant, phred_offset, [None, None])
+        except ValueError:
+            # non-ASCII characters or invalid parameters, which are handled
+            # (or reported) when parsing line by line
+            break
+        starts, ends, qual, invalid = _locate_fastq_records(
+            text, buf, offset, phred_range)
+
+        num_records = len(starts)
+        if not (block or invalid or
+                text[ends[-1, -1] + 1 if num_records else 0:].strip()):
+            # only blank lines after the last record of the file
+            yield from _fastq_records(text, starts, ends, qual, num_records)
+            return
+        if num_records:
+            num_records -= 1
+            yield from _fastq_records(text, starts, ends, qual, num_records)
+            text = text[starts[num_records, 0]:]
+        if invalid or not block:
+            break
+        text += pending
+        pending = ''
+
+    # the rest of the file (starting at a complete line) is parsed line by line
+    lines = itertools.chain(io.StringIO(text + pending + fh.readline()), fh)
+    yield from _parse_fastq_raw(lines, variant, phred_offset)
+
+
+def _locate_fastq_records(text, buf, phred_offset, phred_range):
+    """Locate the valid four-line records at the beginning of `text`.
+
+    `buf` is `text` encoded as a uint8 array. Returns the start and end of each
+    line of each record, the decoded quality scores (i.e., `buf` minus the
+    Phred offset), and whether the records are followed by a record that is
+    not valid (rather than by fewer than four lines).
+
+    """
+    ends = np.flatnonzero(buf == ord('\n'))
+    num_records = len(ends) // 4
+    ends = ends[:num_records * 4].reshape(num_records, 4)
+    starts = np.zeros_like(ends)
+    starts[:, 1:] = ends[:, :-1] + 1
+    starts[1:, 0] = ends[:-1, -1] + 1
+    lengths = ends - starts
+    # first character of each line (a newline for blank lines)
+    first = buf[starts]
+    valid = ((first[:, 0] == ord('@')) & (first[:, 2] == ord('+')) &
+             (first[:, 1] != ord('@')) & (first[:, 1] != ord('+')) &
+             (lengths[:, 1] > 0) & (lengths[:, 1] == lengths[:, 3]))
+    for i in np.flatnonzero(valid & (lengths[:, 2] > 1)).tolist():
+        # the '+' line repeats the header
+        valid[i] = (text[starts[i, 2] + 1:ends[i, 2]] ==
+                    text[starts[i, 0] + 1:ends[i, 0]])
+    invalid = not valid.all()
+    if invalid:
+        num_records = int(np.argmin(valid))
+    starts, ends = starts[:num_records], ends[:num_records]
+
+    qual = buf - phred_offset
+    if not num_records:
+        return starts, ends, qual, invalid
+
+    # Sequence data cannot contain whitespace, and the decoded quality scores
+    # must be in range. Each line is checked with a single reduction.
+    bad = np.logical_or.reduceat(
+        (buf <= ord(' ')) | (buf > ord('~')),
+        np.column_stack((starts[:, 1], ends[:, 1])).ravel())[::2]
+    bad |= np.logical_or.reduceat(
+        (qual < phred_range[0]) | (qual > phred_range[1]),
+        np.column_stack((starts[:, 3], ends[:, 3])).ravel())[::2]
+    if bad.any():
+        invalid = True
+        num_records = int(np.argmax(bad))
+    return starts[:num_records], ends[:num_records], qual, invalid
+
+
+def _fastq_records(text, starts, ends, qual, num_records):
+    """Yield the first `num_records` records located in `text`."""
+    for header, header_end, seq, seq_end, start, stop in zip(
+            *(bounds[:num_records, i].tolist()
+              for bounds, i in ((starts, 0), (ends, 0), (starts, 1),
+                                (ends, 1), (starts, 3), (ends, 3)))):
+        id_, desc = _parse_fasta_like_header(text[header:header_end])
+        yield text[seq:seq_end], id_, desc, qual[start:stop].copy()
+
+
+def _parse_fastq_raw(fh, variant, phred_offset):
+    """Raw parser for FASTQ files.
+
+    Returns raw values (seq, id, description, phred scores) for each record. It
+    is the responsibility of the caller to construct the correct in-memory
+    object to hold the data.
+
+    """
+    # Skip any blank or whitespace-only lines at beginning of file
+    try:
+        seq_header = next(_line_generator(fh, skip_blanks=True))
+    except StopIteration:
+        return
+
+    if not seq_header.startswith('@'):
+        raise FASTQFormatError(
+            "Expected sequence (@) header line at start of file: %r"
+            % str(seq_header))
+
+    while seq_header is not None:
+        id_, desc = _parse_fasta_like_header(seq_header)
+        seq, qual_header = _parse_sequence_data(fh, seq_header)
+
+        if qual_header != '+' and qual_header[1:] != seq_header[1:]:
+            raise FASTQFormatError(
+                "Sequence (@) and quality (+) header lines do not match: "
+                "%r != %r" % (str(seq_header[1:]), str(qual_header[1:])))
+
+        phred_scores, seq_header = _parse_quality_scores(fh, len(seq),
+                                                         variant,
+                                                         phred_offset,
+                                                         qual_header)
+        yield seq, id_, desc, phred_scores
+
+
 def _blank_error(unique_text):
     error_string = ("Found blank or whitespace-only line {} in "
                     "FASTQ file").format(unique_text)
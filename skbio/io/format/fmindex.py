@@ -0,0 +1,132 @@
+"""
+FM-index format (:mod:`skbio.io.format.fmindex`)
+================================================
+
+.. currentmodule:: skbio.io.format.fmindex
+
+The FM-index format (``fmindex``) stores an ``skbio.sequence.FMIndex`` as
+binary data, so that the index of a large sequence (e.g., a reference genome)
+only needs to be built once and can be loaded quickly to search many patterns.
+
+Format Support
+--------------
+**Has Sniffer: Yes**
+
++------+------+---------------------------------------------------------------+
+|Reader|Writer|                          Object Class                         |
++======+======+===============================================================+
+|Yes   |Yes   |:mod:`skbio.sequence.FMIndex`                                  |
++------+------+---------------------------------------------------------------+
+
+Format Specification
+--------------------
+An ``fmindex`` file is a binary file with the following layout, where all
+integers are unsigned and little-endian:
+
+1. The 8 bytes ``\\x89FMI\\r\\n\\x1a\\n``. The first byte is not ASCII so
+   that ``fmindex`` files are never mistaken for text files.
+2. The length ``n`` of the indexed sequence, as an 8-byte integer.
+3. The size in bytes of each suffix array element (``4`` or ``8``), as a
+   1-byte integer. Elements are stored with 4 bytes when possible.
+4. The ``n`` characters of the indexed sequence, one byte each.
+5. The ``n`` elements of the suffix array of the sequence.
+
+The file must not contain any other data. The rest of the index (e.g., the
+Burrows-Wheeler transform of the sequence) is computed from the sequence and
+its suffix array when the file is read, which is much faster than computing
+the suffix array. Metadata of the indexed sequence is not stored.
+
+Format Parameters
+-----------------
+The reader accepts a ``constructor`` parameter (default ``Sequence``),
+specifying the type of the indexed sequence (e.g., ``skbio.DNA``).
+
+Examples
+--------
+Index a sequence and write the index to a file:
+
+>>> from io import BytesIO
+>>> from skbio import DNA
+>>> from skbio.sequence import FMIndex
+>>> index = FMIndex(DNA('ACGTACGTTACG'))
+>>> fh = BytesIO()
+>>> _ = index.write(fh)
+
+Read the index back and search it:
+
+>>> _ = fh.seek(0)
+>>> index = FMIndex.read(fh, constructor=DNA)
+>>> index.count('ACG')
+3
+>>> type(index.sequence).__name__
+'DNA'
+
+"""
+
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+import struct
+
+import numpy as np
+
+from skbio.io import create_format, FMIndexFormatError
+from skbio.sequence import Sequence, FMIndex
+
+
+fmindex = create_format('fmindex', encoding='binary')
+
+_signature = b'\x89FMI\r\n\x1a\n'
+_header = struct.Struct('<QB')
+
+
+@fmindex.sniffer()
+def _fmindex_sniffer(fh):
+    return fh.read(len(_signature)) == _signature, {}
+
+
+@fmindex.reader(FMIndex)
+def _fmindex_to_fm_index(fh, constructor=Sequence):
+    if fh.read(len(_signature)) != _signature:
+        raise FMIndexFormatError(
+            "File must start with the bytes %r." % _signature)
+    length, itemsize = _header.unpack(_read_exactly(fh, _header.size))
+    if itemsize not in (4, 8):
+        raise FMIndexFormatError(
+            "Suffix array elements must be 4 or 8 bytes, not %d." % itemsize)
+
+    sequence = np.frombuffer(_read_exactly(fh, length), dtype=np.uint8)
+    suffix_array = np.frombuffer(_read_exactly(fh, length * itemsize),
+                                 dtype='<u%d' % itemsize)
+    if fh.read(1):
+        raise FMIndexFormatError(
+            "Found unexpected data after the suffix array.")
+
+    try:
+        return FMIndex(constructor(sequence),
+                       suffix_array=suffix_array.astype(np.int64))
+    except ValueError as e:
+        raise FMIndexFormatError(str(e))
+
+
+@fmindex.writer(FMIndex)
+def _fm_index_to_fmindex(obj, fh):
+    suffix_array = obj.suffix_array
+    dtype = '<u4' if len(obj) < 2 ** 32 else '<u8'
+    fh.write(_signature)
+    fh.write(_header.pack(len(obj), np.dtype(dtype).itemsize))
+    fh.write(obj.sequence._bytes.tobytes())
+    fh.write(suffix_array.astype(dtype).tobytes())
+
+
+def _read_exactly(fh, size):
+    data = fh.read(size)
+    if len(data) != size:
+        raise FMIndexFormatError(
+            "Reached end of file before reading the full index.")
+    return data
@@ -0,0 +1,229 @@
+"""
+MinHash sketch format (:mod:`skbio.io.format.minhash`)
+======================================================
+
+.. currentmodule:: skbio.io.format.minhash
+
+The MinHash sketch format (``minhash``) stores one or more
+``skbio.sequence.MinHashSketch`` objects as plain text, so that sequences only
+need to be sketched once and their sketches can be compared many times (e.g.,
+when clustering genomes).
+
+Format Support
+--------------
+**Has Sniffer: Yes**
+
++------+------+---------------------------------------------------------------+
+|Reader|Writer|                          Object Class                         |
++======+======+===============================================================+
+|Yes   |Yes   |generator of :mod:`skbio.sequence.MinHashSketch` objects       |
++------+------+---------------------------------------------------------------+
+|Yes   |Yes   |:mod:`skbio.sequence.MinHashSketch`                            |
++------+------+---------------------------------------------------------------+
+
+Format Specification
+--------------------
+The first line of the file must be ``#minhash``. Each sketch is stored in two
+lines. The first line starts with ``@``, followed by the sketch ID (empty if
+the sketch does not have an ID) and the sketch parameters, separated by tabs::
+
+    @<id><tab>k=<k><tab>num_hashes=<n><tab>seed=<seed><tab>canonical=<bool>
+
+where ``<bool>`` is ``True`` or ``False``.
+The second line contains the sketch's hash values as decimal integers in
+ascending order, separated by single spaces. It is empty if the sketch does not
+contain any hash values.
+
+For example, a file containing two sketches might look like::
+
+    #minhash
+    @genome1	k=21	num_hashes=4	seed=42	canonical=True
+    1283 83921 129918 938192
+    @genome2	k=21	num_hashes=4	seed=42	canonical=True
+    83921 201383 332120 938192
+
+Blank lines between sketches are ignored.
+
+Format Parameters
+-----------------
+The ``MinHashSketch`` reader accepts a ``sketch_num`` parameter (default 1),
+specifying which sketch in the file to read.
+
+Examples
+--------
+Sketch two sequences and write the sketches to a file:
+
+>>> from io import StringIO
+>>> import skbio.io
+>>> from skbio import DNA
+>>> from skbio.sequence import MinHashSketch
+>>> sketches = [
+...     MinHashSketch.from_sequence(DNA('ACGTTGCA', metadata={'id': 'a'}),
+...                                 k=4, num_hashes=3),
+...     MinHashSketch.from_sequence(DNA('ACGTACGG', metadata={'id': 'b'}),
+...                                 k=4, num_hashes=3)]
+>>> fh = StringIO()
+>>> print(skbio.io.write((s for s in sketches), format='minhash',
+...                      into=fh).getvalue())
+... # doctest: +NORMALIZE_WHITESPACE +ELLIPSIS
+#minhash
+@a	k=4	num_hashes=3	seed=42	canonical=True
+... ... ...
+@b	k=4	num_hashes=3	seed=42	canonical=True
+... ... ...
+<BLANKLINE>
+
+Read the sketches back:
+
+>>> _ = fh.seek(0)
+>>> [s.id for s in skbio.io.read(fh, format='minhash')]
+['a', 'b']
+>>> _ = fh.seek(0)
+>>> MinHashSketch.read(fh, sketch_num=2) == sketches[1]
+True
+
+"""
+
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+import numpy as np
+
+from skbio.io import create_format, MinHashFormatError
+from skbio.util._misc import cardinal_to_ordinal
+from skbio.sequence import MinHashSketch
+
+
+minhash = create_format('minhash')
+
+_signature = '#minhash'
+_parameters = ('k', 'num_hashes', 'seed', 'canonical')
+
+
+@minhash.sniffer()
+def _minhash_sniffer(fh):
+    try:
+        next(_parse_sketches(fh), None)
+    except MinHashFormatError:
+        return False, {}
+    return True, {}
+
+
+@minhash.reader(None)
+def _minhash_to_generator(fh):
+    yield from _parse_sketches(fh)
+
+
+@minhash.reader(MinHashSketch)
+def _minhash_to_minhash_sketch(fh, sketch_num=1):
+    if sketch_num < 1:
+        raise ValueError("Invalid sketch number (`sketch_num`=%r). "
+                         "`sketch_num` must be between 1 and the number of "
+                         "sketches in the file." % (sketch_num,))
+    for i, sketch in enumerate(_parse_sketches(fh), start=1):
+        if i == sketch_num:
+            return sketch
+    raise ValueError("Reached end of file before finding the %s sketch."
+                     % cardinal_to_ordinal(sketch_num))
+
+
+@minhash.writer(None)
+def _generator_to_minhash(obj, fh):
+    fh.write(_signature)
+    fh.write('\n')
+    for sketch in obj:
+        id_ = '' if sketch.id is None else sketch.id
+        if '\n' in id_ or '\t' in id_:
+            raise MinHashFormatError(
+                "Sketch IDs cannot contain tabs or newlines: %r" % id_)
+        fh.write('@%s\tk=%d\tnum_hashes=%d\tseed=%d\tcanonical=%r\n'
+                 % (id_, sketch.k, sketch.num_hashes, sketch.seed,
+                    sketch.canonical))
+        fh.write(str(sketch))
+        fh.write('\n')
+
+
+@minhash.writer(MinHashSketch)
+def _minhash_sketch_to_minhash(obj, fh):
+    _generator_to_minhash([obj], fh)
+
+
+def _parse_sketches(fh):
+    lines = (line.rstrip('\n') for line in fh)
+    for line in lines:
+        if line.strip():
+            if line != _signature:
+                raise MinHashFormatError(
+                    "File must start with a %r line." % _signature)
+            break
+    else:
+        raise MinHashFormatError(
+            "File must start with a %r line." % _signature)
+
+    for header in lines:
+        if not header.strip():
+            continue
+        id_, k, num_hashes, seed, canonical = _parse_header(header)
+
+        hashes = next(lines, None)
+        if hashes is None:
+            raise MinHashFormatError(
+                "Found sketch header line without a line of hash values: %r"
+                % header)
+        try:
+            hashes = [int(h) for h in hashes.split()]
+            if hashes and min(hashes) < 0:
+                raise ValueError
+            hashes = np.asarray(hashes, dtype=np.uint64)
+        except (ValueError, OverflowError):
+            raise MinHashFormatError(
+                "Hash values of sketch %r must be non-negative 64-bit "
+                "integers." % id_)
+        if (hashes[1:] <= hashes[:-1]).any() or len(hashes) > num_hashes:
+            raise MinHashFormatError(
+                "Sketch %r must contain at most %d distinct hash values in "
+                "ascending order." % (id_, num_hashes))
+
+        try:
+            sketch = MinHashSketch(hashes, k, num_hashes=num_hashes,
+                                   seed=seed, canonical=canonical, id=id_)
+        except ValueError as e:
+            raise MinHashFormatError(str(e))
+        yield sketch
+
+
+def _parse_header(header):
+    if not header.startswith('@'):
+        raise MinHashFormatError(
+            "Sketch header line must start with '@': %r" % header)
+    fields = header[1:].split('\t')
+    if len(fields) != len(_parameters) + 1:
+        raise MinHashFormatError(
+            "Sketch header line must contain an ID followed by %d "
+            "parameters: %r" % (len(_parameters), header))
+
+    values = []
+    for name, field in zip(_parameters, fields[1:]):
+        key, sep, value = field.partition('=')
+        if key != name or not sep:
+            raise MinHashFormatError(
+                "Expected %r parameter in sketch header line: %r"
+                % (name, header))
+        values.append(value)
+
+    *numbers, canonical = values
+    try:
+        k, num_hashes, seed = (int(number) for number in numbers)
+    except ValueError:
+        raise MinHashFormatError(
+            "`k`, `num_hashes`, and `seed` must be integers: %r" % header)
+    if canonical not in {'True', 'False'}:
+        raise MinHashFormatError(
+            "`canonical` must be True or False, not %r." % canonical)
+    id_ = fields[0] if fields[0] else None
+    return id_, k, num_hashes, seed, canonical == 'True'
@@ -73,6 +73,10 @@ Generators Only
 ^^^^^^^^^^^^^^^
 - ``filter``: If `True`, excludes sequences that did not pass filtering
   (i.e., filter field is 0). Default is `True`.
+- ``constructor``: can also be ``skbio.io.SequenceRecord`` to yield the raw
+  ID, sequence, and quality scores of each record without constructing a
+  sequence object. The description of these records is always empty, and the
+  other fields of the record are only available through the ID.
 
 Examples
 --------
@@ -158,8 +162,9 @@ References
 # The full license is in the file COPYING.txt, distributed with this software.
 # ----------------------------------------------------------------------------
 
-from skbio.io import create_format, QSeqFormatError
-from skbio.io.format._base import _decode_qual_to_phred, _get_nth_sequence
+from skbio.io import create_format, QSeqFormatError, SequenceRecord
+from skbio.io.format._base import (
+    _decode_qual_to_phred, _get_nth_sequence, _check_sequence_record_kwargs)
 from skbio.sequence import Sequence, DNA, RNA, Protein
 
 _default_phred_offset = None
@@ -185,6 +190,9 @@ def _qseq_sniffer(fh):
 def _qseq_to_generator(fh, constructor=Sequence, filter=_will_filter,
                        phred_offset=_default_phred_offset,
                        variant=_default_variant, **kwargs):
+    raw = constructor is SequenceRecord
+    if raw:
+        _check_sequence_record_kwargs(kwargs)
     for line in fh:
         (machine_name, run, lane, tile, x, y, index, read, seq, raw_qual,
          filtered) = _record_parser(line)
@@ -192,6 +200,9 @@ def _qseq_to_generator(fh, constructor=Sequence, filter=_will_filter,
             phred = _decode_qual_to_phred(raw_qual, variant, phred_offset)
             seq_id = '%s_%s:%s:%s:%s:%s#%s/%s' % (
                 machine_name, run, lane, tile, x, y, index, read)
+            if raw:
+                yield SequenceRecord(seq_id, '', seq, phred)
+                continue
             yield constructor(seq, metadata={'id': seq_id,
                                              'machine_name': machine_name,
                                              'run_number': int(run),
@@ -7,15 +7,18 @@
 # ----------------------------------------------------------------------------
 
 import unittest
+from unittest import mock
 
 import numpy.testing as npt
 import numpy as np
 
 from skbio import Sequence, DNA, RNA
+from skbio.io import SequenceRecord
 from skbio.io.format._base import (_decode_qual_to_phred,
                                    _encode_phred_to_qual, _get_nth_sequence,
                                    _parse_fasta_like_header,
-                                   _format_fasta_like_records)
+                                   _format_fasta_like_records,
+                                   _records_to_sequences)
 
 
 class PhredDecoderTests(unittest.TestCase):
@@ -48,6 +51,17 @@ class PhredDecoderTests(unittest.TestCase):
         npt.assert_equal(_decode_qual_to_phred('', variant='sanger'),
                          np.array([], dtype=np.uint8))
 
+    def test_non_finite_phred_scores(self):
+        for scores in ([30, 30, np.nan], np.array([30, np.inf, 30])):
+            with self.assertRaisesRegex(TypeError, 'finite'):
+                _encode_phred_to_qual(scores, variant='sanger')
+
+    def test_non_integer_phred_scores(self):
+        for scores in ([30.7, 2.2, 40.9], np.array([30.0, 2.0, 40.0]),
+                       ['30', '2', '40'], [30, None, 40]):
+            with self.assertRaisesRegex(TypeError, 'integers'):
+                _encode_phred_to_qual(scores, variant='sanger')
+
     def test_sanger_variant(self):
         # test entire range of possible ascii chars for sanger
         all_sanger_ascii = ('!"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOP'
@@ -132,6 +146,17 @@ class PhredEncoderTests(unittest.TestCase):
     def test_no_phred_scores(self):
         self.assertEqual(_encode_phred_to_qual([], variant='sanger'), '')
 
+    def test_non_finite_phred_scores(self):
+        for scores in ([30, 30, np.nan], np.array([30, np.inf, 30])):
+            with self.assertRaisesRegex(TypeError, 'finite'):
+                _encode_phred_to_qual(scores, variant='sanger')
+
+    def test_non_integer_phred_scores(self):
+        for scores in ([30.7, 2.2, 40.9], np.array([30.0, 2.0, 40.0]),
+                       ['30', '2', '40'], [30, None, 40]):
+            with self.assertRaisesRegex(TypeError, 'integers'):
+                _encode_phred_to_qual(scores, variant='sanger')
+
     def test_sanger_variant(self):
         # test entire range of possible ascii chars for sanger
         all_sanger_ascii = ('!"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOP'
@@ -320,6 +345,113 @@ class TestFormatFASTALikeRecords(unittest.TestCase):
             list(_format_fasta_like_records(missing_qual_gen(), '-', '-',
                                             True))
 
+    def test_sequence_records(self):
+        def mixed_gen():
+            yield SequenceRecord('a b', 'x\ny', 'ACgt', np.arange(4))
+            yield DNA('GG', metadata={'id': 'c'})
+            yield SequenceRecord(None, None, b'NNN', None)
+
+        obs = list(_format_fasta_like_records(mixed_gen(), '_', ' ', False))
+        exp = [('a_b x y', 'ACgt', np.arange(4)), ('c', 'GG', None),
+               ('', 'NNN', None)]
+        self.assertEqual(len(obs), len(exp))
+        for o, e in zip(obs, exp):
+            npt.assert_equal(o, e)
+
+    def test_sequence_records_invalid(self):
+        for records, kwargs, error_type, regex in (
+                ([SequenceRecord('a', '', 'A', None),
+                  SequenceRecord('b', '', '', None)], {},
+                 ValueError, '2nd.*empty'),
+                ([SequenceRecord('a', '', 'A', None)],
+                 {'require_qual': True}, ValueError, '1st.*quality scores'),
+                ([SequenceRecord('a', '', 'AC', np.arange(3))], {},
+                 ValueError, r'quality scores \(3\).*\(2\).*\'a\''),
+                ([SequenceRecord('a', '', 'AC', None)],
+                 {'lowercase': 'lower'}, TypeError, '`lowercase`')):
+            with self.assertRaisesRegex(error_type, regex):
+                list(_format_fasta_like_records(
+                    iter(records), None, None,
+                    kwargs.get('require_qual', False),
+                    lowercase=kwargs.get('lowercase')))
+
+
+class TestRecordsToSequences(unittest.TestCase):
+    def setUp(self):
+        self.records = [('ACgt', 'a', 'x', None), ('', 'b', '', None),
+                        ('nNAC', 'c', 'y', None), ('T', 'd', '', None)]
+
+    def assert_sequences_equal(self, obs, exp):
+        self.assertEqual(len(obs), len(exp))
+        for o, e in zip(obs, exp):
+            self.assertIs(type(o), type(e))
+            self.assertEqual(o, e)
+
+    def test_matches_constructor(self):
+        for constructor, kwargs in ((DNA, {'lowercase': True}),
+                                    (DNA, {'lowercase': 'lower'}),
+                                    (RNA, {'validate': False}),
+                                    (Sequence, {}),
+                                    (Sequence, {'lowercase': True})):
+            exp = [constructor(seq, metadata={'id': id_, 'description': d},
+                               **kwargs) for seq, id_, d, _ in self.records]
+            for block_size in 1, 5, 2 ** 16:
+                with mock.patch('skbio.io.format._base._validation_block_size',
+                                block_size):
+                    obs = list(_records_to_sequences(self.records,
+                                                     constructor, **kwargs))
+                self.assert_sequences_equal(obs, exp)
+
+    def test_quality(self):
+        records = [('AC', 'a', '', np.array([1, 2], dtype=np.uint8)),
+                   ('G', 'b', '', np.array([3], dtype=np.uint8))]
+        obs = list(_records_to_sequences(records, DNA))
+        npt.assert_array_equal(obs[0].positional_metadata['quality'], [1, 2])
+        npt.assert_array_equal(obs[1].positional_metadata['quality'], [3])
+
+    def test_sequence_record(self):
+        records = [('AC', 'a', 'x', np.array([1, 2], dtype=np.uint8)),
+                   ('G', 'b', '', None)]
+        obs = list(_records_to_sequences(iter(records), SequenceRecord))
+        self.assertTrue(all(type(o) is SequenceRecord for o in obs))
+        self.assertEqual([o[:3] for o in obs], [('a', 'x', 'AC'),
+                                                ('b', '', 'G')])
+        npt.assert_array_equal(obs[0].quality, [1, 2])
+        self.assertIsNone(obs[1].quality)
+
+        with self.assertRaisesRegex(TypeError, "'lowercase', 'validate'"):
+            list(_records_to_sequences(records, SequenceRecord,
+                                       validate=False, lowercase=True))
+
+    def test_invalid_characters(self):
+        records = [('ACGT', 'a', '', None), ('AC', 'b', '', None),
+                   ('ACQT', 'c', '', None), ('T', 'd', '', None)]
+        for block_size in 1, 2 ** 16:
+            with mock.patch('skbio.io.format._base._validation_block_size',
+                            block_size):
+                # records before the invalid record are still yielded
+                gen = _records_to_sequences(records, DNA)
+                self.assertEqual([str(next(gen)), str(next(gen))],
+                                 ['ACGT', 'AC'])
+                with self.assertRaisesRegex(ValueError, "'Q'"):
+                    next(gen)
+
+    def test_parse_error(self):
+        def records():
+            yield ('ACGT', 'a', '', None)
+            yield ('AC', 'b', '', None)
+            raise ValueError('malformed record')
+
+        for block_size in 1, 2 ** 16:
+            with mock.patch('skbio.io.format._base._validation_block_size',
+                            block_size):
+                # records read before the parse error are still yielded
+                gen = _records_to_sequences(records(), DNA)
+                self.assertEqual([str(next(gen)), str(next(gen))],
+                                 ['ACGT', 'AC'])
+                with self.assertRaisesRegex(ValueError, 'malformed'):
+                    next(gen)
+
 
 if __name__ == '__main__':
     unittest.main()
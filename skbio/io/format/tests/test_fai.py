@@ -0,0 +1,79 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+import io
+from unittest import TestCase, main
+
+import skbio.io
+from skbio.io import FASTAIndex, FAIFormatError
+from skbio.io.format.fai import (
+    _fai_sniffer, _fai_to_fasta_index, _fasta_index_to_fai)
+from skbio.util import get_data_path
+
+
+class FAITests(TestCase):
+    def setUp(self):
+        self.fp = get_data_path('fai_indexed')
+        self.index = FASTAIndex(['chr1', 'chr2', 'plasmid_1', 'empty'],
+                                [22, 10, 8, 0], [23, 54, 85, 102],
+                                [10, 10, 5, 0], [11, 11, 6, 0])
+        with open(self.fp) as f:
+            self.data = f.read()
+
+    def test_sniffer(self):
+        self.assertEqual(_fai_sniffer(self.fp), (True, {}))
+        self.assertEqual(skbio.io.sniff(self.fp)[0], 'fai')
+
+        for fp in (get_data_path('empty'), get_data_path('fasta_10_seqs'),
+                   get_data_path('minhash_multi_sketch')):
+            self.assertEqual(_fai_sniffer(fp), (False, {}))
+        self.assertEqual(_fai_sniffer(io.StringIO('chr1\t10\t6\t10\n')),
+                         (False, {}))
+
+    def test_fai_to_fasta_index(self):
+        obs = _fai_to_fasta_index(self.fp)
+        self.assertEqual(obs, self.index)
+        self.assertEqual(FASTAIndex.read(self.fp), self.index)
+        self.assertEqual(_fai_to_fasta_index(io.StringIO('')),
+                         FASTAIndex([], [], [], [], []))
+
+    def test_fasta_index_to_fai(self):
+        fh = io.StringIO()
+        _fasta_index_to_fai(self.index, fh)
+        self.assertEqual(fh.getvalue(), self.data)
+
+        fh = io.StringIO()
+        self.index.write(fh)
+        self.assertEqual(fh.getvalue(), self.data)
+
+    def test_roundtrip_from_fasta(self):
+        index = FASTAIndex.from_fasta(io.BytesIO(
+            b'>chr1 first chromosome\nACGTACGTAC\nGGGTTTAAAC\nTT\n'
+            b'>chr2\nAAACCCGGGT\n>plasmid_1 circular\nacgtN\nNNN\n'
+            b'>empty\n'))
+        self.assertEqual(index, self.index)
+        fh = io.StringIO()
+        index.write(fh)
+        fh.seek(0)
+        self.assertEqual(FASTAIndex.read(fh), index)
+
+    def test_invalid_files(self):
+        for data, error in [
+                ('chr1\t10\t6\t10\n', '5 tab-separated fields, not 4'),
+                ('chr1\t10\t6\t10\t11\t30\n', 'fields, not 6'),
+                ('chr1\t10\t6\t10\t11\n\n', 'fields, not 1'),
+                ('chr1\t10\tsix\t10\t11\n', 'integers'),
+                ('chr1\t10\t6\t10\t11\nchr1\t5\t23\t5\t6\n', 'unique'),
+                ('chr1\t10\t-6\t10\t11\n', 'negative'),
+                ('chr1\t10\t6\t10\t9\n', 'at least one character')]:
+            with self.assertRaisesRegex(FAIFormatError, error):
+                _fai_to_fasta_index(io.StringIO(data))
+
+
+if __name__ == '__main__':
+    main()
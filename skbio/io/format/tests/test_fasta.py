@@ -13,16 +13,18 @@ from unittest import TestCase, main
 from functools import partial
 
 import numpy as np
+import numpy.testing as npt
 
 from skbio import Sequence, DNA, RNA, Protein, TabularMSA
-from skbio.io import FASTAFormatError, QUALFormatError
+from skbio.io import FASTAFormatError, QUALFormatError, SequenceRecord
 from skbio.io.format.fasta import (
     _fasta_sniffer, _fasta_to_generator, _fasta_to_sequence,
     _fasta_to_dna, _fasta_to_rna, _fasta_to_protein,
     _fasta_to_tabular_msa, _generator_to_fasta,
     _sequence_to_fasta, _dna_to_fasta, _rna_to_fasta, _protein_to_fasta,
-    _tabular_msa_to_fasta)
-from skbio.sequence import GrammaredSequence
+    _tabular_msa_to_fasta, _fasta_to_sequence_batch,
+    _sequence_batch_to_fasta)
+from skbio.sequence import GrammaredSequence, SequenceBatch
 from skbio.util import get_data_path
 from skbio.util import classproperty
 from skbio.util._decorator import overrides
@@ -494,6 +496,85 @@ class ReaderTests(TestCase):
             with self.assertRaisesRegex(error_type, error_msg_regex):
                 list(_fasta_to_generator(fp, **kwargs))
 
+    def test_fasta_to_generator_malformed_later_record(self):
+        # records before a malformed record are yielded before the error
+        data = '>a\nACGT\n>b\n>c\nAC\n'
+        gen = _fasta_to_generator(io.StringIO(data), constructor=DNA)
+        self.assertEqual(next(gen), DNA('ACGT', metadata={
+            'id': 'a', 'description': ''}))
+        with self.assertRaisesRegex(FASTAFormatError, 'without sequence'):
+            next(gen)
+
+        obs = _fasta_to_dna(io.StringIO(data), seq_num=1)
+        self.assertEqual(str(obs), 'ACGT')
+
+    def test_fasta_to_generator_block_size(self):
+        test_cases = (self.empty, self.single, self.multi,
+                      self.odd_labels_different_type,
+                      self.tabular_msa_different_type,
+                      self.lowercase_seqs)
+
+        # records are split across blocks for small block sizes, and read line
+        # by line for `block_size=None`
+        for block_size in None, 1, 2, 7:
+            for exp, kwargs, fasta_fps, _ in test_cases:
+                for fasta_fp in fasta_fps:
+                    obs = list(_fasta_to_generator(
+                        fasta_fp, block_size=block_size, **kwargs))
+                    self.assertEqual(len(obs), len(exp))
+                    for o, e in zip(obs, exp):
+                        e = copy.copy(e)
+                        del e.positional_metadata['quality']
+                        self.assertEqual(o, e)
+
+            for fp, kwargs, error_type, error_msg_regex in self.invalid_fps:
+                with self.assertRaisesRegex(error_type, error_msg_regex):
+                    list(_fasta_to_generator(fp, block_size=block_size,
+                                             **kwargs))
+
+    def test_fasta_to_generator_block_size_unusual_whitespace(self):
+        # records with whitespace within lines are parsed line by line
+        fasta = ('  \n>s1 d1\nAC \n GT\n>s2\r\nA\tC\r\n\n\n> s3 \nA\nCG\n'
+                 '>s4\nAC  GT\n')
+        exp = list(_fasta_to_generator(io.StringIO(fasta), block_size=None))
+        self.assertEqual([str(seq) for seq in exp],
+                         ['ACGT', 'A\tC', 'ACG', 'AC  GT'])
+        for block_size in 1, 3, 1000:
+            obs = list(_fasta_to_generator(io.StringIO(fasta),
+                                           block_size=block_size))
+            self.assertEqual(obs, exp)
+
+    def test_fasta_to_generator_sequence_record(self):
+        for exp, _, fasta_fps, qual_fps in (self.empty, self.single,
+                                            self.multi):
+            exp_fields = [(e.metadata['id'], e.metadata['description'],
+                           str(e)) for e in exp]
+            for fasta_fp in fasta_fps:
+                obs = list(_fasta_to_generator(fasta_fp,
+                                               constructor=SequenceRecord))
+                self.assertTrue(all(type(o) is SequenceRecord for o in obs))
+                self.assertEqual([o[:3] for o in obs], exp_fields)
+                self.assertTrue(all(o.quality is None for o in obs))
+
+                for qual_fp in qual_fps:
+                    obs = list(_fasta_to_generator(
+                        fasta_fp, qual=qual_fp, constructor=SequenceRecord))
+                    self.assertEqual([o[:3] for o in obs], exp_fields)
+                    for o, e in zip(obs, exp):
+                        npt.assert_array_equal(
+                            o.quality, e.positional_metadata['quality'])
+
+        with self.assertRaisesRegex(TypeError, "'lowercase'"):
+            list(_fasta_to_generator(get_data_path('fasta_single_seq'),
+                                     constructor=SequenceRecord,
+                                     lowercase=True))
+
+    def test_fasta_to_generator_invalid_block_size(self):
+        for block_size in 0, -1:
+            with self.assertRaisesRegex(ValueError, '`block_size`.*0'):
+                list(_fasta_to_generator(io.StringIO('>s1\nACGT\n'),
+                                         block_size=block_size))
+
     # light testing of fasta -> object readers to ensure interface is present
     # and kwargs are passed through. extensive testing of underlying reader is
     # performed above
@@ -870,6 +951,25 @@ class WriterTests(TestCase):
                 self.assertEqual(obs_fasta, exp_fasta)
                 self.assertEqual(obs_qual, exp_qual)
 
+    def test_generator_to_fasta_sequence_records(self):
+        # records are written like sequences with the same fields
+        seqs = [self.bio_seq1, self.bio_seq2, self.bio_seq3]
+        records = [SequenceRecord(seq.metadata.get('id', ''),
+                                  seq.metadata.get('description', ''),
+                                  str(seq),
+                                  seq.positional_metadata['quality'].values)
+                   for seq in seqs]
+        for kwargs in ({}, {'max_width': 3, 'id_whitespace_replacement': '-',
+                            'description_newline_replacement': None}):
+            obs_fasta, obs_qual = io.StringIO(), io.StringIO()
+            _generator_to_fasta(iter(records), obs_fasta, qual=obs_qual,
+                                **kwargs)
+            exp_fasta, exp_qual = io.StringIO(), io.StringIO()
+            _generator_to_fasta(iter(seqs), exp_fasta, qual=exp_qual,
+                                **kwargs)
+            self.assertEqual(obs_fasta.getvalue(), exp_fasta.getvalue())
+            self.assertEqual(obs_qual.getvalue(), exp_qual.getvalue())
+
     def test_generator_to_fasta_invalid_input(self):
         for obj, kwargs, error_type, error_msg_regexp in self.invalid_objs:
             fh = io.StringIO()
@@ -1071,5 +1171,57 @@ class RoundtripTests(TestCase):
                 self.assertEqual(obj1, obj2)
 
 
+class SequenceBatchTests(TestCase):
+    def test_read_matches_generator(self):
+        for fasta_fp, qual_fp, constructor in (
+                ('fasta_multi_seq', None, Sequence),
+                ('fasta_multi_seq', 'qual_multi_seq', Sequence),
+                ('fasta_tabular_msa_different_type', None, RNA)):
+            fasta_fp = get_data_path(fasta_fp)
+            if qual_fp is not None:
+                qual_fp = get_data_path(qual_fp)
+            kwargs = {'lowercase': True} if constructor is RNA else {}
+
+            obs = _fasta_to_sequence_batch(fasta_fp, qual=qual_fp,
+                                           constructor=constructor, **kwargs)
+            exp = list(_fasta_to_generator(fasta_fp, qual=qual_fp,
+                                           constructor=constructor, **kwargs))
+
+            self.assertIsInstance(obs, SequenceBatch)
+            self.assertIs(obs.dtype, constructor)
+            self.assertEqual(list(obs), exp)
+
+    def test_read_empty(self):
+        obs = _fasta_to_sequence_batch(get_data_path('empty'), qual=None,
+                                       constructor=DNA)
+        self.assertEqual(len(obs), 0)
+        self.assertIs(obs.dtype, DNA)
+
+    def test_read_invalid_characters(self):
+        with self.assertRaisesRegex(ValueError, 'Invalid character'):
+            _fasta_to_sequence_batch(get_data_path('fasta_multi_seq'),
+                                     qual=None, constructor=DNA)
+
+    def test_read_qual_length_mismatch(self):
+        fasta_fh = io.StringIO('>a\nACGT\n')
+        qual_fh = io.StringIO('>a\n1 2 3\n')
+        with self.assertRaisesRegex(ValueError, 'quality scores'):
+            _fasta_to_sequence_batch(fasta_fh, qual=qual_fh)
+
+    def test_roundtrip(self):
+        fasta_fp = get_data_path('fasta_multi_seq')
+        qual_fp = get_data_path('qual_multi_seq')
+        obj1 = _fasta_to_sequence_batch(fasta_fp, qual=qual_fp)
+
+        fasta_fh = io.StringIO()
+        qual_fh = io.StringIO()
+        _sequence_batch_to_fasta(obj1, fasta_fh, qual=qual_fh)
+        fasta_fh.seek(0)
+        qual_fh.seek(0)
+        obj2 = _fasta_to_sequence_batch(fasta_fh, qual=qual_fh)
+
+        self.assertEqual(obj1, obj2)
+
+
 if __name__ == '__main__':
     main()
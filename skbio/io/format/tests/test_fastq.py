@@ -13,11 +13,12 @@ import warnings
 from functools import partial
 
 from skbio import read, write, Sequence, DNA, RNA, Protein, TabularMSA
-from skbio.io import FASTQFormatError
+from skbio.io import FASTQFormatError, SequenceRecord
 from skbio.io.format.fastq import (
     _fastq_sniffer, _fastq_to_generator, _fastq_to_tabular_msa,
-    _generator_to_fastq, _tabular_msa_to_fastq)
-from skbio.sequence import GrammaredSequence
+    _generator_to_fastq, _tabular_msa_to_fastq, _fastq_to_sequence_batch,
+    _sequence_batch_to_fastq)
+from skbio.sequence import GrammaredSequence, SequenceBatch
 from skbio.util import get_data_path
 from skbio.util import classproperty
 from skbio.util._decorator import overrides
@@ -331,6 +332,22 @@ class TestReaders(unittest.TestCase):
                 with self.assertRaisesRegex(error_type, error_msg_regex):
                     list(_fastq_to_generator(fp, phred_offset=offset))
 
+    def test_fastq_to_generator_malformed_later_record(self):
+        # records before a malformed record are yielded before the error
+        data = '@a\nACGT\n+\nIIII\n@b\nAC\n+\nI\n'
+        gen = _fastq_to_generator(io.StringIO(data), variant='sanger',
+                                  constructor=DNA)
+        self.assertEqual(str(next(gen)), 'ACGT')
+        with self.assertRaisesRegex(FASTQFormatError, 'truncated'):
+            next(gen)
+
+        obs = read(io.StringIO(data), format='fastq', variant='sanger',
+                   into=DNA, seq_num=1)
+        self.assertEqual(str(obs), 'ACGT')
+        gen = read(io.StringIO(data), format='fastq', variant='sanger',
+                   constructor=DNA)
+        self.assertEqual(str(next(gen)), 'ACGT')
+
     def test_fastq_to_generator_invalid_files_illumina(self):
         # files that should be invalid for illumina1.3 and illumina1.8 variants
         fps = [get_data_path(fp) for fp in
@@ -343,6 +360,75 @@ class TestReaders(unittest.TestCase):
             with self.assertRaisesRegex(ValueError, 'out of range \[0, 62\]'):
                 list(_fastq_to_generator(fp, variant='illumina1.8'))
 
+    def test_fastq_to_generator_block_size(self):
+        # records are split across blocks for small block sizes, and read line
+        # by line for `block_size=None`
+        for valid_files, kwargs, _ in self.valid_configurations:
+            for valid in valid_files:
+                for observed_kwargs in kwargs:
+                    _drop_kwargs(observed_kwargs, 'seq_num')
+                    observed_kwargs['lowercase'] = 'introns'
+                    expected = list(_fastq_to_generator(
+                        valid, block_size=None, **observed_kwargs))
+                    for block_size in 1, 7, 100:
+                        observed = list(_fastq_to_generator(
+                            valid, block_size=block_size, **observed_kwargs))
+                        self.assertEqual(observed, expected)
+
+        for fp, error_type, error_msg_regex in self.invalid_files:
+            for block_size in None, 1, 7, 100:
+                with self.assertRaisesRegex(error_type, error_msg_regex):
+                    list(_fastq_to_generator(fp, variant='sanger',
+                                             block_size=block_size))
+
+    def test_fastq_to_generator_block_size_mixed_layouts(self):
+        # four-line records before and after records that are parsed line by
+        # line, followed by an invalid record
+        fastq = ('@r1 d1\nACGT\n+\nIIII\n@r2\nAC\nGT\n+r2\nII\nI#\n'
+                 '@r3\nAAC\n+r3\nIII\n\n@r4\nG\n+\n!\n@r5\nAC\n+\nI\x7f\n')
+        expected = [('r1', 'ACGT', [40, 40, 40, 40]),
+                    ('r2', 'ACGT', [40, 40, 40, 2]),
+                    ('r3', 'AAC', [40, 40, 40]),
+                    ('r4', 'G', [0])]
+        for block_size in None, 1, 5, 1000:
+            observed = []
+            with self.assertRaisesRegex(ValueError, 'out of range'):
+                for seq in _fastq_to_generator(io.StringIO(fastq),
+                                               variant='sanger',
+                                               block_size=block_size):
+                    observed.append((seq.metadata['id'], str(seq),
+                                     seq.positional_metadata['quality']
+                                     .tolist()))
+            self.assertEqual(observed, expected)
+
+    def test_fastq_to_generator_invalid_block_size(self):
+        for block_size in 0, -1:
+            with self.assertRaisesRegex(ValueError, '`block_size`.*0'):
+                list(_fastq_to_generator(io.StringIO('@r1\nA\n+\nI\n'),
+                                         variant='sanger',
+                                         block_size=block_size))
+
+    def test_fastq_to_generator_sequence_record(self):
+        for valid_files, kwargs, components in self.valid_configurations:
+            for valid in valid_files:
+                for observed_kwargs in kwargs:
+                    _drop_kwargs(observed_kwargs, 'seq_num', 'constructor')
+                    for block_size in None, 7:
+                        observed = list(_fastq_to_generator(
+                            valid, constructor=SequenceRecord,
+                            block_size=block_size, **observed_kwargs))
+                        self.assertEqual(len(observed), len(components))
+                        for o, c in zip(observed, components):
+                            self.assertIsInstance(o, SequenceRecord)
+                            self.assertEqual(o[:3], c[:3])
+                            self.assertEqual(o.quality.dtype, np.uint8)
+                            np.testing.assert_array_equal(o.quality, c[3])
+
+        with self.assertRaisesRegex(TypeError, "'lowercase'"):
+            list(_fastq_to_generator(
+                get_data_path('fastq_multi_seq_sanger'), variant='sanger',
+                constructor=SequenceRecord, lowercase='introns'))
+
     def test_fastq_to_generator_solexa(self):
         # solexa support isn't implemented yet. should raise error even with
         # valid solexa file
@@ -549,6 +635,43 @@ class TestWriters(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, '2nd.*quality scores'):
             _generator_to_fastq(gen(), io.StringIO(), variant='illumina1.8')
 
+    def test_generator_to_fastq_missing_qual(self):
+        # the quality scores of the second sequence are filled with NaN
+        seq = Sequence.concat([
+            Sequence('ACGT', positional_metadata={'quality': range(4)}),
+            Sequence('AC')], how='outer')
+        seq.metadata['id'] = 'foo'
+        with self.assertRaisesRegex(TypeError, 'finite'):
+            _generator_to_fastq(iter([seq]), io.StringIO(),
+                                variant='illumina1.8')
+
+    def test_generator_to_fastq_sequence_records(self):
+        for components, kwargs_expected_fp in self.valid_files:
+            for kwargs, expected_fp in kwargs_expected_fp:
+                records = (SequenceRecord(*c) for c in components)
+
+                fh = io.StringIO()
+                _generator_to_fastq(records, fh, **kwargs)
+                observed = fh.getvalue()
+                fh.close()
+
+                with io.open(expected_fp) as f:
+                    expected = f.read()
+
+                self.assertEqual(observed, expected)
+
+    def test_generator_to_fastq_sequence_records_invalid(self):
+        records = [SequenceRecord('foo', None, 'ACGT', [1, 2, 3, 4]),
+                   SequenceRecord('bar', None, 'ACG', None)]
+        with self.assertRaisesRegex(ValueError, '2nd.*quality scores'):
+            _generator_to_fastq(iter(records), io.StringIO(),
+                                variant='illumina1.8')
+
+        records[1] = SequenceRecord('bar', None, 'ACG', [1, 2])
+        with self.assertRaisesRegex(ValueError, r"\(2\).*\(3\).*'bar'"):
+            _generator_to_fastq(iter(records), io.StringIO(),
+                                variant='illumina1.8')
+
 
 class TestConversions(unittest.TestCase):
     def setUp(self):
@@ -669,5 +792,70 @@ class TestConversions(unittest.TestCase):
                 self.assertEqual(obs, exp)
 
 
+class TestSequenceBatch(unittest.TestCase):
+    def test_read_matches_generator(self):
+        fp = get_data_path('fastq_multi_seq_sanger')
+        obs = _fastq_to_sequence_batch(fp, variant='sanger', constructor=DNA)
+        exp = list(_fastq_to_generator(fp, variant='sanger',
+                                       constructor=DNA))
+
+        self.assertIsInstance(obs, SequenceBatch)
+        self.assertIs(obs.dtype, DNA)
+        self.assertEqual(list(obs), exp)
+        np.testing.assert_array_equal(obs.ids, ['foo', 'bar', 'baz'])
+
+    def test_read_block_size(self):
+        fp = get_data_path('fastq_multi_blank_between_records')
+        exp = _fastq_to_sequence_batch(fp, variant='sanger', block_size=None)
+        for block_size in 1, 10, 1000:
+            self.assertEqual(_fastq_to_sequence_batch(
+                fp, variant='sanger', block_size=block_size), exp)
+
+    def test_read_empty(self):
+        obs = _fastq_to_sequence_batch(get_data_path('empty'),
+                                       variant='sanger')
+        self.assertEqual(len(obs), 0)
+
+    def test_roundtrip(self):
+        fp = get_data_path('fastq_multi_seq_sanger')
+        obj1 = _fastq_to_sequence_batch(fp, variant='sanger')
+
+        fh = io.StringIO()
+        _sequence_batch_to_fastq(obj1, fh, variant='sanger')
+        fh.seek(0)
+        obj2 = _fastq_to_sequence_batch(fh, variant='sanger')
+
+        self.assertEqual(obj1, obj2)
+        with io.open(fp) as fh:
+            self.assertEqual(fh.read(), self._write(obj2))
+
+    def test_read_in_batches(self):
+        fp = get_data_path('fastq_multi_seq_sanger')
+        exp = _fastq_to_sequence_batch(fp, variant='sanger', constructor=DNA)
+        for batch_size, exp_sizes in ((1, [1, 1, 1]), (2, [2, 1]), (3, [3]),
+                                      (10, [3])):
+            obs = list(_fastq_to_generator(fp, variant='sanger',
+                                           constructor=DNA,
+                                           batch_size=batch_size))
+            self.assertTrue(all(isinstance(batch, SequenceBatch) and
+                                batch.dtype is DNA for batch in obs))
+            self.assertEqual([len(batch) for batch in obs], exp_sizes)
+            self.assertEqual([seq for batch in obs for seq in batch],
+                             list(exp))
+
+        obs = list(read(fp, format='fastq', variant='sanger', batch_size=2))
+        self.assertEqual([batch.dtype for batch in obs], [Sequence] * 2)
+        self.assertEqual(list(_fastq_to_generator(
+            get_data_path('empty'), variant='sanger', batch_size=2)), [])
+
+        with self.assertRaisesRegex(ValueError, '`batch_size`.*0'):
+            list(_fastq_to_generator(fp, variant='sanger', batch_size=0))
+
+    def _write(self, obj):
+        fh = io.StringIO()
+        write(obj, into=fh, format='fastq', variant='sanger')
+        return fh.getvalue()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,105 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+import io
+import struct
+from unittest import TestCase, main
+
+import numpy as np
+import numpy.testing as npt
+
+import skbio.io
+from skbio import Sequence, DNA
+from skbio.io import FMIndexFormatError
+from skbio.io.format.fmindex import (
+    _fmindex_sniffer, _fmindex_to_fm_index, _fm_index_to_fmindex)
+from skbio.sequence import FMIndex
+from skbio.util import get_data_path
+
+
+class FMIndexFormatTests(TestCase):
+    def setUp(self):
+        self.fp = get_data_path('fmindex_dna')
+        self.index = FMIndex(DNA('ACGTACGTTACG'))
+        with open(self.fp, 'rb') as f:
+            self.data = f.read()
+
+    def test_sniffer(self):
+        self.assertEqual(_fmindex_sniffer(self.fp), (True, {}))
+        self.assertEqual(skbio.io.sniff(self.fp)[0], 'fmindex')
+
+        for fp in (get_data_path('empty'), get_data_path('fasta_10_seqs'),
+                   get_data_path('minhash_multi_sketch')):
+            self.assertEqual(_fmindex_sniffer(fp), (False, {}))
+
+    def test_fmindex_to_fm_index(self):
+        obs = _fmindex_to_fm_index(self.fp)
+        self.assertEqual(obs, self.index)
+        self.assertIs(type(obs.sequence), Sequence)
+        npt.assert_array_equal(obs.suffix_array, self.index.suffix_array)
+        self.assertEqual(obs.count('ACG'), 3)
+
+        obs = FMIndex.read(self.fp, constructor=DNA)
+        self.assertIs(type(obs.sequence), DNA)
+        npt.assert_array_equal(obs.locate('TA'), [3, 8])
+
+    def test_fm_index_to_fmindex(self):
+        fh = io.BytesIO()
+        _fm_index_to_fmindex(self.index, fh)
+        self.assertEqual(fh.getvalue(), self.data)
+
+    def test_invalid_files(self):
+        header = b'\x89FMI\r\n\x1a\n' + struct.pack('<QB', 3, 4)
+        for data, error in [
+                (b'', 'start with'),
+                (b'>seq1\nACGT\n', 'start with'),
+                (b'#fmindex\n' + struct.pack('<QB', 3, 4), 'start with'),
+                (b'\x89FMI\r\n\x1a\n\x03', 'end of file'),
+                (b'\x89FMI\r\n\x1a\n' + struct.pack('<QB', 3, 2),
+                 '4 or 8 bytes'),
+                (header + b'AC', 'end of file'),
+                (header + b'ACG' + struct.pack('<2I', 0, 1), 'end of file'),
+                (header + b'ACG' + struct.pack('<3I', 0, 1, 2) + b'\n',
+                 'unexpected data'),
+                (header + b'ACG' + struct.pack('<3I', 0, 1, 1),
+                 'permutation'),
+                (header + b'ACG' + struct.pack('<3I', 0, 1, 3),
+                 'permutation')]:
+            with self.assertRaisesRegex(FMIndexFormatError, error):
+                _fmindex_to_fm_index(io.BytesIO(data))
+
+        # characters not allowed by the constructor
+        with self.assertRaisesRegex(FMIndexFormatError, 'Invalid character'):
+            _fmindex_to_fm_index(
+                io.BytesIO(header + b'AXG' + struct.pack('<3I', 0, 1, 2)),
+                constructor=DNA)
+
+    def test_roundtrip(self):
+        rng = np.random.RandomState(0)
+        for seq in (Sequence(''), Sequence('a'),
+                    DNA(rng.choice(list('ACGTN-'), 1000).astype('S1'))):
+            fh = io.BytesIO()
+            FMIndex(seq).write(fh)
+            fh.seek(0)
+            obs = FMIndex.read(fh, constructor=type(seq))
+            self.assertEqual(obs, FMIndex(seq))
+            self.assertEqual(obs.sequence, seq)
+            npt.assert_array_equal(obs.suffix_array, FMIndex(seq).suffix_array)
+
+    def test_roundtrip_sniffed(self):
+        # A sequence that could also be read as the rows of a text format.
+        for seq in Sequence('A' * 35), Sequence('1\t2\n'):
+            fh = io.BytesIO()
+            FMIndex(seq).write(fh)
+            fh.seek(0)
+            self.assertEqual(skbio.io.sniff(fh)[0], 'fmindex')
+            self.assertEqual(FMIndex.read(fh), FMIndex(seq))
+
+
+if __name__ == '__main__':
+    main()
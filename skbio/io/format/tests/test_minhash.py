@@ -0,0 +1,146 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+import io
+import warnings
+from unittest import TestCase, main
+
+import numpy as np
+
+import skbio.io
+from skbio.io import MinHashFormatError, FormatIdentificationWarning
+from skbio.io.format.minhash import (
+    _minhash_sniffer, _minhash_to_generator, _minhash_to_minhash_sketch,
+    _generator_to_minhash, _minhash_sketch_to_minhash)
+from skbio.sequence import MinHashSketch
+from skbio.util import get_data_path
+
+
+class MinHashTests(TestCase):
+    def setUp(self):
+        self.multi_fp = get_data_path('minhash_multi_sketch')
+        self.sketches = [
+            MinHashSketch([1283, 83921, 129918, 938192], 21, num_hashes=4,
+                          id='genome1'),
+            MinHashSketch([], 21, num_hashes=10, seed=7, canonical=False),
+            MinHashSketch([np.iinfo(np.uint64).max], 5, num_hashes=3,
+                          id='genome3')]
+
+        self.invalid = [
+            ('', 'start with'),
+            ('>seq1\nACGT\n', 'start with'),
+            ('#minhash\na\tk=4\tnum_hashes=2\tseed=42\tcanonical=True\n1\n',
+             "start with '@'"),
+            ('#minhash\n@a\tk=4\tnum_hashes=2\tseed=42\n1\n',
+             'ID followed by 4'),
+            ('#minhash\n@a\tk=4\tnum_hashes=2\tsed=42\tcanonical=True\n1\n',
+             "'seed' parameter"),
+            ('#minhash\n@a\tk=4\tnum_hashes=x\tseed=42\tcanonical=True\n1\n',
+             'must be integers'),
+            ('#minhash\n@a\tk=4\tnum_hashes=2\tseed=42\tcanonical=yes\n1\n',
+             'True or False'),
+            ('#minhash\n@a\tk=4\tnum_hashes=2\tseed=42\tcanonical=True\n',
+             'without a line of hash values'),
+            ('#minhash\n@a\tk=4\tnum_hashes=2\tseed=42\tcanonical=True\n-1\n',
+             'non-negative 64-bit'),
+            ('#minhash\n@a\tk=4\tnum_hashes=2\tseed=42\tcanonical=True\n'
+             '18446744073709551616\n', 'non-negative 64-bit'),
+            ('#minhash\n@a\tk=4\tnum_hashes=2\tseed=42\tcanonical=True\n'
+             '1 2 3\n', 'at most 2'),
+            (open(get_data_path('minhash_invalid_unsorted')).read(),
+             'ascending order')]
+        self.invalid_parameters = [
+            ('#minhash\n@a\tk=0\tnum_hashes=2\tseed=42\tcanonical=True\n1\n',
+             'k must be greater than 0'),
+            ('#minhash\n@a\tk=4\tnum_hashes=0\tseed=42\tcanonical=True\n\n',
+             '`num_hashes` must be greater than 0')]
+        self.invalid += self.invalid_parameters
+
+    def test_sniffer(self):
+        self.assertEqual(_minhash_sniffer(self.multi_fp), (True, {}))
+        self.assertEqual(_minhash_sniffer(io.StringIO('#minhash\n')),
+                         (True, {}))
+        self.assertEqual(skbio.io.sniff(self.multi_fp)[0], 'minhash')
+
+        for fp in (get_data_path('empty'), get_data_path('fasta_10_seqs'),
+                   get_data_path('minhash_invalid_unsorted')):
+            self.assertEqual(_minhash_sniffer(fp), (False, {}))
+
+    def test_sniffer_invalid_parameters(self):
+        # the sniffer doesn't fail and ask for the error to be reported
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', FormatIdentificationWarning)
+            for text, _ in self.invalid_parameters:
+                self.assertEqual(_minhash_sniffer(io.StringIO(text)),
+                                 (False, {}))
+
+    def test_read_invalid_parameters(self):
+        for text, error in self.invalid_parameters:
+            with self.assertRaisesRegex(MinHashFormatError, error):
+                MinHashSketch.read(io.StringIO(text), format='minhash')
+
+    def test_minhash_to_generator(self):
+        self.assertEqual(list(_minhash_to_generator(self.multi_fp)),
+                         self.sketches)
+        self.assertEqual(list(_minhash_to_generator(
+            io.StringIO('\n#minhash\n\n'))), [])
+
+        # blank lines between sketches are ignored
+        with open(self.multi_fp) as f:
+            text = f.read().replace('\n@genome3', '\n\n\n@genome3')
+        self.assertEqual(list(_minhash_to_generator(io.StringIO(text))),
+                         self.sketches)
+
+    def test_minhash_to_minhash_sketch(self):
+        for i, sketch in enumerate(self.sketches, start=1):
+            self.assertEqual(
+                _minhash_to_minhash_sketch(self.multi_fp, sketch_num=i),
+                sketch)
+        self.assertEqual(MinHashSketch.read(self.multi_fp), self.sketches[0])
+
+        with self.assertRaisesRegex(ValueError, 'Invalid sketch number'):
+            _minhash_to_minhash_sketch(self.multi_fp, sketch_num=0)
+        with self.assertRaisesRegex(ValueError, '4th sketch'):
+            _minhash_to_minhash_sketch(self.multi_fp, sketch_num=4)
+
+    def test_invalid_files(self):
+        for text, error in self.invalid:
+            with self.assertRaisesRegex(MinHashFormatError, error):
+                list(_minhash_to_generator(io.StringIO(text)))
+
+    def test_generator_to_minhash(self):
+        fh = io.StringIO()
+        _generator_to_minhash((s for s in self.sketches), fh)
+        with open(self.multi_fp) as f:
+            self.assertEqual(fh.getvalue(), f.read())
+
+    def test_minhash_sketch_to_minhash(self):
+        fh = io.StringIO()
+        _minhash_sketch_to_minhash(self.sketches[0], fh)
+        self.assertEqual(fh.getvalue(),
+                         '#minhash\n@genome1\tk=21\tnum_hashes=4\tseed=42\t'
+                         'canonical=True\n1283 83921 129918 938192\n')
+
+    def test_writer_invalid_id(self):
+        for id_ in 'a\tb', 'a\nb':
+            with self.assertRaisesRegex(MinHashFormatError, 'tabs'):
+                _minhash_sketch_to_minhash(MinHashSketch([1], 3, id=id_),
+                                           io.StringIO())
+
+    def test_roundtrip(self):
+        fh = io.StringIO()
+        for sketch in self.sketches:
+            fh.seek(0)
+            fh.truncate()
+            sketch.write(fh)
+            fh.seek(0)
+            self.assertEqual(MinHashSketch.read(fh), sketch)
+
+
+if __name__ == '__main__':
+    main()
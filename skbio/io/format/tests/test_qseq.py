@@ -11,7 +11,7 @@ import unittest
 from skbio import Sequence, DNA, RNA, Protein
 from skbio import read
 from skbio.util import get_data_path
-from skbio.io import QSeqFormatError
+from skbio.io import QSeqFormatError, SequenceRecord
 from skbio.io.format.qseq import _qseq_to_generator, _qseq_sniffer
 import numpy as np
 
@@ -282,6 +282,18 @@ class TestQSeqToGenerator(TestQSeqBase):
                 for o, e in zip(observed, expected):
                     self.assertEqual(o, e)
 
+    def test_valid_files_sequence_record(self):
+        for valid, kwargs, components in self.valid_files:
+            for kwarg in kwargs:
+                _drop_kwargs(kwarg, 'seq_num', 'constructor')
+                observed = list(_qseq_to_generator(
+                    valid, constructor=SequenceRecord, **kwarg))
+                self.assertEqual(len(observed), len(components))
+                for o, c in zip(observed, components):
+                    self.assertIsInstance(o, SequenceRecord)
+                    self.assertEqual(o[:3], (c['id'], '', c['sequence']))
+                    np.testing.assert_array_equal(o.quality, c['quality'])
+
 
 class TestQSeqToSequences(TestQSeqBase):
     def test_invalid_files(self):
@@ -0,0 +1,306 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+import io
+import gzip
+import shutil
+import struct
+import tempfile
+import zlib
+import os.path
+import unittest
+from unittest import mock
+
+import skbio.io
+from skbio.io import FASTAIndex
+from skbio.io._bgzf import BGZFReader, BGZFWriter, _eof_block
+from skbio.util import get_data_path
+
+
+def _block(data, extra=b'BC\x02\x00??'):
+    # Build a BGZF block with zlib, independently of BGZFWriter. The block
+    # size is written in place of ``??`` in `extra`.
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+    cdata = compressor.compress(data) + compressor.flush()
+    extra = extra.replace(b'??', struct.pack('<H', len(extra) + len(cdata) +
+                                             19))
+    return (b'\x1f\x8b\x08\x04\x00\x00\x00\x00\x00\xff' +
+            struct.pack('<H', len(extra)) + extra + cdata +
+            struct.pack('<II', zlib.crc32(data) & 0xffffffff, len(data)))
+
+
+class BGZFTests(unittest.TestCase):
+    def setUp(self):
+        self.data = ''.join('>seq%d\n%s\n' % (i, 'ACGTTGCA' * (i % 50))
+                            for i in range(5000)).encode('ascii')
+        self.compressed = self.compress(self.data)
+
+    def compress(self, data, **kwargs):
+        fh = io.BytesIO()
+        writer = BGZFWriter(fh, **kwargs)
+        for i in range(0, len(data), 10000):
+            writer.write(data[i:i + 10000])
+        writer.close()
+        self.assertFalse(fh.closed)
+        return fh.getvalue()
+
+
+class BGZFWriterTests(BGZFTests):
+    def test_write(self):
+        self.assertEqual(gzip.decompress(self.compressed), self.data)
+        self.assertTrue(self.compressed.endswith(_eof_block))
+        # each block is a gzip member with a BC subfield
+        self.assertEqual(self.compressed.count(b'\x1f\x8b\x08\x04'),
+                         len(self.data) // 65280 + 2)
+
+    def test_write_threads(self):
+        for threads in 1, 3:
+            self.assertEqual(self.compress(self.data, threads=threads),
+                             self.compressed)
+        self.assertEqual(gzip.decompress(self.compress(self.data,
+                                                       compresslevel=0)),
+                         self.data)
+
+    def test_write_empty(self):
+        self.assertEqual(self.compress(b''), _eof_block)
+
+    def test_flush(self):
+        fh = io.BytesIO()
+        writer = BGZFWriter(fh)
+        writer.write(b'ACGT')
+        self.assertEqual(fh.getvalue(), b'')
+        writer.flush()
+        self.assertEqual(gzip.decompress(fh.getvalue()), b'ACGT')
+        writer.close()
+        self.assertTrue(fh.getvalue().endswith(_eof_block))
+
+    def test_invalid_threads(self):
+        with self.assertRaisesRegex(ValueError, 'at least 1'):
+            BGZFWriter(io.BytesIO(), threads=0)
+
+
+class BGZFReaderTests(BGZFTests):
+    def test_read(self):
+        for threads in 1, 3:
+            fh = io.BytesIO(self.compressed)
+            reader = BGZFReader(fh, threads=threads)
+            self.assertEqual(reader.readall(), self.data)
+            self.assertEqual(reader.read(10), b'')
+            reader.close()
+            self.assertFalse(fh.closed)
+
+            # reading starts at the beginning of the file, wherever it is
+            fh.seek(1000)
+            reader = BGZFReader(fh, threads=threads)
+            self.assertEqual(reader.read(10), self.data[:10])
+            self.assertEqual(reader.seek(70000), 70000)
+            self.assertEqual(reader.read(10), self.data[70000:70010])
+
+            reader = io.BufferedReader(
+                BGZFReader(io.BytesIO(self.compressed), threads=threads))
+            chunks = iter(lambda: reader.read(1000), b'')
+            self.assertEqual(b''.join(chunks), self.data)
+            reader.close()
+
+    def test_read_blocks_from_other_writers(self):
+        # Blocks with other extra subfields and no end-of-file block.
+        data = (_block(b'ACGT') + _block(b'', b'AB\x01\x00xBC\x02\x00??') +
+                _block(b'TTT', b'BC\x02\x00??CD\x00\x00'))
+        self.assertEqual(BGZFReader(io.BytesIO(data)).readall(), b'ACGTTTT')
+
+    def test_read_invalid(self):
+        block = _block(b'ACGT' * 100)
+        for data, error, msg in [
+                (b'>seq1\nACGTACGT\n', OSError, 'Not a BGZF block'),
+                (gzip.compress(b'ACGT'), OSError,
+                 "Not a BGZF block.*compression='gzip'"),
+                (_block(b'ACGT', b'AB\x02\x00xx'), OSError, 'no block size'),
+                (block[:-8] + b'\x00' * 4 + block[-4:], OSError, 'CRC check'),
+                (block[:-4] + b'\xff\x00\x00\x00', OSError, 'length'),
+                (block[:-5], EOFError, 'ended'),
+                (block + block[:10], EOFError, 'ended')]:
+            with self.assertRaisesRegex(error, msg):
+                BGZFReader(io.BytesIO(data)).readall()
+
+    def test_seek(self):
+        for threads in 1, 3:
+            reader = io.BufferedReader(
+                BGZFReader(io.BytesIO(self.compressed), threads=threads))
+            self.assertTrue(reader.seekable())
+            for pos in [100000, 5, 70000, 0, 65280, 65279, 300000,
+                        len(self.data) - 1]:
+                self.assertEqual(reader.seek(pos), pos)
+                self.assertEqual(reader.read(100000),
+                                 self.data[pos:pos + 100000])
+                self.assertEqual(reader.tell(),
+                                 min(pos + 100000, len(self.data)))
+
+            self.assertEqual(reader.seek(-10, io.SEEK_END),
+                             len(self.data) - 10)
+            self.assertEqual(reader.read(), self.data[-10:])
+            reader.seek(200000)
+            self.assertEqual(reader.seek(-1000, io.SEEK_CUR), 199000)
+            self.assertEqual(reader.read(5), self.data[199000:199005])
+            # past the end of the file
+            self.assertEqual(reader.seek(len(self.data) + 10),
+                             len(self.data))
+            self.assertEqual(reader.read(), b'')
+            with self.assertRaisesRegex(ValueError, 'Negative'):
+                reader.raw.seek(-1)
+
+        reader = BGZFReader(io.BytesIO(_eof_block))
+        self.assertEqual(reader.seek(10), 0)
+        self.assertEqual(reader.read(), b'')
+
+    def test_virtual_offsets(self):
+        reader = BGZFReader(io.BytesIO(self.compressed))
+        self.assertEqual(reader.to_virtual(0), 0)
+        self.assertEqual(reader.to_virtual(10), 10)
+        second_block = struct.unpack('<H', self.compressed[16:18])[0] + 1
+        self.assertEqual(reader.to_virtual(65280), second_block << 16)
+        self.assertEqual(reader.to_virtual(65290), second_block << 16 | 10)
+
+        for pos in 0, 65280, 65290, 300000, len(self.data):
+            voffset = reader.to_virtual(pos)
+            self.assertEqual(reader.from_virtual(voffset), pos)
+            reader.seek(0)
+            self.assertEqual(reader.from_virtual(voffset), pos)
+
+        with self.assertRaisesRegex(ValueError, 'not in the file'):
+            reader.to_virtual(len(self.data) + 1)
+        with self.assertRaisesRegex(ValueError, 'start of a BGZF block'):
+            reader.from_virtual(5 << 16)
+        with self.assertRaisesRegex(ValueError, 'past the end'):
+            reader.from_virtual(65281)
+
+
+class BGZFCompressionTests(BGZFTests):
+    def setUp(self):
+        super(BGZFCompressionTests, self).setUp()
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_open(self):
+        fp = os.path.join(self.tmp_dir, 'example.gz')
+        with skbio.io.open(fp, mode='w', encoding='binary',
+                           compression='bgzf') as fh:
+            fh.write(self.data)
+        with open(fp, 'rb') as fh:
+            self.assertEqual(fh.read(), self.compressed)
+
+        with skbio.io.open(fp, encoding='binary') as fh:
+            self.assertIsInstance(fh.raw, BGZFReader)
+            self.assertEqual(fh.read(), self.data)
+        with skbio.io.open(fp) as fh:
+            self.assertEqual(fh.readline(), '>seq0\n')
+
+        # plain gzip files aren't detected as BGZF
+        with skbio.io.open(get_data_path('example_file.gz'),
+                           encoding='binary') as fh:
+            self.assertIsInstance(fh.raw, gzip.GzipFile)
+            with self.assertRaises(io.UnsupportedOperation):
+                fh.tell_virtual()
+
+    def test_fasta_index_reuses_block_table(self):
+        fp = os.path.join(self.tmp_dir, 'many.fasta.gz')
+        with open(fp, 'wb') as fh:
+            fh.write(self.compressed)
+        read_header = BGZFReader._read_header
+
+        def fetch(index, fasta, id):
+            offsets = []
+
+            def spy(reader, coffset):
+                offsets.append(coffset)
+                return read_header(reader, coffset)
+
+            with mock.patch.object(BGZFReader, '_read_header', spy):
+                self.assertEqual(str(index.fetch(fasta, id)),
+                                 'ACGTTGCA' * (int(id[3:]) % 50))
+            return offsets
+
+        # the block table is built by the first fetch from each file...
+        index = FASTAIndex.from_fasta(io.BytesIO(self.data))
+        with open(fp, 'rb') as fh:
+            self.assertIn(0, fetch(index, fh, 'seq4999'))
+            self.assertGreater(min(fetch(index, fh, 'seq4998')),
+                               len(self.compressed) // 2)
+        self.assertGreater(min(fetch(index, fp, 'seq4997')),
+                           len(self.compressed) // 2)
+        data = io.BytesIO(self.compressed)
+        self.assertIn(0, fetch(index, data, 'seq4999'))
+        self.assertGreater(min(fetch(index, data, 'seq4998')),
+                           len(self.compressed) // 2)
+
+        # ...or when indexing the compressed file
+        index = FASTAIndex.from_fasta(fp)
+        self.assertGreater(min(fetch(index, fp, 'seq4999')),
+                           len(self.compressed) // 2)
+
+        # the block table isn't used once the file is rewritten
+        with open(fp, 'wb') as fh:
+            fh.write(self.compress(self.data, compresslevel=1))
+        self.assertIn(0, fetch(index, fp, 'seq4999'))
+
+    def test_open_bgzf_followed_by_gzip(self):
+        data = self.compressed + gzip.compress(b'>extra\nTTTT\n')
+        with skbio.io.open(io.BytesIO(data), encoding='binary') as fh:
+            self.assertIsInstance(fh.raw, BGZFReader)
+            with self.assertRaisesRegex(OSError, "compression='gzip'"):
+                fh.read()
+        with skbio.io.open(io.BytesIO(data), encoding='binary',
+                           compression='gzip') as fh:
+            self.assertEqual(fh.read(), self.data + b'>extra\nTTTT\n')
+
+    def test_open_virtual_offsets(self):
+        with skbio.io.open(io.BytesIO(self.compressed),
+                           encoding='binary') as fh:
+            fh.seek(300000)
+            voffset = fh.tell_virtual()
+            fh.read(10)
+            self.assertEqual(fh.seek_virtual(voffset), 300000)
+            self.assertEqual(fh.read(10), self.data[300000:300010])
+            self.assertEqual(fh.seek_virtual(0), 0)
+            self.assertEqual(fh.tell_virtual(), 0)
+
+    def test_fasta_index(self):
+        fasta = get_data_path('fasta_indexed')
+        fp = os.path.join(self.tmp_dir, 'fasta_indexed.gz')
+        with open(fasta, 'rb') as fh:
+            with skbio.io.open(fp, mode='w', encoding='binary',
+                               compression='bgzf') as out:
+                out.write(fh.read())
+
+        index = FASTAIndex.from_fasta(fp)
+        self.assertEqual(index, FASTAIndex.from_fasta(fasta))
+        self.assertEqual(str(index.fetch(fp, 'chr1', 8, 12)), 'ACGG')
+        with skbio.io.open(fp, encoding='binary') as fh:
+            self.assertEqual(str(index.fetch(fh, 'plasmid_1')), 'acgtNNNN')
+            self.assertEqual(str(index.fetch(fh, 'chr2')), 'AAACCCGGGT')
+
+    def test_fasta_index_fetch_from_one_filehandle(self):
+        fp = os.path.join(self.tmp_dir, 'many.fasta.gz')
+        with open(fp, 'wb') as fh:
+            fh.write(self.compressed)
+        index = FASTAIndex.from_fasta(fp)
+        self.assertEqual(len(index), 5000)
+
+        with open(fp, 'rb') as fh:
+            for i in [4999, 3, 2500, 1201, 3, 49, 4950, 777]:
+                expected = 'ACGTTGCA' * (i % 50)
+                self.assertEqual(str(index.fetch(fh, 'seq%d' % i)), expected)
+                if len(expected) >= 13:
+                    self.assertEqual(
+                        str(index.fetch(fh, 'seq%d' % i, 5, 13)),
+                        expected[5:13])
+
+
+if __name__ == '__main__':
+    unittest.main()
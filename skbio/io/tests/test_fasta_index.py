@@ -0,0 +1,163 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+import io
+from unittest import TestCase, main, mock
+
+import numpy.testing as npt
+
+from skbio import Sequence, DNA
+from skbio.io import FASTAIndex, FASTAFormatError
+from skbio.util import get_data_path
+
+
+class TestFASTAIndex(TestCase):
+    def setUp(self):
+        self.fp = get_data_path('fasta_indexed')
+        with open(self.fp, 'rb') as f:
+            self.data = f.read()
+        self.index = FASTAIndex(['chr1', 'chr2', 'plasmid_1', 'empty'],
+                                [22, 10, 8, 0], [23, 54, 85, 102],
+                                [10, 10, 5, 0], [11, 11, 6, 0])
+        self.seqs = {'chr1': 'ACGTACGTACGGGTTTAAACTT', 'chr2': 'AAACCCGGGT',
+                     'plasmid_1': 'acgtNNNN', 'empty': ''}
+
+    def assert_entries(self, index, exp):
+        self.assertEqual(list(zip(index.ids, *[column.tolist() for column
+                                               in index._columns()])), exp)
+
+    def test_init(self):
+        self.assertEqual(self.index.ids,
+                         ['chr1', 'chr2', 'plasmid_1', 'empty'])
+        npt.assert_array_equal(self.index.lengths, [22, 10, 8, 0])
+        self.assertEqual(len(self.index), 4)
+        self.assertIn('chr2', self.index)
+        self.assertNotIn('chr3', self.index)
+
+        empty = FASTAIndex([], [], [], [], [])
+        self.assertEqual(len(empty), 0)
+        self.assertEqual(empty.ids, [])
+
+    def test_init_invalid(self):
+        with self.assertRaisesRegex(ValueError, 'one value per ID'):
+            FASTAIndex(['a', 'b'], [1, 2], [3, 4], [1, 1], [2])
+        with self.assertRaisesRegex(ValueError, 'unique'):
+            FASTAIndex(['a', 'a'], [1, 2], [3, 4], [1, 1], [2, 2])
+        with self.assertRaisesRegex(ValueError, 'negative'):
+            FASTAIndex(['a'], [1], [-3], [1], [2])
+        with self.assertRaisesRegex(ValueError, 'one character per line'):
+            FASTAIndex(['a'], [1], [3], [0], [1])
+        with self.assertRaisesRegex(ValueError, 'widths must not be less'):
+            FASTAIndex(['a'], [10], [3], [5], [4])
+
+    def test_from_fasta(self):
+        self.assertEqual(FASTAIndex.from_fasta(self.fp), self.index)
+        self.assertEqual(FASTAIndex.from_fasta(io.BytesIO(self.data)),
+                         self.index)
+        for block_size in 1, 2, 7, 16:
+            with mock.patch('skbio.io._fasta_index._block_size', block_size):
+                self.assertEqual(FASTAIndex.from_fasta(self.fp), self.index)
+
+        self.assertEqual(FASTAIndex.from_fasta(io.BytesIO(b'')),
+                         FASTAIndex([], [], [], [], []))
+
+    def test_from_fasta_layouts(self):
+        for data, exp in [
+                # windows newlines
+                (b'>a x\r\nACG\r\nTA\r\n>b\r\nC\r\n',
+                 [('a', 5, 6, 3, 5), ('b', 1, 19, 1, 3)]),
+                # blank lines at the start of the file and after records, and
+                # no newline at the end of the file
+                (b'\n\n>a\nACG\nTA\n\n\n>b\nCCCC',
+                 [('a', 5, 5, 3, 4), ('b', 4, 17, 4, 5)]),
+                # the last line of a record isn't shorter than the others
+                (b'>a\nAC\nGT\n>\nACG\n',
+                 [('a', 4, 3, 2, 3), ('', 3, 11, 3, 4)])]:
+            for block_size in 1, 3, 100:
+                with mock.patch('skbio.io._fasta_index._block_size',
+                                block_size):
+                    self.assert_entries(
+                        FASTAIndex.from_fasta(io.BytesIO(data)), exp)
+
+    def test_from_fasta_invalid(self):
+        for data, error in [
+                (b'ACGT\n>a\nACGT\n', 'before the first header'),
+                (b'>a\nACG\nTA\nC\n', "record 'a'"),
+                (b'>a\nACG\nTACG\n>b\nA\n', "record 'a'"),
+                (b'>a\nACG\n>b d\nACG\n\nACG\n', "record 'b'"),
+                (b'>a\nACG\r\nACG\nA\n', "record 'a'"),
+                (b'>a\nAC\n>a\nAC\n', 'unique')]:
+            for block_size in 1, 100:
+                with mock.patch('skbio.io._fasta_index._block_size',
+                                block_size):
+                    with self.assertRaisesRegex(FASTAFormatError, error):
+                        FASTAIndex.from_fasta(io.BytesIO(data))
+
+    def test_fetch(self):
+        for id_, seq in self.seqs.items():
+            obs = self.index.fetch(self.fp, id_)
+            self.assertIs(type(obs), Sequence)
+            self.assertEqual(str(obs), seq)
+            self.assertEqual(obs.metadata, {'id': id_})
+            for start in range(len(seq) + 1):
+                for stop in range(start, len(seq) + 1):
+                    self.assertEqual(
+                        str(self.index.fetch(self.fp, id_, start, stop)),
+                        seq[start:stop])
+        self.assertEqual(str(self.index.fetch(self.fp, 'chr1', start=20)),
+                         'TT')
+        self.assertEqual(str(self.index.fetch(self.fp, 'chr1', stop=3)),
+                         'ACG')
+
+    def test_fetch_from_filehandle(self):
+        fh = io.BytesIO(self.data)
+        self.assertEqual(str(self.index.fetch(fh, 'chr1', 8, 12)), 'ACGG')
+        self.assertEqual(str(self.index.fetch(fh, 'plasmid_1', 3)), 'tNNNN')
+        self.assertFalse(fh.closed)
+
+    def test_fetch_constructor(self):
+        obs = self.index.fetch(self.fp, 'plasmid_1', 2, 6, constructor=DNA,
+                               lowercase=True)
+        self.assertEqual(obs, DNA('GTNN', metadata={'id': 'plasmid_1'}))
+
+    def test_fetch_windows_newlines(self):
+        data = b'>a\r\nACG\r\nTAC\r\nG\r\n'
+        index = FASTAIndex.from_fasta(io.BytesIO(data))
+        self.assertEqual(str(index.fetch(io.BytesIO(data), 'a', 2, 7)),
+                         'GTACG')
+
+    def test_fetch_invalid(self):
+        with self.assertRaisesRegex(KeyError, 'chr3'):
+            self.index.fetch(self.fp, 'chr3')
+        for start, stop in (-1, 5), (5, 4), (0, 23):
+            with self.assertRaisesRegex(ValueError, r"\[%d, %d\).*'chr1'.*22"
+                                        % (start, stop)):
+                self.index.fetch(self.fp, 'chr1', start, stop)
+        # the index doesn't match the file
+        with self.assertRaisesRegex(FASTAFormatError, 'up to date'):
+            self.index.fetch(io.BytesIO(self.data[:60]), 'chr2')
+
+    def test_eq(self):
+        self.assertEqual(self.index, FASTAIndex.from_fasta(self.fp))
+        self.assertNotEqual(self.index, FASTAIndex(['chr1'], [22], [23],
+                                                   [10], [11]))
+        self.assertNotEqual(
+            FASTAIndex(['a'], [1], [3], [1], [2]),
+            FASTAIndex(['a'], [1], [4], [1], [2]))
+        self.assertNotEqual(self.index, self.index.ids)
+
+    def test_repr(self):
+        obs = repr(self.index)
+        self.assertTrue(obs.startswith('FASTAIndex\n'))
+        self.assertIn('records: 4', obs)
+        self.assertIn('total length: 40', obs)
+        self.assertEqual(str(self.index), obs)
+
+
+if __name__ == '__main__':
+    main()
@@ -125,12 +125,26 @@ def open(file, mode=_d['mode'], encoding=_d['encoding'], errors=_d['errors'],
         Otherwise this matches the behavior of :func:`io.open`.
     newline : {None, "", '\\n', '\\r\\n', '\\r'}, optional
         Matches the behavior of :func:`io.open`.
-    compression : {'auto', 'gzip', 'bz2', None}, optional
+    compression : {'auto', 'gzip', 'bgzf', 'bz2', None}, optional
         Will compress or decompress `file` depending on `mode`. If 'auto' then
         determining the compression of the file will be attempted and the
         result will be transparently decompressed. 'auto' will do nothing
         when writing. Other legal values will use their respective compression
         schemes. `compression` cannot be used with a text source.
+
+        .. note:: 'bgzf' is the blocked gzip format of ``bgzip`` and SAMtools.
+           Its files can be read as gzip files, but are compressed and
+           decompressed in independent blocks on one thread per CPU, and
+           support seeking (in positions of the uncompressed data) when `file`
+           is seekable. With `encoding='binary'` the returned filehandle also
+           has ``tell_virtual`` and ``seek_virtual`` methods for BGZF virtual
+           offsets (the offset of a block in the compressed file shifted left
+           16 bits, plus a position within the block). For example, a FASTA
+           file compressed with ``bgzip`` can be read with
+           :meth:`skbio.io.FASTAIndex.fetch`. 'auto' detects BGZF from the
+           first block, so a BGZF file followed by an ordinary gzip file
+           (e.g., joined with ``cat``) must be read with
+           ``compression='gzip'``.
     compresslevel : int (0-9 inclusive), optional
         The level of compression to use, will be passed to the appropriate
         compression handler. This is only used when writing.
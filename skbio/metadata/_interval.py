@@ -89,14 +89,21 @@ fuzzy=[(False, False), (False, False)], metadata={'name': 'genA'})
 
     """
     def __init__(self, interval_metadata, bounds,
-                 fuzzy=None, metadata=None):
+                 fuzzy=None, metadata=None, _validate=True):
         if not isinstance(interval_metadata, IntervalMetadata):
             raise TypeError('You need to provide an IntervalMetadata'
                             'object, not %r' % interval_metadata)
         # Intervals
         self._interval_metadata = interval_metadata
 
-        self._bounds_fuzzy_setter(bounds, fuzzy)
+        if _validate:
+            self._bounds_fuzzy_setter(bounds, fuzzy)
+        else:
+            # `bounds` and `fuzzy` are sorted lists of valid coordinates
+            # within the bounds of `interval_metadata`, and the caller adds
+            # the interval feature to it.
+            self._bounds = bounds
+            self._fuzzy = fuzzy
 
         # Metadata
         if metadata is None:
@@ -104,7 +111,8 @@ fuzzy=[(False, False), (False, False)], metadata={'name': 'genA'})
         self.metadata = metadata
 
         # add this interval feature to the associated IntervalMetadata
-        self._add()
+        if _validate:
+            self._add()
 
     def _add(self):
         """Add the current ``Interval`` to the IntervalMetadata object."""
@@ -646,19 +654,35 @@ fuzzy=[(True, True)], metadata={'gene': 'sagB'})
             except TypeError:
                 raise TypeError('You cannot concat the interval metadata '
                                 'because its upper bound is `None`:\n%r' % im)
-        new = cls(upper_bound)
-
+        offsets = []
         length = 0
-        for i, im in enumerate(interval_metadata):
-            for intvl in im._intervals:
-                bounds = intvl.bounds
-                fuzzy = intvl.fuzzy
-                if i != 0:
-                    bounds = [(start + length, end + length)
-                              for start, end in bounds]
-                new.add(bounds, fuzzy, intvl.metadata)
+        for im in interval_metadata:
+            offsets.append(length)
             length += im.upper_bound
 
+        return cls._concat_shifted(upper_bound,
+                                   zip(interval_metadata, offsets))
+
+    @classmethod
+    def _concat_shifted(cls, upper_bound, shifted):
+        """Concatenate (``IntervalMetadata``, offset) pairs in bulk.
+
+        The interval features of each object are shifted by its offset, and
+        their metadata is shallow-copied. They are not validated again, as each
+        object's interval features are within its own bounds, and the interval
+        tree is built once on the next query instead of being updated for every
+        interval feature.
+
+        """
+        new = cls(upper_bound)
+        for im, offset in shifted:
+            for intvl in im._intervals:
+                new._intervals.append(Interval(
+                    new, [(start + offset, end + offset)
+                          for start, end in intvl.bounds],
+                    intvl.fuzzy[:], copy.copy(intvl.metadata),
+                    _validate=False))
+        new._is_stale_tree = True
         return new
 
     @experimental(as_of='0.5.1')
@@ -9,6 +9,7 @@
 import abc
 import copy
 
+import numpy as np
 import pandas as pd
 
 from skbio.util._decorator import stable, experimental
@@ -202,6 +203,12 @@ class PositionalMetadataMixin(metaclass=abc.ABCMeta):
         metadata, a shallow copy is made and the ``pd.DataFrame`` index is set
         to ``pd.RangeIndex(start=0, stop=axis_len, step=1)``.
 
+        Positional metadata set from a ``dict`` of 1D ``np.ndarray`` objects
+        (e.g., quality scores read from a FASTQ file) is stored as a ``dict``
+        of arrays, and the ``pd.DataFrame`` is only created the first time
+        this property is accessed. Until then, slicing, copying, and
+        comparing the object operate on the arrays directly.
+
         Examples
         --------
         .. note:: scikit-bio objects with positional metadata share a common
@@ -278,10 +285,21 @@ class PositionalMetadataMixin(metaclass=abc.ABCMeta):
             # Not using setter to avoid copy.
             self._positional_metadata = pd.DataFrame(
                 index=self._get_positional_metadata_index())
+        elif isinstance(self._positional_metadata, dict):
+            # The arrays of the column store are owned by this object, so the
+            # DataFrame can use them without a copy.
+            self._positional_metadata = pd.DataFrame(
+                self._positional_metadata,
+                index=self._get_positional_metadata_index(), copy=False)
         return self._positional_metadata
 
     @positional_metadata.setter
     def positional_metadata(self, positional_metadata):
+        columns = self._as_positional_metadata_columns(positional_metadata)
+        if columns is not None:
+            self._positional_metadata = columns
+            return
+
         try:
             # Pass copy=True to copy underlying data buffer.
             positional_metadata = pd.DataFrame(positional_metadata, copy=True)
@@ -309,6 +327,26 @@ class PositionalMetadataMixin(metaclass=abc.ABCMeta):
     def positional_metadata(self):
         self._positional_metadata = None
 
+    def _as_positional_metadata_columns(self, positional_metadata):
+        """Return a column store of positional metadata, if possible.
+
+        A column store is a ``dict`` mapping column names to 1D arrays of the
+        positional metadata axis length. Positional metadata that is not a
+        non-empty ``dict`` of such arrays (e.g., a ``pd.DataFrame`` or a
+        ``dict`` of lists) is not converted and ``None`` is returned.
+
+        """
+        if type(positional_metadata) is not dict or not positional_metadata:
+            return None
+        axis_len = self._positional_metadata_axis_len_()
+        for column in positional_metadata.values():
+            if (type(column) is not np.ndarray or column.ndim != 1 or
+                    len(column) != axis_len):
+                return None
+        # Copy the arrays (like the setter's shallow copy of a DataFrame).
+        return {name: column.copy()
+                for name, column in positional_metadata.items()}
+
     def _get_positional_metadata_index(self):
         """Create a memory-efficient integer index for positional metadata."""
         return pd.RangeIndex(start=0,
@@ -337,6 +375,10 @@ class PositionalMetadataMixin(metaclass=abc.ABCMeta):
         # positional metadata representations on the objects if they don't have
         # positional metadata.
         if self.has_positional_metadata() and other.has_positional_metadata():
+            equal = _positional_metadata_columns_equal(
+                self._positional_metadata, other._positional_metadata)
+            if equal is not None:
+                return equal
             return self.positional_metadata.equals(other.positional_metadata)
         elif not (self.has_positional_metadata() or
                   other.has_positional_metadata()):
@@ -360,6 +402,9 @@ class PositionalMetadataMixin(metaclass=abc.ABCMeta):
 
     def _copy_(self):
         if self.has_positional_metadata():
+            if isinstance(self._positional_metadata, dict):
+                return {name: column.copy() for name, column
+                        in self._positional_metadata.items()}
             # deep=True makes a shallow copy of the underlying data buffer.
             return self.positional_metadata.copy(deep=True)
         else:
@@ -371,6 +416,10 @@ class PositionalMetadataMixin(metaclass=abc.ABCMeta):
 
     def _deepcopy_(self, memo):
         if self.has_positional_metadata():
+            if isinstance(self._positional_metadata, dict):
+                # Deep copies of object arrays also copy their elements.
+                return {name: copy.deepcopy(column, memo) for name, column
+                        in self._positional_metadata.items()}
             # `copy.deepcopy` no longer recursively copies contents of the
             # DataFrame, so we must handle the deep copy ourselves.
             # Reference: https://github.com/pandas-dev/pandas/issues/17406
@@ -416,8 +465,34 @@ class PositionalMetadataMixin(metaclass=abc.ABCMeta):
         True
 
         """
-        return (self._positional_metadata is not None and
-                len(self.positional_metadata.columns) > 0)
+        if self._positional_metadata is None:
+            return False
+        if isinstance(self._positional_metadata, dict):
+            return len(self._positional_metadata) > 0
+        return len(self._positional_metadata.columns) > 0
+
+
+def _positional_metadata_columns_equal(columns, other_columns):
+    """Compare two column stores of positional metadata without pandas.
+
+    Returns ``None`` if the comparison cannot be made reliably on the arrays
+    (e.g., if either positional metadata is a ``pd.DataFrame``, or for
+    floating point columns, where pandas considers NaNs equal).
+
+    """
+    if not (isinstance(columns, dict) and isinstance(other_columns, dict)):
+        return None
+    if list(columns) != list(other_columns):
+        # The order of the DataFrame columns may depend on the pandas version.
+        return None if set(columns) == set(other_columns) else False
+    for name, column in columns.items():
+        other_column = other_columns[name]
+        if (column.dtype.kind not in 'biu' or
+                column.dtype != other_column.dtype):
+            return None
+        if not np.array_equal(column, other_column):
+            return False
+    return True
 
 
 class IntervalMetadataMixin(metaclass=abc.ABCMeta):
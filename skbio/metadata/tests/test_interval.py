@@ -42,6 +42,19 @@ class TestInterval(unittest.TestCase, ReallyEqualMixin):
         self.assertDictEqual(f.metadata, {'name': 'sagA',
                                           'function': 'transport'})
 
+    def test_init_without_validation(self):
+        exp = Interval(self.im, bounds=[(1, 2), (4, 7)],
+                       fuzzy=[(True, False), (False, False)],
+                       metadata={'name': 'sagA'})
+        obs = Interval(self.im, [(1, 2), (4, 7)],
+                       [(True, False), (False, False)], {'name': 'sagA'},
+                       _validate=False)
+
+        self.assertEqual(obs, exp)
+        self.assertEqual(vars(obs).keys(), vars(exp).keys())
+        # it is not added to the interval metadata
+        self.assertEqual(self.im._intervals, [exp])
+
     def test_init_iterables(self):
         f = Interval(interval_metadata=self.im,
                      bounds=((1, 2), (4, 7)),
@@ -545,6 +558,21 @@ class TestIntervalMetadata(unittest.TestCase, ReallyEqualMixin):
                 metadata={'gene': 'sagC'})
         self.assertEqual(obs, exp)
 
+        # the interval tree of the concatenated object is up to date
+        self.assertEqual(
+            sorted(i.metadata['gene'] for i in obs.query([(6, 9)])),
+            ['sagB', 'sagC'])
+        intvl = next(obs.query(metadata={'gene': 'sagA'}))
+        intvl.bounds = [(10, 11)]
+        self.assertEqual(
+            sorted(i.metadata['gene'] for i in obs.query([(10, 11)])),
+            ['sagA', 'sagC'])
+        with self.assertRaisesRegex(ValueError, 'upper bound'):
+            intvl.bounds = [(10, 13)]
+        self.assertEqual(im2._intervals[0].bounds, [(0, 3)])
+        intvl.metadata['gene'] = 'sagD'
+        self.assertEqual(im2._intervals[0].metadata, {'gene': 'sagA'})
+
     def test_merge(self):
         # empty + empty
         im = IntervalMetadata(self.upper_bound)
@@ -33,6 +33,20 @@ Classes
    RNA
    Protein
    GeneticCode
+   SequenceBatch
+   PackedSequence
+   MinHashSketch
+   PatternMatcher
+   FMIndex
+
+Functions
+---------
+
+.. autosummary::
+   :toctree: generated/
+
+   dereplicate
+   kmer_count_matrix
 
 Subpackages
 -----------
@@ -312,8 +326,17 @@ from ._dna import DNA
 from ._rna import RNA
 from ._genetic_code import GeneticCode
 from ._grammared_sequence import GrammaredSequence
+from ._batch import SequenceBatch
+from ._packed import PackedSequence
+from ._minhash import MinHashSketch
+from ._pattern import PatternMatcher
+from ._fm_index import FMIndex
+from ._dereplicate import dereplicate
+from ._composition import kmer_count_matrix
 
 __all__ = ['Sequence', 'Protein', 'DNA', 'RNA', 'GeneticCode',
-           'GrammaredSequence']
+           'GrammaredSequence', 'SequenceBatch', 'PackedSequence',
+           'MinHashSketch', 'PatternMatcher', 'FMIndex', 'dereplicate',
+           'kmer_count_matrix']
 
 test = TestRunner(__file__).test
@@ -0,0 +1,1016 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+import numbers
+
+import numpy as np
+import pandas as pd
+
+from skbio._base import SkbioObject, ElasticLines
+from skbio.sequence._sequence import Sequence
+from skbio.sequence._grammared_sequence import GrammaredSequence
+from skbio.util._decorator import experimental, classonlymethod
+
+
+class SequenceBatch(SkbioObject):
+    """Store many sequences of the same type in a single packed buffer.
+
+    A ``SequenceBatch`` holds the characters of all of its sequences in one
+    contiguous ``np.uint8`` array, with an array of offsets marking where each
+    sequence starts and ends. This avoids the per-object overhead of storing
+    many short sequences (e.g., sequencing reads) as individual ``Sequence``
+    objects, and allows common operations to be applied to all sequences at
+    once with vectorized NumPy code.
+
+    Parameters
+    ----------
+    data : 1D np.ndarray (np.uint8), str, or bytes
+        Characters of all sequences, concatenated.
+    offsets : 1D array_like (int)
+        Position in `data` where each sequence starts, followed by the length
+        of `data`. Sequence ``i`` is ``data[offsets[i]:offsets[i + 1]]``.
+    dtype : type, optional
+        Type of the stored sequences (``Sequence`` or a subclass).
+    ids : 1D array_like (str), optional
+        ID of each sequence.
+    descriptions : 1D array_like (str), optional
+        Description of each sequence.
+    quality : 1D array_like (int), optional
+        Quality score of each character in `data` (e.g., Phred scores read
+        from a FASTQ file).
+    validate : bool, optional
+        If ``True`` and `dtype` is a ``GrammaredSequence``, validate that
+        `data` only contains characters in the alphabet of `dtype`.
+    lowercase : bool, optional
+        If ``True``, lowercase characters in `data` are converted to
+        uppercase.
+
+    Raises
+    ------
+    TypeError
+        If `dtype` is not ``Sequence`` or a subclass of it.
+    ValueError
+        If `offsets` does not describe consecutive, non-overlapping sequences
+        covering all of `data`, or if the length of `ids`, `descriptions`, or
+        `quality` does not match.
+
+    See Also
+    --------
+    Sequence
+    skbio.alignment.TabularMSA
+
+    Notes
+    -----
+    Indexing a ``SequenceBatch`` with an integer returns a sequence of type
+    `dtype` whose underlying data is a view of the batch's buffer, so no
+    characters are copied. The sequence's metadata contains its ID and
+    description (if present), and its positional metadata contains its quality
+    scores (if present). Indexing with a slice, boolean mask, or array of
+    integers returns a new ``SequenceBatch``.
+
+    ``SequenceBatch`` objects can be read from and written to FASTA and FASTQ
+    files with ``skbio.io``.
+
+    Examples
+    --------
+    >>> from skbio import DNA
+    >>> from skbio.sequence import SequenceBatch
+    >>> batch = SequenceBatch.from_sequences([
+    ...     DNA('ACGT', metadata={'id': 'r1'}),
+    ...     DNA('GGC-C', metadata={'id': 'r2'}),
+    ...     DNA('A', metadata={'id': 'r3'})])
+    >>> batch
+    SequenceBatch[DNA]
+    ---------------------
+    Stats:
+        sequence count: 3
+        total length: 10
+        min length: 1
+        max length: 5
+    ---------------------
+    0 r1 ACGT
+    1 r2 GGC-C
+    2 r3 A
+    >>> batch.lengths
+    array([4, 5, 1])
+    >>> batch.gc_content()
+    array([ 0.5,  1. ,  0. ])
+    >>> batch.filter_by_length(min_length=4).ids
+    array(['r1', 'r2'], dtype=object)
+    >>> str(batch[1].reverse_complement())
+    'G-GCC'
+
+    """
+    default_write_format = 'fasta'
+    __hash__ = None
+
+    @experimental(as_of='0.5.2')
+    def __init__(self, data, offsets, dtype=Sequence, ids=None,
+                 descriptions=None, quality=None, validate=True,
+                 lowercase=False):
+        if not (isinstance(dtype, type) and issubclass(dtype, Sequence)):
+            raise TypeError(
+                "`dtype` must be Sequence or a subclass of it, not %r."
+                % (dtype,))
+        self._dtype = dtype
+
+        if isinstance(data, str):
+            data = data.encode('ascii')
+        if isinstance(data, (bytes, bytearray)):
+            data = np.frombuffer(data, dtype=np.uint8)
+        data = np.ascontiguousarray(data)
+        if data.dtype != np.uint8 or data.ndim != 1:
+            raise TypeError(
+                "`data` must be a 1D np.ndarray of dtype np.uint8.")
+
+        offsets = np.asarray(offsets, dtype=np.int64)
+        if (offsets.ndim != 1 or len(offsets) == 0 or offsets[0] != 0 or
+                offsets[-1] != len(data) or (np.diff(offsets) < 0).any()):
+            raise ValueError(
+                "`offsets` must start at zero, be non-decreasing, and end "
+                "with the length of `data` (%d)." % len(data))
+
+        if issubclass(dtype, GrammaredSequence):
+            # Validate and uppercase the whole buffer at once by wrapping it
+            # in a single sequence object (the data are not copied unless
+            # lowercase characters need to be converted).
+            data = dtype(data, validate=validate, lowercase=lowercase)._bytes
+        elif lowercase:
+            data = dtype(data, lowercase=True)._bytes
+        else:
+            data = data.view()
+            data.flags.writeable = False
+
+        offsets.flags.writeable = False
+        self._data = data
+        self._offsets = offsets
+        self._ids = self._munge_labels(ids, 'ids')
+        self._descriptions = self._munge_labels(descriptions, 'descriptions')
+
+        if quality is not None:
+            quality = np.asarray(quality)
+            if quality.shape != data.shape:
+                raise ValueError(
+                    "Number of quality scores (%d) must match the total "
+                    "length of the sequences (%d)."
+                    % (len(quality), len(data)))
+            quality = quality.view()
+            quality.flags.writeable = False
+        self._quality = quality
+
+    def _munge_labels(self, labels, name):
+        if labels is None:
+            return None
+        if isinstance(labels, str):
+            raise TypeError("`%s` must be an iterable of str, not str." % name)
+        labels = np.asarray(list(labels), dtype=object)
+        if labels.shape != (len(self),):
+            raise ValueError(
+                "Number of %s (%d) must match the number of sequences (%d)."
+                % (name, len(labels), len(self)))
+        labels.flags.writeable = False
+        return labels
+
+    @classonlymethod
+    @experimental(as_of='0.5.2')
+    def from_sequences(cls, sequences, dtype=None):
+        """Create a ``SequenceBatch`` from an iterable of sequences.
+
+        Parameters
+        ----------
+        sequences : iterable of Sequence
+            Sequences to pack into the batch. All sequences must be of the
+            same type.
+        dtype : type, optional
+            Type of the sequences. If not provided, it is inferred from the
+            first sequence (``Sequence`` if there are no sequences).
+
+        Returns
+        -------
+        SequenceBatch
+            Batch of the sequences. IDs and descriptions are taken from each
+            sequence's ``'id'`` and ``'description'`` metadata, and quality
+            scores from its ``'quality'`` positional metadata, if all
+            sequences have them.
+
+        Raises
+        ------
+        TypeError
+            If the sequences are not all of type `dtype`.
+
+        """
+        sequences = list(sequences)
+        if dtype is None:
+            dtype = type(sequences[0]) if sequences else Sequence
+        for seq in sequences:
+            if type(seq) is not dtype:
+                raise TypeError(
+                    "Sequences must all be of type %r, not %r."
+                    % (dtype.__name__, type(seq).__name__))
+
+        lengths = np.fromiter((len(seq) for seq in sequences), dtype=np.int64,
+                              count=len(sequences))
+        offsets = np.zeros(len(sequences) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        data = np.empty(offsets[-1], dtype=np.uint8)
+        for seq, start, stop in zip(sequences, offsets[:-1], offsets[1:]):
+            data[start:stop] = seq._bytes
+
+        def _labels(key):
+            if any(seq.has_metadata() and key in seq.metadata
+                   for seq in sequences):
+                return [seq.metadata.get(key, '') for seq in sequences]
+            return None
+
+        quality = None
+        if sequences and all(seq.has_positional_metadata() and
+                             'quality' in seq._positional_metadata
+                             for seq in sequences):
+            # Index the stored positional metadata (a DataFrame or a dict of
+            # arrays) to avoid creating a DataFrame per sequence.
+            quality = np.concatenate(
+                [np.asarray(seq._positional_metadata['quality'])
+                 for seq in sequences])
+
+        return cls(data, offsets, dtype=dtype, ids=_labels('id'),
+                   descriptions=_labels('description'), quality=quality,
+                   validate=False)
+
+    @property
+    @experimental(as_of='0.5.2')
+    def dtype(self):
+        """Type of the stored sequences.
+
+        Notes
+        -----
+        This property is not writeable.
+
+        """
+        return self._dtype
+
+    @property
+    @experimental(as_of='0.5.2')
+    def data(self):
+        """Characters of all sequences, concatenated.
+
+        Notes
+        -----
+        This property is not writeable.
+
+        """
+        return self._data
+
+    @property
+    @experimental(as_of='0.5.2')
+    def offsets(self):
+        """Start of each sequence in ``data``, followed by its length.
+
+        Notes
+        -----
+        This property is not writeable.
+
+        """
+        return self._offsets
+
+    @property
+    @experimental(as_of='0.5.2')
+    def ids(self):
+        """ID of each sequence, or ``None`` if there are no IDs.
+
+        Notes
+        -----
+        This property is not writeable.
+
+        """
+        return self._ids
+
+    @property
+    @experimental(as_of='0.5.2')
+    def descriptions(self):
+        """Description of each sequence, or ``None``.
+
+        Notes
+        -----
+        This property is not writeable.
+
+        """
+        return self._descriptions
+
+    @property
+    @experimental(as_of='0.5.2')
+    def quality(self):
+        """Quality score of each character in ``data``, or ``None``.
+
+        Notes
+        -----
+        This property is not writeable.
+
+        """
+        return self._quality
+
+    @property
+    @experimental(as_of='0.5.2')
+    def lengths(self):
+        """Length of each sequence.
+
+        Notes
+        -----
+        This property is not writeable.
+
+        """
+        return np.diff(self._offsets)
+
+    @experimental(as_of='0.5.2')
+    def __len__(self):
+        """Return the number of sequences in the batch."""
+        return len(self._offsets) - 1
+
+    @experimental(as_of='0.5.2')
+    def __iter__(self):
+        """Iterate over the sequences in the batch."""
+        for i in range(len(self)):
+            yield self._sequence(i)
+
+    @experimental(as_of='0.5.2')
+    def __getitem__(self, indexable):
+        """Return a sequence or a subset of the batch.
+
+        Parameters
+        ----------
+        indexable : int, slice, 1D array_like (bool), or 1D array_like (int)
+            An integer selects a single sequence. Any other index selects a
+            subset of the sequences, in the order given.
+
+        Returns
+        -------
+        Sequence or SequenceBatch
+            A sequence (of type ``dtype``) viewing the batch's data if
+            `indexable` is an integer, otherwise a new batch.
+
+        """
+        if isinstance(indexable, numbers.Integral) and \
+                not isinstance(indexable, bool):
+            n = len(self)
+            if indexable < -n or indexable >= n:
+                raise IndexError(
+                    "Sequence index %d is out of range for a batch of %d "
+                    "sequences." % (indexable, n))
+            return self._sequence(indexable % n)
+
+        if isinstance(indexable, slice):
+            start, stop, step = indexable.indices(len(self))
+            if step == 1:
+                stop = max(start, stop)
+                begin, end = self._offsets[start], self._offsets[stop]
+                quality = None
+                if self._quality is not None:
+                    quality = self._quality[begin:end]
+                return self._subset(self._data[begin:end],
+                                    self._offsets[start:stop + 1] - begin,
+                                    quality, slice(start, stop))
+            indexable = np.arange(start, stop, step)
+
+        indices = np.asarray(indexable)
+        if indices.dtype == bool:
+            if indices.shape != (len(self),):
+                raise ValueError(
+                    "Boolean index must have length %d, not %d."
+                    % (len(self), len(indices)))
+            indices = np.flatnonzero(indices)
+        return self._take(indices)
+
+    def _sequence(self, i):
+        start, stop = self._offsets[i], self._offsets[i + 1]
+        metadata = None
+        if self._ids is not None or self._descriptions is not None:
+            metadata = {}
+            if self._ids is not None:
+                metadata['id'] = self._ids[i]
+            if self._descriptions is not None:
+                metadata['description'] = self._descriptions[i]
+        positional_metadata = None
+        if self._quality is not None:
+            positional_metadata = {'quality': self._quality[start:stop]}
+        return self._constructor(self._data[start:stop], metadata=metadata,
+                                 positional_metadata=positional_metadata)
+
+    def _constructor(self, sequence, **kwargs):
+        if issubclass(self._dtype, GrammaredSequence):
+            kwargs['validate'] = False
+        return self._dtype(sequence, **kwargs)
+
+    def _subset(self, data, offsets, quality, index):
+        ids = descriptions = None
+        if self._ids is not None:
+            ids = self._ids[index]
+        if self._descriptions is not None:
+            descriptions = self._descriptions[index]
+        return self.__class__(data, offsets, dtype=self._dtype, ids=ids,
+                              descriptions=descriptions, quality=quality,
+                              validate=False)
+
+    def _take(self, indices):
+        """Return a batch of the sequences at `indices`, copying the data."""
+        indices = np.asarray(indices, dtype=np.int64)
+        starts = self._offsets[:-1][indices]
+        lengths = self.lengths[indices]
+        offsets = _lengths_to_offsets(lengths)
+        positions = np.repeat(starts - offsets[:-1], lengths)
+        positions += np.arange(offsets[-1])
+
+        quality = None
+        if self._quality is not None:
+            quality = self._quality[positions]
+        return self._subset(self._data[positions], offsets, quality, indices)
+
+    def _record_indices(self):
+        """Return the index of the sequence each position belongs to."""
+        return np.repeat(np.arange(len(self)), self.lengths)
+
+    def _count_per_sequence(self, mask):
+        """Count the True values of a positional mask in each sequence."""
+        cumulative = np.zeros(len(mask) + 1, dtype=np.int64)
+        np.cumsum(mask, out=cumulative[1:])
+        return np.diff(cumulative[self._offsets])
+
+    def _reduce_per_sequence(self, ufunc, values, identity):
+        """Reduce a positional array over each sequence with a ufunc.
+
+        Empty sequences reduce to `identity`.
+
+        """
+        # Padding with the identity keeps every start a valid index, even for
+        # empty sequences at the end of the batch.
+        padded = np.append(values, np.asarray(identity, dtype=values.dtype))
+        reduced = ufunc.reduceat(padded, self._offsets[:-1])
+        reduced[self.lengths == 0] = identity
+        return reduced
+
+    def _assert_quality(self, method):
+        if self._quality is None:
+            raise ValueError(
+                "%s requires quality scores, but the batch does not have "
+                "any." % method)
+
+    def _trim(self, starts, stops):
+        """Return a batch of each sequence trimmed to [start, stop)."""
+        lengths = stops - starts
+        offsets = _lengths_to_offsets(lengths)
+        positions = np.repeat(starts - offsets[:-1], lengths)
+        positions += np.arange(offsets[-1])
+
+        quality = self._quality[positions]
+        return self._subset(self._data[positions], offsets, quality,
+                            slice(None))
+
+    def _lookup_mask(self, codes):
+        lookup = np.zeros(Sequence._number_of_extended_ascii_codes,
+                          dtype=bool)
+        lookup[codes] = True
+        return lookup[self._data]
+
+    def _assert_nucleotide(self, method):
+        if getattr(self._dtype, '_complement_lookup', None) is None:
+            raise TypeError(
+                "%s is only supported for nucleotide sequences, not %r."
+                % (method, self._dtype.__name__))
+
+    @experimental(as_of='0.5.2')
+    def filter_by_length(self, min_length=None, max_length=None):
+        """Return the sequences with lengths in a given range.
+
+        Parameters
+        ----------
+        min_length : int, optional
+            Minimum length (inclusive) of the sequences to keep.
+        max_length : int, optional
+            Maximum length (inclusive) of the sequences to keep.
+
+        Returns
+        -------
+        SequenceBatch
+            Sequences whose lengths are in the given range, in their original
+            order.
+
+        """
+        lengths = self.lengths
+        keep = np.ones(len(self), dtype=bool)
+        if min_length is not None:
+            keep &= lengths >= min_length
+        if max_length is not None:
+            keep &= lengths <= max_length
+        return self[keep]
+
+    @experimental(as_of='0.5.2')
+    def trim_ends(self, leading=None, trailing=None):
+        """Trim low quality characters from the ends of each sequence.
+
+        Parameters
+        ----------
+        leading : int, optional
+            Characters at the start of a sequence are removed until one with
+            a quality score of at least `leading` is found.
+        trailing : int, optional
+            Characters at the end of a sequence are removed until one with a
+            quality score of at least `trailing` is found.
+
+        Returns
+        -------
+        SequenceBatch
+            Batch of the trimmed sequences, in their original order. Sequences
+            without any character of sufficient quality become empty (use
+            ``filter_by_length`` to remove them).
+
+        Raises
+        ------
+        ValueError
+            If the batch does not have quality scores.
+
+        See Also
+        --------
+        trim_sliding_window
+        filter_by_length
+
+        Examples
+        --------
+        >>> from skbio import DNA
+        >>> from skbio.sequence import SequenceBatch
+        >>> batch = SequenceBatch('ACGTAGGCC', [0, 5, 9], dtype=DNA,
+        ...                       quality=[2, 30, 30, 10, 2, 2, 2, 2, 2])
+        >>> [str(seq) for seq in batch.trim_ends(leading=3, trailing=20)]
+        ['CG', '']
+
+        """
+        self._assert_quality('trim_ends')
+        starts, stops = self._offsets[:-1], self._offsets[1:]
+        if leading is not None:
+            # First position of sufficient quality at or after each start.
+            kept = np.append(np.flatnonzero(self._quality >= leading),
+                             len(self._data))
+            starts = np.minimum(kept[np.searchsorted(kept, starts)], stops)
+        if trailing is not None:
+            # Last position of sufficient quality before each stop.
+            kept = np.append(-1, np.flatnonzero(self._quality >= trailing))
+            last = kept[np.searchsorted(kept, stops) - 1]
+            stops = np.maximum(last + 1, starts)
+        return self._trim(starts, stops)
+
+    @experimental(as_of='0.5.2')
+    def trim_sliding_window(self, window, threshold):
+        """Truncate each sequence where its quality drops below a threshold.
+
+        Parameters
+        ----------
+        window : int
+            Number of consecutive characters whose quality scores are
+            averaged.
+        threshold : float
+            Minimum average quality score of a window.
+
+        Returns
+        -------
+        SequenceBatch
+            Batch of the trimmed sequences, in their original order. Each
+            sequence is truncated at the start of its first window (scanning
+            from the start of the sequence) with an average quality score
+            below `threshold`. Sequences shorter than `window` are averaged
+            as a single window and either kept entirely or become empty.
+
+        Raises
+        ------
+        ValueError
+            If `window` is less than 1.
+        ValueError
+            If the batch does not have quality scores.
+
+        See Also
+        --------
+        trim_ends
+        filter_by_expected_errors
+
+        Examples
+        --------
+        >>> from skbio import DNA
+        >>> from skbio.sequence import SequenceBatch
+        >>> batch = SequenceBatch('ACGTACGTAC', [0, 8, 10], dtype=DNA,
+        ...                       quality=[30, 30, 30, 30, 10, 30, 2, 2, 9, 9])
+        >>> [str(seq) for seq in batch.trim_sliding_window(2, 15)]
+        ['ACGTAC', '']
+        >>> [str(seq) for seq in batch.trim_sliding_window(3, 20)]
+        ['ACGT', '']
+
+        """
+        if window < 1:
+            raise ValueError("`window` must be greater than 0, not %r."
+                             % window)
+        self._assert_quality('trim_sliding_window')
+        starts, stops = self._offsets[:-1], self._offsets[1:]
+        cumulative = np.zeros(
+            len(self._data) + 1,
+            dtype=np.int64 if self._quality.dtype.kind in 'biu' else float)
+        np.cumsum(self._quality, out=cumulative[1:])
+
+        # Find the first failing window at or after the start of each
+        # sequence. Windows spanning two sequences start after every window
+        # of the first sequence, so the first failing window only belongs to
+        # the sequence if it ends within it.
+        windows = max(len(self._data) - window + 1, 0)
+        sums = cumulative[window:] - cumulative[:windows]
+        failed = np.append(np.flatnonzero(sums < threshold * window),
+                           len(self._data))
+        first = failed[np.searchsorted(failed, starts)]
+        stops = np.where(first + window <= stops, first, stops)
+
+        # Sequences shorter than the window are kept or removed whole.
+        lengths = self.lengths
+        short = (lengths < window) & (lengths > 0)
+        means = np.zeros(len(self))
+        means[short] = ((cumulative[self._offsets[1:][short]] -
+                         cumulative[starts[short]]) / lengths[short])
+        stops = np.where(short & (means < threshold), starts, stops)
+        return self._trim(starts, stops)
+
+    @experimental(as_of='0.5.2')
+    def expected_errors(self):
+        """Calculate the expected number of errors in each sequence.
+
+        Returns
+        -------
+        1D np.ndarray (float)
+            Sum of the error probabilities of the characters of each
+            sequence, as given by their Phred quality scores (a quality score
+            of ``q`` is an error probability of ``10 ** (-q / 10)``). Empty
+            sequences have zero expected errors.
+
+        Raises
+        ------
+        ValueError
+            If the batch does not have quality scores.
+
+        See Also
+        --------
+        filter_by_expected_errors
+
+        References
+        ----------
+        .. [1] Edgar, R. C., & Flyvbjerg, H. (2015). Error filtering, pair
+           assembly and error correction for next-generation sequencing
+           reads. Bioinformatics, 31(21), 3476-3482.
+
+        Examples
+        --------
+        >>> from skbio import DNA
+        >>> from skbio.sequence import SequenceBatch
+        >>> batch = SequenceBatch('ACGTAC', [0, 2, 6], dtype=DNA,
+        ...                       quality=[10, 20, 30, 30, 30, 30])
+        >>> batch.expected_errors()
+        array([ 0.11 ,  0.004])
+
+        """
+        self._assert_quality('expected_errors')
+        quality = self._quality
+        if (quality.dtype.kind in 'biu' and len(quality) and
+                0 <= quality.min() and quality.max() <= 255):
+            # Look up the probability of each (small, integer) score.
+            table = 10.0 ** (np.arange(quality.max() + 1) / -10.0)
+            probabilities = table[quality]
+        else:
+            probabilities = 10.0 ** (quality / -10.0)
+        return self._reduce_per_sequence(np.add, probabilities, 0.0)
+
+    @experimental(as_of='0.5.2')
+    def filter_by_expected_errors(self, max_errors):
+        """Return the sequences with at most a number of expected errors.
+
+        Parameters
+        ----------
+        max_errors : float
+            Maximum expected number of errors (inclusive) of the sequences to
+            keep.
+
+        Returns
+        -------
+        SequenceBatch
+            Sequences whose expected number of errors (see
+            ``expected_errors``) is at most `max_errors`, in their original
+            order.
+
+        Raises
+        ------
+        ValueError
+            If the batch does not have quality scores.
+
+        See Also
+        --------
+        expected_errors
+        filter_by_length
+
+        Examples
+        --------
+        >>> from skbio import DNA
+        >>> from skbio.sequence import SequenceBatch
+        >>> batch = SequenceBatch('ACGTAC', [0, 2, 6], dtype=DNA,
+        ...                       ids=['a', 'b'],
+        ...                       quality=[10, 20, 30, 30, 30, 30])
+        >>> batch.filter_by_expected_errors(0.1).ids
+        array(['b'], dtype=object)
+
+        """
+        return self[self.expected_errors() <= max_errors]
+
+    @experimental(as_of='0.5.2')
+    def filter_by_degenerates(self, max_degenerates=0):
+        """Return the sequences with at most a number of degenerate characters.
+
+        Parameters
+        ----------
+        max_degenerates : int, optional
+            Maximum number of degenerate characters (e.g., ``N``) of the
+            sequences to keep (inclusive).
+
+        Returns
+        -------
+        SequenceBatch
+            Sequences with at most `max_degenerates` degenerate characters, in
+            their original order.
+
+        Raises
+        ------
+        TypeError
+            If the sequences are not ``GrammaredSequence`` objects.
+
+        See Also
+        --------
+        skbio.sequence.GrammaredSequence.degenerates
+        filter_by_length
+
+        Examples
+        --------
+        >>> from skbio import DNA
+        >>> from skbio.sequence import SequenceBatch
+        >>> batch = SequenceBatch('ACGTNCNNAC', [0, 4, 7, 10], dtype=DNA,
+        ...                       ids=['a', 'b', 'c'])
+        >>> batch.filter_by_degenerates().ids
+        array(['a'], dtype=object)
+        >>> batch.filter_by_degenerates(1).ids
+        array(['a', 'c'], dtype=object)
+
+        """
+        if not issubclass(self._dtype, GrammaredSequence):
+            raise TypeError(
+                "filter_by_degenerates is only supported for "
+                "GrammaredSequence objects, not %r." % self._dtype.__name__)
+        degenerates = self._count_per_sequence(
+            self._lookup_mask(self._dtype._degenerate_codes))
+        return self[degenerates <= max_degenerates]
+
+    @experimental(as_of='0.5.2')
+    def frequencies(self, chars=None, relative=False):
+        """Compute frequencies of characters in each sequence.
+
+        Parameters
+        ----------
+        chars : str or set of str, optional
+            Characters to compute the frequencies of. May be a ``str``
+            containing a single character or a ``set`` of single-character
+            strings. If ``None``, frequencies will be computed for all
+            characters present in the batch.
+        relative : bool, optional
+            If ``True``, return the relative frequency of each character
+            instead of its count. Empty sequences have relative frequencies of
+            ``NaN``.
+
+        Returns
+        -------
+        pd.DataFrame
+            Frequencies with one row per sequence (labeled with its ID, if
+            present) and one column per character (in sorted order).
+
+        See Also
+        --------
+        Sequence.frequencies
+
+        """
+        if chars is None:
+            codes = np.flatnonzero(np.bincount(
+                self._data,
+                minlength=Sequence._number_of_extended_ascii_codes))
+        else:
+            _, codes = Sequence('')._chars_to_indices(chars)
+            codes = np.unique(codes)
+        columns = list(codes.astype(np.uint8).tostring().decode('ascii'))
+
+        lookup = np.full(Sequence._number_of_extended_ascii_codes, -1,
+                         dtype=np.int64)
+        lookup[codes] = np.arange(len(codes))
+        char_indices = lookup[self._data]
+        counted = char_indices >= 0
+        bins = self._record_indices()[counted] * len(codes)
+        bins += char_indices[counted]
+        counts = np.bincount(bins, minlength=len(self) * len(codes))
+        counts = counts.reshape(len(self), len(codes))
+
+        if relative:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                counts = counts / self.lengths[:, np.newaxis]
+
+        index = None if self._ids is None else pd.Index(self._ids.tolist())
+        return pd.DataFrame(counts, index=index, columns=columns)
+
+    @experimental(as_of='0.5.2')
+    def gc_frequency(self, relative=False):
+        """Calculate the frequency of G's and C's in each sequence.
+
+        Parameters
+        ----------
+        relative : bool, optional
+            If ``True``, return the proportion of G, C, and S characters in
+            each degapped sequence instead of their count.
+
+        Returns
+        -------
+        1D np.ndarray (int or float)
+            GC frequency of each sequence.
+
+        Raises
+        ------
+        TypeError
+            If the sequences are not nucleotide sequences.
+
+        See Also
+        --------
+        gc_content
+        skbio.sequence.DNA.gc_frequency
+
+        """
+        self._assert_nucleotide('gc_frequency')
+        gc = self._count_per_sequence(self._lookup_mask(self._dtype._gc_codes))
+        if not relative:
+            return gc
+        lengths = self.lengths - self._count_per_sequence(
+            self._lookup_mask(self._dtype._gap_codes))
+        frequency = np.zeros(len(self), dtype=float)
+        nonempty = lengths != 0
+        frequency[nonempty] = gc[nonempty] / lengths[nonempty]
+        return frequency
+
+    @experimental(as_of='0.5.2')
+    def gc_content(self):
+        """Calculate the relative frequency of G's and C's in each sequence.
+
+        Returns
+        -------
+        1D np.ndarray (float)
+            GC content of each sequence, ignoring gaps. Sequences without any
+            non-gap characters have a GC content of zero.
+
+        See Also
+        --------
+        gc_frequency
+        skbio.sequence.DNA.gc_content
+
+        """
+        return self.gc_frequency(relative=True)
+
+    @experimental(as_of='0.5.2')
+    def reverse_complement(self):
+        """Return the reverse complement of each sequence.
+
+        Returns
+        -------
+        SequenceBatch
+            Batch of the reverse complemented sequences. Quality scores are
+            reversed along with the sequences.
+
+        Raises
+        ------
+        TypeError
+            If the sequences are not nucleotide sequences.
+
+        See Also
+        --------
+        skbio.sequence.DNA.reverse_complement
+
+        """
+        self._assert_nucleotide('reverse_complement')
+        # Position p of sequence i maps to position (start + stop - 1 - p).
+        ends = self._offsets[:-1] + self._offsets[1:] - 1
+        positions = np.repeat(ends, self.lengths)
+        positions -= np.arange(len(self._data))
+
+        data = self._dtype._complement_lookup[self._data[positions]]
+        quality = None
+        if self._quality is not None:
+            quality = self._quality[positions]
+        return self._subset(data, self._offsets, quality, slice(None))
+
+    @experimental(as_of='0.5.2')
+    def degap(self):
+        """Return the sequences with gap characters removed.
+
+        Returns
+        -------
+        SequenceBatch
+            Batch of the degapped sequences. Quality scores of gap characters
+            are removed along with them.
+
+        Raises
+        ------
+        TypeError
+            If the sequences are not ``GrammaredSequence`` objects.
+
+        See Also
+        --------
+        skbio.sequence.GrammaredSequence.degap
+
+        """
+        if not issubclass(self._dtype, GrammaredSequence):
+            raise TypeError(
+                "degap is only supported for GrammaredSequence objects, not "
+                "%r." % self._dtype.__name__)
+        keep = ~self._lookup_mask(self._dtype._gap_codes)
+        cumulative = np.zeros(len(keep) + 1, dtype=np.int64)
+        np.cumsum(keep, out=cumulative[1:])
+
+        quality = None
+        if self._quality is not None:
+            quality = self._quality[keep]
+        return self._subset(self._data[keep], cumulative[self._offsets],
+                            quality, slice(None))
+
+    @experimental(as_of='0.5.2')
+    def __eq__(self, other):
+        """Determine if this batch is equal to another.
+
+        ``SequenceBatch`` objects are equal if they are of the same type and
+        their dtype, data, offsets, IDs, descriptions, and quality scores are
+        equal.
+
+        """
+        if self.__class__ != other.__class__ or self._dtype != other._dtype:
+            return False
+        if not (np.array_equal(self._offsets, other._offsets) and
+                np.array_equal(self._data, other._data)):
+            return False
+        for attr in '_ids', '_descriptions', '_quality':
+            mine, theirs = getattr(self, attr), getattr(other, attr)
+            if (mine is None) != (theirs is None):
+                return False
+            if mine is not None and not np.array_equal(mine, theirs):
+                return False
+        return True
+
+    @experimental(as_of='0.5.2')
+    def __ne__(self, other):
+        """Determine if this batch is not equal to another."""
+        return not (self == other)
+
+    @experimental(as_of='0.5.2')
+    def __repr__(self):
+        """Return a string summary of the batch."""
+        lines = ElasticLines()
+        lines.add_line('%s[%s]' % (self.__class__.__name__,
+                                   self._dtype.__name__))
+        lines.add_separator()
+        lines.add_line('Stats:')
+        lengths = self.lengths
+        lines.add_line('    sequence count: %d' % len(self))
+        lines.add_line('    total length: %d' % len(self._data))
+        if len(self):
+            lines.add_line('    min length: %d' % lengths.min())
+            lines.add_line('    max length: %d' % lengths.max())
+        lines.add_separator()
+
+        shown = range(len(self))
+        if len(self) > 5:
+            shown = [0, 1, None, len(self) - 2, len(self) - 1]
+        for i in shown:
+            if i is None:
+                lines.add_line('...')
+                continue
+            start, stop = self._offsets[i], self._offsets[i + 1]
+            seq = self._data[start:min(stop, start + 50)].tostring().decode(
+                'ascii')
+            if stop - start > 50:
+                seq += '...'
+            label = '%d' % i
+            if self._ids is not None:
+                label += ' %s' % self._ids[i]
+            lines.add_line('%s %s' % (label, seq))
+        return lines.to_str()
+
+    @experimental(as_of='0.5.2')
+    def __str__(self):
+        """Return a string summary of the batch."""
+        return self.__repr__()
+
+
+def _lengths_to_offsets(lengths):
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
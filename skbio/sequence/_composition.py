@@ -0,0 +1,261 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+import numpy as np
+
+from skbio.sequence._grammared_sequence import GrammaredSequence
+from skbio.sequence._batch import SequenceBatch
+from skbio.sequence._kmer import (_encode_kmers, _kmer_encoding,
+                                  _max_kmer_code, _count_kmers)
+from skbio.util._decorator import experimental
+
+# Number of positions counted at a time, which bounds the memory used to count
+# the kmers of many short sequences or of a few long ones (e.g., chromosomes).
+_chunk_size = 2 ** 22
+_too_many_kmers = ("Cannot count kmers of length %(k)d: there are too many "
+                   "possible kmers (%(base)d ** %(k)d).")
+
+
+@experimental(as_of='0.5.2')
+def kmer_count_matrix(sequences, k, overlap=True, canonical=False,
+                      sparse=False):
+    """Count the definite kmers of many sequences into a matrix.
+
+    Parameters
+    ----------
+    sequences : iterable of GrammaredSequence or SequenceBatch
+        Sequences to count the kmers of (e.g., contigs or reads read with
+        ``skbio.io.read``). All sequences must be of the same type. Sequences
+        are consumed one at a time and counted in chunks, so they do not need
+        to fit in memory at once.
+    k : int
+        The kmer length. Use ``k=1`` to count definite characters.
+    overlap : bool, optional
+        Defines whether the kmers should be overlapping or not.
+    canonical : bool, optional
+        If ``True``, count each kmer together with its reverse complement
+        under whichever of the two sorts first. Columns of kmers that are not
+        canonical are always zero. Only supported for nucleotide sequences.
+    sparse : bool, optional
+        If ``True``, return a ``scipy.sparse.csr_matrix`` instead of a dense
+        array.
+
+    Returns
+    -------
+    counts : 2D np.ndarray (int) or scipy.sparse.csr_matrix
+        Count of each kmer (columns) in each sequence (rows, in the order of
+        `sequences`). There is one column for each of the
+        ``len(definite_chars) ** k`` possible kmers, in the same order as
+        ``GrammaredSequence.kmer_counts``. If there are no sequences, the
+        matrix has no rows and no columns.
+    ids : list
+        ID of each sequence (i.e., its ``'id'`` metadata), or ``None`` for
+        sequences without an ID.
+
+    Raises
+    ------
+    ValueError
+        If `k` is less than 1.
+    ValueError
+        If there are too many possible kmers to index with a 64-bit integer.
+    TypeError
+        If the sequences are not all ``GrammaredSequence`` objects of the same
+        type, or if `canonical` is ``True`` and the sequences do not have a
+        complement.
+
+    See Also
+    --------
+    GrammaredSequence.kmer_counts
+    SequenceBatch.frequencies
+
+    Notes
+    -----
+    Row ``i`` of the matrix is equal to ``sequences[i].kmer_counts(k)``, but
+    kmers are encoded and counted for many sequences at once instead of
+    building a ``dict`` or vector per sequence. Kmers containing gap or
+    degenerate characters are not counted. Dense matrices grow exponentially
+    with `k`; use ``sparse=True`` for large `k`.
+
+    Examples
+    --------
+    >>> from skbio import DNA
+    >>> from skbio.sequence import kmer_count_matrix
+    >>> seqs = [DNA('ACGTT', metadata={'id': 'a'}),
+    ...         DNA('GGNGC', metadata={'id': 'b'})]
+    >>> counts, ids = kmer_count_matrix(seqs, 1)
+    >>> counts
+    array([[1, 1, 1, 2],
+           [0, 1, 3, 0]])
+    >>> ids
+    ['a', 'b']
+
+    Columns are in lexicographic order of the definite characters:
+
+    >>> from itertools import product
+    >>> kmers = [''.join(kmer)
+    ...          for kmer in product(sorted(DNA.definite_chars), repeat=2)]
+    >>> counts, ids = kmer_count_matrix(seqs, 2, sparse=True)
+    >>> counts.shape
+    (2, 16)
+    >>> [(ids[row], kmers[col], counts[row, col])
+    ...  for row, col in zip(*counts.nonzero())]
+    ... # doctest: +NORMALIZE_WHITESPACE
+    [('a', 'AC', 1), ('a', 'CG', 1), ('a', 'GT', 1), ('a', 'TT', 1),
+     ('b', 'GC', 1), ('b', 'GG', 1)]
+
+    Count the kmers of each sequence in a FASTA file:
+
+    >>> from io import StringIO
+    >>> import skbio.io
+    >>> fh = StringIO('>s1\\nAACC\\n>s2\\nTTTTGG\\n')
+    >>> seqs = skbio.io.read(fh, format='fasta', constructor=DNA)
+    >>> counts, ids = kmer_count_matrix(seqs, 1)
+    >>> counts
+    array([[2, 2, 0, 0],
+           [0, 0, 2, 4]])
+    >>> ids
+    ['s1', 's2']
+
+    """
+    if k < 1:
+        raise ValueError("k must be greater than 0.")
+    step = 1 if overlap else k
+
+    dtype = sequences.dtype if isinstance(sequences, SequenceBatch) else None
+    ids = []
+    rows, codes, counts = [], [], []
+    chunk, chunk_rows, chunk_length = [], [], 0
+    num_codes = 0
+    for dtype, bytes_, id in _kmer_records(sequences):
+        if not num_codes:
+            encoding = _kmer_encoding(dtype, k, canonical, _too_many_kmers)
+            num_codes = encoding[1] ** k
+
+        row = len(ids)
+        ids.append(id)
+        for segment in _segments(bytes_, k, step):
+            chunk.append(segment)
+            chunk_rows.append(row)
+            chunk_length += len(segment) + step
+            if chunk_length >= _chunk_size:
+                for total, new in zip((rows, codes, counts), _count_chunk(
+                        chunk, chunk_rows, k, step, encoding)):
+                    total.append(new)
+                chunk, chunk_rows, chunk_length = [], [], 0
+
+    if dtype is not None and not num_codes:
+        # No sequences, but their type is known (e.g., an empty batch).
+        num_codes = _kmer_encoding(dtype, k, canonical,
+                                   _too_many_kmers)[1] ** k
+    if chunk:
+        for total, new in zip((rows, codes, counts),
+                              _count_chunk(chunk, chunk_rows, k, step,
+                                           encoding)):
+            total.append(new)
+
+    from scipy.sparse import coo_matrix
+    empty = np.empty(0, dtype=np.int64)
+    matrix = coo_matrix((np.concatenate(counts + [empty]),
+                         (np.concatenate(rows + [empty]),
+                          np.concatenate(codes + [empty]))),
+                        shape=(len(ids), num_codes))
+    # Counts of a sequence split across chunks are summed here.
+    return (matrix.tocsr() if sparse else matrix.toarray()), ids
+
+
+def _kmer_records(sequences):
+    """Yield the type, bytes (a view), and ID of each sequence.
+
+    `sequences` is a ``SequenceBatch`` or an iterable of sequences, which must
+    all be ``GrammaredSequence`` objects of the same type.
+
+    """
+    if isinstance(sequences, SequenceBatch):
+        data, offsets, ids = (sequences.data, sequences.offsets.tolist(),
+                              sequences.ids)
+        for i, (start, stop) in enumerate(zip(offsets[:-1], offsets[1:])):
+            yield (sequences.dtype, data[start:stop],
+                   None if ids is None else ids[i])
+        return
+
+    dtype = None
+    for seq in sequences:
+        if dtype is None:
+            dtype = type(seq)
+            if not issubclass(dtype, GrammaredSequence):
+                raise TypeError("Sequences must be GrammaredSequence objects, "
+                                "not %r." % dtype.__name__)
+        elif type(seq) is not dtype:
+            raise TypeError("Sequences must all be of type %r, not %r."
+                            % (dtype.__name__, type(seq).__name__))
+        id = seq.metadata.get('id') if seq.has_metadata() else None
+        yield dtype, seq._bytes, id
+
+
+def _segments(bytes_, k, step):
+    """Split a sequence into pieces of about `_chunk_size` positions.
+
+    Consecutive pieces overlap by ``k - 1`` positions so that every kmer of
+    the sequence is in exactly one piece, and each piece starts at a multiple
+    of `step` so that non-overlapping kmers keep their frame.
+
+    """
+    length = max(step, _chunk_size // step * step)
+    return [bytes_[begin:begin + length + k - 1]
+            for begin in range(0, len(bytes_) - k + 1, length)]
+
+
+def _count_chunk(segments, segment_rows, k, step, encoding):
+    """Count the kmers of many sequence segments at once.
+
+    Returns the row, kmer code, and count of each kmer observed in each row.
+
+    """
+    rank, base, complement = encoding
+    # Segments are separated by invalid characters (NUL is never definite) so
+    # that no kmer spans two segments. When kmers don't overlap, segments are
+    # padded to a multiple of `step` so that each one starts a new kmer.
+    lengths = np.asarray([len(segment) for segment in segments],
+                         dtype=np.int64)
+    if step == 1:
+        padded = lengths + 1
+    else:
+        padded = lengths - lengths % -step
+    padding = np.zeros(step, dtype=np.uint8)
+    parts = []
+    for segment, size in zip(segments, (padded - lengths).tolist()):
+        parts.append(segment)
+        parts.append(padding[:size])
+    buffer = np.concatenate(parts)
+
+    kmers, valid = _encode_kmers(rank[buffer], k, step, base, complement)
+    # Each segment (with its padding) starts `padded // step` kmers.
+    kmer_rows = np.repeat(np.asarray(segment_rows, dtype=np.int64),
+                          padded // step)[:len(kmers)]
+    if valid is not None:
+        kmers = kmers[valid]
+        kmer_rows = kmer_rows[valid]
+
+    # Count each (row, kmer) pair, encoded as a single integer if possible.
+    num_codes = base ** k
+    first_row = segment_rows[0]
+    num_keys = (segment_rows[-1] - first_row + 1) * num_codes
+    if num_keys <= _max_kmer_code:
+        keys = (kmer_rows - first_row) * num_codes + kmers
+        keys, counts = _count_kmers(keys, num_keys)
+        kmer_rows, kmers = np.divmod(keys, num_codes)
+        return kmer_rows + first_row, kmers, counts
+
+    order = np.lexsort((kmers, kmer_rows))
+    kmers = kmers[order]
+    kmer_rows = kmer_rows[order]
+    first = np.ones(len(kmers), dtype=bool)
+    first[1:] = (kmers[1:] != kmers[:-1]) | (kmer_rows[1:] != kmer_rows[:-1])
+    first = np.flatnonzero(first)
+    counts = np.diff(np.append(first, len(kmers)))
+    return kmer_rows[first], kmers[first], counts
@@ -0,0 +1,196 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+import numpy as np
+
+from skbio.sequence._sequence import Sequence
+from skbio.sequence._grammared_sequence import GrammaredSequence
+from skbio.sequence._batch import SequenceBatch
+from skbio.util._decorator import experimental
+
+
+@experimental(as_of='0.5.2')
+def dereplicate(sequences, reverse_complement=False, min_abundance=1,
+                members=True):
+    """Collapse identical sequences, counting how often each occurs.
+
+    Parameters
+    ----------
+    sequences : iterable of Sequence or SequenceBatch
+        Sequences to dereplicate (e.g., reads read with ``skbio.io.read``).
+        All sequences must be of the same type. Sequences are consumed one at
+        a time, so they do not need to fit in memory at once.
+    reverse_complement : bool, optional
+        If ``True``, a sequence and its reverse complement are considered
+        identical. Only supported for nucleotide sequences (e.g., ``DNA``).
+    min_abundance : int, optional
+        Minimum number of occurrences of a unique sequence for it to be
+        returned (e.g., ``2`` to discard singletons).
+    members : bool, optional
+        If ``True``, keep the ID of every occurrence of each unique sequence.
+        If ``False``, only the unique sequences and their abundances are
+        kept, so memory use does not grow with the number of input sequences.
+
+    Returns
+    -------
+    list of Sequence
+        Unique sequences, ordered by decreasing abundance and then by first
+        occurrence. Each sequence has the type and orientation of its first
+        occurrence, and metadata containing the ``'id'`` of its first
+        occurrence (if present), its ``'abundance'``, and, if `members` is
+        ``True``, the list of IDs of all of its occurrences as ``'members'``
+        (``None`` for occurrences without an ID). Positional metadata (e.g.,
+        quality scores) is not kept.
+
+    Raises
+    ------
+    TypeError
+        If the sequences are not all of the same type, or if
+        `reverse_complement` is ``True`` and the sequences are not nucleotide
+        sequences.
+    ValueError
+        If `min_abundance` is less than one.
+
+    See Also
+    --------
+    SequenceBatch
+
+    Notes
+    -----
+    Sequences are compared by hashing their underlying bytes, without
+    converting them to ``str``. Only the first occurrence of each unique
+    sequence is stored. Sequences differing only in case are identical if
+    they were read with ``lowercase=True``, since ``GrammaredSequence``
+    objects store them in uppercase.
+
+    Examples
+    --------
+    >>> from skbio import DNA
+    >>> from skbio.sequence import dereplicate
+    >>> reads = [DNA('ACGT', metadata={'id': 'r1'}),
+    ...          DNA('GGCA', metadata={'id': 'r2'}),
+    ...          DNA('ACGT', metadata={'id': 'r3'}),
+    ...          DNA('TGCC', metadata={'id': 'r4'})]
+    >>> for seq in dereplicate(reads):
+    ...     str(seq), seq.metadata['abundance'], seq.metadata['members']
+    ('ACGT', 2, ['r1', 'r3'])
+    ('GGCA', 1, ['r2'])
+    ('TGCC', 1, ['r4'])
+
+    Also collapse reverse complements:
+
+    >>> for seq in dereplicate(reads, reverse_complement=True):
+    ...     str(seq), seq.metadata['abundance'], seq.metadata['members']
+    ('ACGT', 2, ['r1', 'r3'])
+    ('GGCA', 2, ['r2', 'r4'])
+
+    Dereplicate the reads in a FASTQ file, discarding singletons:
+
+    >>> from io import StringIO
+    >>> import skbio.io
+    >>> fh = StringIO('@r1\\nACGT\\n+\\nIIII\\n@r2\\nACGT\\n+\\nII#I\\n'
+    ...               '@r3\\nACGA\\n+\\nIIII\\n')
+    >>> reads = skbio.io.read(fh, format='fastq', variant='illumina1.8',
+    ...                       constructor=DNA)
+    >>> [str(seq) for seq in dereplicate(reads, min_abundance=2)]
+    ['ACGT']
+
+    """
+    if min_abundance < 1:
+        raise ValueError("`min_abundance` must be greater than 0, not %r."
+                         % min_abundance)
+
+    if isinstance(sequences, SequenceBatch):
+        records = _batch_records(sequences, reverse_complement)
+    else:
+        records = _sequence_records(sequences, reverse_complement)
+
+    index = {}
+    dtype = None
+    representatives = []
+    abundances = []
+    member_ids = []
+    for dtype, key, data, id in records:
+        i = index.get(key)
+        if i is None:
+            i = index[key] = len(representatives)
+            representatives.append((data, id))
+            abundances.append(0)
+            if members:
+                member_ids.append([])
+        abundances[i] += 1
+        if members:
+            member_ids[i].append(id)
+
+    abundances = np.asarray(abundances, dtype=np.int64)
+    order = np.argsort(-abundances, kind='mergesort')
+    order = order[abundances[order] >= min_abundance]
+
+    kwargs = {}
+    if dtype is not None and issubclass(dtype, GrammaredSequence):
+        kwargs['validate'] = False
+    uniques = []
+    for i in order.tolist():
+        data, id = representatives[i]
+        metadata = {}
+        if id is not None:
+            metadata['id'] = id
+        metadata['abundance'] = int(abundances[i])
+        if members:
+            metadata['members'] = member_ids[i]
+        uniques.append(dtype(np.frombuffer(data, dtype=np.uint8),
+                             metadata=metadata, **kwargs))
+    return uniques
+
+
+def _assert_nucleotide(dtype):
+    if getattr(dtype, '_complement_lookup', None) is None:
+        raise TypeError(
+            "Reverse complements can only be collapsed for nucleotide "
+            "sequences, not %r." % dtype.__name__)
+
+
+def _sequence_records(sequences, reverse_complement):
+    """Yield the type, key, bytes, and ID of each sequence."""
+    dtype = None
+    for seq in sequences:
+        if dtype is None:
+            dtype = type(seq)
+            if not issubclass(dtype, Sequence):
+                raise TypeError("Sequences must be Sequence objects, not %r."
+                                % dtype.__name__)
+            if reverse_complement:
+                _assert_nucleotide(dtype)
+                complement = dtype._complement_lookup
+        elif type(seq) is not dtype:
+            raise TypeError("Sequences must all be of type %r, not %r."
+                            % (dtype.__name__, type(seq).__name__))
+
+        data = seq._bytes.tobytes()
+        key = data
+        if reverse_complement:
+            key = min(key, complement[seq._bytes[::-1]].tobytes())
+        id = seq.metadata.get('id') if seq.has_metadata() else None
+        yield dtype, key, data, id
+
+
+def _batch_records(batch, reverse_complement):
+    """Yield the type, key, bytes, and ID of each sequence in a batch."""
+    dtype = batch.dtype
+    if reverse_complement:
+        _assert_nucleotide(dtype)
+        # Reverse complement all sequences at once. Both batches share the
+        # same offsets since sequences keep their lengths and order.
+        complements = batch.reverse_complement().data
+    data, offsets, ids = batch.data, batch.offsets.tolist(), batch.ids
+    for i, (start, stop) in enumerate(zip(offsets[:-1], offsets[1:])):
+        seq = data[start:stop].tobytes()
+        key = seq
+        if reverse_complement:
+            key = min(key, complements[start:stop].tobytes())
+        yield dtype, key, seq, None if ids is None else ids[i]
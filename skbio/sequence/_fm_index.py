@@ -0,0 +1,504 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+import numpy as np
+
+from skbio._base import SkbioObject, ElasticLines
+from skbio.sequence._sequence import Sequence
+from skbio.util._decorator import experimental
+
+# Distance between the rows of the BWT at which occurrence counts are stored.
+# Counts at other rows are computed by scanning at most this many characters.
+_checkpoint_interval = 32
+# Number of patterns searched at a time, which bounds the memory used by
+# count_many and locate_many.
+_query_chunk_size = 2 ** 16
+# Row `i` selects the first `i` characters of a block.
+_scan_masks = np.tri(_checkpoint_interval, k=-1, dtype=bool)
+
+
+class FMIndex(SkbioObject):
+    """Full-text index of a sequence for fast exact substring queries.
+
+    An ``FMIndex`` [1]_ is built once from a sequence (e.g., a reference
+    genome). It can then count and locate the exact occurrences of a pattern
+    in time proportional to the length of the pattern, independent of the
+    length of the sequence, and search many patterns (e.g., millions of
+    probes or reads) at once.
+
+    Parameters
+    ----------
+    sequence : Sequence or str
+        Sequence to index. Only its characters are indexed (metadata is
+        ignored).
+    suffix_array : 1D array_like (int), optional
+        Suffix array of `sequence` (e.g., as stored in an ``fmindex`` file),
+        i.e., the start positions of the suffixes of `sequence` in
+        lexicographic order. If not provided, it is computed. A provided
+        suffix array must be a permutation of the positions of `sequence`,
+        but is otherwise not checked.
+
+    Raises
+    ------
+    TypeError
+        If `sequence` is not a ``Sequence`` or ``str``.
+    ValueError
+        If `suffix_array` is not a permutation of the positions of
+        `sequence`.
+
+    See Also
+    --------
+    Sequence.count
+    Sequence.index
+    PatternMatcher
+
+    Notes
+    -----
+    The suffix array is built by prefix doubling with NumPy sorts, starting
+    from as many characters per suffix as fit into a 64-bit integer. The
+    Burrows-Wheeler transform (BWT) of the sequence and the number of
+    occurrences of each character before every 32nd row of the BWT are
+    stored, and patterns are searched backwards one character at a time [1]_.
+    Many patterns are searched together, advancing all of them by one
+    character per step with NumPy. Occurrences are located with the full
+    suffix array.
+
+    Matching is exact: degenerate characters only match themselves, and
+    characters are case sensitive (``GrammaredSequence`` objects are stored in
+    uppercase).
+
+    ``FMIndex`` objects can be written to and read from binary ``fmindex``
+    files with ``skbio.io``, so that the index only needs to be built once.
+
+    References
+    ----------
+    .. [1] Ferragina, P., & Manzini, G. (2000). Opportunistic data structures
+       with applications. In Proceedings 41st Annual Symposium on Foundations
+       of Computer Science (pp. 390-398). IEEE.
+
+    Examples
+    --------
+    >>> from skbio import DNA
+    >>> from skbio.sequence import FMIndex
+    >>> index = FMIndex(DNA('ACGTACGTTACG'))
+    >>> index.count('ACG')
+    3
+    >>> index.locate('ACG')
+    array([0, 4, 9])
+    >>> 'GTT' in index
+    True
+
+    Count and locate many patterns at once:
+
+    >>> index.count_many(['ACG', 'TA', 'GG', 'C'])
+    array([3, 2, 0, 3])
+    >>> positions, offsets = index.locate_many(['TA', 'GG', 'C'])
+    >>> positions
+    array([ 3,  8,  1,  5, 10])
+    >>> offsets
+    array([0, 2, 2, 5])
+
+    """
+    default_write_format = 'fmindex'
+    __hash__ = None
+
+    @experimental(as_of='0.5.2')
+    def __init__(self, sequence, suffix_array=None):
+        if isinstance(sequence, str):
+            sequence = Sequence(sequence)
+        elif not isinstance(sequence, Sequence):
+            raise TypeError("Can only index a Sequence or str, not %r."
+                            % type(sequence).__name__)
+        self._sequence = sequence
+        text = sequence._bytes
+        n = len(text)
+
+        # Characters are ranked from 1 in the order of their byte values;
+        # rank 0 is the sentinel that ends the text.
+        observed = np.flatnonzero(np.bincount(
+            text, minlength=Sequence._number_of_extended_ascii_codes))
+        self._lookup = np.zeros(Sequence._number_of_extended_ascii_codes,
+                                dtype=np.int64)
+        self._lookup[observed] = np.arange(1, len(observed) + 1)
+        num_ranks = len(observed) + 1
+        ranks = np.zeros(n + 1, dtype=np.uint8 if num_ranks <= 256
+                         else np.uint16)
+        ranks[:n] = self._lookup[text]
+
+        if suffix_array is None:
+            suffixes = _suffix_array(ranks, num_ranks)
+        else:
+            suffix_array = np.asarray(suffix_array)
+            if (suffix_array.shape != (n,) or
+                    (n and (suffix_array.dtype.kind not in 'iu' or
+                            suffix_array.min() < 0 or
+                            suffix_array.max() >= n or
+                            (np.bincount(suffix_array, minlength=n) != 1)
+                            .any()))):
+                raise ValueError(
+                    "`suffix_array` must be a permutation of the %d "
+                    "positions of the sequence." % n)
+            # The empty suffix (starting at the sentinel) sorts first.
+            suffixes = np.empty(n + 1, dtype=np.int64)
+            suffixes[0] = n
+            suffixes[1:] = suffix_array
+        suffixes.flags.writeable = False
+        self._suffixes = suffixes
+
+        # The BWT holds the character preceding each sorted suffix (the
+        # sentinel precedes the suffix starting at 0).
+        bwt = ranks[suffixes - 1]
+        counts = np.bincount(ranks, minlength=num_ranks)
+        self._first = np.cumsum(counts) - counts
+
+        # Occurrences of each rank in the BWT before every checkpoint row.
+        num_checkpoints = n // _checkpoint_interval + 2
+        blocks = np.arange(n + 1) // _checkpoint_interval
+        checkpoints = np.zeros((num_checkpoints, num_ranks),
+                               dtype=np.int64)
+        checkpoints[1:] = np.bincount(
+            blocks * num_ranks + bwt,
+            minlength=(num_checkpoints - 1) * num_ranks).reshape(
+                num_checkpoints - 1, num_ranks)
+        np.cumsum(checkpoints, axis=0, out=checkpoints)
+        self._checkpoints = checkpoints
+        # Pad the BWT to whole blocks (one per checkpoint) with a rank that is
+        # never counted.
+        self._bwt = np.full(num_checkpoints * _checkpoint_interval, num_ranks,
+                            dtype=bwt.dtype)
+        self._bwt[:n + 1] = bwt
+        self._bwt = self._bwt.reshape(num_checkpoints, _checkpoint_interval)
+
+    @property
+    @experimental(as_of='0.5.2')
+    def sequence(self):
+        """Indexed sequence.
+
+        Returns
+        -------
+        Sequence
+            Sequence the index was built from.
+
+        """
+        return self._sequence
+
+    @property
+    @experimental(as_of='0.5.2')
+    def suffix_array(self):
+        """Start positions of the suffixes of the sequence in sorted order.
+
+        Returns
+        -------
+        1D np.ndarray (int)
+            Suffix array of the indexed sequence. The array is read-only.
+
+        Examples
+        --------
+        >>> from skbio.sequence import FMIndex
+        >>> FMIndex('banana').suffix_array
+        array([5, 3, 1, 0, 4, 2])
+
+        """
+        return self._suffixes[1:]
+
+    @experimental(as_of='0.5.2')
+    def __len__(self):
+        """Return the length of the indexed sequence."""
+        return len(self._suffixes) - 1
+
+    @experimental(as_of='0.5.2')
+    def __contains__(self, pattern):
+        """Determine if a pattern occurs in the indexed sequence.
+
+        Parameters
+        ----------
+        pattern : str, bytes, or Sequence
+            Pattern to search for.
+
+        Returns
+        -------
+        bool
+            Indicates whether `pattern` occurs in the indexed sequence.
+
+        """
+        return self.count(pattern) > 0
+
+    @experimental(as_of='0.5.2')
+    def count(self, pattern):
+        """Count the occurrences of a pattern in the indexed sequence.
+
+        Parameters
+        ----------
+        pattern : str, bytes, or Sequence
+            Pattern to count. Must not be empty.
+
+        Returns
+        -------
+        int
+            Number of (possibly overlapping) occurrences of `pattern`.
+
+        Raises
+        ------
+        ValueError
+            If `pattern` is empty or is a str containing non-ASCII
+            characters.
+
+        See Also
+        --------
+        count_many
+        locate
+
+        """
+        return int(self.count_many([pattern])[0])
+
+    @experimental(as_of='0.5.2')
+    def locate(self, pattern):
+        """Find the start positions of a pattern in the indexed sequence.
+
+        Parameters
+        ----------
+        pattern : str, bytes, or Sequence
+            Pattern to locate. Must not be empty.
+
+        Returns
+        -------
+        1D np.ndarray (int)
+            Start position of each (possibly overlapping) occurrence of
+            `pattern`, in ascending order.
+
+        Raises
+        ------
+        ValueError
+            If `pattern` is empty or is a str containing non-ASCII
+            characters.
+
+        See Also
+        --------
+        locate_many
+        count
+
+        """
+        return self.locate_many([pattern])[0]
+
+    @experimental(as_of='0.5.2')
+    def count_many(self, patterns):
+        """Count the occurrences of many patterns in the indexed sequence.
+
+        Parameters
+        ----------
+        patterns : iterable of str, bytes, or Sequence
+            Patterns to count. Patterns must not be empty.
+
+        Returns
+        -------
+        1D np.ndarray (int)
+            Number of (possibly overlapping) occurrences of each pattern.
+
+        Raises
+        ------
+        ValueError
+            If a pattern is empty or is a str containing non-ASCII
+            characters.
+
+        See Also
+        --------
+        count
+        locate_many
+
+        """
+        lower, upper = self._search(patterns)
+        return upper - lower
+
+    @experimental(as_of='0.5.2')
+    def locate_many(self, patterns):
+        """Find the start positions of many patterns in the indexed sequence.
+
+        Parameters
+        ----------
+        patterns : iterable of str, bytes, or Sequence
+            Patterns to locate. Patterns must not be empty.
+
+        Returns
+        -------
+        positions : 1D np.ndarray (int)
+            Start positions of the occurrences of all patterns. The positions
+            of pattern ``i`` are ``positions[offsets[i]:offsets[i + 1]]``, in
+            ascending order.
+        offsets : 1D np.ndarray (int)
+            Offsets of the positions of each pattern in `positions`, with one
+            more element than there are patterns.
+
+        Raises
+        ------
+        ValueError
+            If a pattern is empty or is a str containing non-ASCII
+            characters.
+
+        See Also
+        --------
+        locate
+        count_many
+
+        """
+        lower, upper = self._search(patterns)
+        counts = upper - lower
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        # Rows of the sorted suffixes matching each pattern, in order.
+        rows = np.arange(offsets[-1], dtype=np.int64)
+        rows += np.repeat(lower - offsets[:-1], counts)
+        # Sort the positions of each pattern by sorting (pattern, position)
+        # pairs encoded as single integers.
+        keys = np.repeat(np.arange(len(counts), dtype=np.int64), counts)
+        keys *= len(self._suffixes)
+        keys += self._suffixes[rows]
+        keys.sort()
+        return keys % len(self._suffixes), offsets
+
+    def _search(self, patterns):
+        """Return the range of sorted suffixes starting with each pattern."""
+        patterns = [_pattern_to_bytes(pattern) for pattern in patterns]
+        lower = np.zeros(len(patterns), dtype=np.int64)
+        upper = np.zeros(len(patterns), dtype=np.int64)
+        for begin in range(0, len(patterns), _query_chunk_size):
+            chunk = slice(begin, begin + _query_chunk_size)
+            lower[chunk], upper[chunk] = self._backward_search(
+                patterns[chunk])
+        return lower, upper
+
+    def _backward_search(self, patterns):
+        lengths = np.fromiter((len(pattern) for pattern in patterns),
+                              dtype=np.int64, count=len(patterns))
+        if (lengths == 0).any():
+            raise ValueError("Patterns must not be empty.")
+        ranks = self._lookup[np.frombuffer(b''.join(patterns),
+                                           dtype=np.uint8)]
+        ends = np.cumsum(lengths) - 1
+
+        lower = np.zeros(len(patterns), dtype=np.int64)
+        upper = np.full(len(patterns), len(self._suffixes), dtype=np.int64)
+        for step in range(lengths.max() if len(patterns) else 0):
+            active = np.flatnonzero((lengths > step) & (lower < upper))
+            if not active.size:
+                break
+            chars = ranks[ends[active] - step]
+            first = self._first[chars]
+            # Rank 0 (the sentinel) marks characters that don't occur in the
+            # sequence.
+            found = chars != 0
+            # Narrow the ranges of all active patterns at once.
+            bounds = self._occurrences(
+                np.tile(chars, 2),
+                np.concatenate((lower[active], upper[active])))
+            bounds += np.tile(first, 2)
+            bounds[np.tile(~found, 2)] = 0
+            lower[active], upper[active] = np.split(bounds, 2)
+        return lower, upper
+
+    def _occurrences(self, chars, rows):
+        """Count each char in the BWT before the corresponding row."""
+        blocks, offsets = np.divmod(rows, _checkpoint_interval)
+        counts = self._checkpoints[blocks, chars]
+        # Scan the block of each row up to the row.
+        windows = self._bwt[blocks] == chars.astype(self._bwt.dtype)[
+            :, np.newaxis]
+        windows &= _scan_masks[offsets]
+        counts += windows.sum(axis=1)
+        return counts
+
+    @experimental(as_of='0.5.2')
+    def __eq__(self, other):
+        """Determine if the index is equal to another.
+
+        Indexes are equal if they are of the same type and index the same
+        characters (the types and metadata of the indexed sequences are
+        ignored).
+
+        Parameters
+        ----------
+        other : FMIndex
+            Index to test for equality against.
+
+        Returns
+        -------
+        bool
+            Indicates whether the indexes are equal.
+
+        """
+        if self.__class__ != other.__class__:
+            return False
+        return np.array_equal(self._sequence._bytes, other._sequence._bytes)
+
+    @experimental(as_of='0.5.2')
+    def __ne__(self, other):
+        """Determine if the index is not equal to another."""
+        return not (self == other)
+
+    @experimental(as_of='0.5.2')
+    def __repr__(self):
+        """Return a string summary of the index."""
+        lines = ElasticLines()
+        lines.add_line('%s[%s]' % (self.__class__.__name__,
+                                   type(self._sequence).__name__))
+        lines.add_separator()
+        lines.add_line('Stats:')
+        lines.add_line('    length: %d' % len(self))
+        lines.add_line('    characters: %d' % (len(self._first) - 1))
+        return lines.to_str()
+
+    @experimental(as_of='0.5.2')
+    def __str__(self):
+        return repr(self)
+
+
+def _pattern_to_bytes(pattern):
+    if isinstance(pattern, str):
+        try:
+            return pattern.encode('ascii')
+        except UnicodeEncodeError:
+            raise ValueError("Patterns must only contain ASCII characters, "
+                             "not %r." % pattern)
+    if isinstance(pattern, bytes):
+        return pattern
+    if isinstance(pattern, Sequence):
+        return pattern._bytes.tobytes()
+    raise TypeError("Patterns must be str, bytes, or Sequence objects, not "
+                    "%r." % type(pattern).__name__)
+
+
+def _suffix_array(ranks, num_ranks):
+    """Sort the suffixes of `ranks` (which ends with a unique rank 0)."""
+    size = len(ranks)
+    # Rank suffixes by their first few characters, packed into an integer.
+    prefix = 1
+    while prefix < 64 and num_ranks ** (prefix + 1) < 2 ** 62:
+        prefix += 1
+    padded = np.zeros(size + prefix, dtype=np.int64)
+    padded[:size] = ranks
+    keys = np.zeros(size, dtype=np.int64)
+    for offset in range(prefix):
+        keys *= num_ranks
+        keys += padded[offset:offset + size]
+
+    # Prefix doubling: once suffixes are ranked by their first `length`
+    # characters, rank them by their first `2 * length` characters by
+    # sorting (rank of the suffix, rank of the suffix `length` later) pairs.
+    length = prefix
+    while True:
+        suffixes = np.argsort(keys)
+        keys = keys[suffixes]
+        sorted_ranks = np.zeros(size, dtype=np.int64)
+        np.cumsum(keys[1:] != keys[:-1], out=sorted_ranks[1:])
+        if sorted_ranks[-1] == size - 1:
+            return suffixes
+        ranks = np.empty(size, dtype=np.int64)
+        ranks[suffixes] = sorted_ranks
+        keys = ranks * size
+        keys[:size - length] += ranks[length:]
+        length *= 2
@@ -7,10 +7,14 @@
 # ----------------------------------------------------------------------------
 
 import numpy as np
+import pandas as pd
 
-from skbio.util._decorator import classproperty, stable, classonlymethod
+from skbio.metadata import IntervalMetadata
+from skbio.util._decorator import (classproperty, stable, classonlymethod,
+                                   experimental)
 from skbio._base import SkbioObject
-from skbio.sequence import Protein, RNA
+from skbio.sequence import Protein, RNA, DNA
+from skbio.sequence._batch import SequenceBatch, _lengths_to_offsets
 from skbio._base import ElasticLines
 
 
@@ -116,6 +120,9 @@ class GeneticCode(SkbioObject):
     """
     _num_codons = 64
     _radix_multiplier = np.asarray([16, 4, 1], dtype=np.uint8)
+    # codons in NCBI's codon order, i.e., ordered by codon index (0-63)
+    _codons = [first + second + third
+               for first in 'UCAG' for second in 'UCAG' for third in 'UCAG']
     _start_stop_options = ['ignore', 'optional', 'require']
     __offset_table = None
 
@@ -128,10 +135,12 @@ class GeneticCode(SkbioObject):
             # invalid (out of bounds) index into `amino_acids` which should
             # error noisily. this is important in case the valid definite
             # IUPAC RNA characters change in the future and the assumptions
-            # currently made by the code become invalid
-            table = np.empty(ord(b'U') + 1, dtype=np.uint8)
+            # currently made by the code become invalid. T shares U's offset
+            # so that DNA can be translated in batches without transcribing
+            table = np.empty(256, dtype=np.uint8)
             table.fill(255)
             table[ord(b'U')] = 0
+            table[ord(b'T')] = 0
             table[ord(b'C')] = 1
             table[ord(b'A')] = 2
             table[ord(b'G')] = 3
@@ -236,6 +245,8 @@ class GeneticCode(SkbioObject):
                              "(methionine) character")
         self._amino_acids = amino_acids
         self._m_character_codon = self._index_to_codon(indices[0])
+        # whether each codon index (0-63) is a stop codon, used to find ORFs
+        self._stop_codon_mask = amino_acids.values == b'*'
 
     def _set_starts(self, starts):
         starts = Protein(starts)
@@ -256,6 +267,9 @@ class GeneticCode(SkbioObject):
         for i, index in enumerate(indices):
             codons[i] = self._index_to_codon(index)
         self._start_codons = codons
+        # whether each codon index (0-63) is a start codon, used to find
+        # start codons in batch translation
+        self._start_codon_mask = self._starts.values == b'M'
 
     def _index_to_codon(self, index):
         """Convert AA index (0-63) to codon encoded in offsets (0-3)."""
@@ -756,6 +770,751 @@ class GeneticCode(SkbioObject):
             yield self.translate(rc, reading_frame=reading_frame,
                                  start=start, stop=stop)
 
+    @experimental(as_of="0.5.2")
+    def translate_batch(self, sequences, reading_frame=1, start='ignore',
+                        stop='ignore'):
+        """Translate many RNA or DNA sequences into protein at once.
+
+        Parameters
+        ----------
+        sequences : SequenceBatch or iterable of RNA or DNA
+            Sequences to translate. All sequences must be of the same type.
+            DNA sequences are translated as if they had been transcribed.
+        reading_frame : {1, 2, 3, -1, -2, -3}
+            Reading frame to use in translation. See
+            ``GeneticCode.translate`` for details.
+        start : {'ignore', 'require', 'optional'}
+            How to handle start codons. See ``GeneticCode.translate`` for
+            details. With "require", every sequence must contain a start
+            codon in the reading frame.
+        stop : {'ignore', 'require', 'optional'}
+            How to handle stop codons. See ``GeneticCode.translate`` for
+            details. With "require", every sequence must contain a stop
+            codon in the reading frame.
+
+        Returns
+        -------
+        SequenceBatch
+            Batch of ``Protein`` sequences, in the same order as `sequences`.
+            The i-th protein is equal to the result of calling
+            ``GeneticCode.translate`` on the i-th sequence.
+
+        Raises
+        ------
+        TypeError
+            If the sequences are not ``RNA`` or ``DNA``.
+        ValueError
+            If `reading_frame`, `start`, or `stop` is invalid, if any sequence
+            contains gaps, or if a required start or stop codon is missing.
+        NotImplementedError
+            If any sequence contains degenerate characters.
+
+        See Also
+        --------
+        translate
+        translate_six_frames_batch
+        skbio.sequence.SequenceBatch
+
+        Notes
+        -----
+        All sequences are translated together: the codons of every sequence
+        are converted into amino acid indices with a single lookup into the
+        genetic code, and start and stop codons are located for all sequences
+        with array operations. This is much faster than calling
+        ``GeneticCode.translate`` on each sequence when translating many short
+        sequences.
+
+        IDs and descriptions of the input sequences are kept in the returned
+        batch. Quality scores are not included.
+
+        Examples
+        --------
+        >>> from skbio import RNA, GeneticCode
+        >>> sgc = GeneticCode.from_ncbi()
+        >>> proteins = sgc.translate_batch(
+        ...     [RNA('AGUAUUCUGCCACUGUAAGAA', metadata={'id': 'a'}),
+        ...      RNA('AUGCCACUUUAA', metadata={'id': 'b'})],
+        ...     start='optional', stop='optional')
+        >>> [str(protein) for protein in proteins]
+        ['MPL', 'MPL']
+        >>> proteins.ids
+        array(['a', 'b'], dtype=object)
+
+        """
+        batch = self._validate_translate_batch_inputs(
+            sequences, reading_frame, start, stop)
+        if reading_frame < 0:
+            batch = batch.reverse_complement()
+        codes = self._offset_table[batch.data]
+        return self._translate_codes(batch, codes, reading_frame, start, stop)
+
+    @experimental(as_of="0.5.2")
+    def translate_six_frames_batch(self, sequences, start='ignore',
+                                   stop='ignore'):
+        """Translate many RNA or DNA sequences using six reading frames.
+
+        Parameters
+        ----------
+        sequences : SequenceBatch or iterable of RNA or DNA
+            Sequences to translate. All sequences must be of the same type.
+        start : {'ignore', 'require', 'optional'}
+            How to handle start codons. See ``GeneticCode.translate`` for
+            details.
+        stop : {'ignore', 'require', 'optional'}
+            How to handle stop codons. See ``GeneticCode.translate`` for
+            details.
+
+        Yields
+        ------
+        SequenceBatch
+            Batch of ``Protein`` sequences translated in the current reading
+            frame. Batches are yielded in the order of
+            ``GeneticCode.reading_frames``.
+
+        See Also
+        --------
+        translate_six_frames
+        translate_batch
+
+        Notes
+        -----
+        The sequences are reverse complemented, and their characters converted
+        to codon offsets, only once for all six reading frames.
+
+        Examples
+        --------
+        >>> from skbio import RNA, GeneticCode
+        >>> sgc = GeneticCode.from_ncbi()
+        >>> rnas = [RNA('AUGCCACUUUAA'), RNA('GCAUA')]
+        >>> for proteins in sgc.translate_six_frames_batch(rnas):
+        ...     [str(protein) for protein in proteins]
+        ['MPL*', 'A']
+        ['CHF', 'H']
+        ['ATL', 'I']
+        ['LKWH', 'Y']
+        ['*SG', 'M']
+        ['KVA', 'C']
+
+        """
+        batch = self._validate_translate_batch_inputs(sequences, 1, start,
+                                                      stop)
+        codes = self._offset_table[batch.data]
+        for reading_frame in range(1, 4):
+            yield self._translate_codes(batch, codes, reading_frame, start,
+                                        stop)
+
+        batch = batch.reverse_complement()
+        codes = self._offset_table[batch.data]
+        for reading_frame in range(-1, -4, -1):
+            yield self._translate_codes(batch, codes, reading_frame, start,
+                                        stop)
+
+    @experimental(as_of="0.5.2")
+    def find_orfs(self, sequence, min_length=0, start='require',
+                  stop='require', interval_metadata=False):
+        """Find open reading frames (ORFs) in all six reading frames.
+
+        Parameters
+        ----------
+        sequence : RNA, DNA, or SequenceBatch
+            Sequence (or batch of ``RNA`` or ``DNA`` sequences) to search.
+        min_length : int, optional
+            Minimum length of an ORF in nucleotides, including its stop codon.
+        start : {'require', 'ignore'}
+            How to find the beginning of each ORF:
+
+            * "require": an ORF begins at the first start codon following the
+              previous stop codon in the same reading frame (or the beginning
+              of the reading frame).
+
+            * "ignore": an ORF begins immediately after the previous stop
+              codon in the same reading frame (or at the beginning of the
+              reading frame), regardless of the presence of a start codon.
+
+        stop : {'require', 'optional'}
+            How to find the end of each ORF:
+
+            * "require": an ORF ends with the first stop codon following its
+              beginning, which is included in the ORF. Regions without a
+              stop codon are not reported.
+
+            * "optional": like "require", but an ORF that reaches the end of
+              the reading frame without a stop codon ends with the last
+              complete codon of the reading frame.
+
+        interval_metadata : bool, optional
+            If ``True``, return the ORFs as ``IntervalMetadata`` features
+            instead of a ``pd.DataFrame``.
+
+        Returns
+        -------
+        pd.DataFrame, IntervalMetadata, or list of IntervalMetadata
+            By default, a ``pd.DataFrame`` with one row per ORF and the
+            columns ``start`` and ``stop`` (0-based, half-open coordinates on
+            the forward strand of the sequence), ``strand`` (``'+'`` or
+            ``'-'``), and ``reading_frame`` (one of
+            ``GeneticCode.reading_frames``). If `sequence` is a
+            ``SequenceBatch``, the first column, ``sequence``, is the index of
+            the sequence in the batch containing the ORF. Rows are sorted by
+            sequence and start position.
+
+            If `interval_metadata` is ``True``, an ``IntervalMetadata`` object
+            (or a list with one per sequence in the batch) with a feature per
+            ORF. The metadata of each feature contain its ``type``
+            (``'ORF'``), ``strand``, and ``reading_frame``.
+
+        Raises
+        ------
+        TypeError
+            If the sequence is not ``RNA`` or ``DNA``.
+        ValueError
+            If `start` or `stop` is invalid, `min_length` is negative, or the
+            sequence contains gaps.
+
+        See Also
+        --------
+        translate_six_frames
+        translate
+        skbio.metadata.IntervalMetadata
+
+        Notes
+        -----
+        Start and stop codons are located in all reading frames at once by
+        converting every codon of the sequence (and of its reverse complement)
+        into an index into the genetic code, so no ``Protein`` is created. The
+        ORF in reading frame ``rf`` spanning ``start`` to ``stop`` is
+        translated by ``translate`` with ``reading_frame=rf`` (``M`` replacing
+        an alternative start codon with ``start='require'``).
+
+        Codons containing degenerate characters are neither start nor stop
+        codons, so they do not interrupt an ORF.
+
+        Examples
+        --------
+        >>> from skbio import DNA, GeneticCode
+        >>> sgc = GeneticCode.from_ncbi()
+        >>> dna = DNA('CCATGAAATTTTAGGCTTACATGGC')
+        >>> sgc.find_orfs(dna)
+           start  stop strand  reading_frame
+        0      2    14      +              3
+        1     16    22      -             -1
+
+        The ORFs can also be returned as interval features:
+
+        >>> orfs = sgc.find_orfs(dna, interval_metadata=True)
+        >>> orfs.num_interval_features
+        2
+        >>> str(dna[2:14].translate())
+        'MKF*'
+
+        """
+        if isinstance(sequence, SequenceBatch):
+            batch = sequence
+        else:
+            batch = SequenceBatch.from_sequences([sequence])
+        if batch.dtype not in (RNA, DNA):
+            raise TypeError("Sequences to search for ORFs must be RNA or DNA, "
+                            "not %s" % batch.dtype.__name__)
+        if start not in {'require', 'ignore'}:
+            raise ValueError("`start` must be one of %r, not %r" %
+                             (['require', 'ignore'], start))
+        if stop not in {'require', 'optional'}:
+            raise ValueError("`stop` must be one of %r, not %r" %
+                             (['require', 'optional'], stop))
+        if min_length < 0:
+            raise ValueError("`min_length` must be non-negative, not %r" %
+                             min_length)
+        if batch._lookup_mask(batch.dtype._gap_codes).any():
+            raise ValueError("scikit-bio does not support finding ORFs in "
+                             "gapped sequences.")
+
+        lengths = batch.lengths
+        forward = self._find_strand_orfs(batch, start, stop, min_length)
+        # coordinates on the reverse complement are mapped back onto the
+        # forward strand
+        records, begin, end = self._find_strand_orfs(
+            batch.reverse_complement(), start, stop, min_length)
+        reverse = records, lengths[records] - end, lengths[records] - begin
+
+        records, starts, stops = (np.concatenate(a)
+                                  for a in zip(forward, reverse))
+        is_forward = np.arange(records.size) < forward[0].size
+        reading_frames = np.where(is_forward, starts % 3 + 1,
+                                  -((lengths[records] - stops) % 3 + 1))
+        order = np.lexsort((stops, starts, records))
+
+        orfs = pd.DataFrame(
+            {'sequence': records[order],
+             'start': starts[order],
+             'stop': stops[order],
+             'strand': np.where(is_forward[order], '+', '-').astype(object),
+             'reading_frame': reading_frames[order]},
+            columns=['sequence', 'start', 'stop', 'strand', 'reading_frame'])
+
+        if interval_metadata:
+            features = [IntervalMetadata(length) for length in lengths]
+            for row in orfs.itertuples(index=False):
+                features[row.sequence].add(
+                    [(row.start, row.stop)],
+                    metadata={'type': 'ORF', 'strand': row.strand,
+                              'reading_frame': row.reading_frame})
+            return features if sequence is batch else features[0]
+
+        if sequence is not batch:
+            del orfs['sequence']
+        return orfs
+
+    @experimental(as_of="0.5.2")
+    def codon_usage(self, sequences, reading_frame=1):
+        """Count the codons of many RNA or DNA sequences at once.
+
+        Parameters
+        ----------
+        sequences : SequenceBatch or iterable of RNA or DNA
+            Coding sequences (e.g., the genes of one or more genomes) to count
+            the codons of. All sequences must be of the same type.
+        reading_frame : {1, 2, 3, -1, -2, -3}
+            Reading frame of the codons. See ``GeneticCode.translate`` for
+            details.
+
+        Returns
+        -------
+        pd.DataFrame
+            Count of each of the 64 codons (columns) in each sequence (rows, in
+            the order of `sequences`). Columns are in NCBI's codon order and
+            are spelled with the RNA alphabet. Rows are indexed by sequence ID
+            if the sequences have IDs.
+
+        Raises
+        ------
+        TypeError
+            If the sequences are not ``RNA`` or ``DNA``.
+        ValueError
+            If `reading_frame` is invalid.
+
+        See Also
+        --------
+        relative_synonymous_codon_usage
+        codon_adaptation_index
+        translate_batch
+
+        Notes
+        -----
+        The codons of all sequences are converted into indices (0-63), as in
+        ``GeneticCode.translate_batch``, and counted together. Codons
+        containing gap or degenerate characters (e.g., ``N``), and incomplete
+        codons at the end of a sequence, are not counted.
+
+        Examples
+        --------
+        >>> from skbio import DNA, GeneticCode
+        >>> sgc = GeneticCode.from_ncbi()
+        >>> genes = [DNA('ATGCTGCTTTAA', metadata={'id': 'g1'}),
+        ...          DNA('ATGCTGNNNCTGTGA', metadata={'id': 'g2'})]
+        >>> usage = sgc.codon_usage(genes)
+        >>> usage.shape
+        (2, 64)
+        >>> usage[['AUG', 'CUG', 'CUU', 'UAA', 'UGA']]
+            AUG  CUG  CUU  UAA  UGA
+        g1    1    1    1    1    0
+        g2    1    2    0    0    1
+
+        """
+        batch = self._as_nucleotide_batch(sequences, reading_frame,
+                                          'count codons in')
+        if reading_frame < 0:
+            batch = batch.reverse_complement()
+        codes = self._offset_table[batch.data]
+        frame_offset = abs(reading_frame) - 1
+        indices, codon_offsets = self._codon_indices(codes, batch.offsets,
+                                                     frame_offset)
+        # the index of a codon computed from the mask of invalid characters
+        # is nonzero if any of the codon's characters is invalid
+        invalid, _ = self._codon_indices((codes == 255).view(np.uint8),
+                                         batch.offsets, frame_offset)
+        rows = np.repeat(np.arange(len(batch)), np.diff(codon_offsets))
+        keys = (rows * self._num_codons + indices)[invalid == 0]
+        counts = np.bincount(keys, minlength=len(batch) * self._num_codons)
+
+        index = None if batch.ids is None else pd.Index(batch.ids.tolist())
+        return pd.DataFrame(counts.reshape(len(batch), self._num_codons),
+                            index=index, columns=self._codons)
+
+    @experimental(as_of="0.5.2")
+    def relative_synonymous_codon_usage(self, codon_usage):
+        """Compute the relative synonymous codon usage (RSCU) of codons.
+
+        Parameters
+        ----------
+        codon_usage : pd.DataFrame, pd.Series, or array_like
+            Count of each codon, in NCBI's codon order, in one sequence (1D) or
+            in each of many sequences (2D, one row per sequence), such as
+            returned by ``GeneticCode.codon_usage``.
+
+        Returns
+        -------
+        pd.DataFrame, pd.Series, or np.ndarray
+            RSCU of each codon, with the same shape, type, and labels as
+            `codon_usage`. The RSCU is ``NaN`` for the codons of amino acids
+            that are not encoded by any of the counted codons.
+
+        Raises
+        ------
+        ValueError
+            If `codon_usage` does not have 64 columns.
+
+        See Also
+        --------
+        codon_usage
+        codon_adaptation_index
+
+        Notes
+        -----
+        The RSCU of a codon is its count divided by the mean count of the
+        synonymous codons encoding the same amino acid under this genetic code
+        [1]_. It is 1 for every codon if synonymous codons are used equally.
+        Stop codons are treated as synonymous codons of the stop "amino acid".
+
+        References
+        ----------
+        .. [1] Sharp, P. M., Tuohy, T. M., & Mosurski, K. R. (1986). Codon
+           usage in yeast: cluster analysis clearly differentiates highly and
+           lowly expressed genes. Nucleic Acids Research, 14(13), 5125-5143.
+
+        Examples
+        --------
+        >>> from skbio import DNA, GeneticCode
+        >>> sgc = GeneticCode.from_ncbi()
+        >>> usage = sgc.codon_usage([DNA('CTGCTGCTGTTAATGATG')])
+        >>> rscu = sgc.relative_synonymous_codon_usage(usage)
+        >>> rscu[['CUG', 'UUA', 'CUU', 'AUG', 'UUU']]
+           CUG  UUA  CUU  AUG  UUU
+        0  4.5  1.5  0.0  1.0  NaN
+
+        """
+        counts = self._as_codon_counts(codon_usage)
+        family, sizes = self._synonymous_families()
+        # sum the counts of the codons of each amino acid
+        membership = family == np.arange(sizes.size)[:, np.newaxis]
+        totals = np.dot(counts, membership.T)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rscu = counts * sizes[family] / totals[..., family]
+
+        if isinstance(codon_usage, pd.DataFrame):
+            return pd.DataFrame(rscu, index=codon_usage.index,
+                                columns=codon_usage.columns)
+        if isinstance(codon_usage, pd.Series):
+            return pd.Series(rscu, index=codon_usage.index,
+                             name=codon_usage.name)
+        return rscu
+
+    @experimental(as_of="0.5.2")
+    def codon_adaptation_index(self, sequences, reference, reading_frame=1):
+        """Compute the codon adaptation index (CAI) of many sequences at once.
+
+        Parameters
+        ----------
+        sequences : SequenceBatch or iterable of RNA or DNA
+            Coding sequences to compute the CAI of. All sequences must be of
+            the same type.
+        reference : pd.DataFrame, pd.Series, or array_like
+            Codon usage of a reference set of genes (e.g., highly expressed
+            genes), in NCBI's codon order, such as returned by
+            ``GeneticCode.codon_usage``. If 2D, the counts of all rows are
+            summed.
+        reading_frame : {1, 2, 3, -1, -2, -3}
+            Reading frame of the codons. See ``GeneticCode.translate`` for
+            details.
+
+        Returns
+        -------
+        pd.Series
+            CAI of each sequence, indexed as the rows returned by
+            ``GeneticCode.codon_usage``. The CAI is ``NaN`` for sequences
+            without any codon that contributes to it.
+
+        Raises
+        ------
+        TypeError
+            If the sequences are not ``RNA`` or ``DNA``.
+        ValueError
+            If `reading_frame` is invalid, or if `reference` does not have 64
+            columns.
+
+        See Also
+        --------
+        codon_usage
+        relative_synonymous_codon_usage
+
+        Notes
+        -----
+        The CAI of a sequence is the geometric mean of the relative
+        adaptiveness of its codons [1]_. The relative adaptiveness of a codon
+        is its count in `reference` divided by the count of the most frequent
+        synonymous codon. As in [1]_, a count of 0.5 is used for codons that
+        are not in `reference`. Stop codons, codons of amino acids encoded by
+        a single codon (e.g., ``AUG`` in the standard genetic code), and
+        codons of amino acids that are not in `reference` are ignored.
+
+        The CAI of all sequences is computed from their codon usage with a
+        single matrix product.
+
+        References
+        ----------
+        .. [1] Sharp, P. M., & Li, W. H. (1987). The codon adaptation index--a
+           measure of directional synonymous codon usage bias, and its
+           potential applications. Nucleic Acids Research, 15(3), 1281-1295.
+
+        Examples
+        --------
+        >>> from skbio import DNA, GeneticCode
+        >>> sgc = GeneticCode.from_ncbi()
+        >>> reference = sgc.codon_usage([DNA('CTGCTGCTGCTGAAAAAGAAG')])
+        >>> genes = [DNA('ATGCTGAAGTAA', metadata={'id': 'g1'}),
+        ...          DNA('ATGCTTAAATAA', metadata={'id': 'g2'})]
+        >>> sgc.codon_adaptation_index(genes, reference).round(3)
+        g1    1.00
+        g2    0.25
+        dtype: float64
+
+        """
+        reference = self._as_codon_counts(reference)
+        if reference.ndim == 2:
+            reference = reference.sum(axis=0)
+        family, sizes = self._synonymous_families()
+        maxima = np.zeros(sizes.size)
+        np.maximum.at(maxima, family, reference)
+        ignored = ((sizes[family] == 1) | (maxima[family] == 0) |
+                   self._stop_codon_mask)
+        weights = np.log(np.maximum(reference[~ignored], 0.5) /
+                         maxima[family][~ignored])
+
+        usage = self.codon_usage(sequences, reading_frame)
+        counts = usage.values[:, ~ignored]
+        with np.errstate(invalid='ignore'):
+            cai = np.exp(np.dot(counts, weights) / counts.sum(axis=1))
+        return pd.Series(cai, index=usage.index)
+
+    def _find_strand_orfs(self, batch, start, stop, min_length):
+        """Find ORFs in the forward reading frames of each sequence.
+
+        Returns the index of the sequence containing each ORF and the ORF's
+        start and stop positions within the sequence.
+
+        """
+        codes = self._offset_table[batch.data]
+        lengths = batch.lengths
+        records = batch._record_indices()
+        # position of each character within its sequence
+        local = np.arange(codes.size) - batch.offsets[records]
+
+        # Every position is the first character of a codon in one of the
+        # reading frames. Codons that run past the end of their sequence or
+        # contain a degenerate character are neither start nor stop codons.
+        codons = np.zeros(codes.size, dtype=np.intp)
+        complete = local <= lengths[records] - 3
+        invalid = codes == 255
+        for i, multiplier in enumerate(self._radix_multiplier):
+            shifted = codes[i:].astype(np.intp)
+            shifted[invalid[i:]] = 0
+            codons[:codes.size - i] += multiplier * shifted
+            complete[:codes.size - i] &= ~invalid[i:]
+        is_stop = self._stop_codon_mask[codons] & complete
+
+        # codons at the beginning of a reading frame or following a stop codon
+        # start a new region that may contain an ORF
+        frame_starts = (local < 3) & (local <= lengths[records] - 3)
+        after_stop = np.zeros(codes.size, dtype=bool)
+        after_stop[3:] = is_stop[:-3]
+        after_stop &= local <= lengths[records] - 3
+        if start == 'require':
+            candidates = self._start_codon_mask[codons] & complete
+        else:
+            candidates = (frame_starts | after_stop) & ~is_stop
+
+        # Sort codon positions by sequence and reading frame, so that the next
+        # stop codon in the same frame is found with a binary search. Only the
+        # first candidate preceding each stop codon begins an ORF.
+        span = max(int(lengths.max()) if lengths.size else 0, 1)
+        frame = records * 3 + local % 3
+
+        def keys(mask):
+            return np.sort(frame[mask] * span + local[mask])
+
+        candidate_keys = keys(candidates)
+        stop_keys = np.append(keys(is_stop), np.iinfo(np.int64).max)
+        next_stop = np.searchsorted(stop_keys, candidate_keys)
+        frames = candidate_keys // span
+        first = np.ones(candidate_keys.size, dtype=bool)
+        first[1:] = ((next_stop[1:] != next_stop[:-1]) |
+                     (frames[1:] != frames[:-1]))
+
+        candidate_keys = candidate_keys[first]
+        next_stop = stop_keys[next_stop[first]]
+        frames = frames[first]
+        records = frames // 3
+        begin = candidate_keys - frames * span
+        has_stop = next_stop // span == frames
+        end = np.where(has_stop, next_stop - frames * span + 3,
+                       begin + (lengths[records] - begin) // 3 * 3)
+
+        keep = end - begin >= max(min_length, 1)
+        if stop == 'require':
+            keep &= has_stop
+        return records[keep], begin[keep], end[keep]
+
+    def _validate_translate_batch_inputs(self, sequences, reading_frame,
+                                         start, stop):
+        """Return `sequences` as a validated ``SequenceBatch``."""
+        sequences = self._as_nucleotide_batch(sequences, reading_frame,
+                                              'translate')
+        for name, value in ('start', start), ('stop', stop):
+            if value not in self._start_stop_options:
+                raise ValueError("`%s` must be one of %r, not %r" %
+                                 (name, self._start_stop_options, value))
+
+        if (self._offset_table[sequences.data] == 255).any():
+            if sequences._lookup_mask(sequences.dtype._gap_codes).any():
+                raise ValueError("scikit-bio does not support translation of "
+                                 "gapped sequences.")
+            raise NotImplementedError("scikit-bio does not currently support "
+                                      "translation of degenerate sequences."
+                                      "`RNA.expand_degenerates` can be used "
+                                      "to obtain all definite versions "
+                                      "of a degenerate sequence.")
+        return sequences
+
+    def _as_nucleotide_batch(self, sequences, reading_frame, purpose):
+        """Return `sequences` as a ``SequenceBatch`` of RNA or DNA."""
+        if not isinstance(sequences, SequenceBatch):
+            sequences = list(sequences)
+            dtype = type(sequences[0]) if sequences else RNA
+            sequences = SequenceBatch.from_sequences(sequences, dtype=dtype)
+
+        if sequences.dtype not in (RNA, DNA):
+            raise TypeError("Sequences to %s must be RNA or DNA, not %s"
+                            % (purpose, sequences.dtype.__name__))
+
+        if reading_frame not in self.reading_frames:
+            raise ValueError("`reading_frame` must be one of %r, not %r" %
+                             (self.reading_frames, reading_frame))
+        return sequences
+
+    def _as_codon_counts(self, codon_usage):
+        """Return codon counts as a 1D or 2D array of 64 columns."""
+        counts = np.asarray(codon_usage, dtype=float)
+        if counts.ndim not in (1, 2) or counts.shape[-1] != self._num_codons:
+            raise ValueError("Codon usage must have %d columns (one per "
+                             "codon), not shape %r"
+                             % (self._num_codons, counts.shape))
+        return counts
+
+    def _synonymous_families(self):
+        """Return the amino acid of each codon and the size of each family.
+
+        Amino acids are numbered in sorted order of their characters.
+
+        """
+        _, family, sizes = np.unique(self._amino_acids.values,
+                                     return_inverse=True, return_counts=True)
+        return family, sizes
+
+    def _codon_indices(self, codes, offsets, frame_offset):
+        """Convert the codons of each sequence into indices (0-63).
+
+        Parameters
+        ----------
+        codes : 1D np.ndarray (np.uint8)
+            Codon offset (0-3) of each character of the sequences, as
+            produced by ``_offset_table``.
+        offsets : 1D np.ndarray (int)
+            Start of each sequence in `codes`, followed by the length of
+            `codes`.
+        frame_offset : int
+            Number of characters skipped at the start of each sequence.
+
+        Returns
+        -------
+        indices : 1D np.ndarray (np.intp)
+            Index of every codon in every sequence, concatenated.
+        codon_offsets : 1D np.ndarray (np.int64)
+            Start of each sequence's codons in `indices`, followed by the
+            length of `indices`.
+
+        """
+        lengths = np.diff(offsets) - frame_offset
+        num_codons = np.maximum(lengths, 0) // 3
+        codon_offsets = _lengths_to_offsets(num_codons)
+
+        # position of the first character of each codon
+        positions = np.repeat(
+            offsets[:-1] + frame_offset - 3 * codon_offsets[:-1], num_codons)
+        positions += 3 * np.arange(codon_offsets[-1])
+
+        indices = codes[positions].astype(np.intp)
+        indices *= 16
+        indices += 4 * codes[positions + 1]
+        indices += codes[positions + 2]
+        return indices, codon_offsets
+
+    def _translate_codes(self, batch, codes, reading_frame, start, stop):
+        """Translate a batch whose characters are converted to offsets."""
+        # Batch translation strategy (see ``translate`` for the strategy used
+        # with a single sequence):
+        #
+        #   1. Convert the codons of all sequences in the reading frame into
+        #      amino acid indices (0-63) and translate them with a single
+        #      lookup into the amino acids vector.
+        #   2. (Optional) Find the first start codon of each sequence by
+        #      searching for the first start codon at or after the sequence's
+        #      first codon. Replace each start codon's amino acid with M.
+        #   3. (Optional) Find the first stop codon at or after each
+        #      sequence's (possibly trimmed) start.
+        #   4. Gather the translated region of each sequence into a new
+        #      batch.
+        frame_offset = abs(reading_frame) - 1
+        indices, codon_offsets = self._codon_indices(codes, batch.offsets,
+                                                     frame_offset)
+        translated = self._amino_acids._bytes[indices]
+        first = codon_offsets[:-1]
+        last = codon_offsets[1:]
+
+        begin = first
+        if start in {'require', 'optional'}:
+            found, has_start = self._first_match(
+                self._start_codon_mask[indices], first, last)
+            if start == 'require' and not has_start.all():
+                self._raise_require_error('start', reading_frame)
+            begin = np.where(has_start, found, first)
+            translated[found[has_start]] = ord(b'M')
+
+        end = last
+        if stop in {'require', 'optional'}:
+            found, has_stop = self._first_match(translated == ord(b'*'),
+                                                begin, last)
+            if stop == 'require' and not has_stop.all():
+                self._raise_require_error('stop', reading_frame)
+            end = np.where(has_stop, found, last)
+
+        lengths = end - begin
+        offsets = _lengths_to_offsets(lengths)
+        positions = np.repeat(begin - offsets[:-1], lengths)
+        positions += np.arange(offsets[-1])
+
+        # turn off validation because `translated` is guaranteed to be valid
+        return SequenceBatch(translated[positions], offsets, dtype=Protein,
+                             ids=batch.ids, descriptions=batch.descriptions,
+                             validate=False)
+
+    @staticmethod
+    def _first_match(mask, begin, end):
+        """Find the first True value of `mask` in each [begin, end) range."""
+        # the length of `mask` is appended as a match past the end of every
+        # range
+        matches = np.append(np.flatnonzero(mask), mask.size)
+        found = matches[np.searchsorted(matches, begin)]
+        return found, found < end
+
 
 # defined at http://www.ncbi.nlm.nih.gov/Taxonomy/Utils/wprintgc.cgi
 _ncbi_genetic_codes = {
@@ -11,11 +11,18 @@ from itertools import product
 import re
 
 import numpy as np
+import pandas as pd
 
 from skbio.util._decorator import (classproperty, overrides, stable,
                                    deprecated, experimental)
 from skbio.util._misc import MiniRegistry
 from ._sequence import Sequence
+from ._kmer import _encode_kmers, _kmer_encoding, _count_kmers
+from ._window import _window_index, _window_sums
+
+# Number of characters looked up at a time when validating a sequence. Chunks
+# are small enough for their lookups to stay in the CPU cache.
+_validation_chunk_size = 2 ** 16
 
 
 class GrammaredSequenceMeta(ABCMeta, type):
@@ -184,6 +191,7 @@ class GrammaredSequence(Sequence, metaclass=GrammaredSequenceMeta):
 
     """
     __validation_mask = None
+    __uppercase_lookup = None
     __degenerate_codes = None
     __definite_char_codes = None
     __gap_codes = None
@@ -198,6 +206,21 @@ class GrammaredSequence(Sequence, metaclass=GrammaredSequenceMeta):
                 minlength=cls._number_of_extended_ascii_codes).astype(bool))
         return cls.__validation_mask
 
+    @classproperty
+    def _uppercase_lookup(cls):
+        # Maps each character code to its uppercase version (as converted by
+        # `lowercase`) if that is in the alphabet, and to 0 (never in an
+        # alphabet) otherwise, to validate and uppercase in a single lookup.
+        if cls.__uppercase_lookup is None:
+            codes = np.arange(cls._number_of_extended_ascii_codes,
+                              dtype=np.uint8)
+            uppercase = np.where(codes > cls._ascii_lowercase_boundary,
+                                 codes ^ cls._ascii_invert_case_bit_offset,
+                                 codes).astype(np.uint8)
+            cls.__uppercase_lookup = np.where(
+                cls._validation_mask[uppercase], 0, uppercase).astype(np.uint8)
+        return cls.__uppercase_lookup
+
     @classproperty
     def _degenerate_codes(cls):
         if cls.__degenerate_codes is None:
@@ -330,27 +353,80 @@ class GrammaredSequence(Sequence, metaclass=GrammaredSequenceMeta):
     @overrides(Sequence)
     def __init__(self, sequence, metadata=None, positional_metadata=None,
                  interval_metadata=None, lowercase=False, validate=True):
+        # Uppercase characters while validating them instead of in a separate
+        # pass, unless the lowercase characters must be recorded.
+        fused = validate and lowercase is True
         super(GrammaredSequence, self).__init__(
             sequence, metadata, positional_metadata,
-            interval_metadata, lowercase)
-
-        if validate:
-            self._validate()
-
-    def _validate(self):
-        # This is the fastest way that we have found to identify the
-        # presence or absence of certain characters (numbers).
-        # It works by multiplying a mask where the numbers which are
-        # permitted have a zero at their index, and all others have a one.
-        # The result is a vector which will propogate counts of invalid
-        # numbers and remove counts of valid numbers, so that we need only
-        # see if the array is empty to determine validity.
-        invalid_characters = np.bincount(
-            self._bytes, minlength=self._number_of_extended_ascii_codes
-        ) * self._validation_mask
-        if np.any(invalid_characters):
-            bad = list(np.where(
-                invalid_characters > 0)[0].astype(np.uint8).view('|S1'))
+            interval_metadata, False if fused else lowercase)
+
+        if fused:
+            self._set_bytes(self._validate_bytes(self._bytes, lowercase=True))
+            self._owns_bytes = True
+        elif validate:
+            self._validate_bytes(self._bytes)
+
+    @classmethod
+    def _validate_bytes(cls, bytes_, lowercase=False):
+        """Validate characters, uppercasing them in the same pass if requested.
+
+        Parameters
+        ----------
+        bytes_ : 1D np.ndarray (np.uint8)
+            Character codes to validate.
+        lowercase : bool, optional
+            If ``True``, lowercase characters are converted to uppercase (as
+            with the ``lowercase`` constructor parameter) before they are
+            validated.
+
+        Returns
+        -------
+        1D np.ndarray (np.uint8)
+            `bytes_` if `lowercase` is ``False``, otherwise a new array of the
+            uppercased characters.
+
+        Raises
+        ------
+        ValueError
+            If any (uppercased) character is not in the alphabet.
+
+        Notes
+        -----
+        Characters are mapped through a 256-entry lookup table cached on the
+        class, in chunks so that validating very long sequences (e.g.,
+        memory-mapped genomes) does not allocate a copy of them unless they
+        are uppercased. Readers that have validated a buffer of many records
+        with this method can construct each sequence with ``validate=False``.
+
+        """
+        if lowercase:
+            lookup = cls._uppercase_lookup
+            result = np.empty(len(bytes_), dtype=np.uint8)
+        else:
+            mask = cls._validation_mask
+        for start in range(0, len(bytes_), _validation_chunk_size):
+            chunk = bytes_[start:start + _validation_chunk_size]
+            if lowercase:
+                converted = result[start:start + _validation_chunk_size]
+                # character codes are always valid indices, so clipping them
+                # has no effect (but avoids buffering the output)
+                np.take(lookup, chunk, out=converted, mode='clip')
+                invalid = not converted.all()
+            else:
+                invalid = mask.take(chunk).any()
+            if invalid:
+                cls._raise_invalid_characters(bytes_, lowercase)
+        return result if lowercase else bytes_
+
+    @classmethod
+    def _raise_invalid_characters(cls, bytes_, lowercase):
+        if lowercase:
+            bytes_ = np.where(bytes_ > cls._ascii_lowercase_boundary,
+                              bytes_ ^ cls._ascii_invert_case_bit_offset,
+                              bytes_).astype(np.uint8)
+        invalid = np.unique(bytes_[cls._validation_mask[bytes_]])
+        if invalid.size:
+            bad = list(invalid.view('|S1'))
             raise ValueError(
                 "Invalid character%s in sequence: %r. \n"
                 "Valid characters: %r\n"
@@ -359,7 +435,7 @@ class GrammaredSequence(Sequence, metaclass=GrammaredSequenceMeta):
                 % ('s' if len(bad) > 1 else '',
                    [str(b.tostring().decode("ascii")) for b in bad] if
                    len(bad) > 1 else bad[0],
-                   list(self.alphabet)))
+                   list(cls.alphabet)))
 
     @stable(as_of='0.4.0')
     def gaps(self):
@@ -579,6 +655,99 @@ class GrammaredSequence(Sequence, metaclass=GrammaredSequenceMeta):
         # TODO: cache results
         return self.has_definites()
 
+    @experimental(as_of='0.5.2')
+    def window_gap_fraction(self, window, step=1):
+        """Compute the fraction of gap characters in sliding windows.
+
+        Parameters
+        ----------
+        window : int
+            Length of each window.
+        step : int, optional
+            Distance between the starts of consecutive windows.
+
+        Returns
+        -------
+        pd.Series
+            Fraction of positions in each window containing a gap character.
+            The index is the position where each window starts.
+
+        Raises
+        ------
+        ValueError
+            If `window` or `step` is less than 1.
+
+        See Also
+        --------
+        gaps
+        window_degenerate_fraction
+        Sequence.window_frequencies
+
+        Examples
+        --------
+        >>> from skbio import DNA
+        >>> s = DNA('AC--G-.-')
+        >>> s.window_gap_fraction(4, step=2)
+        start
+        0    0.50
+        2    0.75
+        4    0.75
+        dtype: float64
+
+        """
+        index = _window_index(len(self), window, step)
+        gaps = _window_sums(self.gaps(), window, step)
+        return pd.Series(gaps / window, index=index)
+
+    @experimental(as_of='0.5.2')
+    def window_degenerate_fraction(self, window, step=1):
+        """Compute the fraction of degenerate characters in sliding windows.
+
+        Parameters
+        ----------
+        window : int
+            Length of each window.
+        step : int, optional
+            Distance between the starts of consecutive windows.
+
+        Returns
+        -------
+        pd.Series
+            Fraction of positions in each window containing a degenerate
+            character. The index is the position where each window starts.
+
+        Raises
+        ------
+        ValueError
+            If `window` or `step` is less than 1.
+
+        See Also
+        --------
+        degenerates
+        window_gap_fraction
+        Sequence.window_frequencies
+
+        Examples
+        --------
+        Find windows made up mostly of ambiguous bases:
+
+        >>> from skbio import DNA
+        >>> s = DNA('ACGTNNNNNACG')
+        >>> fractions = s.window_degenerate_fraction(4, step=4)
+        >>> fractions
+        start
+        0    0.00
+        4    1.00
+        8    0.25
+        dtype: float64
+        >>> fractions.index[fractions > 0.5].tolist()
+        [4]
+
+        """
+        index = _window_index(len(self), window, step)
+        degenerates = _window_sums(self.degenerates(), window, step)
+        return pd.Series(degenerates / window, index=index)
+
     @stable(as_of='0.4.0')
     def degap(self):
         """Return a new sequence with gap characters removed.
@@ -792,6 +961,157 @@ class GrammaredSequence(Sequence, metaclass=GrammaredSequenceMeta):
 
         return self._motifs[motif_type](self, min_length, ignore)
 
+    @experimental(as_of='0.5.2')
+    def kmer_counts(self, k, overlap=True, canonical=False, sparse=False):
+        """Return a vector of counts of definite kmers of length `k`.
+
+        Parameters
+        ----------
+        k : int
+            The kmer length.
+        overlap : bool, optional
+            Defines whether the kmers should be overlapping or not.
+        canonical : bool, optional
+            If ``True``, count each kmer together with its reverse complement
+            under whichever of the two sorts first. Positions of kmers that
+            are not canonical are always zero. Only supported by nucleotide
+            sequences.
+        sparse : bool, optional
+            If ``True``, return a ``scipy.sparse.csr_matrix`` with a single row
+            instead of a dense array.
+
+        Returns
+        -------
+        1D np.ndarray (int) or scipy.sparse.csr_matrix
+            Count of each possible kmer. There is one entry for each of the
+            ``len(definite_chars) ** k`` kmers, in lexicographic order of the
+            sorted definite characters (e.g., ``AA``, ``AC``, ``AG``, ...,
+            ``TT`` for DNA and ``k=2``).
+
+        Raises
+        ------
+        ValueError
+            If `k` is less than 1.
+        ValueError
+            If there are too many possible kmers to index with a 64-bit
+            integer.
+        TypeError
+            If `canonical` is ``True`` and this sequence does not have a
+            complement.
+
+        See Also
+        --------
+        kmer_frequencies
+        definite_chars
+
+        Notes
+        -----
+        Kmers containing gap or degenerate characters are not counted. Dense
+        vectors grow exponentially with `k`; use ``sparse=True`` for large
+        `k`.
+
+        Examples
+        --------
+        >>> from skbio import DNA
+        >>> s = DNA('ACGTNACG')
+        >>> s.kmer_counts(1)
+        array([2, 2, 2, 1])
+        >>> s.kmer_counts(2)
+        array([0, 2, 0, 0, 0, 0, 2, 0, 0, 0, 0, 1, 0, 0, 0, 0])
+        >>> s.kmer_counts(2, canonical=True)
+        array([0, 3, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0])
+
+        """
+        kmers, _ = self._encode_kmers(k, overlap, canonical, 'count')
+        num_codes = len(self.definite_chars) ** k
+
+        if sparse:
+            from scipy.sparse import csr_matrix
+            codes, counts = _count_kmers(kmers, num_codes)
+            return csr_matrix((counts, (np.zeros_like(codes), codes)),
+                              shape=(1, num_codes))
+        return np.bincount(kmers, minlength=num_codes)
+
+    @experimental(as_of='0.5.2')
+    def kmer_codes(self, k, overlap=True, canonical=False):
+        """Return integer codes of the definite kmers of length `k`.
+
+        Parameters
+        ----------
+        k : int
+            The kmer length.
+        overlap : bool, optional
+            Defines whether the kmers should be overlapping or not.
+        canonical : bool, optional
+            If ``True``, encode each kmer as whichever of it and its reverse
+            complement sorts first. Only supported by nucleotide sequences.
+
+        Returns
+        -------
+        codes : 1D np.ndarray (np.int64)
+            Code of each kmer, in the order the kmers occur in this sequence.
+            Codes are indices into the lexicographic order of the sorted
+            definite characters (e.g., ``AA`` is 0, ``AC`` is 1, ..., ``TT``
+            is 15 for DNA and ``k=2``), as in ``kmer_counts``.
+        starts : 1D np.ndarray (int)
+            Position in this sequence where each kmer starts.
+
+        Raises
+        ------
+        ValueError
+            If `k` is less than 1.
+        ValueError
+            If there are too many possible kmers to encode with a 64-bit
+            integer.
+        TypeError
+            If `canonical` is ``True`` and this sequence does not have a
+            complement.
+
+        See Also
+        --------
+        kmer_counts
+        kmer_windows
+        definite_chars
+
+        Notes
+        -----
+        Kmers containing gap or degenerate characters are skipped, so `starts`
+        may not be evenly spaced.
+
+        Examples
+        --------
+        >>> from skbio import DNA
+        >>> s = DNA('ACGTNACG')
+        >>> codes, starts = s.kmer_codes(2)
+        >>> codes
+        array([ 1,  6, 11,  1,  6])
+        >>> starts
+        array([0, 1, 2, 5, 6])
+        >>> codes, _ = s.kmer_codes(2, canonical=True)
+        >>> codes
+        array([1, 6, 1, 1, 6])
+
+        """
+        return self._encode_kmers(k, overlap, canonical, 'encode')
+
+    def _encode_kmers(self, k, overlap, canonical, verb):
+        if k < 1:
+            raise ValueError("k must be greater than 0.")
+
+        rank, base, complement = _kmer_encoding(
+            type(self), k, canonical,
+            "Cannot " + verb + " kmers of length %(k)d: there are too many "
+            "possible kmers (%(base)d ** %(k)d).")
+
+        step = 1 if overlap else k
+        kmers, valid = _encode_kmers(rank[self._bytes], k, step, base,
+                                     complement)
+        starts = np.arange(0, len(kmers) * step, step)
+        if valid is not None:
+            kmers = kmers[valid]
+            starts = starts[valid]
+        return kmers, starts
+
     @overrides(Sequence)
     def _constructor(self, **kwargs):
         return self.__class__(validate=False, lowercase=False, **kwargs)
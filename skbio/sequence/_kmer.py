@@ -0,0 +1,213 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+import numpy as np
+
+# k-mer codes are stored as int64, so the k-mer space (base ** k) must fit.
+_max_kmer_code = np.iinfo(np.int64).max
+# np.bincount allocates a counter for every possible k-mer code. It is only
+# used when that table is small or comparable in size to the number of
+# k-mers; otherwise k-mer codes are counted by sorting (np.unique).
+_min_bincount_codes = 2 ** 16
+_max_bincount_codes = 2 ** 26
+_invalid_code = 255
+
+
+def _kmer_windows(array, k, step):
+    """Return a read-only (count, k) strided view of windows in `array`."""
+    if array.size < k:
+        count = 0
+    else:
+        count = (array.size - k) // step + 1
+    itemsize = array.dtype.itemsize
+    windows = np.lib.stride_tricks.as_strided(
+        array, shape=(count, k), strides=(step * itemsize, itemsize))
+    windows.flags.writeable = False
+    return windows
+
+
+def _rank_lookup(alphabet):
+    """Map each byte to its rank in `alphabet`, or 255 if not in it."""
+    lookup = np.empty(256, dtype=np.uint8)
+    lookup.fill(_invalid_code)
+    lookup[alphabet] = np.arange(len(alphabet), dtype=np.uint8)
+    return lookup
+
+
+def _kmer_encoding(dtype, k, canonical, too_many_kmers):
+    """Return the rank lookup, base and complement ranks of `dtype`.
+
+    Each definite character of `dtype` is a digit of the k-mer codes. If the
+    k-mers of length `k` cannot be encoded as 64-bit integers, a ValueError is
+    raised with the message `too_many_kmers`, formatted with the ``name`` of
+    `dtype`, ``k``, and ``base`` (the number of definite characters).
+
+    """
+    from skbio.sequence import GrammaredSequence
+
+    if not issubclass(dtype, GrammaredSequence):
+        raise TypeError("Sequences must be GrammaredSequence objects, not %r."
+                        % dtype.__name__)
+    alphabet = np.unique(dtype._definite_char_codes).astype(np.uint8)
+    base = len(alphabet)
+    if base ** k > _max_kmer_code:
+        raise ValueError(too_many_kmers
+                         % {'name': dtype.__name__, 'k': k, 'base': base})
+    rank = _rank_lookup(alphabet)
+    complement = None
+    if canonical:
+        complement_lookup = getattr(dtype, '_complement_lookup', None)
+        if complement_lookup is None:
+            raise TypeError(
+                "Canonical kmers are only defined for sequences with a "
+                "complement, not %r." % dtype.__name__)
+        complement = rank[complement_lookup[alphabet]]
+    return rank, base, complement
+
+
+def _encode_kmers(codes, k, step, base, complement=None):
+    """Encode every window of `codes` as an integer in base `base`.
+
+    Parameters
+    ----------
+    codes : 1D np.ndarray (np.uint8)
+        Per-position character ranks. Values greater than or equal to `base`
+        mark positions that cannot be part of a k-mer.
+    k : int
+        k-mer length.
+    step : int
+        Distance between the starts of consecutive windows.
+    base : int
+        Number of characters in the alphabet. ``base ** k`` must fit into a
+        signed 64-bit integer.
+    complement : 1D np.ndarray (np.uint8), optional
+        Rank of the complement of each rank. If provided, each k-mer is
+        replaced by the smaller of its code and the code of its reverse
+        complement (i.e., its canonical k-mer).
+
+    Returns
+    -------
+    kmers : 1D np.ndarray (np.int64)
+        Code of each window, in order.
+    valid : 1D np.ndarray (bool) or None
+        Whether each window contains only valid positions. ``None`` if every
+        window is valid.
+
+    """
+    invalid = codes >= base
+    has_invalid = bool(invalid.any())
+    if has_invalid:
+        codes = np.where(invalid, 0, codes).astype(np.uint8)
+
+    windows = _kmer_windows(codes, k, step)
+    kmers = np.zeros(windows.shape[0], dtype=np.int64)
+    for j in range(k):
+        kmers *= base
+        kmers += windows[:, j]
+
+    if complement is not None:
+        rc_windows = _kmer_windows(complement[codes], k, step)
+        rc_kmers = np.zeros(windows.shape[0], dtype=np.int64)
+        for j in range(k - 1, -1, -1):
+            rc_kmers *= base
+            rc_kmers += rc_windows[:, j]
+        np.minimum(kmers, rc_kmers, out=kmers)
+
+    valid = None
+    if has_invalid:
+        # A window is valid if the number of invalid positions before its
+        # end equals the number before its start.
+        cumulative = np.concatenate(([0], np.cumsum(invalid)))
+        starts = np.arange(windows.shape[0]) * step
+        valid = cumulative[starts + k] == cumulative[starts]
+    return kmers, valid
+
+
+def _count_kmers(kmers, num_codes):
+    """Return the observed k-mer codes (sorted) and their counts."""
+    if num_codes <= min(max(_min_bincount_codes, 4 * kmers.size),
+                        _max_bincount_codes):
+        counts = np.bincount(kmers, minlength=num_codes)
+        observed = np.flatnonzero(counts)
+        return observed, counts[observed]
+    return np.unique(kmers, return_counts=True)
+
+
+def _decode_kmers(kmers, k, alphabet):
+    """Convert k-mer codes into a list of str using `alphabet` (np.uint8)."""
+    base = len(alphabet)
+    digits = np.empty((kmers.size, k), dtype=np.uint8)
+    remaining = kmers.copy()
+    for j in range(k - 1, -1, -1):
+        digits[:, j] = remaining % base
+        remaining //= base
+    return _rows_to_str(alphabet[digits])
+
+
+def _rows_to_str(rows):
+    """Convert each row of a 2D np.uint8 array into a str."""
+    if rows.size == 0:
+        return [] if rows.shape[0] == 0 else [''] * rows.shape[0]
+    if rows.min() == 0:
+        # fixed-width byte strings drop trailing NUL characters
+        return [r.tostring().decode('ascii') for r in rows]
+    rows = np.ascontiguousarray(rows)
+    strings = rows.view('|S%d' % rows.shape[1]).ravel()
+    return [s.decode('ascii') for s in strings.tolist()]
+
+
+def _kmer_frequencies(bytes_, k, step, complement_lookup=None):
+    """Count the k-mers in a sequence's bytes.
+
+    All characters are considered part of the alphabet, so the result matches
+    counting ``str`` k-mers. `complement_lookup` maps each byte to its
+    complement and is used to collapse k-mers onto their canonical form.
+
+    Returns
+    -------
+    list of str
+        Observed k-mers, in sorted order.
+    1D np.ndarray (int)
+        Count of each k-mer.
+
+    """
+    observed = np.flatnonzero(np.bincount(bytes_, minlength=256))
+    if complement_lookup is not None:
+        observed = np.union1d(observed, complement_lookup[observed])
+    alphabet = observed.astype(np.uint8)
+    base = max(len(alphabet), 1)
+
+    if base ** k > _max_kmer_code:
+        return _kmer_frequencies_by_sorting(bytes_, k, step,
+                                            complement_lookup)
+
+    rank = _rank_lookup(alphabet)
+    complement = None
+    if complement_lookup is not None:
+        complement = rank[complement_lookup[alphabet]]
+    kmers, _ = _encode_kmers(rank[bytes_], k, step, base, complement)
+    codes, counts = _count_kmers(kmers, base ** k)
+    return _decode_kmers(codes, k, alphabet), counts
+
+
+def _kmer_frequencies_by_sorting(bytes_, k, step, complement_lookup=None):
+    """Count k-mers too long to be encoded as 64-bit integers."""
+    windows = _kmer_windows(bytes_, k, step).copy()
+    if complement_lookup is not None:
+        rc = complement_lookup[windows[:, ::-1]]
+        # keep the lexicographically smaller of each k-mer and its reverse
+        # complement
+        differ = windows != rc
+        first = differ.argmax(axis=1)
+        rows = np.arange(windows.shape[0])
+        use_rc = windows[rows, first] > rc[rows, first]
+        windows[use_rc] = rc[use_rc]
+
+    kmers = windows.view(np.dtype((np.void, k))).ravel()
+    unique, counts = np.unique(kmers, return_counts=True)
+    return _rows_to_str(unique.view(np.uint8).reshape(-1, k)), counts
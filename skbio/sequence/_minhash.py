@@ -0,0 +1,567 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+import numpy as np
+
+from skbio._base import SkbioObject, ElasticLines
+from skbio.sequence._kmer import _encode_kmers, _kmer_encoding
+from skbio.util._decorator import experimental, classonlymethod
+
+# Number of positions hashed at a time when sketching a sequence, which bounds
+# the memory used to sketch long sequences (e.g., chromosomes).
+_chunk_size = 2 ** 22
+_too_many_kmers = ("Cannot sketch %(name)s kmers of length %(k)d: kmers must "
+                   "be encodable as 64-bit integers (%(base)d ** %(k)d "
+                   "possible kmers).")
+
+
+def _mix64(values):
+    """Scramble 64-bit integers with the SplitMix64 finalizer."""
+    values = values + np.uint64(0x9E3779B97F4A7C15)
+    values ^= values >> np.uint64(30)
+    values *= np.uint64(0xBF58476D1CE4E5B9)
+    values ^= values >> np.uint64(27)
+    values *= np.uint64(0x94D049BB133111EB)
+    values ^= values >> np.uint64(31)
+    return values
+
+
+class MinHashSketch(SkbioObject):
+    """Bottom-k MinHash sketch of the kmers of one or more sequences.
+
+    A MinHash sketch stores the `num_hashes` smallest hash values of the
+    distinct kmers in a collection of sequences (e.g., the contigs of a genome
+    assembly). Sketches are small and of fixed size regardless of the length
+    of the sketched sequences, and can be compared to estimate the Jaccard
+    index of the sequences' kmer sets and the Mash distance between them [1]_.
+
+    Parameters
+    ----------
+    hashes : 1D array_like (np.uint64)
+        Hash values of kmers. Only the `num_hashes` smallest distinct values
+        are kept.
+    k : int
+        Length of the hashed kmers.
+    num_hashes : int, optional
+        Maximum number of hash values in the sketch.
+    seed : int, optional
+        Seed of the hash function.
+    canonical : bool, optional
+        Whether each kmer was hashed together with its reverse complement
+        (i.e., only its canonical kmer was hashed).
+    id : str, optional
+        Identifier of the sketch (e.g., a genome ID).
+
+    Raises
+    ------
+    ValueError
+        If `k` or `num_hashes` is less than one.
+
+    See Also
+    --------
+    skbio.sequence.distance.sketch_distances
+    skbio.sequence.distance.kmer_distance
+
+    Notes
+    -----
+    Kmers are hashed by encoding them as integers (using the rank of each
+    character among the sequence type's definite characters) and scrambling
+    the integers with a 64-bit mixing function. Kmers containing gap or
+    degenerate characters are not hashed. The hash values are not compatible
+    with those computed by the Mash software, so sketches created by it cannot
+    be compared with ``MinHashSketch`` objects.
+
+    The Jaccard index of two sketches is estimated from the hash values of
+    both sketches that are not larger than the smaller of the two sketches'
+    largest hash values, since all hash values of both kmer sets below that
+    threshold are included in the sketches.
+
+    ``MinHashSketch`` objects (or collections of them) can be read from and
+    written to files in the ``minhash`` format with ``skbio.io``.
+
+    References
+    ----------
+    .. [1] Ondov, B. D., Treangen, T. J., Melsted, P., Mallonee, A. B.,
+       Bergman, N. H., Koren, S., & Phillippy, A. M. (2016). Mash: fast genome
+       and metagenome distance estimation using MinHash. Genome Biology,
+       17(1), 132.
+
+    Examples
+    --------
+    >>> from skbio import DNA
+    >>> from skbio.sequence import MinHashSketch
+    >>> seq1 = DNA('ACGTTGCATGCAAGTCCTAGGACTT', metadata={'id': 's1'})
+    >>> seq2 = DNA('ACGTTGCATGCAAGTCCTAGCACTT', metadata={'id': 's2'})
+    >>> sketch1 = MinHashSketch.from_sequence(seq1, k=5, num_hashes=100)
+    >>> sketch2 = MinHashSketch.from_sequence(seq2, k=5, num_hashes=100)
+    >>> len(sketch1)
+    13
+    >>> round(sketch1.jaccard(sketch2), 3)
+    0.722
+    >>> round(sketch1.mash_distance(sketch2), 3)
+    0.035
+
+    Sketch all sequences in a FASTA file together:
+
+    >>> from io import StringIO
+    >>> import skbio.io
+    >>> fh = StringIO('>contig1\\nACGTTGCATG\\n>contig2\\nCAAGTCCTAG\\n')
+    >>> seqs = skbio.io.read(fh, format='fasta', constructor=DNA)
+    >>> sketch = MinHashSketch.from_sequences(seqs, k=5, id='genome')
+    >>> len(sketch)
+    12
+
+    """
+    default_write_format = 'minhash'
+    __hash__ = None
+
+    @experimental(as_of='0.5.2')
+    def __init__(self, hashes, k, num_hashes=1000, seed=42, canonical=True,
+                 id=None):
+        if k < 1:
+            raise ValueError("k must be greater than 0.")
+        if num_hashes < 1:
+            raise ValueError("`num_hashes` must be greater than 0, not %r."
+                             % num_hashes)
+
+        hashes = np.unique(np.asarray(hashes, dtype=np.uint64))
+        hashes = hashes[:num_hashes]
+        hashes.flags.writeable = False
+        self._hashes = hashes
+        self._k = k
+        self._num_hashes = num_hashes
+        self._seed = seed
+        self._canonical = canonical
+        self._id = id
+
+    @classonlymethod
+    @experimental(as_of='0.5.2')
+    def from_sequence(cls, sequence, k=21, num_hashes=1000, seed=42,
+                      canonical=None, id=None):
+        """Sketch the kmers of a sequence.
+
+        Parameters
+        ----------
+        sequence : GrammaredSequence
+            Sequence to sketch (e.g., ``DNA``).
+        k : int, optional
+            Length of the hashed kmers.
+        num_hashes : int, optional
+            Maximum number of hash values in the sketch.
+        seed : int, optional
+            Seed of the hash function.
+        canonical : bool, optional
+            Whether to hash each kmer together with its reverse complement.
+            Defaults to ``True`` for nucleotide sequences and ``False``
+            otherwise.
+        id : str, optional
+            Identifier of the sketch. Defaults to the sequence's ``'id'``
+            metadata, if present.
+
+        Returns
+        -------
+        MinHashSketch
+            Sketch of the sequence.
+
+        See Also
+        --------
+        from_sequences
+
+        """
+        if id is None and sequence.has_metadata():
+            id = sequence.metadata.get('id')
+        return cls.from_sequences([sequence], k=k, num_hashes=num_hashes,
+                                  seed=seed, canonical=canonical, id=id)
+
+    @classonlymethod
+    @experimental(as_of='0.5.2')
+    def from_sequences(cls, sequences, k=21, num_hashes=1000, seed=42,
+                       canonical=None, id=None):
+        """Sketch the kmers of many sequences together.
+
+        Parameters
+        ----------
+        sequences : iterable of GrammaredSequence
+            Sequences to sketch (e.g., the contigs of a genome read with
+            ``skbio.io.read``, or a ``SequenceBatch``). Sequences are sketched
+            one at a time, so memory use does not depend on the number of
+            sequences.
+        k : int, optional
+            Length of the hashed kmers. Kmers spanning two sequences are not
+            hashed.
+        num_hashes : int, optional
+            Maximum number of hash values in the sketch.
+        seed : int, optional
+            Seed of the hash function.
+        canonical : bool, optional
+            Whether to hash each kmer together with its reverse complement.
+            Defaults to ``True`` if the first sequence is a nucleotide
+            sequence (or there are no sequences) and ``False`` otherwise.
+        id : str, optional
+            Identifier of the sketch.
+
+        Returns
+        -------
+        MinHashSketch
+            Sketch of all kmers in `sequences`.
+
+        Raises
+        ------
+        TypeError
+            If a sequence is not a ``GrammaredSequence``, or if `canonical` is
+            ``True`` and a sequence does not have a complement.
+        ValueError
+            If the kmers of a sequence cannot be encoded as 64-bit integers
+            because `k` is too large for its alphabet.
+
+        See Also
+        --------
+        from_sequence
+
+        """
+        if k < 1:
+            raise ValueError("k must be greater than 0.")
+        seed_hash = _mix64(np.asarray([seed], dtype=np.uint64))[0]
+        encodings = {}
+        sketch = np.empty(0, dtype=np.uint64)
+
+        for sequence in sequences:
+            dtype = type(sequence)
+            if dtype not in encodings:
+                if canonical is None:
+                    canonical = getattr(
+                        dtype, '_complement_lookup', None) is not None
+                encodings[dtype] = _kmer_encoding(
+                    dtype, k, canonical, _too_many_kmers)
+            rank, base, complement = encodings[dtype]
+
+            codes = rank[sequence._bytes]
+            for begin in range(0, max(len(codes) - k + 1, 0), _chunk_size):
+                kmers, valid = _encode_kmers(
+                    codes[begin:begin + _chunk_size + k - 1], k, 1, base,
+                    complement)
+                if valid is not None:
+                    kmers = kmers[valid]
+                hashes = _mix64(kmers.view(np.uint64) ^ seed_hash)
+                if len(sketch) == num_hashes:
+                    hashes = hashes[hashes < sketch[-1]]
+                sketch = np.unique(np.concatenate((sketch, hashes)))
+                sketch = sketch[:num_hashes]
+
+        if canonical is None:
+            canonical = True
+        return cls(sketch, k, num_hashes=num_hashes, seed=seed,
+                   canonical=canonical, id=id)
+
+    @property
+    @experimental(as_of='0.5.2')
+    def hashes(self):
+        """Sorted hash values in the sketch.
+
+        Returns
+        -------
+        1D np.ndarray (np.uint64)
+            Hash values, in ascending order. The array is read-only.
+
+        """
+        return self._hashes
+
+    @property
+    @experimental(as_of='0.5.2')
+    def k(self):
+        """Length of the hashed kmers.
+
+        Returns
+        -------
+        int
+            Kmer length.
+
+        """
+        return self._k
+
+    @property
+    @experimental(as_of='0.5.2')
+    def num_hashes(self):
+        """Maximum number of hash values in the sketch.
+
+        Returns
+        -------
+        int
+            Sketch size. The sketch contains fewer hash values if fewer
+            distinct kmers were sketched.
+
+        """
+        return self._num_hashes
+
+    @property
+    @experimental(as_of='0.5.2')
+    def seed(self):
+        """Seed of the hash function.
+
+        Returns
+        -------
+        int
+            Hash seed.
+
+        """
+        return self._seed
+
+    @property
+    @experimental(as_of='0.5.2')
+    def canonical(self):
+        """Whether kmers were hashed together with their reverse complements.
+
+        Returns
+        -------
+        bool
+            ``True`` if canonical kmers were hashed.
+
+        """
+        return self._canonical
+
+    @property
+    @experimental(as_of='0.5.2')
+    def id(self):
+        """Identifier of the sketch.
+
+        Returns
+        -------
+        str or None
+            Sketch ID, or ``None`` if the sketch does not have one.
+
+        """
+        return self._id
+
+    @experimental(as_of='0.5.2')
+    def __len__(self):
+        """Return the number of hash values in the sketch."""
+        return len(self._hashes)
+
+    @experimental(as_of='0.5.2')
+    def jaccard(self, other):
+        """Estimate the Jaccard index of two sketches' kmer sets.
+
+        Parameters
+        ----------
+        other : MinHashSketch
+            Sketch to compare to.
+
+        Returns
+        -------
+        float
+            Estimated fraction of distinct kmers found in either sketched
+            collection that are found in both. ``0.0`` if either sketch is
+            empty.
+
+        Raises
+        ------
+        TypeError
+            If `other` is not a ``MinHashSketch``.
+        ValueError
+            If the sketches were created with different `k`, `seed`, or
+            `canonical` parameters.
+
+        """
+        self._assert_compatible(other)
+        shared = len(np.intersect1d(self._hashes, other._hashes,
+                                    assume_unique=True))
+        if shared == 0:
+            return 0.0
+        threshold = min(self._hashes[-1], other._hashes[-1])
+        union = (self._hashes.searchsorted(threshold, side='right') +
+                 other._hashes.searchsorted(threshold, side='right') -
+                 shared)
+        return shared / int(union)
+
+    @experimental(as_of='0.5.2')
+    def containment(self, other):
+        """Estimate the fraction of this sketch's kmers found in another.
+
+        Parameters
+        ----------
+        other : MinHashSketch
+            Sketch whose kmers may contain this sketch's kmers.
+
+        Returns
+        -------
+        float
+            Estimated fraction of the distinct kmers sketched in `self` that
+            were also sketched in `other`. ``0.0`` if either sketch is empty.
+
+        Raises
+        ------
+        TypeError
+            If `other` is not a ``MinHashSketch``.
+        ValueError
+            If the sketches were created with different `k`, `seed`, or
+            `canonical` parameters.
+
+        Notes
+        -----
+        Only this sketch's hash values that are not larger than the largest
+        hash value in `other` are considered, since larger hash values may
+        have been left out of `other`.
+
+        """
+        self._assert_compatible(other)
+        if len(self) == 0 or len(other) == 0:
+            return 0.0
+        hashes = self._hashes[:self._hashes.searchsorted(other._hashes[-1],
+                                                         side='right')]
+        if len(hashes) == 0:
+            return 0.0
+        shared = len(np.intersect1d(hashes, other._hashes,
+                                    assume_unique=True))
+        return shared / len(hashes)
+
+    @experimental(as_of='0.5.2')
+    def mash_distance(self, other):
+        """Estimate the Mash distance between two sketches.
+
+        Parameters
+        ----------
+        other : MinHashSketch
+            Sketch to compare to.
+
+        Returns
+        -------
+        float
+            Mash distance, which estimates the per-position mutation rate
+            between the sketched sequences. ``1.0`` if the sketches do not
+            share any hash values.
+
+        Raises
+        ------
+        TypeError
+            If `other` is not a ``MinHashSketch``.
+        ValueError
+            If the sketches were created with different `k`, `seed`, or
+            `canonical` parameters.
+
+        See Also
+        --------
+        jaccard
+
+        Notes
+        -----
+        The Mash distance is :math:`-\\frac{1}{k}\\ln\\frac{2j}{1+j}`, where
+        :math:`j` is the estimated Jaccard index of the sketches [1]_.
+
+        References
+        ----------
+        .. [1] Ondov, B. D., Treangen, T. J., Melsted, P., Mallonee, A. B.,
+           Bergman, N. H., Koren, S., & Phillippy, A. M. (2016). Mash: fast
+           genome and metagenome distance estimation using MinHash. Genome
+           Biology, 17(1), 132.
+
+        """
+        return float(_mash_distance(self.jaccard(other), self._k))
+
+    @experimental(as_of='0.5.2')
+    def __eq__(self, other):
+        """Determine if the sketch is equal to another.
+
+        Sketches are equal if they are of the same type, have the same
+        parameters, ID, and hash values.
+
+        Parameters
+        ----------
+        other : MinHashSketch
+            Sketch to test for equality against.
+
+        Returns
+        -------
+        bool
+            Indicates whether the sketches are equal.
+
+        """
+        if self.__class__ != other.__class__:
+            return False
+        return (self._k == other._k and
+                self._num_hashes == other._num_hashes and
+                self._seed == other._seed and
+                self._canonical == other._canonical and
+                self._id == other._id and
+                np.array_equal(self._hashes, other._hashes))
+
+    @experimental(as_of='0.5.2')
+    def __ne__(self, other):
+        """Determine if the sketch is not equal to another."""
+        return not (self == other)
+
+    @experimental(as_of='0.5.2')
+    def __repr__(self):
+        """Return a string summary of the sketch."""
+        lines = ElasticLines()
+        lines.add_line(self.__class__.__name__)
+        lines.add_separator()
+        lines.add_line('Stats:')
+        lines.add_line('    id: %r' % (self._id,))
+        lines.add_line('    k: %d' % self._k)
+        lines.add_line('    hashes: %d (of %d)'
+                       % (len(self), self._num_hashes))
+        lines.add_line('    seed: %d' % self._seed)
+        lines.add_line('    canonical: %r' % self._canonical)
+        return lines.to_str()
+
+    @experimental(as_of='0.5.2')
+    def __str__(self):
+        """Return the sketch's hash values separated by spaces."""
+        return ' '.join(map(str, self._hashes.tolist()))
+
+    def _assert_compatible(self, other):
+        if not isinstance(other, MinHashSketch):
+            raise TypeError("Sketches can only be compared to other "
+                            "MinHashSketch objects, not %r."
+                            % type(other).__name__)
+        for name in 'k', 'seed', 'canonical':
+            if getattr(self, name) != getattr(other, name):
+                raise ValueError(
+                    "Sketches with different `%s` parameters cannot be "
+                    "compared (%r != %r)."
+                    % (name, getattr(self, name), getattr(other, name)))
+
+
+def _mash_distance(jaccard, k):
+    """Convert Jaccard index estimates into Mash distances."""
+    jaccard = np.asarray(jaccard, dtype=float)
+    with np.errstate(divide='ignore'):
+        distance = -np.log(2 * jaccard / (1 + jaccard)) / k
+    return np.minimum(distance, 1.0)
+
+
+def _pairwise_jaccard(sketches):
+    """Estimate the Jaccard index of every pair of compatible sketches."""
+    num_sketches = len(sketches)
+    lengths = np.asarray([len(s) for s in sketches], dtype=np.int64)
+    hashes = np.concatenate([s.hashes for s in sketches] +
+                            [np.empty(0, dtype=np.uint64)])
+    # Count the hash values shared by each pair of sketches with a sparse
+    # (sketch x hash value) incidence matrix.
+    from scipy.sparse import csr_matrix
+    _, columns = np.unique(hashes, return_inverse=True)
+    rows = np.repeat(np.arange(num_sketches), lengths)
+    incidence = csr_matrix((np.ones(len(hashes), dtype=np.int64),
+                            (rows, columns)),
+                           shape=(num_sketches, len(hashes)))
+    shared = (incidence * incidence.T).toarray()
+
+    # Number of hash values of sketch i that are not larger than the smaller
+    # of the largest hash values of sketches i and j. Shared hash values are
+    # always below both sketches' largest hash values.
+    largest = np.asarray([s.hashes[-1] if len(s) else 0 for s in sketches],
+                         dtype=np.uint64)
+    below = np.empty((num_sketches, num_sketches), dtype=np.int64)
+    for i, sketch in enumerate(sketches):
+        below[i] = sketch.hashes.searchsorted(
+            np.minimum(largest, largest[i]), side='right')
+    union = below + below.T - shared
+
+    jaccard = np.zeros((num_sketches, num_sketches))
+    np.divide(shared, union, out=jaccard, where=shared > 0)
+    return jaccard
@@ -9,9 +9,11 @@
 from abc import ABCMeta, abstractproperty
 
 import numpy as np
+import pandas as pd
 
-from skbio.util._decorator import classproperty, stable
+from skbio.util._decorator import classproperty, stable, experimental
 from ._grammared_sequence import _motifs as parent_motifs
+from ._window import _window_index, _window_sums
 
 
 class NucleotideMixin(metaclass=ABCMeta):
@@ -31,6 +33,7 @@ class NucleotideMixin(metaclass=ABCMeta):
     """
     __complement_lookup = None
     __gc_codes = None
+    __nucleotide_masks = None
 
     @classproperty
     def _complement_lookup(cls):
@@ -50,6 +53,24 @@ class NucleotideMixin(metaclass=ABCMeta):
             cls.__gc_codes = np.asarray([ord(g) for g in gc_iupac_chars])
         return cls.__gc_codes
 
+    @classproperty
+    def _nucleotide_masks(cls):
+        # Lookup table from each character to a 4-bit mask of the definite
+        # characters it represents (e.g., A -> 0b0001, R -> 0b0101). Gaps and
+        # invalid characters map to 0.
+        if cls.__nucleotide_masks is None:
+            bits = {c: 1 << i
+                    for i, c in enumerate(sorted(cls.definite_chars))}
+            masks = np.zeros(cls._number_of_extended_ascii_codes,
+                             dtype=np.uint8)
+            for char, bit in bits.items():
+                masks[ord(char)] = bit
+            for char, definites in cls.degenerate_map.items():
+                for definite in definites:
+                    masks[ord(char)] |= bits[definite]
+            cls.__nucleotide_masks = masks
+        return cls.__nucleotide_masks
+
     @property
     def _motifs(self):
         return _motifs
@@ -267,6 +288,279 @@ class NucleotideMixin(metaclass=ABCMeta):
             # underlying sequence data
             return self.reverse_complement()._string == other._string
 
+    @experimental(as_of='0.5.2')
+    def find_degenerate_matches(self, subsequence, max_mismatches=0,
+                                start=None, end=None):
+        """Find matches of a possibly degenerate subsequence.
+
+        Two characters match if the sets of nucleotides they represent
+        overlap. For example, ``R`` (``A`` or ``G``) matches ``A``, ``G``,
+        ``R``, ``N``, and ``S`` (``G`` or ``C``), but not ``C`` or ``Y``.
+        Degenerate characters may occur in both the subsequence and this
+        sequence. Gap characters do not match any character.
+
+        Parameters
+        ----------
+        subsequence : str, Sequence, or 1D np.ndarray (np.uint8 or '\|S1')
+            Subsequence to search for. It must be valid for this sequence's
+            type.
+        max_mismatches : int, optional
+            Maximum number of positions in a match at which the characters do
+            not match.
+        start : int, optional
+            The position at which to start searching (inclusive).
+        end : int, optional
+            The position at which to stop searching (exclusive).
+
+        Yields
+        ------
+        slice
+            Location of each match, in ascending order. Matches may overlap.
+
+        Raises
+        ------
+        ValueError
+            If `subsequence` is of length 0 or `max_mismatches` is negative.
+        TypeError
+            If `subsequence` is a ``Sequence`` object with a different type
+            than this sequence.
+
+        See Also
+        --------
+        degenerate_contains
+        degenerate_index
+        degenerate_count
+        to_regex
+
+        Notes
+        -----
+        Each character is encoded as a 4-bit mask of the nucleotides it
+        represents, and matches are found by comparing the masks with bitwise
+        AND for all candidate positions at once. This avoids expanding
+        degenerate characters (see ``expand_degenerates``) or backtracking
+        regular expressions (see ``to_regex``).
+
+        Examples
+        --------
+        >>> from skbio import DNA
+        >>> s = DNA('GATTACAGNTACA')
+        >>> for match in s.find_degenerate_matches('ACR'):
+        ...     match
+        slice(4, 7, None)
+        slice(10, 13, None)
+
+        Allow a single mismatch:
+
+        >>> for match in s.find_degenerate_matches('ACR', max_mismatches=1):
+        ...     match
+        slice(4, 7, None)
+        slice(6, 9, None)
+        slice(8, 11, None)
+        slice(10, 13, None)
+
+        """
+        for start in self._degenerate_match_starts(
+                subsequence, max_mismatches, start, end,
+                'find_degenerate_matches'):
+            yield slice(start, start + len(subsequence))
+
+    @experimental(as_of='0.5.2')
+    def degenerate_contains(self, subsequence, max_mismatches=0):
+        """Determine if a possibly degenerate subsequence matches this sequence.
+
+        Parameters
+        ----------
+        subsequence : str, Sequence, or 1D np.ndarray (np.uint8 or '\|S1')
+            Subsequence to search for. It must be valid for this sequence's
+            type.
+        max_mismatches : int, optional
+            Maximum number of positions in a match at which the characters do
+            not match.
+
+        Returns
+        -------
+        bool
+            Indicates whether `subsequence` matches anywhere in this sequence.
+
+        Raises
+        ------
+        ValueError
+            If `subsequence` is of length 0 or `max_mismatches` is negative.
+        TypeError
+            If `subsequence` is a ``Sequence`` object with a different type
+            than this sequence.
+
+        See Also
+        --------
+        find_degenerate_matches
+        __contains__
+
+        Examples
+        --------
+        >>> from skbio import DNA
+        >>> s = DNA('GATTACA')
+        >>> 'TRC' in s
+        False
+        >>> s.degenerate_contains('TRC')
+        True
+        >>> s.degenerate_contains('GGT')
+        False
+        >>> s.degenerate_contains('GGT', max_mismatches=1)
+        True
+
+        """
+        return len(self._degenerate_match_starts(
+            subsequence, max_mismatches, None, None,
+            'degenerate_contains')) > 0
+
+    @experimental(as_of='0.5.2')
+    def degenerate_index(self, subsequence, max_mismatches=0, start=None,
+                         end=None):
+        """Find where a possibly degenerate subsequence first matches.
+
+        Parameters
+        ----------
+        subsequence : str, Sequence, or 1D np.ndarray (np.uint8 or '\|S1')
+            Subsequence to search for. It must be valid for this sequence's
+            type.
+        max_mismatches : int, optional
+            Maximum number of positions in a match at which the characters do
+            not match.
+        start : int, optional
+            The position at which to start searching (inclusive).
+        end : int, optional
+            The position at which to stop searching (exclusive).
+
+        Returns
+        -------
+        int
+            Position where `subsequence` first matches this sequence.
+
+        Raises
+        ------
+        ValueError
+            If `subsequence` does not match this sequence, is of length 0, or
+            if `max_mismatches` is negative.
+        TypeError
+            If `subsequence` is a ``Sequence`` object with a different type
+            than this sequence.
+
+        See Also
+        --------
+        find_degenerate_matches
+        index
+
+        Examples
+        --------
+        >>> from skbio import DNA
+        >>> s = DNA('GATTACAGNTACA')
+        >>> s.degenerate_index('YAC')
+        3
+        >>> s.degenerate_index('YAC', start=4)
+        9
+
+        """
+        starts = self._degenerate_match_starts(
+            subsequence, max_mismatches, start, end, 'degenerate_index')
+        if len(starts) == 0:
+            raise ValueError(
+                "%r does not match %r." % (subsequence, self))
+        return int(starts[0])
+
+    @experimental(as_of='0.5.2')
+    def degenerate_count(self, subsequence, max_mismatches=0, start=None,
+                         end=None):
+        """Count non-overlapping matches of a possibly degenerate subsequence.
+
+        Like ``count``, matches are counted from left to right, skipping
+        matches that overlap a previously counted match.
+
+        Parameters
+        ----------
+        subsequence : str, Sequence, or 1D np.ndarray (np.uint8 or '\|S1')
+            Subsequence to count matches of. It must be valid for this
+            sequence's type.
+        max_mismatches : int, optional
+            Maximum number of positions in a match at which the characters do
+            not match.
+        start : int, optional
+            The position at which to start counting (inclusive).
+        end : int, optional
+            The position at which to stop counting (exclusive).
+
+        Returns
+        -------
+        int
+            Number of non-overlapping matches of `subsequence` in this
+            sequence.
+
+        Raises
+        ------
+        ValueError
+            If `subsequence` is of length 0 or `max_mismatches` is negative.
+        TypeError
+            If `subsequence` is a ``Sequence`` object with a different type
+            than this sequence.
+
+        See Also
+        --------
+        find_degenerate_matches
+        count
+
+        Examples
+        --------
+        >>> from skbio import DNA
+        >>> s = DNA('AAGAANAA')
+        >>> s.count('AR')
+        0
+        >>> s.degenerate_count('AR')
+        3
+        >>> s.degenerate_count('NN')
+        4
+
+        """
+        starts = self._degenerate_match_starts(
+            subsequence, max_mismatches, start, end, 'degenerate_count')
+        count = 0
+        next_start = -1
+        length = len(subsequence)
+        for start in starts.tolist():
+            if start >= next_start:
+                count += 1
+                next_start = start + length
+        return count
+
+    def _degenerate_match_starts(self, subsequence, max_mismatches, start,
+                                 end, method):
+        if max_mismatches < 0:
+            raise ValueError("`max_mismatches` must be greater than or equal "
+                             "to 0, not %r." % max_mismatches)
+        subsequence = self._munge_to_self_type(subsequence, method)
+        if len(subsequence) == 0:
+            raise ValueError(
+                "`%s` is not defined for empty subsequences." % method)
+
+        masks = self._nucleotide_masks
+        pattern = masks[subsequence._bytes]
+        start, end, _ = slice(start, end).indices(len(self))
+        text = masks[self._bytes[start:end]]
+
+        # Compare one position of the subsequence at a time for all candidate
+        # starts, discarding candidates as soon as they have too many
+        # mismatches.
+        num_candidates = len(text) - len(pattern) + 1
+        candidates = np.arange(max(num_candidates, 0))
+        mismatches = np.zeros(len(candidates), dtype=np.intp)
+        for offset, mask in enumerate(pattern):
+            if len(candidates) == 0:
+                break
+            mismatches += (text[candidates + offset] & mask) == 0
+            keep = mismatches <= max_mismatches
+            if not keep.all():
+                candidates = candidates[keep]
+                mismatches = mismatches[keep]
+        return candidates + start
+
     @stable(as_of='0.4.0')
     def gc_content(self):
         """Calculate the relative frequency of G's and C's in the sequence.
@@ -372,6 +666,123 @@ class NucleotideMixin(metaclass=ABCMeta):
                 gc /= len(seq)
         return gc
 
+    @experimental(as_of='0.5.2')
+    def window_gc_content(self, window, step=1):
+        """Calculate the GC content of the sequence in sliding windows.
+
+        As in ``gc_content``, G, C, and S characters are counted and gap
+        characters are excluded from the length of each window.
+
+        Parameters
+        ----------
+        window : int
+            Length of each window, including gap characters.
+        step : int, optional
+            Distance between the starts of consecutive windows.
+
+        Returns
+        -------
+        pd.Series
+            Relative frequency of G's and C's in each window, or zero if the
+            window only contains gaps. The index is the position where each
+            window starts.
+
+        Raises
+        ------
+        ValueError
+            If `window` or `step` is less than 1.
+
+        See Also
+        --------
+        gc_content
+        window_gc_skew
+
+        Notes
+        -----
+        Only complete windows are included, so positions after the last
+        complete window are ignored. GC content is computed from cumulative
+        counts, so the running time is linear in the length of the sequence
+        regardless of the window size. This is much faster than calling
+        ``gc_content`` on a slice of the sequence for each window.
+
+        Examples
+        --------
+        >>> from skbio import DNA
+        >>> s = DNA('ATATGCGC--GCAT')
+        >>> s.window_gc_content(4, step=2)
+        start
+        0     0.0
+        2     0.5
+        4     1.0
+        6     1.0
+        8     1.0
+        10    0.5
+        dtype: float64
+
+        """
+        index = _window_index(len(self), window, step)
+        gc = _window_sums(np.in1d(self._bytes, self._gc_codes), window, step)
+        definites = window - _window_sums(self.gaps(), window, step)
+        content = np.zeros(len(index))
+        np.divide(gc, definites, out=content, where=definites != 0)
+        return pd.Series(content, index=index)
+
+    @experimental(as_of='0.5.2')
+    def window_gc_skew(self, window, step=1):
+        """Calculate the GC skew of the sequence in sliding windows.
+
+        GC skew is ``(G - C) / (G + C)``, where ``G`` and ``C`` are the number
+        of G's and C's in a window. Changes in the sign of the cumulative GC
+        skew along a bacterial chromosome indicate the origin and terminus of
+        replication.
+
+        Parameters
+        ----------
+        window : int
+            Length of each window.
+        step : int, optional
+            Distance between the starts of consecutive windows.
+
+        Returns
+        -------
+        pd.Series
+            GC skew of each window, or zero if the window contains neither G
+            nor C. The index is the position where each window starts.
+
+        Raises
+        ------
+        ValueError
+            If `window` or `step` is less than 1.
+
+        See Also
+        --------
+        window_gc_content
+
+        Notes
+        -----
+        Degenerate characters (including S) are not counted. See
+        ``window_gc_content`` for how windows are defined.
+
+        Examples
+        --------
+        >>> from skbio import DNA
+        >>> s = DNA('GGGCATATCCGC')
+        >>> s.window_gc_skew(4, step=4)
+        start
+        0    0.5
+        4    0.0
+        8   -0.5
+        dtype: float64
+
+        """
+        index = _window_index(len(self), window, step)
+        g = _window_sums(self._bytes == ord('G'), window, step)
+        c = _window_sums(self._bytes == ord('C'), window, step)
+        gc = g + c
+        skew = np.zeros(len(index))
+        np.divide(g - c, gc, out=skew, where=gc != 0)
+        return pd.Series(skew, index=index)
+
 
 _motifs = parent_motifs.copy()
 
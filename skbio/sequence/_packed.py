@@ -0,0 +1,622 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+import collections
+import copy
+import numbers
+
+import numpy as np
+
+from skbio._base import SkbioObject, ElasticLines
+from skbio.metadata._mixin import MetadataMixin
+from skbio.sequence._dna import DNA
+from skbio.sequence._rna import RNA
+from skbio.sequence._kmer import _kmer_frequencies
+from skbio.util._decorator import experimental
+
+# Number of positions processed at a time when packing, counting, or iterating
+# over a packed sequence. Must be a multiple of 4.
+_chunk_size = 2 ** 22
+# Bit shifts that extract the four 2-bit codes of a byte, first position in
+# the most significant bits.
+_shifts = np.array([6, 4, 2, 0], dtype=np.uint8)
+_invalid_code = 255
+
+
+def _byte_table(function):
+    """Tabulate `function` of the four 2-bit codes for every byte value."""
+    codes = (np.arange(256, dtype=np.uint8)[:, np.newaxis] >> _shifts) & 3
+    return np.asarray([function(c) for c in codes], dtype=np.uint8)
+
+
+# Number of C (1) or G (2) codes in each byte.
+_gc_counts = _byte_table(lambda c: ((c == 1) | (c == 2)).sum())
+# Each byte with the order of its four codes reversed.
+_reversed_codes = _byte_table(lambda c: (c[::-1] << _shifts).sum())
+
+
+class PackedSequence(MetadataMixin, SkbioObject):
+    """Store a DNA or RNA sequence using two bits per position.
+
+    Definite characters (``A``, ``C``, ``G``, and ``T``/``U``) are packed four
+    to a byte. All other characters (degenerate and gap characters) are stored
+    in a side table as runs of identical characters, so long stretches of
+    ``N`` or gaps take up a constant amount of space.
+
+    Parameters
+    ----------
+    sequence : DNA, RNA, str, bytes, or 1D np.ndarray (np.uint8)
+        Sequence to pack. If it is a ``DNA`` or ``RNA`` object, its type and
+        metadata are used, and its characters are not revalidated.
+    dtype : type, optional
+        ``DNA`` or ``RNA`` (or a subclass of either). Defaults to the type of
+        `sequence` if it is a ``DNA`` or ``RNA`` object, otherwise ``DNA``.
+    metadata : dict, optional
+        Arbitrary metadata which applies to the entire sequence.
+
+    Raises
+    ------
+    TypeError
+        If `dtype` is not ``DNA`` or ``RNA``, or does not match the type of
+        `sequence`.
+    ValueError
+        If `sequence` contains characters that are not in the alphabet of
+        `dtype`.
+
+    See Also
+    --------
+    DNA
+    RNA
+
+    Notes
+    -----
+    A packed sequence requires about a quarter of the memory of the
+    corresponding ``DNA`` or ``RNA`` object. Indexing, complementing,
+    computing GC content, and counting or iterating over kmers operate on the
+    packed data directly, unpacking at most a bounded region at a time; only
+    ``unpack`` (and ``str``) materializes the entire sequence.
+
+    Positional and interval metadata are not stored.
+
+    Examples
+    --------
+    >>> from skbio import DNA
+    >>> from skbio.sequence import PackedSequence
+    >>> seq = PackedSequence(DNA('ACGTNNNNACGT', metadata={'id': 'chr1'}))
+    >>> len(seq)
+    12
+    >>> str(seq[2:6])
+    'GTNN'
+    >>> seq.gc_content()
+    0.3333333333333333
+    >>> str(seq.reverse_complement())
+    'ACGTNNNNACGT'
+    >>> seq.unpack()
+    DNA
+    -------------------------
+    Metadata:
+        'id': 'chr1'
+    Stats:
+        length: 12
+        has gaps: False
+        has degenerates: True
+        has definites: True
+        GC-content: 33.33%
+    -------------------------
+    0 ACGTNNNNAC GT
+
+    """
+    __hash__ = None
+
+    @property
+    @experimental(as_of='0.5.2')
+    def dtype(self):
+        """Type of the packed sequence (``DNA`` or ``RNA``).
+
+        Notes
+        -----
+        This property is not writeable.
+
+        """
+        return self._dtype
+
+    @property
+    @experimental(as_of='0.5.2')
+    def nbytes(self):
+        """Number of bytes used to store the sequence's characters.
+
+        Notes
+        -----
+        This property is not writeable.
+
+        """
+        return (self._packed.nbytes + self._exception_starts.nbytes +
+                self._exception_ends.nbytes + self._exception_chars.nbytes)
+
+    @experimental(as_of='0.5.2')
+    def __init__(self, sequence, dtype=None, metadata=None):
+        if isinstance(sequence, (DNA, RNA)):
+            if dtype is not None and dtype is not type(sequence):
+                raise TypeError(
+                    "`dtype` (%r) does not match the type of `sequence` (%r)."
+                    % (dtype.__name__, type(sequence).__name__))
+            dtype = type(sequence)
+            if metadata is None and sequence.has_metadata():
+                metadata = sequence.metadata
+            data = sequence._bytes
+            validate = False
+        else:
+            if dtype is None:
+                dtype = DNA
+            if isinstance(sequence, str):
+                sequence = sequence.encode('ascii')
+            if isinstance(sequence, (bytes, bytearray)):
+                sequence = np.frombuffer(sequence, dtype=np.uint8)
+            data = np.ascontiguousarray(sequence)
+            if data.dtype != np.uint8 or data.ndim != 1:
+                raise TypeError(
+                    "Can only pack a sequence from a DNA or RNA object, str, "
+                    "bytes, or 1D np.ndarray of dtype np.uint8.")
+            validate = True
+
+        if not (isinstance(dtype, type) and issubclass(dtype, (DNA, RNA))):
+            raise TypeError(
+                "`dtype` must be DNA or RNA, not %r." % (dtype,))
+
+        self._dtype = dtype
+        self._length = len(data)
+        MetadataMixin._init_(self, metadata=metadata)
+        self._pack(data, validate)
+
+    def _pack(self, data, validate):
+        lookup = np.empty(256, dtype=np.uint8)
+        lookup.fill(_invalid_code)
+        lookup[self._alphabet] = np.arange(4, dtype=np.uint8)
+
+        packed = np.empty((len(data) + 3) // 4, dtype=np.uint8)
+        starts, ends, chars = [], [], []
+        for begin in range(0, len(data), _chunk_size):
+            chunk = data[begin:begin + _chunk_size]
+            if validate:
+                self._dtype(chunk)
+
+            codes = lookup[chunk]
+            is_exception = codes == _invalid_code
+            if is_exception.any():
+                run_starts, run_ends, run_chars = _runs(
+                    np.flatnonzero(is_exception), chunk)
+                starts.append(run_starts + begin)
+                ends.append(run_ends + begin)
+                chars.append(run_chars)
+                codes[is_exception] = 0
+
+            if len(codes) % 4:
+                codes = np.concatenate(
+                    [codes, np.zeros(4 - len(codes) % 4, dtype=np.uint8)])
+            codes = codes.reshape(-1, 4)
+            packed[begin // 4:begin // 4 + len(codes)] = (
+                (codes[:, 0] << 6) | (codes[:, 1] << 4) | (codes[:, 2] << 2) |
+                codes[:, 3])
+
+        def concat(arrays, dtype):
+            return np.concatenate(arrays) if arrays else np.empty(0, dtype)
+
+        self._set_parts(packed, concat(starts, np.int64),
+                        concat(ends, np.int64), concat(chars, np.uint8))
+
+    def _set_parts(self, packed, starts, ends, chars):
+        # Runs that were split across chunk boundaries are merged so that
+        # equal sequences always have identical side tables.
+        if len(starts) > 1:
+            joined = (ends[:-1] == starts[1:]) & (chars[:-1] == chars[1:])
+            if joined.any():
+                first = np.concatenate(([True], ~joined))
+                last = np.concatenate((~joined, [True]))
+                starts, ends, chars = starts[first], ends[last], chars[first]
+
+        for array in packed, starts, ends, chars:
+            array.flags.writeable = False
+        self._packed = packed
+        self._exception_starts = starts
+        self._exception_ends = ends
+        self._exception_chars = chars
+
+    def _derive(self, packed, starts, ends, chars):
+        """Return a packed sequence of the same type, length, and metadata."""
+        derived = self.__class__.__new__(self.__class__)
+        derived._dtype = self._dtype
+        derived._length = self._length
+        MetadataMixin._init_(
+            derived, metadata=self.metadata if self.has_metadata() else None)
+        derived._set_parts(packed, starts, ends, chars)
+        return derived
+
+    @property
+    def _alphabet(self):
+        return np.fromstring(''.join(sorted(self._dtype.definite_chars)),
+                             dtype=np.uint8)
+
+    def _unpack(self, start, stop):
+        """Return the characters in [start, stop) as np.uint8."""
+        first = start // 4
+        codes = (self._packed[first:(stop + 3) // 4, np.newaxis] >> _shifts)
+        codes = (codes & 3).ravel()[start - first * 4:stop - first * 4]
+        chars = self._alphabet[codes]
+
+        lo = np.searchsorted(self._exception_ends, start, side='right')
+        hi = np.searchsorted(self._exception_starts, stop, side='left')
+        if lo < hi:
+            run_starts = np.maximum(self._exception_starts[lo:hi], start)
+            run_ends = np.minimum(self._exception_ends[lo:hi], stop)
+            lengths = run_ends - run_starts
+            offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+            positions = np.repeat(run_starts - start - offsets, lengths)
+            positions += np.arange(lengths.sum())
+            chars[positions] = np.repeat(self._exception_chars[lo:hi],
+                                         lengths)
+        return chars
+
+    def _to_sequence(self, chars):
+        metadata = self.metadata if self.has_metadata() else None
+        return self._dtype(chars, metadata=metadata, validate=False)
+
+    def _chunks(self, k, overlap):
+        """Yield unpacked regions holding each kmer window exactly once."""
+        step = 1 if overlap else k
+        size = max(_chunk_size // step, 1) * step
+        extra = k - 1 if overlap else 0
+        for start in range(0, self._length, size):
+            yield self._unpack(start, min(start + size + extra, self._length))
+
+    @experimental(as_of='0.5.2')
+    def __len__(self):
+        """Return the number of characters in the sequence."""
+        return self._length
+
+    @experimental(as_of='0.5.2')
+    def __getitem__(self, indexable):
+        """Unpack a character or a region of the sequence.
+
+        Parameters
+        ----------
+        indexable : int or slice
+            Position or region to unpack.
+
+        Returns
+        -------
+        DNA or RNA
+            Sequence (of type ``dtype``) containing the selected characters.
+            Only the selected region is unpacked.
+
+        """
+        if isinstance(indexable, numbers.Integral) and \
+                not isinstance(indexable, bool):
+            if indexable < -self._length or indexable >= self._length:
+                raise IndexError(
+                    "Position %d is out of range for a sequence of length %d."
+                    % (indexable, self._length))
+            start = indexable % self._length
+            return self._to_sequence(self._unpack(start, start + 1))
+
+        if not isinstance(indexable, slice):
+            raise TypeError(
+                "Packed sequences can only be indexed with an int or a slice, "
+                "not %r." % type(indexable).__name__)
+
+        positions = range(*indexable.indices(self._length))
+        if len(positions) == 0:
+            return self._to_sequence(np.empty(0, dtype=np.uint8))
+        lo = min(positions[0], positions[-1])
+        hi = max(positions[0], positions[-1]) + 1
+        chars = self._unpack(lo, hi)
+        if positions.step != 1:
+            chars = chars[np.arange(positions.start, positions.stop,
+                                    positions.step) - lo]
+        return self._to_sequence(chars)
+
+    @experimental(as_of='0.5.2')
+    def unpack(self):
+        """Return the entire sequence as a ``DNA`` or ``RNA`` object.
+
+        Returns
+        -------
+        DNA or RNA
+            Unpacked sequence, with the packed sequence's metadata.
+
+        """
+        return self._to_sequence(self._unpack(0, self._length))
+
+    @experimental(as_of='0.5.2')
+    def complement(self, reverse=False):
+        """Return the complement of the packed sequence.
+
+        Parameters
+        ----------
+        reverse : bool, optional
+            If ``True``, return the reverse complement.
+
+        Returns
+        -------
+        PackedSequence
+            The (reverse) complement, computed without unpacking.
+
+        See Also
+        --------
+        reverse_complement
+        skbio.sequence.DNA.complement
+
+        """
+        # With A=0, C=1, G=2, T/U=3, complementing a code flips its bits.
+        packed = np.invert(self._packed)
+        chars = self._dtype._complement_lookup[self._exception_chars]
+        starts, ends = self._exception_starts, self._exception_ends
+
+        padding = -self._length % 4
+        if reverse:
+            packed = _reversed_codes[packed[::-1]]
+            if padding:
+                # The padding codes are now at the start of the first byte;
+                # shift every code towards the start of the sequence.
+                shifted = packed << (2 * padding)
+                shifted[:-1] |= packed[1:] >> (8 - 2 * padding)
+                packed = shifted
+            starts, ends = (self._length - ends[::-1],
+                            self._length - starts[::-1])
+            chars = chars[::-1]
+        elif padding:
+            packed[-1] &= 0xFF << (2 * padding) & 0xFF
+        return self._derive(packed, starts, ends, chars)
+
+    @experimental(as_of='0.5.2')
+    def reverse_complement(self):
+        """Return the reverse complement of the packed sequence.
+
+        Returns
+        -------
+        PackedSequence
+            The reverse complement, computed without unpacking.
+
+        See Also
+        --------
+        complement
+        skbio.sequence.DNA.reverse_complement
+
+        """
+        return self.complement(reverse=True)
+
+    @experimental(as_of='0.5.2')
+    def gc_frequency(self, relative=False):
+        """Calculate frequency of G's and C's in the sequence.
+
+        Parameters
+        ----------
+        relative : bool, optional
+            If ``True``, return the proportion of G, C, and S characters in
+            the degapped sequence instead of their count.
+
+        Returns
+        -------
+        int or float
+            The GC frequency of the sequence.
+
+        See Also
+        --------
+        gc_content
+        skbio.sequence.DNA.gc_frequency
+
+        """
+        gc = 0
+        for start in range(0, len(self._packed), _chunk_size):
+            gc += int(_gc_counts[self._packed[start:start + _chunk_size]].sum(
+                dtype=np.int64))
+
+        # Positions in the side table are packed as A or T/U (never C or G),
+        # so only degenerate G/C characters need to be added.
+        lengths = self._exception_ends - self._exception_starts
+        gc += int(lengths[np.in1d(self._exception_chars,
+                                  self._dtype._gc_codes)].sum())
+        if not relative:
+            return gc
+
+        num_chars = self._length - int(lengths[np.in1d(
+            self._exception_chars, self._dtype._gap_codes)].sum())
+        return gc / num_chars if num_chars else 0.0
+
+    @experimental(as_of='0.5.2')
+    def gc_content(self):
+        """Calculate the relative frequency of G's and C's in the sequence.
+
+        Returns
+        -------
+        float
+            Relative frequency of G, C, and S characters, ignoring gaps.
+
+        See Also
+        --------
+        gc_frequency
+        skbio.sequence.DNA.gc_content
+
+        """
+        return self.gc_frequency(relative=True)
+
+    @experimental(as_of='0.5.2')
+    def kmer_frequencies(self, k, overlap=True, relative=False,
+                         canonical=False):
+        """Return counts of words of length `k` from the packed sequence.
+
+        Parameters
+        ----------
+        k : int
+            The word length.
+        overlap : bool, optional
+            Defines whether the kmers should be overlapping or not.
+        relative : bool, optional
+            If ``True``, return the relative frequency of each kmer instead of
+            its count.
+        canonical : bool, optional
+            If ``True``, count each kmer together with its reverse complement
+            under whichever of the two sorts first.
+
+        Returns
+        -------
+        dict
+            Frequencies of words of length `k` contained in the sequence.
+
+        Raises
+        ------
+        ValueError
+            If `k` is less than 1.
+
+        See Also
+        --------
+        skbio.sequence.Sequence.kmer_frequencies
+
+        Notes
+        -----
+        The sequence is unpacked and counted one region at a time.
+
+        """
+        if k < 1:
+            raise ValueError("k must be greater than 0.")
+
+        complement_lookup = None
+        if canonical:
+            complement_lookup = self._dtype._complement_lookup
+        step = 1 if overlap else k
+        freqs = collections.Counter()
+        for chars in self._chunks(k, overlap):
+            kmers, counts = _kmer_frequencies(chars, k, step,
+                                              complement_lookup)
+            for kmer, count in zip(kmers, counts.tolist()):
+                freqs[kmer] += count
+        freqs = dict(freqs)
+
+        if relative:
+            if overlap:
+                num_kmers = self._length - k + 1
+            else:
+                num_kmers = self._length // k
+            freqs = {kmer: count / num_kmers for kmer, count in freqs.items()}
+        return freqs
+
+    @experimental(as_of='0.5.2')
+    def iter_kmers(self, k, overlap=True):
+        """Generate kmers of length `k` from the packed sequence.
+
+        Parameters
+        ----------
+        k : int
+            The kmer length.
+        overlap : bool, optional
+            Defines whether the kmers should be overlapping or not.
+
+        Yields
+        ------
+        DNA or RNA
+            kmer of length `k` contained in the sequence.
+
+        Raises
+        ------
+        ValueError
+            If `k` is less than 1.
+
+        See Also
+        --------
+        skbio.sequence.Sequence.iter_kmers
+
+        Notes
+        -----
+        The sequence is unpacked one region at a time.
+
+        """
+        if k < 1:
+            raise ValueError("k must be greater than 0.")
+
+        for chars in self._chunks(k, overlap):
+            yield from self._to_sequence(chars).iter_kmers(k, overlap=overlap)
+
+    @experimental(as_of='0.5.2')
+    def __eq__(self, other):
+        """Determine if the packed sequence is equal to another.
+
+        Packed sequences are equal if they are of the same type and have the
+        same characters and metadata.
+
+        """
+        if self.__class__ != other.__class__ or self._dtype != other._dtype:
+            return False
+        if self._length != other._length:
+            return False
+        if not MetadataMixin._eq_(self, other):
+            return False
+        if not all(np.array_equal(getattr(self, attr), getattr(other, attr))
+                   for attr in ('_exception_starts', '_exception_ends',
+                                '_exception_chars')):
+            return False
+        if np.array_equal(self._packed, other._packed):
+            return True
+        # Positions in the side table may be packed with different codes, so
+        # compare the characters themselves.
+        return all(np.array_equal(mine, theirs) for mine, theirs in
+                   zip(self._chunks(1, True), other._chunks(1, True)))
+
+    @experimental(as_of='0.5.2')
+    def __ne__(self, other):
+        """Determine if the packed sequence is not equal to another."""
+        return not (self == other)
+
+    @experimental(as_of='0.5.2')
+    def __copy__(self):
+        """Return a shallow copy of the packed sequence."""
+        duplicate = self._derive(self._packed, self._exception_starts,
+                                 self._exception_ends, self._exception_chars)
+        duplicate._metadata = MetadataMixin._copy_(self)
+        return duplicate
+
+    @experimental(as_of='0.5.2')
+    def __deepcopy__(self, memo):
+        """Return a deep copy of the packed sequence."""
+        duplicate = copy.copy(self)
+        duplicate._metadata = MetadataMixin._deepcopy_(self, memo)
+        return duplicate
+
+    @experimental(as_of='0.5.2')
+    def __str__(self):
+        """Return the unpacked sequence as a string."""
+        return str(self.unpack())
+
+    @experimental(as_of='0.5.2')
+    def __repr__(self):
+        """Return a string summary of the packed sequence."""
+        lines = ElasticLines()
+        lines.add_line('%s[%s]' % (self.__class__.__name__,
+                                   self._dtype.__name__))
+        lines.add_separator()
+        lines.add_line('Stats:')
+        lines.add_line('    length: %d' % self._length)
+        lines.add_line('    packed size: %d bytes' % self.nbytes)
+        lines.add_line('    side table runs: %d'
+                       % len(self._exception_starts))
+        lines.add_separator()
+        preview = self._unpack(0, min(self._length, 50))
+        preview = preview.tostring().decode('ascii')
+        if self._length > 50:
+            preview += '...'
+        lines.add_line(preview)
+        return lines.to_str()
+
+
+def _runs(positions, chars):
+    """Run-length encode the characters at sorted `positions`."""
+    run_chars = chars[positions]
+    is_first = np.ones(len(positions), dtype=bool)
+    is_first[1:] = ((np.diff(positions) != 1) |
+                    (run_chars[1:] != run_chars[:-1]))
+    first = np.flatnonzero(is_first)
+    last = np.append(first[1:] - 1, len(positions) - 1)
+    return positions[first], positions[last] + 1, run_chars[first]
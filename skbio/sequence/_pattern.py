@@ -0,0 +1,393 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+import collections
+import math
+
+import numpy as np
+import pandas as pd
+
+from skbio._base import SkbioObject, ElasticLines
+from skbio.sequence._sequence import Sequence
+from skbio.sequence._grammared_sequence import GrammaredSequence
+from skbio.sequence._batch import SequenceBatch
+from skbio.util._decorator import experimental
+
+
+class PatternMatcher(SkbioObject):
+    """Find many patterns in sequences in a single pass.
+
+    A ``PatternMatcher`` compiles a collection of patterns (e.g., primers,
+    adapters, or barcodes) into an Aho-Corasick automaton [1]_ once, and can
+    then find every occurrence of every pattern in a sequence, or in all
+    sequences of a ``SequenceBatch``, in a single pass over the sequences.
+
+    Parameters
+    ----------
+    patterns : iterable of str or Sequence
+        Patterns to search for. Patterns must not be empty.
+    ids : iterable, optional
+        ID of each pattern, reported with each of its matches. Defaults to the
+        position of each pattern in `patterns`.
+    dtype : type, optional
+        Sequence type of the patterns (e.g., ``DNA``). If `patterns` are
+        ``Sequence`` objects, defaults to the type of the first pattern.
+        Patterns given as ``str`` are validated against `dtype`.
+    degenerate : bool, optional
+        If ``True`` and `dtype` is a ``GrammaredSequence``, degenerate
+        characters in patterns match any of the characters they represent in
+        the ``degenerate_map`` of `dtype` (e.g., ``N`` matches ``A``, ``C``,
+        ``G``, or ``T`` in ``DNA``). Otherwise, all pattern characters match
+        only themselves.
+    max_expansions : int, optional
+        Maximum number of definite sequences a degenerate pattern may
+        represent.
+
+    Raises
+    ------
+    ValueError
+        If a pattern is empty, if the number of IDs does not match the number
+        of patterns, or if a degenerate pattern represents more than
+        `max_expansions` definite sequences.
+    TypeError
+        If `patterns` are sequences of different types.
+
+    See Also
+    --------
+    Sequence.find_with_regex
+    GrammaredSequence.find_motifs
+    SequenceBatch
+
+    Notes
+    -----
+    The automaton is stored as a transition table with one row per state and
+    one column per distinct pattern character (all other characters share a
+    column). Rather than stepping through a sequence one character at a time
+    in Python, the automaton is run on many segments of the sequences
+    simultaneously with NumPy: each sequence in a batch (or each segment of a
+    long sequence) is advanced by one character per step. Segments of long
+    sequences overlap by the length of the longest pattern minus one so that
+    matches spanning segments are found exactly once.
+
+    Matching is exact: characters in the searched sequences match only
+    themselves, so a degenerate character in a searched sequence (e.g., ``N``)
+    only matches the same character in a pattern when `degenerate` is
+    ``False``. Overlapping matches are all reported.
+
+    References
+    ----------
+    .. [1] Aho, A. V., & Corasick, M. J. (1975). Efficient string matching: an
+       aid to bibliographic search. Communications of the ACM, 18(6),
+       333-340.
+
+    Examples
+    --------
+    >>> from skbio import DNA
+    >>> from skbio.sequence import PatternMatcher
+    >>> matcher = PatternMatcher(['ACGT', 'GTN', 'CC'], dtype=DNA,
+    ...                          ids=['p1', 'p2', 'p3'])
+    >>> matcher.search(DNA('AACGTACCGTT'))
+      pattern  start  stop
+    0      p1      1     5
+    1      p2      3     6
+    2      p3      6     8
+    3      p2      8    11
+
+    Search every sequence of a batch at once:
+
+    >>> from skbio.sequence import SequenceBatch
+    >>> batch = SequenceBatch.from_sequences([DNA('CCGTA'), DNA('TTTT'),
+    ...                                       DNA('ACGTC')])
+    >>> matcher.search(batch)
+       sequence pattern  start  stop
+    0         0      p3      0     2
+    1         0      p2      2     5
+    2         2      p1      0     4
+    3         2      p2      2     5
+
+    """
+    __hash__ = None
+
+    @experimental(as_of='0.5.2')
+    def __init__(self, patterns, ids=None, dtype=None, degenerate=True,
+                 max_expansions=10000):
+        patterns = list(patterns)
+        if dtype is None:
+            dtype = Sequence
+            if patterns and isinstance(patterns[0], Sequence):
+                dtype = type(patterns[0])
+
+        if ids is None:
+            ids = np.arange(len(patterns))
+        else:
+            ids = np.asarray(list(ids), dtype=object)
+            if len(ids) != len(patterns):
+                raise ValueError(
+                    "Number of IDs (%d) must match the number of patterns "
+                    "(%d)." % (len(ids), len(patterns)))
+
+        degenerate_map = {}
+        if degenerate and issubclass(dtype, GrammaredSequence):
+            degenerate_map = dtype.degenerate_map
+
+        encoded = []
+        for pattern in patterns:
+            if isinstance(pattern, Sequence):
+                if type(pattern) is not dtype:
+                    raise TypeError(
+                        "Patterns must all be of type %r, not %r."
+                        % (dtype.__name__, type(pattern).__name__))
+            else:
+                pattern = dtype(pattern)
+            if len(pattern) == 0:
+                raise ValueError("Patterns must not be empty.")
+            encoded.append([_options(c, degenerate_map)
+                            for c in str(pattern)])
+
+        self._dtype = dtype
+        self._ids = ids
+        self._lengths = np.asarray([len(p) for p in encoded], dtype=np.int64)
+        self._build(encoded, max_expansions)
+
+    def _build(self, patterns, max_expansions):
+        # Map each byte to a character class: one class per distinct pattern
+        # character, plus class 0 for all other characters.
+        chars = sorted({c for p in patterns for options in p
+                        for c in options})
+        classes = np.zeros(Sequence._number_of_extended_ascii_codes,
+                           dtype=np.intp)
+        classes[[ord(c) for c in chars]] = np.arange(1, len(chars) + 1)
+        num_classes = len(chars) + 1
+
+        # Build the trie of all patterns. Degenerate characters branch into
+        # every character they represent.
+        children = [{}]
+        outputs = [[]]
+        for pattern_id, pattern in enumerate(patterns):
+            frontier = [0]
+            for options in pattern:
+                if len(frontier) * len(options) > max_expansions:
+                    raise ValueError(
+                        "Pattern %r represents more than %d definite "
+                        "sequences. Increase `max_expansions` or use fewer "
+                        "degenerate characters."
+                        % (self._ids[pattern_id], max_expansions))
+                next_frontier = []
+                for state in frontier:
+                    for c in options:
+                        child = children[state].get(c)
+                        if child is None:
+                            child = len(children)
+                            children[state][c] = child
+                            children.append({})
+                            outputs.append([])
+                        next_frontier.append(child)
+                # the same state may be reached through different expansions
+                frontier = list(collections.OrderedDict.fromkeys(
+                    next_frontier))
+            for state in frontier:
+                outputs[state].append(pattern_id)
+
+        # Convert the trie into a complete transition table (a DFA) in
+        # breadth-first order, so that each state's failure state is complete
+        # before the state itself.
+        num_states = len(children)
+        transitions = np.zeros((num_states, num_classes), dtype=np.intp)
+        failure = np.zeros(num_states, dtype=np.intp)
+        queue = collections.deque()
+        for c, child in children[0].items():
+            transitions[0, classes[ord(c)]] = child
+            queue.append(child)
+        while queue:
+            state = queue.popleft()
+            transitions[state] = transitions[failure[state]]
+            outputs[state].extend(outputs[failure[state]])
+            for c, child in children[state].items():
+                failure[child] = transitions[failure[state], classes[ord(c)]]
+                transitions[state, classes[ord(c)]] = child
+                queue.append(child)
+
+        self._classes = classes
+        self._transitions = transitions
+        counts = np.asarray([len(o) for o in outputs], dtype=np.int64)
+        self._output_offsets = np.zeros(num_states + 1, dtype=np.int64)
+        np.cumsum(counts, out=self._output_offsets[1:])
+        self._outputs = np.asarray([i for o in outputs for i in o],
+                                   dtype=np.int64)
+        self._has_output = counts > 0
+
+    @property
+    @experimental(as_of='0.5.2')
+    def ids(self):
+        """IDs of the patterns.
+
+        Returns
+        -------
+        1D np.ndarray
+            Pattern IDs, in the order the patterns were provided.
+
+        """
+        return self._ids
+
+    @property
+    @experimental(as_of='0.5.2')
+    def num_states(self):
+        """Number of states in the automaton.
+
+        Returns
+        -------
+        int
+            Number of states, including the initial state.
+
+        """
+        return self._transitions.shape[0]
+
+    @experimental(as_of='0.5.2')
+    def __len__(self):
+        """Return the number of patterns."""
+        return len(self._ids)
+
+    @experimental(as_of='0.5.2')
+    def search(self, sequence):
+        """Find all matches of all patterns in a sequence or a batch.
+
+        Parameters
+        ----------
+        sequence : Sequence or SequenceBatch
+            Sequence, or batch of sequences, to search.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per match, with the columns ``pattern`` (the pattern ID),
+            and ``start`` and ``stop`` (the 0-based, half-open location of the
+            match). If `sequence` is a ``SequenceBatch``, the first column,
+            ``sequence``, is the index of the sequence in the batch containing
+            the match. Rows are sorted by sequence, start position, and
+            pattern.
+
+        Raises
+        ------
+        TypeError
+            If `sequence` is not a ``Sequence`` or ``SequenceBatch``.
+
+        """
+        if isinstance(sequence, SequenceBatch):
+            data, offsets = sequence.data, sequence.offsets
+        elif isinstance(sequence, Sequence):
+            data = sequence._bytes
+            offsets = np.asarray([0, len(data)], dtype=np.int64)
+        else:
+            raise TypeError("Can only search a Sequence or SequenceBatch, "
+                            "not %r." % type(sequence).__name__)
+
+        records, positions, patterns = self._scan(data, offsets)
+        stops = positions + 1 - offsets[records]
+        starts = stops - self._lengths[patterns]
+        order = np.lexsort((patterns, starts, records))
+
+        hits = pd.DataFrame(
+            {'sequence': records[order],
+             'pattern': self._ids[patterns[order]],
+             'start': starts[order],
+             'stop': stops[order]},
+            columns=['sequence', 'pattern', 'start', 'stop'])
+        if not isinstance(sequence, SequenceBatch):
+            del hits['sequence']
+        return hits
+
+    def _scan(self, data, offsets):
+        """Run the automaton over each sequence in a packed buffer.
+
+        Returns the sequence index, end position (in `data`, inclusive), and
+        pattern index of each match.
+
+        """
+        lengths = np.diff(offsets)
+        overlap = int(self._lengths.max()) - 1 if len(self) else 0
+        segment = max(math.isqrt(len(data)) if hasattr(math, 'isqrt')
+                      else int(math.sqrt(len(data))), 8 * (overlap + 1))
+
+        # Split each sequence into segments whose own positions start at
+        # `own`. Each lane starts `overlap` positions earlier (but not before
+        # its sequence) so matches ending in its own positions are complete.
+        num_segments = np.maximum(-(-lengths // segment), 0)
+        records = np.repeat(np.arange(len(lengths)), num_segments)
+        first = np.zeros(len(records), dtype=np.int64)
+        if len(records):
+            starts_of = np.zeros(len(lengths) + 1, dtype=np.int64)
+            np.cumsum(num_segments, out=starts_of[1:])
+            first = np.arange(len(records)) - starts_of[records]
+        own = offsets[records] + first * segment
+        ends = np.minimum(own + segment, offsets[records + 1])
+        begins = np.maximum(own - overlap, offsets[records])
+
+        # Lanes are sorted by length (longest first), so that the lanes still
+        # running at each step are a prefix of the lanes.
+        order = np.argsort(begins - ends, kind='mergesort')
+        records, own, ends, begins = (records[order], own[order],
+                                      ends[order], begins[order])
+        lane_lengths = ends - begins
+
+        classes = self._classes[data]
+        states = np.zeros(len(records), dtype=np.intp)
+        found_positions, found_states = [], []
+        num_active = len(records)
+        for step in range(int(lane_lengths[0]) if len(records) else 0):
+            while lane_lengths[num_active - 1] <= step:
+                num_active -= 1
+            positions = begins[:num_active] + step
+            active = states[:num_active]
+            active[...] = self._transitions[active, classes[positions]]
+            hit = self._has_output[active]
+            if step >= overlap or hit.any():
+                hit &= positions >= own[:num_active]
+                if hit.any():
+                    found_positions.append(positions[hit])
+                    found_states.append(active[hit])
+
+        if not found_positions:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, empty
+        positions = np.concatenate(found_positions)
+        states = np.concatenate(found_states)
+
+        # each match state may report several patterns
+        counts = np.diff(self._output_offsets)[states]
+        positions = np.repeat(positions, counts)
+        index = np.repeat(self._output_offsets[states] - np.cumsum(counts) +
+                          counts, counts) + np.arange(counts.sum())
+        patterns = self._outputs[index]
+        records = np.searchsorted(offsets, positions, side='right') - 1
+        return records, positions, patterns
+
+    @experimental(as_of='0.5.2')
+    def __repr__(self):
+        """Return a string summary of the pattern matcher."""
+        lines = ElasticLines()
+        lines.add_line('%s[%s]' % (self.__class__.__name__,
+                                   self._dtype.__name__))
+        lines.add_separator()
+        lines.add_line('Stats:')
+        lines.add_line('    pattern count: %d' % len(self))
+        lines.add_line('    automaton states: %d' % self.num_states)
+        if len(self):
+            lines.add_line('    min length: %d' % self._lengths.min())
+            lines.add_line('    max length: %d' % self._lengths.max())
+        return lines.to_str()
+
+    @experimental(as_of='0.5.2')
+    def __str__(self):
+        return repr(self)
+
+
+def _options(char, degenerate_map):
+    """Return the characters a pattern character matches, in sorted order."""
+    if char in degenerate_map:
+        return sorted(degenerate_map[char])
+    return [char]
@@ -20,6 +20,8 @@ from skbio.metadata._mixin import (MetadataMixin, PositionalMetadataMixin,
                                    IntervalMetadataMixin)
 from skbio.metadata import IntervalMetadata
 from skbio.sequence._repr import _SequenceReprBuilder
+from skbio.sequence._kmer import _kmer_frequencies, _kmer_windows
+from skbio.sequence._window import _window_index, _window_sums
 from skbio.util._decorator import (stable, experimental, classonlymethod,
                                    overrides)
 
@@ -561,20 +563,143 @@ fuzzy=[(True, False)], metadata={'gene': 'foo'})
                 raise ValueError("The positional metadata of the sequences do"
                                  " not have matching columns. Consider setting"
                                  " how='inner' or how='outer'")
-        seq_data = []
-        pm_data = []
-        for seq in seqs:
-            seq_data.append(seq._bytes)
-            pm_data.append(seq.positional_metadata)
-            if not seq.has_positional_metadata():
-                del seq.positional_metadata
+        offsets = np.zeros(len(seqs) + 1, dtype=np.int64)
+        np.cumsum([len(seq) for seq in seqs], out=offsets[1:])
+        bytes_ = np.empty(offsets[-1], dtype=np.uint8)
+        for seq, start, stop in zip(seqs, offsets[:-1], offsets[1:]):
+            bytes_[start:stop] = seq._bytes
+
+        pm = _concat_positional_metadata(seqs, offsets, how)
+
+        result = cls(bytes_, positional_metadata=pm)
+        if any(seq.has_interval_metadata() for seq in seqs):
+            # Only the sequences that have interval metadata are shifted, so
+            # no empty interval metadata is created on the others. Not using
+            # the setter to avoid copying the concatenated interval metadata
+            # again.
+            result._interval_metadata = IntervalMetadata._concat_shifted(
+                len(result),
+                ((seq._interval_metadata, offset) for seq, offset
+                 in zip(seqs, offsets[:-1].tolist())
+                 if seq._interval_metadata is not None))
+        return result
+
+    @classonlymethod
+    @experimental(as_of='0.5.2')
+    def from_buffer(cls, buffer, offset=0, length=None, **kwargs):
+        """Create a sequence that shares memory with a buffer.
+
+        The sequence's data is a read-only view of `buffer`, so no characters
+        are copied. This makes it possible to work with sequences that are
+        larger than the available memory, such as a genome stored in a
+        memory-mapped file.
+
+        Parameters
+        ----------
+        buffer : 1D np.ndarray (np.uint8 or '\|S1') or buffer
+            Characters of the sequence. Any object exposing the buffer
+            interface is supported (e.g., ``bytes``, ``bytearray``,
+            ``mmap.mmap``, or a ``np.memmap``).
+        offset : int, optional
+            Position in `buffer` where the sequence starts.
+        length : int, optional
+            Number of characters in the sequence. Defaults to all characters
+            in `buffer` after `offset`.
+        kwargs : dict, optional
+            Keyword arguments passed to the constructor (e.g., `metadata` or,
+            for ``GrammaredSequence`` objects, `validate`).
+
+        Returns
+        -------
+        Sequence
+            Sequence of the calling class sharing memory with `buffer`.
+
+        Raises
+        ------
+        TypeError
+            If `buffer` is a ``str``, or an array that is not of dtype
+            ``np.uint8`` or ``'|S1'``.
+        ValueError
+            If `buffer` is an array that is not 1D and C-contiguous, or if
+            `offset` and `length` do not describe a region of `buffer`.
+
+        See Also
+        --------
+        values
+
+        Notes
+        -----
+        `buffer` must not be modified while the sequence is in use, since
+        changes to it are visible through the sequence. The buffer itself is
+        not made read-only.
+
+        The sequence is validated (if applicable) in fixed-size chunks, so
+        validation does not allocate memory proportional to the sequence's
+        length. Slicing the sequence with a ``slice`` of step 1 also returns
+        a sequence sharing memory with `buffer`. Operations that modify
+        characters (e.g., converting lowercase characters with `lowercase`)
+        make a copy.
+
+        Examples
+        --------
+        >>> from skbio import DNA
+        >>> buffer = bytearray(b'>chr1\\nACGTACGGA')
+        >>> seq = DNA.from_buffer(buffer, offset=6)
+        >>> str(seq)
+        'ACGTACGGA'
+        >>> str(seq[2:5])
+        'GTA'
+
+        Open a genome stored in a file without reading it into memory:
+
+        >>> import numpy as np
+        >>> from tempfile import NamedTemporaryFile
+        >>> with NamedTemporaryFile() as f:
+        ...     _ = f.write(b'ACGTNNNNACGT')
+        ...     f.flush()
+        ...     seq = DNA.from_buffer(np.memmap(f.name, mode='r'))
+        ...     seq.gc_content()
+        0.33333333333333331
 
-        pm = pd.concat(pm_data, join=how, ignore_index=True)
-        bytes_ = np.concatenate(seq_data)
+        """
+        if offset < 0:
+            raise ValueError("`offset` must be greater than or equal to 0, "
+                             "not %r." % offset)
+        if length is not None and length < 0:
+            raise ValueError("`length` must be greater than or equal to 0, "
+                             "not %r." % length)
+
+        if isinstance(buffer, np.ndarray):
+            if buffer.dtype not in (np.uint8, np.dtype('|S1')):
+                raise TypeError(
+                    "Can only create sequence from numpy.ndarray of dtype "
+                    "np.uint8 or '|S1'. Invalid dtype: %s" % buffer.dtype)
+            if buffer.ndim != 1 or not buffer.flags['C_CONTIGUOUS']:
+                raise ValueError(
+                    "`buffer` must be a 1D C-contiguous array to be shared "
+                    "without copying.")
+            # Drop ndarray subclasses (e.g., np.memmap) so that operations on
+            # the sequence return plain arrays.
+            data = buffer.view(np.uint8).view(np.ndarray)
+        elif isinstance(buffer, str):
+            raise TypeError("`buffer` must expose the buffer interface, not "
+                            "str. Use `bytes` instead.")
+        else:
+            data = np.frombuffer(buffer, dtype=np.uint8)
 
-        im = IntervalMetadata.concat(i.interval_metadata for i in seqs)
+        if offset > len(data):
+            raise ValueError("`offset` (%d) is past the end of `buffer` (%d)."
+                             % (offset, len(data)))
+        stop = len(data) if length is None else offset + length
+        if stop > len(data):
+            raise ValueError(
+                "`offset` + `length` (%d) is past the end of `buffer` (%d)."
+                % (stop, len(data)))
 
-        return cls(bytes_, positional_metadata=pm, interval_metadata=im)
+        # A view is made so that the caller's array is not made read-only.
+        data = data[offset:stop].view()
+        data.flags.writeable = False
+        return cls(data, **kwargs)
 
     @classmethod
     def _assert_can_cast_to(cls, target):
@@ -617,7 +742,8 @@ fuzzy=[(True, False)], metadata={'gene': 'foo'})
                 metadata = sequence.metadata
             if (positional_metadata is None and
                     sequence.has_positional_metadata()):
-                positional_metadata = sequence.positional_metadata
+                # Pass a column store as is, without creating its DataFrame.
+                positional_metadata = sequence._positional_metadata
             if (interval_metadata is None and
                     sequence.has_interval_metadata()):
                 interval_metadata = sequence.interval_metadata
@@ -628,7 +754,14 @@ fuzzy=[(True, False)], metadata={'gene': 'foo'})
             # Encode as ascii to raise UnicodeEncodeError if necessary.
             if isinstance(sequence, str):
                 sequence = sequence.encode("ascii")
-            s = np.fromstring(sequence, dtype=np.uint8)
+            if type(sequence) is bytes:
+                # bytes are immutable, so their memory can be shared instead
+                # of copied.
+                s = np.frombuffer(sequence, dtype=np.uint8)
+                self._owns_bytes = False
+            else:
+                s = np.fromstring(sequence, dtype=np.uint8)
+                self._owns_bytes = True
 
             # There are two possibilities (to our knowledge) at this point:
             # Either the sequence we were given was something string-like,
@@ -639,8 +772,6 @@ fuzzy=[(True, False)], metadata={'gene': 'foo'})
                                 type(sequence).__name__)
 
             sequence = s
-            self._owns_bytes = True
-
             self._set_bytes(sequence)
 
         MetadataMixin._init_(self, metadata=metadata)
@@ -674,6 +805,10 @@ fuzzy=[(True, False)], metadata={'gene': 'foo'})
             self._owns_bytes = True
         else:
             self._owns_bytes = False
+        if type(sequence) is not np.ndarray:
+            # Store subclasses (e.g., np.memmap) as plain arrays sharing the
+            # same memory.
+            sequence = sequence.view(np.ndarray)
         self._set_bytes(sequence)
 
     def _set_bytes(self, sequence):
@@ -919,7 +1054,13 @@ fuzzy=[(True, False)], metadata={'gene': 'foo'})
                     index = _as_slice_if_single_index(indexable)
 
                     positional_metadata = None
-                    if self.has_positional_metadata():
+                    if isinstance(self._positional_metadata, dict):
+                        positional_metadata = {
+                            name: np.concatenate(list(
+                                _slices_from_iter(column, index)))
+                            for name, column
+                            in self._positional_metadata.items()}
+                    elif self.has_positional_metadata():
                         pos_md_slices = list(_slices_from_iter(
                                              self.positional_metadata, index))
                         positional_metadata = pd.concat(pos_md_slices)
@@ -967,6 +1108,9 @@ fuzzy=[(True, False)], metadata={'gene': 'foo'})
                 index = _single_index_to_slice(indexable)
             else:
                 index = indexable
+            if isinstance(self._positional_metadata, dict):
+                return {name: column[index] for name, column
+                        in self._positional_metadata.items()}
             return self.positional_metadata.iloc[index]
         else:
             return None
@@ -1860,6 +2004,145 @@ fuzzy=[(True, False)], metadata={'gene': 'foo'})
             indices.append(index)
         return chars, indices
 
+    @experimental(as_of='0.5.2')
+    def window_frequencies(self, window, step=1, chars=None, relative=False):
+        """Compute frequencies of characters in sliding windows.
+
+        Parameters
+        ----------
+        window : int
+            Length of each window.
+        step : int, optional
+            Distance between the starts of consecutive windows.
+        chars : str or set of str, optional
+            Characters to compute the frequencies of. May be a ``str``
+            containing a single character or a ``set`` of single-character
+            strings. If ``None``, frequencies will be computed for all
+            characters present in the sequence.
+        relative : bool, optional
+            If ``True``, return the relative frequency of each character in
+            each window (i.e., its count divided by `window`) instead of its
+            count.
+
+        Returns
+        -------
+        pd.DataFrame
+            Frequencies of characters in each window, one row per window and
+            one column per character (in sorted order). The index is the
+            position where each window starts.
+
+        Raises
+        ------
+        ValueError
+            If `window` or `step` is less than 1.
+        TypeError
+            If `chars` is not a ``str`` or ``set`` of ``str``.
+        ValueError
+            If `chars` is not a single-character ``str`` or a ``set`` of
+            single-character strings.
+
+        See Also
+        --------
+        frequencies
+        window_entropy
+
+        Notes
+        -----
+        Only complete windows are included, so positions after the last
+        complete window are not counted. Frequencies are computed from the
+        cumulative counts of each character, so the running time is linear in
+        the length of the sequence regardless of the window size.
+
+        Examples
+        --------
+        >>> from skbio import Sequence
+        >>> seq = Sequence('AAGAGGCC')
+        >>> seq.window_frequencies(4, step=2) # doctest: +NORMALIZE_WHITESPACE
+               A  C  G
+        start
+        0      3  0  1
+        2      1  0  3
+        4      0  2  2
+
+        Compute the relative frequency of C in non-overlapping windows:
+
+        >>> seq.window_frequencies(4, step=4, chars='C', relative=True)
+        ... # doctest: +NORMALIZE_WHITESPACE
+                 C
+        start
+        0      0.0
+        4      0.5
+
+        """
+        index = _window_index(len(self), window, step)
+        if chars is None:
+            codes, = np.nonzero(np.bincount(
+                self._bytes, minlength=self._number_of_extended_ascii_codes))
+            codes = codes.tolist()
+        else:
+            codes = sorted(self._chars_to_indices(chars)[1])
+
+        freqs = np.empty((len(index), len(codes)), dtype=np.int64)
+        for i, code in enumerate(codes):
+            freqs[:, i] = _window_sums(self._bytes == code, window, step)
+        if relative:
+            freqs = freqs / window
+        return pd.DataFrame(freqs, index=index,
+                            columns=[chr(code) for code in codes])
+
+    @experimental(as_of='0.5.2')
+    def window_entropy(self, window, step=1, base=2):
+        """Compute the Shannon entropy of characters in sliding windows.
+
+        Parameters
+        ----------
+        window : int
+            Length of each window.
+        step : int, optional
+            Distance between the starts of consecutive windows.
+        base : int, optional
+            Logarithm base to use in the calculation.
+
+        Returns
+        -------
+        pd.Series
+            Shannon entropy of the character frequencies in each window. The
+            index is the position where each window starts.
+
+        Raises
+        ------
+        ValueError
+            If `window` or `step` is less than 1.
+
+        See Also
+        --------
+        window_frequencies
+        skbio.diversity.alpha.shannon
+
+        Notes
+        -----
+        Low-complexity regions (e.g., homopolymers and short tandem repeats)
+        have low entropy. See ``window_frequencies`` for how windows are
+        defined.
+
+        Examples
+        --------
+        >>> from skbio import Sequence
+        >>> seq = Sequence('AAAAACGT')
+        >>> seq.window_entropy(4, step=4)
+        start
+        0    0.0
+        4    2.0
+        dtype: float64
+
+        """
+        freqs = self.window_frequencies(window, step, relative=True)
+        probs = freqs.values
+        with np.errstate(divide='ignore', invalid='ignore'):
+            terms = probs * np.log(probs)
+        entropy = -np.nansum(terms, axis=1) / np.log(base)
+        return pd.Series(entropy + 0.0, index=freqs.index)
+
     @stable(as_of="0.4.0")
     def iter_kmers(self, k, overlap=True):
         """Generate kmers of length `k` from this sequence.
@@ -1904,12 +2187,7 @@ fuzzy=[(True, False)], metadata={'gene': 'foo'})
         if k < 1:
             raise ValueError("k must be greater than 0.")
 
-        if overlap:
-            step = 1
-            count = len(self) - k + 1
-        else:
-            step = k
-            count = len(self) // k
+        step = 1 if overlap else k
 
         if len(self) == 0 or self.has_positional_metadata():
             # Slower path when sequence is empty or positional metadata needs
@@ -1918,8 +2196,7 @@ fuzzy=[(True, False)], metadata={'gene': 'foo'})
                 yield self[i:i+k]
         else:
             # Optimized path when positional metadata doesn't need slicing.
-            kmers = np.lib.stride_tricks.as_strided(
-                self._bytes, shape=(k, count), strides=(1, step)).T
+            kmers = _kmer_windows(self._bytes, k, step)
 
             metadata = None
             if self.has_metadata():
@@ -1931,8 +2208,70 @@ fuzzy=[(True, False)], metadata={'gene': 'foo'})
                     metadata=metadata,
                     positional_metadata=None)
 
+    @experimental(as_of='0.5.2')
+    def kmer_windows(self, k, overlap=True):
+        """Return the kmers of length `k` as rows of a read-only array.
+
+        Unlike ``iter_kmers``, no ``Sequence`` object is created for each
+        kmer, so the kmers of long sequences can be processed with NumPy
+        (e.g., to select minimizers or apply spaced seeds).
+
+        Parameters
+        ----------
+        k : int
+            The kmer length.
+        overlap : bool, optional
+            Defines whether the kmers should be overlapping or not.
+
+        Returns
+        -------
+        windows : 2D np.ndarray (np.uint8)
+            Characters of each kmer, one kmer per row, in the order the kmers
+            occur in this sequence. The array is a read-only view of this
+            sequence's data, so no characters are copied.
+        starts : 1D np.ndarray (int)
+            Position in this sequence where each kmer starts.
+
+        Raises
+        ------
+        ValueError
+            If `k` is less than 1.
+
+        See Also
+        --------
+        iter_kmers
+        kmer_frequencies
+        GrammaredSequence.kmer_codes
+
+        Notes
+        -----
+        Rows of `windows` overlap in memory when `overlap` is ``True``. Use
+        ``windows.copy()`` to obtain a writeable array.
+
+        Examples
+        --------
+        >>> from skbio import Sequence
+        >>> s = Sequence('ACACGACGTT')
+        >>> windows, starts = s.kmer_windows(4, overlap=False)
+        >>> windows.view('|S1')
+        array([[b'A', b'C', b'A', b'C'],
+               [b'G', b'A', b'C', b'G']],
+              dtype='|S1')
+        >>> starts
+        array([0, 4])
+
+        """
+        if k < 1:
+            raise ValueError("k must be greater than 0.")
+
+        step = 1 if overlap else k
+        windows = _kmer_windows(self._bytes, k, step)
+        starts = np.arange(0, windows.shape[0] * step, step)
+        return windows, starts
+
     @stable(as_of="0.4.0")
-    def kmer_frequencies(self, k, overlap=True, relative=False):
+    def kmer_frequencies(self, k, overlap=True, relative=False,
+                         canonical=False):
         """Return counts of words of length `k` from this sequence.
 
         Parameters
@@ -1944,6 +2283,10 @@ fuzzy=[(True, False)], metadata={'gene': 'foo'})
         relative : bool, optional
             If ``True``, return the relative frequency of each kmer instead of
             its count.
+        canonical : bool, optional
+            If ``True``, count each kmer together with its reverse complement
+            under whichever of the two sorts first. Only supported by
+            nucleotide sequences.
 
         Returns
         -------
@@ -1954,6 +2297,20 @@ fuzzy=[(True, False)], metadata={'gene': 'foo'})
         ------
         ValueError
             If `k` is less than 1.
+        TypeError
+            If `canonical` is ``True`` and this sequence does not have a
+            complement.
+
+        See Also
+        --------
+        iter_kmers
+
+        Notes
+        -----
+        Kmers are counted without creating a ``Sequence`` object per kmer:
+        each kmer is encoded as an integer and the integers are tallied with
+        NumPy. This is much faster than counting the kmers generated by
+        ``iter_kmers``, particularly for long sequences.
 
         Examples
         --------
@@ -1967,22 +2324,38 @@ fuzzy=[(True, False)], metadata={'gene': 'foo'})
         >>> pprint(freqs)
         {'ACA': 0.25, 'CAT': 0.25, 'TTA': 0.5}
 
+        Count canonical kmers of a DNA sequence, combining each kmer with its
+        reverse complement:
+
+        >>> from skbio import DNA
+        >>> s = DNA('AACGTT')
+        >>> pprint(s.kmer_frequencies(2, canonical=True))
+        {'AA': 2, 'AC': 2, 'CG': 1}
+
         """
-        kmers = self.iter_kmers(k, overlap=overlap)
-        freqs = dict(collections.Counter((str(seq) for seq in kmers)))
+        if k < 1:
+            raise ValueError("k must be greater than 0.")
+
+        complement_lookup = None
+        if canonical:
+            complement_lookup = getattr(self, '_complement_lookup', None)
+            if complement_lookup is None:
+                raise TypeError(
+                    "Canonical kmers are only defined for sequences with a "
+                    "complement, not %r." % type(self).__name__)
+
+        step = 1 if overlap else k
+        kmers, counts = _kmer_frequencies(self._bytes, k, step,
+                                          complement_lookup)
 
         if relative:
             if overlap:
                 num_kmers = len(self) - k + 1
             else:
                 num_kmers = len(self) // k
+            counts = counts / num_kmers
 
-            relative_freqs = {}
-            for kmer, count in freqs.items():
-                relative_freqs[kmer] = count / num_kmers
-            freqs = relative_freqs
-
-        return freqs
+        return dict(zip(kmers, counts.tolist()))
 
     @stable(as_of="0.4.0")
     def find_with_regex(self, regex, ignore=None):
@@ -2102,6 +2475,210 @@ fuzzy=[(True, False)], metadata={'gene': 'foo'})
             if len(r) >= min_length:
                 yield r
 
+    @experimental(as_of='0.5.2')
+    def extract_regions(self, starts, stops, strands=None, as_batch=False):
+        """Extract many regions of this sequence at once.
+
+        Parameters
+        ----------
+        starts : 1D array_like (int)
+            Start position (inclusive) of each region.
+        stops : 1D array_like (int)
+            Stop position (exclusive) of each region.
+        strands : 1D array_like (str), optional
+            Strand of each region, either ``'+'`` or ``'-'``. Regions on the
+            ``'-'`` strand are reverse complemented. If not provided, all
+            regions are on the ``'+'`` strand.
+        as_batch : bool, optional
+            If ``True``, return a ``SequenceBatch`` instead of a list.
+
+        Returns
+        -------
+        list of Sequence or SequenceBatch
+            Sequence of each region, of the same type as this sequence and in
+            the order of `starts`.
+
+        Raises
+        ------
+        ValueError
+            If `starts`, `stops`, and `strands` do not have the same length,
+            if a region is not within this sequence, or if a strand is not
+            ``'+'`` or ``'-'``.
+        TypeError
+            If `starts` or `stops` are not integers, or if a region is on the
+            ``'-'`` strand and this sequence does not have a complement.
+
+        See Also
+        --------
+        extract_intervals
+        GeneticCode.find_orfs
+
+        Notes
+        -----
+        The characters of all regions are copied (and complemented) into one
+        buffer, and each returned sequence is a view of that buffer. No
+        intermediate ``Sequence`` objects are created and positional metadata
+        is not sliced, so this is much faster than slicing the sequence once
+        per region. Metadata, positional metadata, and interval metadata are
+        not extracted.
+
+        Examples
+        --------
+        >>> from skbio import DNA
+        >>> genome = DNA('ATGAAATAGCCCTTACATTTCAT')
+        >>> genes = genome.extract_regions([0, 14], [9, 23], ['+', '-'])
+        >>> [str(gene) for gene in genes]
+        ['ATGAAATAG', 'ATGAAATGT']
+
+        Extract the open reading frames found in a sequence into a
+        ``SequenceBatch``:
+
+        >>> from skbio import GeneticCode
+        >>> orfs = GeneticCode.from_ncbi().find_orfs(genome, min_length=3)
+        >>> batch = genome.extract_regions(orfs.start, orfs.stop, orfs.strand,
+        ...                                as_batch=True)
+        >>> [str(orf) for orf in batch]
+        ['ATGAAATAG', 'ATGTAA']
+
+        """
+        coordinates = []
+        for name, values in ('starts', starts), ('stops', stops):
+            values = np.asarray(values)
+            # Casting would truncate float positions.
+            if values.size and values.dtype.kind not in 'iu':
+                raise TypeError("`%s` must contain integers, not %s."
+                                % (name, values.dtype))
+            coordinates.append(values.astype(np.int64))
+        starts, stops = coordinates
+        if strands is None:
+            reverse = np.zeros(starts.shape, dtype=bool)
+        else:
+            strands = np.asarray(strands, dtype=object)
+            reverse = strands == '-'
+            if not (reverse | (strands == '+')).all():
+                raise ValueError("Strands must be '+' or '-'.")
+        if not (starts.shape == stops.shape == reverse.shape and
+                starts.ndim == 1):
+            raise ValueError(
+                "`starts`, `stops`, and `strands` must be 1D and have the "
+                "same length.")
+
+        data = self._extract_pieces(starts, stops, reverse)
+        offsets = np.zeros(len(starts) + 1, dtype=np.int64)
+        np.cumsum(stops - starts, out=offsets[1:])
+        return self._extracted_sequences(data, offsets, as_batch)
+
+    @experimental(as_of='0.5.2')
+    def extract_intervals(self, intervals, as_batch=False):
+        """Extract the regions of many intervals of this sequence at once.
+
+        Parameters
+        ----------
+        intervals : iterable of Interval
+            Intervals to extract (e.g., the result of
+            ``seq.interval_metadata.query``). The bounds of an interval with
+            several bounds (e.g., the exons of a gene) are joined. Intervals
+            with ``'-'`` as their ``'strand'`` metadata are reverse
+            complemented; all others are extracted as is.
+        as_batch : bool, optional
+            If ``True``, return a ``SequenceBatch`` instead of a list.
+
+        Returns
+        -------
+        list of Sequence or SequenceBatch
+            Sequence of each interval, of the same type as this sequence and
+            in the order of `intervals`.
+
+        Raises
+        ------
+        ValueError
+            If the bounds of an interval are not within this sequence.
+        TypeError
+            If an interval is on the ``'-'`` strand and this sequence does not
+            have a complement.
+
+        See Also
+        --------
+        extract_regions
+        skbio.metadata.IntervalMetadata.query
+
+        Notes
+        -----
+        Fuzzy bounds are treated as exact. Metadata, positional metadata, and
+        interval metadata are not extracted.
+
+        Examples
+        --------
+        >>> from skbio import DNA
+        >>> genome = DNA('ATGCCTAAGTTAGGCCATTTT')
+        >>> genome.interval_metadata.add(
+        ...     [(0, 5), (8, 12)], metadata={'type': 'CDS', 'strand': '+'})
+        ... # doctest: +ELLIPSIS
+        Interval(...)
+        >>> genome.interval_metadata.add(
+        ...     [(12, 21)], metadata={'type': 'CDS', 'strand': '-'})
+        ... # doctest: +ELLIPSIS
+        Interval(...)
+        >>> cds = genome.interval_metadata.query(metadata={'type': 'CDS'})
+        >>> [str(seq) for seq in genome.extract_intervals(cds)]
+        ['ATGCCGTTA', 'AAAATGGCC']
+
+        """
+        starts, stops, reverse, lengths = [], [], [], []
+        for interval in intervals:
+            bounds = interval.bounds
+            is_reverse = interval.metadata.get('strand') == '-'
+            if is_reverse:
+                # Reverse complementing the joined bounds is the same as
+                # joining the reverse complemented bounds in reverse order.
+                bounds = bounds[::-1]
+            length = 0
+            for start, stop in bounds:
+                starts.append(start)
+                stops.append(stop)
+                reverse.append(is_reverse)
+                length += stop - start
+            lengths.append(length)
+
+        data = self._extract_pieces(np.asarray(starts, dtype=np.int64),
+                                    np.asarray(stops, dtype=np.int64),
+                                    np.asarray(reverse, dtype=bool))
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        return self._extracted_sequences(data, offsets, as_batch)
+
+    def _extract_pieces(self, starts, stops, reverse):
+        """Concatenate the (reverse complemented) characters of each piece."""
+        if ((starts < 0) | (stops < starts) | (stops > len(self))).any():
+            raise ValueError(
+                "Regions must have 0 <= start <= stop <= %d (the length of "
+                "the sequence)." % len(self))
+        if reverse.any():
+            complement = getattr(self, '_complement_lookup', None)
+            if complement is None:
+                raise TypeError(
+                    "Regions on the '-' strand can only be extracted from "
+                    "sequences with a complement, not %r."
+                    % type(self).__name__)
+
+        # Gather views of every piece and copy them all with a single call.
+        bytes_ = self._bytes
+        pieces = [complement[bytes_[start:stop][::-1]] if is_reverse
+                  else bytes_[start:stop]
+                  for start, stop, is_reverse in zip(
+                      starts.tolist(), stops.tolist(), reverse.tolist())]
+        return np.concatenate(pieces + [np.empty(0, dtype=np.uint8)])
+
+    def _extracted_sequences(self, data, offsets, as_batch):
+        if as_batch:
+            from skbio.sequence._batch import SequenceBatch
+            return SequenceBatch(data, offsets, dtype=type(self),
+                                 validate=False)
+        data.flags.writeable = False
+        bounds = offsets.tolist()
+        return [self._constructor(sequence=data[start:stop])
+                for start, stop in zip(bounds[:-1], bounds[1:])]
+
     def _constructor(self, **kwargs):
         return self.__class__(**kwargs)
 
@@ -2202,6 +2779,55 @@ fuzzy=[(True, False)], metadata={'gene': 'foo'})
         self._bytes.flags.writeable = False
 
 
+def _concat_positional_metadata(seqs, offsets, how):
+    """Concatenate the positional metadata of sequences column by column.
+
+    The columns and their dtypes are determined by concatenating one
+    representative row per distinct set of columns and dtypes, so the result
+    matches concatenating all positional metadata with ``pd.concat`` without
+    aligning a ``pd.DataFrame`` per sequence.
+
+    """
+    arrays = []
+    samples = {}
+    for seq in seqs:
+        if seq.has_positional_metadata():
+            pm = seq.positional_metadata
+            columns = [(column, pm[column].values)
+                       for column in pm.columns.values]
+            key = tuple((column, values.dtype) for column, values in columns)
+            arrays.append(dict(columns))
+        else:
+            pm = None
+            key = ()
+            arrays.append({})
+        if key not in samples or (len(seq) and not samples[key][0]):
+            samples[key] = (len(seq), pm)
+    if list(samples) == [()]:
+        return None
+
+    frames = [pd.DataFrame(index=pd.RangeIndex(min(length, 1)))
+              if pm is None else pm.iloc[:1]
+              for length, pm in samples.values()]
+    template = pd.concat(frames, join=how, ignore_index=True)
+    if len(template.columns) == 0:
+        return None
+    if not all(isinstance(dtype, np.dtype) for dtype in template.dtypes):
+        # Columns with pandas-specific dtypes (e.g., categorical) cannot be
+        # filled as NumPy arrays.
+        return pd.concat([seq.positional_metadata for seq in seqs],
+                         join=how, ignore_index=True)
+
+    columns = {}
+    for column, dtype in zip(template.columns, template.dtypes):
+        values = np.empty(offsets[-1], dtype=dtype)
+        for seq_arrays, start, stop in zip(arrays, offsets[:-1],
+                                           offsets[1:]):
+            values[start:stop] = seq_arrays.get(column, np.nan)
+        columns[column] = values
+    return pd.DataFrame(columns, columns=template.columns)
+
+
 def _single_index_to_slice(start_index):
     end_index = None if start_index == -1 else start_index+1
     return slice(start_index, end_index)
@@ -0,0 +1,41 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+import numpy as np
+import pandas as pd
+
+
+def _window_count(length, window, step):
+    """Return the number of complete windows in a sequence of `length`."""
+    if window < 1:
+        raise ValueError("`window` must be greater than 0, not %r." % window)
+    if step < 1:
+        raise ValueError("`step` must be greater than 0, not %r." % step)
+    if length < window:
+        return 0
+    return (length - window) // step + 1
+
+
+def _window_index(length, window, step):
+    """Return the start position of each complete window."""
+    count = _window_count(length, window, step)
+    return pd.RangeIndex(0, count * step, step, name='start')
+
+
+def _window_sums(mask, window, step):
+    """Sum `mask` over each complete window.
+
+    Each sum is the difference of two cumulative sums, so the cost does not
+    depend on the window size.
+
+    """
+    count = _window_count(mask.size, window, step)
+    cumulative = np.zeros(mask.size + 1, dtype=np.int64)
+    np.cumsum(mask, dtype=np.int64, out=cumulative[1:])
+    stop = count * step
+    return cumulative[window:window + stop:step] - cumulative[:stop:step]
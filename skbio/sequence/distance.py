@@ -18,6 +18,7 @@ Functions
 
    hamming
    kmer_distance
+   sketch_distances
 
 """
 
@@ -163,6 +164,88 @@ def kmer_distance(seq1, seq2, k, overlap=True):
     return fraction_unique
 
 
+@experimental(as_of='0.5.2')
+def sketch_distances(sketches, metric='mash'):
+    """Compute distances between all pairs of MinHash sketches.
+
+    Parameters
+    ----------
+    sketches : iterable of MinHashSketch
+        Sketches to compare. All sketches must have been created with the same
+        `k`, `seed`, and `canonical` parameters.
+    metric : {'mash', 'jaccard'}, optional
+        Distance to compute: the Mash distance, or the Jaccard distance (one
+        minus the estimated Jaccard index).
+
+    Returns
+    -------
+    skbio.DistanceMatrix
+        Distances between the sketches. IDs are the sketch IDs, or the
+        sketches' positions in `sketches` if any sketch does not have an ID.
+
+    Raises
+    ------
+    TypeError
+        If `sketches` contains an object that is not a ``MinHashSketch``.
+    ValueError
+        If `sketches` is empty, if the sketches were created with different
+        parameters, or if `metric` is invalid.
+
+    See Also
+    --------
+    skbio.sequence.MinHashSketch
+    kmer_distance
+
+    Notes
+    -----
+    Hash values shared by each pair of sketches are counted for all pairs at
+    once, so this is much faster than comparing each pair of sketches with
+    ``MinHashSketch.mash_distance``, while giving the same results.
+
+    Examples
+    --------
+    >>> from skbio import DNA
+    >>> from skbio.sequence import MinHashSketch
+    >>> seqs = [DNA('ACGTTGCATGCAAGTCCTAGGACTT', metadata={'id': 's1'}),
+    ...         DNA('ACGTTGCATGCAAGTCCTAGCACTT', metadata={'id': 's2'}),
+    ...         DNA('TTTTGGGGCCCCAAAATTTTGGGGC', metadata={'id': 's3'})]
+    >>> sketches = [MinHashSketch.from_sequence(seq, k=5) for seq in seqs]
+    >>> dm = sketch_distances(sketches)
+    >>> dm.ids
+    ('s1', 's2', 's3')
+    >>> print(round(dm['s1', 's2'], 3), round(dm['s1', 's3'], 3))
+    0.035 1.0
+
+    """
+    from skbio.sequence._minhash import (MinHashSketch, _pairwise_jaccard,
+                                         _mash_distance)
+    from skbio.stats.distance import DistanceMatrix
+
+    if metric not in {'mash', 'jaccard'}:
+        raise ValueError("`metric` must be 'mash' or 'jaccard', not %r."
+                         % (metric,))
+    sketches = list(sketches)
+    if not sketches:
+        raise ValueError("`sketches` must contain at least one sketch.")
+    for sketch in sketches:
+        if not isinstance(sketch, MinHashSketch):
+            raise TypeError("`sketches` must only contain MinHashSketch "
+                            "objects, not %r." % type(sketch).__name__)
+        sketches[0]._assert_compatible(sketch)
+
+    jaccard = _pairwise_jaccard(sketches)
+    if metric == 'mash':
+        distances = _mash_distance(jaccard, sketches[0].k)
+    else:
+        distances = 1 - jaccard
+    np.fill_diagonal(distances, 0.0)
+
+    ids = [sketch.id for sketch in sketches]
+    if any(id_ is None for id_ in ids):
+        ids = None
+    return DistanceMatrix(distances, ids=ids)
+
+
 def _check_seqs(seq1, seq2):
     # Asserts both sequences are skbio.sequence objects
     for seq in seq1, seq2:
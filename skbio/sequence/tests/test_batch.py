@@ -0,0 +1,389 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+from unittest import TestCase, main
+
+import numpy as np
+import numpy.testing as npt
+import pandas as pd
+
+from skbio import Sequence, DNA, RNA, Protein
+from skbio.sequence import SequenceBatch
+from skbio.util import assert_data_frame_almost_equal
+
+
+class TestSequenceBatch(TestCase):
+    def setUp(self):
+        self.seqs = [
+            DNA('ACGT', metadata={'id': 'r1', 'description': 'd1'},
+                positional_metadata={'quality': np.array([1, 2, 3, 4],
+                                                         dtype=np.uint8)}),
+            DNA('GGC-C', metadata={'id': 'r2', 'description': ''},
+                positional_metadata={'quality': np.array([5, 6, 7, 8, 9],
+                                                         dtype=np.uint8)}),
+            DNA('', metadata={'id': 'r3', 'description': 'd3'},
+                positional_metadata={'quality': np.array([],
+                                                         dtype=np.uint8)}),
+            DNA('N.A', metadata={'id': 'r4', 'description': 'd4'},
+                positional_metadata={'quality': np.array([10, 11, 12],
+                                                         dtype=np.uint8)})]
+        self.batch = SequenceBatch.from_sequences(self.seqs)
+
+    def test_init(self):
+        batch = SequenceBatch(np.array([65, 67, 71], dtype=np.uint8),
+                              [0, 1, 3], ids=['a', 'b'])
+        self.assertIs(batch.dtype, Sequence)
+        npt.assert_equal(batch.data, np.array([65, 67, 71], dtype=np.uint8))
+        npt.assert_equal(batch.offsets, np.array([0, 1, 3]))
+        npt.assert_equal(batch.ids, np.array(['a', 'b'], dtype=object))
+        self.assertIsNone(batch.descriptions)
+        self.assertIsNone(batch.quality)
+        npt.assert_equal(batch.lengths, np.array([1, 2]))
+        self.assertEqual(len(batch), 2)
+
+    def test_init_from_str(self):
+        batch = SequenceBatch('acgGG', [0, 3, 5], dtype=DNA, lowercase=True)
+        self.assertEqual(list(batch), [DNA('ACG'), DNA('GG')])
+
+    def test_init_empty(self):
+        batch = SequenceBatch('', [0], dtype=RNA)
+        self.assertEqual(len(batch), 0)
+        self.assertEqual(list(batch), [])
+        npt.assert_equal(batch.gc_content(), np.array([]))
+
+    def test_init_invalid_dtype(self):
+        with self.assertRaisesRegex(TypeError, '`dtype`.*Sequence'):
+            SequenceBatch('ACGT', [0, 4], dtype=str)
+
+    def test_init_invalid_data(self):
+        with self.assertRaisesRegex(TypeError, 'np.uint8'):
+            SequenceBatch(np.array([1, 2]), [0, 2])
+
+    def test_init_invalid_offsets(self):
+        for offsets in [], [1, 4], [0, 3], [0, 3, 2, 4], [[0, 4]]:
+            with self.assertRaisesRegex(ValueError, '`offsets`'):
+                SequenceBatch('ACGT', offsets)
+
+    def test_init_invalid_labels(self):
+        with self.assertRaisesRegex(ValueError, 'Number of ids'):
+            SequenceBatch('ACGT', [0, 2, 4], ids=['a'])
+        with self.assertRaisesRegex(ValueError, 'Number of descriptions'):
+            SequenceBatch('ACGT', [0, 2, 4], descriptions=['a', 'b', 'c'])
+        with self.assertRaisesRegex(TypeError, '`ids`'):
+            SequenceBatch('ACGT', [0, 2, 4], ids='ab')
+
+    def test_init_invalid_quality(self):
+        with self.assertRaisesRegex(ValueError, 'quality scores'):
+            SequenceBatch('ACGT', [0, 2, 4], quality=[1, 2, 3])
+
+    def test_init_validates(self):
+        with self.assertRaisesRegex(ValueError, 'Invalid character'):
+            SequenceBatch('ACGX', [0, 2, 4], dtype=DNA)
+        batch = SequenceBatch('ACGX', [0, 2, 4], dtype=DNA, validate=False)
+        self.assertEqual(len(batch), 2)
+
+    def test_properties_read_only(self):
+        for attr in 'data', 'offsets', 'ids', 'descriptions', 'quality':
+            with self.assertRaises(AttributeError):
+                setattr(self.batch, attr, None)
+            with self.assertRaises(ValueError):
+                getattr(self.batch, attr)[0] = 0
+
+    def test_from_sequences(self):
+        batch = self.batch
+        self.assertIs(batch.dtype, DNA)
+        self.assertEqual(batch.data.tostring(), b'ACGTGGC-CN.A')
+        npt.assert_equal(batch.offsets, np.array([0, 4, 9, 9, 12]))
+        npt.assert_equal(batch.ids, np.array(['r1', 'r2', 'r3', 'r4']))
+        npt.assert_equal(batch.descriptions, np.array(['d1', '', 'd3', 'd4']))
+        npt.assert_equal(batch.quality, np.arange(1, 13))
+
+    def test_from_sequences_no_metadata(self):
+        batch = SequenceBatch.from_sequences([Protein('PAW'), Protein('K')])
+        self.assertIs(batch.dtype, Protein)
+        self.assertIsNone(batch.ids)
+        self.assertIsNone(batch.descriptions)
+        self.assertIsNone(batch.quality)
+        self.assertEqual(list(batch), [Protein('PAW'), Protein('K')])
+
+    def test_from_sequences_partial_metadata(self):
+        batch = SequenceBatch.from_sequences(
+            [Sequence('A', metadata={'id': 'x'}), Sequence('C')])
+        npt.assert_equal(batch.ids, np.array(['x', '']))
+        self.assertIsNone(batch.descriptions)
+
+    def test_from_sequences_empty(self):
+        batch = SequenceBatch.from_sequences([], dtype=DNA)
+        self.assertIs(batch.dtype, DNA)
+        self.assertEqual(len(batch), 0)
+
+        self.assertIs(SequenceBatch.from_sequences([]).dtype, Sequence)
+
+    def test_from_sequences_mixed_types(self):
+        with self.assertRaisesRegex(TypeError, "'DNA'.*'RNA'"):
+            SequenceBatch.from_sequences([DNA('A'), RNA('A')])
+
+    def test_iter(self):
+        self.assertEqual(list(self.batch), self.seqs)
+
+    def test_getitem_int(self):
+        for i in range(len(self.seqs)):
+            self.assertEqual(self.batch[i], self.seqs[i])
+        self.assertEqual(self.batch[-1], self.seqs[-1])
+
+        for i in 4, -5:
+            with self.assertRaises(IndexError):
+                self.batch[i]
+
+    def test_getitem_int_is_view(self):
+        seq = self.batch[1]
+        self.assertTrue(np.may_share_memory(seq._bytes, self.batch.data))
+        self.assertEqual(seq.reverse_complement(), DNA('G-GCC', metadata={
+            'id': 'r2', 'description': ''}, positional_metadata={
+            'quality': np.array([9, 8, 7, 6, 5], dtype=np.uint8)}))
+
+    def test_getitem_slice(self):
+        obs = self.batch[1:3]
+        self.assertEqual(obs, SequenceBatch.from_sequences(self.seqs[1:3]))
+        self.assertTrue(np.may_share_memory(obs.data, self.batch.data))
+
+        obs = self.batch[::-2]
+        self.assertEqual(
+            obs, SequenceBatch.from_sequences(self.seqs[::-2]))
+
+        obs = self.batch[3:1]
+        self.assertEqual(len(obs), 0)
+        self.assertEqual(len(obs.data), 0)
+
+    def test_getitem_mask_and_indices(self):
+        obs = self.batch[np.array([True, False, False, True])]
+        self.assertEqual(
+            obs, SequenceBatch.from_sequences([self.seqs[0], self.seqs[3]]))
+
+        obs = self.batch[[3, 0, 0]]
+        self.assertEqual(obs, SequenceBatch.from_sequences(
+            [self.seqs[3], self.seqs[0], self.seqs[0]]))
+
+        with self.assertRaisesRegex(ValueError, 'Boolean index'):
+            self.batch[np.array([True])]
+
+    def test_filter_by_length(self):
+        self.assertEqual(self.batch.filter_by_length(min_length=4),
+                         self.batch[[0, 1]])
+        self.assertEqual(self.batch.filter_by_length(max_length=3),
+                         self.batch[[2, 3]])
+        self.assertEqual(self.batch.filter_by_length(3, 4),
+                         self.batch[[0, 3]])
+        self.assertEqual(self.batch.filter_by_length(), self.batch)
+
+    def random_batch(self, dtype=DNA):
+        rng = np.random.RandomState(0)
+        lengths = rng.randint(0, 12, 200)
+        data = rng.choice(np.frombuffer(b'ACGTN-', dtype=np.uint8),
+                          lengths.sum())
+        quality = rng.randint(0, 41, lengths.sum()).astype(np.uint8)
+        return SequenceBatch(data, np.append(0, np.cumsum(lengths)),
+                             dtype=dtype, quality=quality,
+                             ids=[str(i) for i in range(len(lengths))])
+
+    def assert_trimmed(self, obs, batch, bounds):
+        self.assertEqual(len(obs), len(batch))
+        npt.assert_array_equal(obs.ids, batch.ids)
+        for trimmed, seq, (start, stop) in zip(obs, batch, bounds):
+            self.assertEqual(trimmed, seq[start:stop])
+
+    def test_trim_ends(self):
+        batch = self.random_batch()
+        for leading, trailing in ((None, None), (20, None), (None, 30),
+                                  (15, 25), (41, 41), (0, 0)):
+            bounds = []
+            for seq in batch:
+                quality = seq.positional_metadata['quality'].values
+                start, stop = 0, len(seq)
+                if leading is not None:
+                    while start < stop and quality[start] < leading:
+                        start += 1
+                if trailing is not None:
+                    while stop > start and quality[stop - 1] < trailing:
+                        stop -= 1
+                bounds.append((start, stop))
+            self.assert_trimmed(batch.trim_ends(leading, trailing), batch,
+                                bounds)
+
+    def test_trim_sliding_window(self):
+        batch = self.random_batch()
+        for window, threshold in ((1, 10), (4, 20), (5, 15.5), (20, 20)):
+            bounds = []
+            for seq in batch:
+                quality = seq.positional_metadata['quality'].values
+                stop = len(seq)
+                if 0 < len(seq) < window:
+                    if quality.mean() < threshold:
+                        stop = 0
+                for start in range(len(seq) - window + 1):
+                    if quality[start:start + window].mean() < threshold:
+                        stop = start
+                        break
+                bounds.append((0, stop))
+            self.assert_trimmed(batch.trim_sliding_window(window, threshold),
+                                batch, bounds)
+
+    def test_trim_sliding_window_invalid_window(self):
+        with self.assertRaisesRegex(ValueError, '`window`.*0'):
+            self.batch.trim_sliding_window(0, 20)
+
+    def test_expected_errors(self):
+        batch = self.random_batch()
+        exp = [np.sum(10 ** (-seq.positional_metadata['quality'].values
+                             .astype(float) / 10)) for seq in batch]
+        npt.assert_almost_equal(batch.expected_errors(), exp)
+        npt.assert_almost_equal(self.batch.expected_errors(),
+                                [2.3246, 1.0513, 0, 0.2425], decimal=4)
+
+        obs = batch.filter_by_expected_errors(0.5)
+        npt.assert_array_equal(obs.ids, batch.ids[np.asarray(exp) <= 0.5])
+        self.assertEqual(
+            list(obs), [seq for seq, errors in zip(batch, exp)
+                        if errors <= 0.5])
+
+    def test_filter_by_degenerates(self):
+        batch = self.random_batch()
+        for max_degenerates in 0, 1, 3:
+            obs = batch.filter_by_degenerates(max_degenerates)
+            self.assertEqual(list(obs), [
+                seq for seq in batch
+                if seq.degenerates().sum() <= max_degenerates])
+        self.assertEqual(self.batch.filter_by_degenerates(),
+                         self.batch[[0, 1, 2]])
+
+        with self.assertRaisesRegex(TypeError, 'GrammaredSequence.*Sequence'):
+            SequenceBatch('AC', [0, 2]).filter_by_degenerates()
+
+    def test_quality_control_empty(self):
+        batch = SequenceBatch('', [0], dtype=DNA, quality=[])
+        for obs in (batch.trim_ends(10, 10), batch.trim_sliding_window(4, 20),
+                    batch.filter_by_expected_errors(1),
+                    batch.filter_by_degenerates()):
+            self.assertEqual(obs, batch)
+        npt.assert_array_equal(batch.expected_errors(), [])
+
+    def test_quality_control_requires_quality(self):
+        batch = SequenceBatch('ACGT', [0, 4], dtype=DNA)
+        for method, args in (('trim_ends', (10, 10)),
+                             ('trim_sliding_window', (4, 20)),
+                             ('expected_errors', ()),
+                             ('filter_by_expected_errors', (1,))):
+            with self.assertRaisesRegex(ValueError, 'requires quality'):
+                getattr(batch, method)(*args)
+
+    def test_frequencies(self):
+        obs = self.batch.frequencies()
+        exp = pd.DataFrame(
+            [[0, 0, 1, 1, 1, 0, 1], [1, 0, 0, 2, 2, 0, 0],
+             [0, 0, 0, 0, 0, 0, 0], [0, 1, 1, 0, 0, 1, 0]],
+            index=['r1', 'r2', 'r3', 'r4'],
+            columns=['-', '.', 'A', 'C', 'G', 'N', 'T'])
+        assert_data_frame_almost_equal(obs, exp)
+
+        for i, seq in enumerate(self.seqs):
+            self.assertEqual(
+                {c: n for c, n in obs.iloc[i].items() if n},
+                seq.frequencies())
+
+    def test_frequencies_chars_relative(self):
+        obs = self.batch.frequencies(chars={'G', 'A'}, relative=True)
+        exp = pd.DataFrame([[0.25, 0.25], [0.0, 0.4], [np.nan, np.nan],
+                            [1 / 3, 0.0]],
+                           index=['r1', 'r2', 'r3', 'r4'],
+                           columns=['A', 'G'])
+        assert_data_frame_almost_equal(obs, exp)
+
+    def test_frequencies_no_ids(self):
+        batch = SequenceBatch('AAB', [0, 2, 3])
+        exp = pd.DataFrame([[2, 0], [0, 1]], columns=['A', 'B'])
+        assert_data_frame_almost_equal(batch.frequencies(), exp)
+
+    def test_gc_frequency_and_content(self):
+        npt.assert_equal(self.batch.gc_frequency(), np.array([2, 4, 0, 0]))
+        npt.assert_almost_equal(self.batch.gc_frequency(relative=True),
+                                np.array([0.5, 1.0, 0.0, 0.0]))
+        npt.assert_almost_equal(self.batch.gc_content(),
+                                [seq.gc_content() for seq in self.seqs])
+
+    def test_nucleotide_methods_unsupported(self):
+        batch = SequenceBatch.from_sequences([Protein('PAW')])
+        with self.assertRaisesRegex(TypeError, 'gc_frequency.*Protein'):
+            batch.gc_content()
+        with self.assertRaisesRegex(TypeError,
+                                    'reverse_complement.*Protein'):
+            batch.reverse_complement()
+
+    def test_reverse_complement(self):
+        obs = self.batch.reverse_complement()
+        exp = SequenceBatch.from_sequences(
+            [seq.reverse_complement() for seq in self.seqs])
+        self.assertEqual(obs, exp)
+
+        batch = SequenceBatch.from_sequences([RNA('ACGU'), RNA('G')])
+        self.assertEqual(list(batch.reverse_complement()),
+                         [RNA('ACGU'), RNA('C')])
+
+    def test_degap(self):
+        obs = self.batch.degap()
+        exp = SequenceBatch.from_sequences(
+            [seq.degap() for seq in self.seqs])
+        self.assertEqual(obs, exp)
+
+        with self.assertRaisesRegex(TypeError, 'degap.*Sequence'):
+            SequenceBatch('A-', [0, 2]).degap()
+
+    def test_eq(self):
+        self.assertTrue(self.batch == SequenceBatch.from_sequences(self.seqs))
+        self.assertFalse(self.batch != SequenceBatch.from_sequences(self.seqs))
+
+        for other in (self.batch[:3],
+                      SequenceBatch.from_sequences(
+                          [RNA(str(s).replace('T', 'U')) for s in self.seqs]),
+                      SequenceBatch(self.batch.data, [0, 4, 9, 10, 12],
+                                    dtype=DNA, ids=self.batch.ids,
+                                    descriptions=self.batch.descriptions,
+                                    quality=self.batch.quality),
+                      SequenceBatch(self.batch.data, self.batch.offsets,
+                                    dtype=DNA,
+                                    descriptions=self.batch.descriptions,
+                                    quality=self.batch.quality),
+                      SequenceBatch(self.batch.data, self.batch.offsets,
+                                    dtype=DNA, ids=self.batch.ids,
+                                    descriptions=self.batch.ids,
+                                    quality=self.batch.quality),
+                      SequenceBatch(self.batch.data, self.batch.offsets,
+                                    dtype=DNA, ids=self.batch.ids,
+                                    descriptions=self.batch.descriptions),
+                      self.seqs):
+            self.assertFalse(self.batch == other)
+            self.assertTrue(self.batch != other)
+
+    def test_repr(self):
+        obs = repr(self.batch)
+        self.assertTrue(obs.startswith('SequenceBatch[DNA]\n'))
+        self.assertIn('sequence count: 4', obs)
+        self.assertIn('total length: 12', obs)
+        self.assertIn('min length: 0', obs)
+        self.assertIn('max length: 5', obs)
+        self.assertTrue(obs.endswith('3 r4 N.A'))
+        self.assertEqual(str(self.batch), obs)
+
+    def test_repr_truncated(self):
+        batch = SequenceBatch('A' * 60 + 'CGTAC', [0, 60, 61, 62, 63, 64, 65])
+        obs = repr(batch).split('\n')
+        self.assertEqual(obs[-5:], ['0 ' + 'A' * 50 + '...', '1 C', '...',
+                                    '4 A', '5 C'])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+import itertools
+from unittest import TestCase, main, mock
+
+import numpy as np
+import numpy.testing as npt
+from scipy.sparse import csr_matrix
+
+from skbio import Sequence, DNA, RNA, Protein
+from skbio.sequence import kmer_count_matrix, SequenceBatch
+
+
+class TestKmerCountMatrix(TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.seqs = [DNA(''.join(rng.choice(list('ACGTN-'), rng.randint(20))),
+                         metadata={'id': 's%d' % i}) for i in range(50)]
+
+    def assert_rows_match(self, seqs, k, **kwargs):
+        for sparse in False, True:
+            counts, ids = kmer_count_matrix(seqs, k, sparse=sparse, **kwargs)
+            overlap = kwargs.get('overlap', True)
+            canonical = kwargs.get('canonical', False)
+            self.assertEqual(ids, [seq.metadata.get('id') for seq in seqs])
+            if sparse:
+                self.assertIsInstance(counts, csr_matrix)
+                counts = counts.toarray()
+            else:
+                self.assertIsInstance(counts, np.ndarray)
+            exp = [seq.kmer_counts(k, overlap=overlap, canonical=canonical)
+                   for seq in seqs]
+            npt.assert_array_equal(
+                counts, np.array(exp).reshape(len(seqs), -1))
+
+    def test_kmer_count_matrix(self):
+        for k, overlap, canonical in itertools.product(
+                (1, 2, 3, 5), (True, False), (True, False)):
+            self.assert_rows_match(self.seqs, k, overlap=overlap,
+                                   canonical=canonical)
+
+    def test_kmer_count_matrix_other_types(self):
+        self.assert_rows_match([RNA('ACGU'), RNA('UUNU')], 2)
+        self.assert_rows_match([Protein('MKVLA*'), Protein('XMK')], 2)
+
+    def test_kmer_count_matrix_chunked(self):
+        # Split long sequences across chunks and combine many short sequences
+        # into the same chunk.
+        seqs = self.seqs + [DNA('ACGT' * 10 + 'N' + 'GATTACA' * 7)]
+        for chunk_size in 1, 7, 16, 50:
+            with mock.patch('skbio.sequence._composition._chunk_size',
+                            chunk_size):
+                for k, overlap in itertools.product((1, 3, 4), (True, False)):
+                    self.assert_rows_match(seqs, k, overlap=overlap,
+                                           canonical=True)
+
+    def test_kmer_count_matrix_iterator(self):
+        counts, ids = kmer_count_matrix(iter(self.seqs), 2)
+        npt.assert_array_equal(counts, kmer_count_matrix(self.seqs, 2)[0])
+
+    def test_kmer_count_matrix_sequence_batch(self):
+        batch = SequenceBatch.from_sequences(self.seqs)
+        for sparse in False, True:
+            obs, obs_ids = kmer_count_matrix(batch, 3, sparse=sparse)
+            exp, exp_ids = kmer_count_matrix(self.seqs, 3, sparse=sparse)
+            self.assertEqual(obs_ids, exp_ids)
+            npt.assert_array_equal(obs.toarray() if sparse else obs,
+                                   exp.toarray() if sparse else exp)
+
+        counts, ids = kmer_count_matrix(SequenceBatch('', [0], dtype=RNA), 2)
+        self.assertEqual(counts.shape, (0, 16))
+        self.assertEqual(ids, [])
+
+    def test_kmer_count_matrix_empty(self):
+        counts, ids = kmer_count_matrix([], 3)
+        self.assertEqual(counts.shape, (0, 0))
+        self.assertEqual(ids, [])
+
+        counts, ids = kmer_count_matrix([DNA(''), DNA('AC')], 3, sparse=True)
+        self.assertEqual(counts.shape, (2, 64))
+        self.assertEqual(counts.nnz, 0)
+        self.assertEqual(ids, [None, None])
+
+    def test_kmer_count_matrix_invalid(self):
+        with self.assertRaisesRegex(ValueError, 'k must be greater than 0'):
+            kmer_count_matrix(self.seqs, 0)
+        with self.assertRaisesRegex(ValueError, 'too many possible kmers'):
+            kmer_count_matrix(self.seqs, 32)
+        with self.assertRaisesRegex(TypeError, 'DNA.*RNA'):
+            kmer_count_matrix([DNA('A'), RNA('A')], 1)
+        with self.assertRaisesRegex(TypeError, 'GrammaredSequence.*Sequence'):
+            kmer_count_matrix([Sequence('A')], 1)
+        with self.assertRaisesRegex(TypeError, 'GrammaredSequence.*str'):
+            kmer_count_matrix(['ACGT'], 1)
+        with self.assertRaisesRegex(TypeError, 'complement.*Protein'):
+            kmer_count_matrix([Protein('A')], 1, canonical=True)
+
+
+if __name__ == '__main__':
+    main()
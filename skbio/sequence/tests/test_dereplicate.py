@@ -0,0 +1,118 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+from collections import Counter
+from unittest import TestCase, main
+
+import numpy as np
+
+from skbio import Sequence, DNA, RNA, Protein
+from skbio.sequence import dereplicate, SequenceBatch
+
+
+class TestDereplicate(TestCase):
+    def setUp(self):
+        self.seqs = [DNA('ACGT', metadata={'id': 'r1'}),
+                     DNA('GGCA', metadata={'id': 'r2'}),
+                     DNA('ACGT', metadata={'id': 'r3'}),
+                     DNA('TGCC', metadata={'id': 'r4'}),
+                     DNA('GGCA', metadata={'id': 'r5'}),
+                     DNA('GGCA', metadata={'id': 'r6'}),
+                     DNA('AAAA', metadata={'id': 'r7'})]
+
+    def summarize(self, uniques):
+        return [(str(seq), seq.metadata.get('id'),
+                 seq.metadata['abundance'], seq.metadata.get('members'))
+                for seq in uniques]
+
+    def test_dereplicate(self):
+        obs = dereplicate(self.seqs)
+        self.assertTrue(all(type(seq) is DNA for seq in obs))
+        self.assertEqual(self.summarize(obs),
+                         [('GGCA', 'r2', 3, ['r2', 'r5', 'r6']),
+                          ('ACGT', 'r1', 2, ['r1', 'r3']),
+                          ('TGCC', 'r4', 1, ['r4']),
+                          ('AAAA', 'r7', 1, ['r7'])])
+
+    def test_dereplicate_reverse_complement(self):
+        obs = dereplicate(self.seqs, reverse_complement=True)
+        self.assertEqual(self.summarize(obs),
+                         [('GGCA', 'r2', 4, ['r2', 'r4', 'r5', 'r6']),
+                          ('ACGT', 'r1', 2, ['r1', 'r3']),
+                          ('AAAA', 'r7', 1, ['r7'])])
+
+        obs = dereplicate([RNA('AAGU'), RNA('ACUU'), RNA('AAGU')],
+                          reverse_complement=True)
+        self.assertEqual(self.summarize(obs),
+                         [('AAGU', None, 3, [None, None, None])])
+
+    def test_dereplicate_min_abundance_and_members(self):
+        obs = dereplicate(iter(self.seqs), min_abundance=2, members=False)
+        self.assertEqual(self.summarize(obs),
+                         [('GGCA', 'r2', 3, None), ('ACGT', 'r1', 2, None)])
+        self.assertEqual(dereplicate(self.seqs, min_abundance=4), [])
+
+    def test_dereplicate_matches_counter(self):
+        rng = np.random.RandomState(0)
+        reads = [DNA(''.join(rng.choice(list('ACGT-N'), rng.randint(0, 4))),
+                     metadata={'id': str(i)}) for i in range(500)]
+        obs = dereplicate(reads)
+        exp = Counter(str(read) for read in reads)
+        self.assertEqual({str(seq): seq.metadata['abundance'] for seq in obs},
+                         exp)
+        abundances = [seq.metadata['abundance'] for seq in obs]
+        self.assertEqual(abundances, sorted(abundances, reverse=True))
+        for seq in obs:
+            self.assertEqual(seq.metadata['members'],
+                             [read.metadata['id'] for read in reads
+                              if str(read) == str(seq)])
+
+    def test_dereplicate_drops_positional_metadata(self):
+        seqs = [Protein('MKV', positional_metadata={'quality': [1, 2, 3]}),
+                Protein('MKV', positional_metadata={'quality': [3, 2, 1]})]
+        obs = dereplicate(seqs)
+        self.assertEqual(len(obs), 1)
+        self.assertFalse(obs[0].has_positional_metadata())
+        self.assertEqual(obs[0].metadata, {'abundance': 2,
+                                           'members': [None, None]})
+
+    def test_dereplicate_sequence_batch(self):
+        batch = SequenceBatch.from_sequences(self.seqs)
+        for reverse_complement in False, True:
+            self.assertEqual(
+                self.summarize(dereplicate(
+                    batch, reverse_complement=reverse_complement)),
+                self.summarize(dereplicate(
+                    self.seqs, reverse_complement=reverse_complement)))
+
+        batch = SequenceBatch('AAAAAAA', [0, 2, 3, 5, 7], dtype=Sequence)
+        obs = dereplicate(batch)
+        self.assertEqual(self.summarize(obs),
+                         [('AA', None, 3, [None, None, None]),
+                          ('A', None, 1, [None])])
+        self.assertTrue(all(type(seq) is Sequence for seq in obs))
+
+    def test_dereplicate_empty(self):
+        self.assertEqual(dereplicate([]), [])
+        self.assertEqual(dereplicate(SequenceBatch('', [0], dtype=DNA)), [])
+
+    def test_dereplicate_invalid(self):
+        with self.assertRaisesRegex(ValueError, '`min_abundance`.*0'):
+            dereplicate(self.seqs, min_abundance=0)
+        with self.assertRaisesRegex(TypeError, 'DNA.*RNA'):
+            dereplicate([DNA('A'), RNA('A')])
+        with self.assertRaisesRegex(TypeError, 'Sequence objects.*str'):
+            dereplicate(['ACGT'])
+        with self.assertRaisesRegex(TypeError, 'nucleotide.*Protein'):
+            dereplicate([Protein('MKV')], reverse_complement=True)
+        with self.assertRaisesRegex(TypeError, 'nucleotide.*Sequence'):
+            dereplicate(SequenceBatch('AC', [0, 2]), reverse_complement=True)
+
+
+if __name__ == '__main__':
+    main()
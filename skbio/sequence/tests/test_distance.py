@@ -12,8 +12,9 @@ import unittest
 import numpy as np
 import numpy.testing as npt
 
-from skbio import Sequence, DNA
-from skbio.sequence.distance import hamming, kmer_distance
+from skbio import Sequence, DNA, DistanceMatrix
+from skbio.sequence import MinHashSketch
+from skbio.sequence.distance import hamming, kmer_distance, sketch_distances
 
 
 class TestHamming(unittest.TestCase):
@@ -230,5 +231,58 @@ class TestKmerDistance(unittest.TestCase):
             kmer_distance(seq1, seq2, 3)
 
 
+class TestSketchDistances(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(42)
+        genome = rng.choice(list('ACGT'), 5000)
+        self.sketches = []
+        for i, rate in enumerate([0.0, 0.01, 0.05, 0.5]):
+            seq = genome.copy()
+            mutated = rng.rand(len(seq)) < rate
+            seq[mutated] = rng.choice(list('ACGT'), mutated.sum())
+            self.sketches.append(MinHashSketch.from_sequence(
+                DNA(''.join(seq)), k=11, num_hashes=200 + 50 * i,
+                id='s%d' % i))
+        self.sketches.append(MinHashSketch([], 11, id='empty'))
+
+    def test_matches_pairwise(self):
+        for metric in 'mash', 'jaccard':
+            dm = sketch_distances(self.sketches, metric=metric)
+            self.assertIsInstance(dm, DistanceMatrix)
+            self.assertEqual(dm.ids, ('s0', 's1', 's2', 's3', 'empty'))
+            for i, j in itertools.combinations(range(len(self.sketches)), 2):
+                sketch1, sketch2 = self.sketches[i], self.sketches[j]
+                if metric == 'mash':
+                    exp = sketch1.mash_distance(sketch2)
+                else:
+                    exp = 1 - sketch1.jaccard(sketch2)
+                self.assertAlmostEqual(dm[i, j], exp)
+
+    def test_ordered_by_divergence(self):
+        dm = sketch_distances(self.sketches)
+        self.assertTrue(0 < dm['s0', 's1'] < dm['s0', 's2'] < dm['s0', 's3'])
+        self.assertEqual(dm['s0', 'empty'], 1.0)
+        npt.assert_array_equal(np.diag(dm.data), 0.0)
+
+    def test_ids(self):
+        sketches = [MinHashSketch([1, 2], 5, id='a'), MinHashSketch([2], 5)]
+        dm = sketch_distances(iter(sketches), metric='jaccard')
+        self.assertEqual(dm.ids, ('0', '1'))
+        self.assertAlmostEqual(dm['0', '1'], 0.5)
+
+    def test_invalid_input(self):
+        with self.assertRaisesRegex(ValueError, 'metric.*foo'):
+            sketch_distances(self.sketches, metric='foo')
+        with self.assertRaisesRegex(TypeError, 'MinHashSketch.*DNA'):
+            sketch_distances([self.sketches[0], DNA('ACGT')])
+        with self.assertRaisesRegex(ValueError, '`k`'):
+            sketch_distances([self.sketches[0], MinHashSketch([1], 5)])
+
+    def test_empty(self):
+        for sketches in [], iter([]):
+            with self.assertRaisesRegex(ValueError, 'at least one sketch'):
+                sketch_distances(sketches)
+
+
 if __name__ == "__main__":
     unittest.main()
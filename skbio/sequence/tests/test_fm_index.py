@@ -0,0 +1,145 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+import re
+from unittest import TestCase, main, mock
+
+import numpy as np
+import numpy.testing as npt
+
+from skbio import Sequence, DNA, Protein
+from skbio.sequence import FMIndex
+
+
+def _brute_force_locate(text, pattern):
+    return [match.start() for match in
+            re.finditer(b'(?=' + re.escape(pattern) + b')', text)]
+
+
+class TestFMIndex(TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.texts = [b'', b'a', b'banana', b'mississippi', b'AAAAAAAA',
+                      b'\x00\xff\x00\xff\x01',
+                      rng.choice(list(b'AC'), 300).astype(np.uint8).tobytes(),
+                      rng.choice(list(b'ACGTN-'),
+                                 1000).astype(np.uint8).tobytes()]
+
+    def patterns(self, text):
+        rng = np.random.RandomState(len(text))
+        patterns = [b'A', b'AC', b'ana', b'ss', b'\x00', b'Z', b'AZ', b'ZA',
+                    text[:5] or b'A', text[-3:] or b'A', text + b'A']
+        for start in rng.randint(0, max(len(text), 1), 50):
+            patterns.append(text[start:start + rng.randint(1, 10)] or b'A')
+        return patterns
+
+    def test_suffix_array(self):
+        for text in self.texts:
+            index = FMIndex(Sequence(text))
+            exp = sorted(range(len(text)), key=lambda i: text[i:])
+            npt.assert_array_equal(index.suffix_array, exp)
+            self.assertFalse(index.suffix_array.flags.writeable)
+
+    def test_count_and_locate_match_brute_force(self):
+        for text in self.texts:
+            index = FMIndex(Sequence(text))
+            patterns = self.patterns(text)
+            counts = index.count_many(patterns)
+            positions, offsets = index.locate_many(patterns)
+            self.assertEqual(len(offsets), len(patterns) + 1)
+            for i, pattern in enumerate(patterns):
+                exp = _brute_force_locate(text, pattern)
+                self.assertEqual(counts[i], len(exp))
+                self.assertEqual(index.count(pattern), len(exp))
+                npt.assert_array_equal(
+                    positions[offsets[i]:offsets[i + 1]], exp)
+                npt.assert_array_equal(index.locate(pattern), exp)
+                self.assertEqual(pattern in index, bool(exp))
+
+    def test_search_chunked(self):
+        text = self.texts[-1]
+        index = FMIndex(Sequence(text))
+        patterns = self.patterns(text)
+        exp_counts = index.count_many(patterns)
+        exp_positions, exp_offsets = index.locate_many(patterns)
+        for chunk_size in 1, 7, 64:
+            with mock.patch('skbio.sequence._fm_index._query_chunk_size',
+                            chunk_size):
+                npt.assert_array_equal(index.count_many(patterns),
+                                       exp_counts)
+                positions, offsets = index.locate_many(iter(patterns))
+                npt.assert_array_equal(positions, exp_positions)
+                npt.assert_array_equal(offsets, exp_offsets)
+
+    def test_pattern_types(self):
+        index = FMIndex(DNA('ACGTACGTTACG'))
+        for pattern in 'ACG', b'ACG', DNA('ACG'), Sequence('ACG'):
+            self.assertEqual(index.count(pattern), 3)
+        npt.assert_array_equal(index.count_many([]), [])
+        positions, offsets = index.locate_many([])
+        npt.assert_array_equal(positions, [])
+        npt.assert_array_equal(offsets, [0])
+
+    def test_case_sensitive(self):
+        index = FMIndex(DNA('acgt', lowercase=True))
+        self.assertEqual(index.count('ACGT'), 1)
+        self.assertEqual(index.count('acgt'), 0)
+        self.assertEqual(FMIndex(Sequence('acgt')).count('ACGT'), 0)
+
+    def test_invalid_patterns(self):
+        index = FMIndex('ACGT')
+        with self.assertRaisesRegex(ValueError, 'must not be empty'):
+            index.count('')
+        with self.assertRaisesRegex(ValueError, 'must not be empty'):
+            index.locate_many(['A', b''])
+        with self.assertRaisesRegex(TypeError, 'str, bytes, or Sequence.*int'):
+            index.count(1)
+        for method in index.count, index.locate, index.__contains__:
+            with self.assertRaisesRegex(ValueError, 'ASCII.*\u00e9'):
+                method('AC\u00e9')
+        with self.assertRaisesRegex(ValueError, 'ASCII'):
+            index.count_many(['A', '\u00e9'])
+
+    def test_constructor(self):
+        seq = Protein('MKVLA', metadata={'id': 'p'})
+        index = FMIndex(seq)
+        self.assertIs(index.sequence, seq)
+        self.assertEqual(len(index), 5)
+        self.assertEqual(FMIndex('MKVLA'), index)
+        self.assertEqual(FMIndex('MKVLA').sequence, Sequence('MKVLA'))
+
+        with self.assertRaisesRegex(TypeError, 'Sequence or str.*list'):
+            FMIndex(['A'])
+
+    def test_constructor_suffix_array(self):
+        index = FMIndex('banana', suffix_array=[5, 3, 1, 0, 4, 2])
+        npt.assert_array_equal(index.locate('ana'), [1, 3])
+        self.assertEqual(FMIndex('', suffix_array=[]), FMIndex(''))
+
+        for suffix_array in ([5, 3, 1, 0, 4], [5, 3, 1, 0, 4, 4],
+                             [5, 3, 1, 0, 4, 6], [5, 3, 1, 0, 4, -1],
+                             [5., 3., 1., 0., 4., 2.]):
+            with self.assertRaisesRegex(ValueError, 'permutation of the 6'):
+                FMIndex('banana', suffix_array=suffix_array)
+
+    def test_eq(self):
+        self.assertEqual(FMIndex(DNA('ACGT')), FMIndex(Sequence('ACGT')))
+        self.assertNotEqual(FMIndex('ACGT'), FMIndex('ACGA'))
+        self.assertNotEqual(FMIndex('ACGT'), 'ACGT')
+        self.assertFalse(FMIndex('ACGT') != FMIndex('ACGT'))
+
+    def test_repr(self):
+        obs = repr(FMIndex(DNA('ACGTACGTTACG')))
+        self.assertEqual(obs, str(FMIndex(DNA('ACGTACGTTACG'))))
+        self.assertEqual(obs.split('\n'), [
+            'FMIndex[DNA]', '-' * 17, 'Stats:', '    length: 12',
+            '    characters: 4'])
+
+
+if __name__ == '__main__':
+    main()
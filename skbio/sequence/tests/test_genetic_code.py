@@ -11,8 +11,12 @@ import unittest
 
 import numpy as np
 import numpy.testing as npt
+import pandas as pd
+import pandas.util.testing as pdt
 
 from skbio import Sequence, DNA, RNA, Protein, GeneticCode
+from skbio.metadata import IntervalMetadata
+from skbio.sequence import SequenceBatch
 from skbio.sequence._genetic_code import _ncbi_genetic_codes
 
 
@@ -498,6 +502,304 @@ class TestGeneticCode(unittest.TestCase):
             [Protein('M', metadata={'foo': 'bar', 'baz': 42}),
              Protein('', metadata={'foo': 'bar', 'baz': 42})])
 
+    def assertTranslatesLikeSequences(self, gc, seqs, **kwargs):
+        for reading_frame in gc.reading_frames:
+            obs = gc.translate_batch(seqs, reading_frame=reading_frame,
+                                     **kwargs)
+            self.assertIsInstance(obs, SequenceBatch)
+            self.assertIs(obs.dtype, Protein)
+            exp = [gc.translate(seq, reading_frame=reading_frame, **kwargs)
+                   for seq in seqs]
+            self.assertEqual([str(p) for p in obs], [str(p) for p in exp])
+
+    def test_translate_batch_matches_translate(self):
+        seqs = [RNA(''), RNA('A'), RNA('AUG'), RNA('AUGCUAACAUAAA'),
+                RNA('AGUAUUCUGCCACUGUAAGAA'), RNA('GGGGCCCAAAUUUGGG'),
+                RNA('AAUGAUGUGACUAUCAGAAGG')]
+        for gc in self.sgc, GeneticCode.from_ncbi(2), \
+                GeneticCode('MWN*' * 16, '-' * 64):
+            for start, stop in itertools.product(['ignore', 'optional'],
+                                                 repeat=2):
+                self.assertTranslatesLikeSequences(gc, seqs, start=start,
+                                                   stop=stop)
+
+    def test_translate_batch_require(self):
+        seqs = [RNA('AUGCUAACAUAAA'), RNA('AGUAUUCUGCCACUGUAAGAA')]
+        obs = self.sgc.translate_batch(seqs, start='require', stop='require')
+        self.assertEqual([str(p) for p in obs], ['MLT', 'MPL'])
+
+        with self.assertRaisesRegex(ValueError,
+                                    'reading_frame=2.*start=\'require\''):
+            self.sgc.translate_batch(seqs, reading_frame=2, start='require')
+        with self.assertRaisesRegex(ValueError,
+                                    'reading_frame=-1.*stop=\'require\''):
+            self.sgc.translate_batch(seqs, reading_frame=-1, stop='require')
+
+    def test_translate_batch_input_types(self):
+        rnas = [RNA('AUGCUAACAUAAA', metadata={'id': 'a'}),
+                RNA('GCAUA', metadata={'id': 'b', 'description': 'c'})]
+        exp = ['MLT*', 'A']
+
+        # iterable of RNA, DNA, and SequenceBatch of either are equivalent
+        for seqs in (rnas, iter(rnas), SequenceBatch.from_sequences(rnas),
+                     [seq.reverse_transcribe() for seq in rnas],
+                     SequenceBatch.from_sequences(
+                         [seq.reverse_transcribe() for seq in rnas])):
+            obs = self.sgc.translate_batch(seqs)
+            self.assertEqual([str(p) for p in obs], exp)
+            npt.assert_array_equal(obs.ids, ['a', 'b'])
+            npt.assert_array_equal(obs.descriptions, ['', 'c'])
+
+        obs = self.sgc.translate_batch([])
+        self.assertEqual(len(obs), 0)
+        self.assertIs(obs.dtype, Protein)
+
+    def test_translate_batch_invalid_input(self):
+        with self.assertRaisesRegex(TypeError, 'RNA or DNA.*Protein'):
+            self.sgc.translate_batch([Protein('ACG')])
+        with self.assertRaisesRegex(TypeError, 'all be of type'):
+            self.sgc.translate_batch([RNA('ACG'), DNA('ACG')])
+        with self.assertRaisesRegex(ValueError, '\[1, 2, 3, -1, -2, -3\].*0'):
+            self.sgc.translate_batch([RNA('AUG')], reading_frame=0)
+        with self.assertRaisesRegex(ValueError, 'start.*foo'):
+            self.sgc.translate_batch([RNA('AUG')], start='foo')
+        with self.assertRaisesRegex(ValueError, 'stop.*foo'):
+            self.sgc.translate_batch([RNA('AUG')], stop='foo')
+        with self.assertRaisesRegex(ValueError, 'gapped'):
+            self.sgc.translate_batch([RNA('AUG'), RNA('UU-G')])
+        with self.assertRaisesRegex(NotImplementedError, 'degenerate'):
+            self.sgc.translate_batch([DNA('ATG'), DNA('RTG')])
+
+    def test_translate_six_frames_batch(self):
+        seqs = [RNA('AUGCUAACAUAAA'), RNA(''), RNA('GCAUA')]
+        for start, stop in itertools.product(['ignore', 'optional'],
+                                             repeat=2):
+            obs = list(self.sgc.translate_six_frames_batch(
+                SequenceBatch.from_sequences(seqs), start=start, stop=stop))
+            self.assertEqual(len(obs), 6)
+            for i, seq in enumerate(seqs):
+                exp = self.sgc.translate_six_frames(seq, start=start,
+                                                    stop=stop)
+                self.assertEqual([str(batch[i]) for batch in obs],
+                                 [str(p) for p in exp])
+
+    def test_find_orfs(self):
+        # rc = GCCATGTAAGCCTAAAATTTCATGG
+        seq = DNA('CCATGAAATTTTAGGCTTACATGGC')
+        exp = pd.DataFrame(
+            {'start': [2, 16], 'stop': [14, 22], 'strand': ['+', '-'],
+             'reading_frame': [3, -1]},
+            columns=['start', 'stop', 'strand', 'reading_frame'])
+        pdt.assert_frame_equal(self.sgc.find_orfs(seq), exp)
+        pdt.assert_frame_equal(self.sgc.find_orfs(seq.transcribe()), exp)
+
+        obs = self.sgc.find_orfs(seq, min_length=7)
+        pdt.assert_frame_equal(obs, exp[:1])
+
+        # ORFs running off the end of the sequence
+        obs = self.sgc.find_orfs(seq, stop='optional')
+        self.assertEqual(obs.values.tolist(),
+                         [[1, 4, '-', -1], [2, 14, '+', 3],
+                          [16, 22, '-', -1], [20, 23, '+', 3]])
+
+        # regions between stop codons
+        obs = self.sgc.find_orfs(seq, start='ignore')
+        self.assertEqual(obs.values.tolist(),
+                         [[0, 6, '+', 1], [2, 14, '+', 3],
+                          [10, 16, '-', -1], [16, 25, '-', -1]])
+
+    def test_find_orfs_translate(self):
+        seq = RNA('AAGUUGCAUGCCCUGAAAUAGGGUGUACUUACAAUGUUCUAGACUAACGAUG')
+        for gc in self.sgc, GeneticCode.from_ncbi(2):
+            orfs = gc.find_orfs(seq)
+            self.assertGreater(len(orfs), 0)
+            for start, stop, strand, reading_frame in orfs.values:
+                orf = seq[start:stop]
+                if strand == '-':
+                    orf = orf.reverse_complement()
+                protein = str(gc.translate(orf, start='require'))
+                self.assertEqual(protein[0], 'M')
+                self.assertEqual(protein.find('*'), len(protein) - 1)
+
+                # the ORF is in the reported reading frame
+                translated = str(gc.translate(seq, reading_frame=reading_frame,
+                                              start='ignore'))
+                self.assertIn(protein[1:], translated)
+
+    def test_find_orfs_degenerate(self):
+        # degenerate codons are neither start nor stop codons
+        obs = self.sgc.find_orfs(DNA('ATGNNNTAANTGATAAAA'))
+        self.assertEqual(obs.values.tolist(), [[0, 9, '+', 1]])
+
+    def test_find_orfs_no_orfs(self):
+        for seq in DNA(''), DNA('AT'), RNA('CCCCCCC'):
+            obs = self.sgc.find_orfs(seq)
+            self.assertEqual(obs.shape, (0, 4))
+            self.assertEqual(list(obs.columns),
+                             ['start', 'stop', 'strand', 'reading_frame'])
+
+    def test_find_orfs_batch(self):
+        seqs = [DNA('CCATGAAATTTTAGGCTTACATGGC'), DNA(''), DNA('ATGTAA'),
+                DNA('TTACAT')]
+        obs = self.sgc.find_orfs(SequenceBatch.from_sequences(seqs))
+        self.assertEqual(list(obs.columns),
+                         ['sequence', 'start', 'stop', 'strand',
+                          'reading_frame'])
+        self.assertEqual(obs.values.tolist(),
+                         [[0, 2, 14, '+', 3], [0, 16, 22, '-', -1],
+                          [2, 0, 6, '+', 1], [3, 0, 6, '-', -1]])
+
+        obs = self.sgc.find_orfs(SequenceBatch.from_sequences(seqs),
+                                 interval_metadata=True)
+        self.assertEqual(len(obs), 4)
+        self.assertEqual([im.upper_bound for im in obs], [25, 0, 6, 6])
+        self.assertEqual([im.num_interval_features for im in obs],
+                         [2, 0, 1, 1])
+
+    def test_find_orfs_interval_metadata(self):
+        obs = self.sgc.find_orfs(DNA('CCATGAAATTTTAGGCTTACATGGC'),
+                                 interval_metadata=True)
+        exp = IntervalMetadata(25)
+        exp.add([(2, 14)], metadata={'type': 'ORF', 'strand': '+',
+                                     'reading_frame': 3})
+        exp.add([(16, 22)], metadata={'type': 'ORF', 'strand': '-',
+                                      'reading_frame': -1})
+        self.assertEqual(obs, exp)
+
+    def test_find_orfs_invalid_input(self):
+        with self.assertRaisesRegex(TypeError, 'RNA or DNA.*Protein'):
+            self.sgc.find_orfs(Protein('MAT'))
+        with self.assertRaisesRegex(TypeError, 'RNA or DNA.*Sequence'):
+            self.sgc.find_orfs(SequenceBatch.from_sequences([Sequence('A')]))
+        with self.assertRaisesRegex(ValueError, 'start.*optional'):
+            self.sgc.find_orfs(DNA('ATG'), start='optional')
+        with self.assertRaisesRegex(ValueError, 'stop.*ignore'):
+            self.sgc.find_orfs(DNA('ATG'), stop='ignore')
+        with self.assertRaisesRegex(ValueError, 'min_length.*-1'):
+            self.sgc.find_orfs(DNA('ATG'), min_length=-1)
+        with self.assertRaisesRegex(ValueError, 'gapped'):
+            self.sgc.find_orfs(DNA('ATG-TAA'))
+
+    def test_codon_usage(self):
+        rng = np.random.RandomState(0)
+        seqs = [DNA(''.join(rng.choice(list('ACGTN-'), rng.randint(20),
+                                       p=[0.22] * 4 + [0.06] * 2)),
+                    metadata={'id': 's%d' % i}) for i in range(50)]
+        for reading_frame in self.sgc.reading_frames:
+            obs = self.sgc.codon_usage(seqs, reading_frame=reading_frame)
+            self.assertEqual(list(obs.index), [seq.metadata['id']
+                                               for seq in seqs])
+            self.assertEqual(obs.columns[:5].tolist(),
+                             ['UUU', 'UUC', 'UUA', 'UUG', 'UCU'])
+            for seq, (_, row) in zip(seqs, obs.iterrows()):
+                if reading_frame < 0:
+                    seq = seq.reverse_complement()
+                seq = seq[abs(reading_frame) - 1:].transcribe()
+                exp = dict.fromkeys(obs.columns, 0)
+                for codon in seq.iter_kmers(3, overlap=False):
+                    if str(codon) in exp:
+                        exp[str(codon)] += 1
+                self.assertEqual(row.to_dict(), exp)
+
+    def test_codon_usage_input_types(self):
+        rnas = [RNA('AUGGCAUAA'), RNA('GCAGCC')]
+        exp = self.sgc.codon_usage(rnas)
+        self.assertEqual(exp.index.tolist(), [0, 1])
+        self.assertEqual(exp[['AUG', 'GCA', 'GCC', 'UAA']].values.tolist(),
+                         [[1, 1, 0, 1], [0, 1, 1, 0]])
+        self.assertEqual(exp.values.sum(), 5)
+
+        dnas = [seq.reverse_transcribe() for seq in rnas]
+        for seqs in (iter(rnas), SequenceBatch.from_sequences(rnas), dnas,
+                     SequenceBatch.from_sequences(dnas)):
+            pdt.assert_frame_equal(self.sgc.codon_usage(seqs), exp)
+
+        obs = self.sgc.codon_usage([])
+        self.assertEqual(obs.shape, (0, 64))
+
+    def test_codon_usage_invalid_input(self):
+        with self.assertRaisesRegex(TypeError, 'RNA or DNA.*Protein'):
+            self.sgc.codon_usage([Protein('ACG')])
+        with self.assertRaisesRegex(ValueError, r'\[1, 2, 3, -1, -2, -3\].*0'):
+            self.sgc.codon_usage([RNA('AUG')], reading_frame=0)
+
+    def test_relative_synonymous_codon_usage(self):
+        usage = self.sgc.codon_usage([DNA('CTGCTGCTGTTAATGATGTGA'),
+                                      DNA('GGGGGA')])
+        obs = self.sgc.relative_synonymous_codon_usage(usage)
+        self.assertIsInstance(obs, pd.DataFrame)
+        self.assertEqual(obs.shape, (2, 64))
+        self.assertEqual(
+            obs.loc[0, ['CUG', 'UUA', 'CUU', 'AUG', 'UGA', 'UAA']].tolist(),
+            [4.5, 1.5, 0.0, 1.0, 3.0, 0.0])
+        self.assertEqual(obs.loc[1, ['GGG', 'GGA', 'GGC', 'GGU']].tolist(),
+                         [2.0, 2.0, 0.0, 0.0])
+        self.assertTrue(np.isnan(obs.loc[1, 'CUG']))
+        self.assertTrue(np.isnan(obs.loc[0, 'UUU']))
+        self.assertTrue(np.isnan(obs.loc[0, 'GGG']))
+
+        # the RSCU of the codons of every amino acid sums to its number of
+        # codons
+        rows = obs.loc[0].groupby(list(str(self.sgc._amino_acids))).sum()
+        self.assertEqual(rows[['L', 'M', '*']].tolist(), [6.0, 1.0, 3.0])
+
+        series = self.sgc.relative_synonymous_codon_usage(usage.loc[0])
+        self.assertIsInstance(series, pd.Series)
+        pdt.assert_series_equal(series, obs.loc[0])
+        array = self.sgc.relative_synonymous_codon_usage(usage.values.tolist())
+        self.assertIsInstance(array, np.ndarray)
+        npt.assert_array_equal(array, obs.values)
+
+    def test_relative_synonymous_codon_usage_invalid_input(self):
+        with self.assertRaisesRegex(ValueError, r'64 columns.*\(2, 3\)'):
+            self.sgc.relative_synonymous_codon_usage(np.ones((2, 3)))
+        with self.assertRaisesRegex(ValueError, r'64 columns.*\(\)'):
+            self.sgc.relative_synonymous_codon_usage(1)
+
+    def test_codon_adaptation_index(self):
+        rng = np.random.RandomState(0)
+        reference = rng.randint(0, 10, 64)
+        seqs = [DNA(''.join(rng.choice(list('ACGT'), rng.randint(1, 40))),
+                    metadata={'id': 's%d' % i}) for i in range(20)]
+        obs = self.sgc.codon_adaptation_index(seqs, reference)
+        self.assertEqual(obs.index.tolist(), ['s%d' % i for i in range(20)])
+
+        amino_acids = str(self.sgc._amino_acids)
+        weights = {}
+        for index, (codon, aa) in enumerate(zip(self.sgc._codons,
+                                                amino_acids)):
+            synonymous = [i for i, other in enumerate(amino_acids)
+                          if other == aa]
+            if aa != '*' and len(synonymous) > 1:
+                weights[codon] = (max(reference[index], 0.5) /
+                                  max(reference[synonymous]))
+        for seq, cai in zip(seqs, obs):
+            codons = [str(codon) for codon in
+                      seq.transcribe().iter_kmers(3, overlap=False)]
+            codon_weights = [weights[codon] for codon in codons
+                             if codon in weights]
+            if codon_weights:
+                self.assertAlmostEqual(
+                    cai, np.prod(codon_weights) ** (1 / len(codon_weights)))
+            else:
+                self.assertTrue(np.isnan(cai))
+
+    def test_codon_adaptation_index_reference(self):
+        genes = [RNA('AUGCUGCUUGGGUAA'), RNA('AUGUGG'), RNA('CUA')]
+        reference = self.sgc.codon_usage([RNA('CUGCUGCUU'), RNA('CUGCUG')])
+        obs = self.sgc.codon_adaptation_index(genes, reference)
+        # GGG (glycine) is not in the reference and AUG, UGG, and UAA are
+        # ignored
+        npt.assert_allclose(obs, [0.5, np.nan, 0.5 / 4])
+        npt.assert_allclose(
+            self.sgc.codon_adaptation_index(genes, reference.sum()), obs)
+
+    def test_codon_adaptation_index_invalid_input(self):
+        with self.assertRaisesRegex(TypeError, 'RNA or DNA.*Protein'):
+            self.sgc.codon_adaptation_index([Protein('ACG')], np.ones(64))
+        with self.assertRaisesRegex(ValueError, '64 columns'):
+            self.sgc.codon_adaptation_index([RNA('AUG')], np.ones(63))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -6,7 +6,8 @@
 # The full license is in the file COPYING.txt, distributed with this software.
 # ----------------------------------------------------------------------------
 
-from unittest import TestCase, main
+import itertools
+from unittest import TestCase, main, mock
 
 import numpy as np
 import numpy.testing as npt
@@ -209,6 +210,47 @@ class TestGrammaredSequence(TestCase):
 
         ExampleGrammaredSequence(seq, validate=False)
 
+    def test_init_validate_in_chunks(self):
+        with mock.patch('skbio.sequence._grammared_sequence.'
+                        '_validation_chunk_size', 3):
+            seq = ExampleGrammaredSequence('BAACB.XYY-AZ')
+            self.assertEqual(str(seq), 'BAACB.XYY-AZ')
+            with self.assertRaisesRegex(ValueError, "\\['a', 'w'\\]"):
+                ExampleGrammaredSequence('BAACB.XYY-AZaw')
+            with self.assertRaisesRegex(ValueError, "character.*'w'"):
+                ExampleGrammaredSequence('BAACwB')
+            seq = ExampleGrammaredSequence('baaCB.xYy-Az', lowercase=True)
+            self.assertEqual(str(seq), 'BAACB.XYY-AZ')
+            with self.assertRaisesRegex(ValueError, "\\['D', 'W'\\]"):
+                ExampleGrammaredSequence('BAACB.XYY-AZdw', lowercase=True)
+
+    def test_validate_bytes(self):
+        data = np.frombuffer(b'BAACB.XYY-AZ', dtype=np.uint8)
+        self.assertIs(ExampleGrammaredSequence._validate_bytes(data), data)
+
+        obs = ExampleGrammaredSequence._validate_bytes(
+            np.frombuffer(b'bAacb.xYy-aZ', dtype=np.uint8), lowercase=True)
+        npt.assert_array_equal(obs, data)
+        self.assertTrue(obs.flags.writeable)
+
+        with self.assertRaisesRegex(ValueError, "\\['a', 'b', 'c'\\]"):
+            ExampleGrammaredSequence._validate_bytes(
+                np.frombuffer(b'bAacb', dtype=np.uint8))
+        with self.assertRaisesRegex(ValueError, "character.*'W'"):
+            ExampleGrammaredSequence._validate_bytes(
+                np.frombuffer(b'bAwcb', dtype=np.uint8), lowercase=True)
+
+    def test_uppercase_lookup(self):
+        lookup = ExampleGrammaredSequence._uppercase_lookup
+        self.assertEqual(lookup.shape, (256,))
+        self.assertEqual(lookup[ord('a')], ord('A'))
+        self.assertEqual(lookup[ord('A')], ord('A'))
+        self.assertEqual(lookup[ord('-')], ord('-'))
+        self.assertEqual(lookup[ord('w')], 0)
+        self.assertEqual(lookup[ord('W')], 0)
+        self.assertEqual(set(lookup[lookup > 0].tobytes().decode('ascii')),
+                         ExampleGrammaredSequence.alphabet)
+
     def test_init_lowercase_all_lowercase(self):
         s = 'cbcbbbazcbbzbxyz-.x'
 
@@ -419,6 +461,27 @@ class TestGrammaredSequence(TestCase):
         self.assertTrue(ExampleGrammaredSequence("Z").has_degenerates())
         self.assertTrue(ExampleGrammaredSequence("ABC.XYZ-").has_degenerates())
 
+    def test_window_gap_and_degenerate_fractions(self):
+        seq = ExampleGrammaredSequence("AX.Y-ZBXC--.")
+        for window, step in itertools.product(range(1, 14), range(1, 4)):
+            gaps = seq.window_gap_fraction(window, step=step)
+            degenerates = seq.window_degenerate_fraction(window, step=step)
+            starts = list(range(0, len(seq) - window + 1, step))
+            self.assertEqual(gaps.index.tolist(), starts)
+            self.assertEqual(degenerates.index.tolist(), starts)
+            for start in starts:
+                subseq = seq[start:start + window]
+                self.assertAlmostEqual(gaps[start], subseq.gaps().mean())
+                self.assertAlmostEqual(degenerates[start],
+                                       subseq.degenerates().mean())
+
+    def test_window_fractions_invalid(self):
+        seq = ExampleGrammaredSequence("ABC")
+        with self.assertRaisesRegex(ValueError, '`window`'):
+            seq.window_gap_fraction(0)
+        with self.assertRaisesRegex(ValueError, '`step`'):
+            seq.window_degenerate_fraction(2, step=0)
+
     # TODO: duplicate of test_definites; remove when nondegenerates is removed
     def test_nondegenerates(self):
         self.assertIs(type(ExampleGrammaredSequence("").nondegenerates()),
@@ -616,6 +679,75 @@ class TestGrammaredSequence(TestCase):
         self.assertEqual(seq.find_motifs("name1"), "ABC")
         self.assertEqual(seq.find_motifs("name2"), 3)
 
+    def test_kmer_counts(self):
+        seq = ExampleGrammaredSequence('ABCAXB-CC')
+
+        npt.assert_equal(seq.kmer_counts(1), np.array([2, 2, 3]))
+        # AA AB AC BA BB BC CA CB CC
+        npt.assert_equal(seq.kmer_counts(2),
+                         np.array([0, 1, 0, 0, 0, 1, 1, 0, 1]))
+        npt.assert_equal(seq.kmer_counts(2, overlap=False),
+                         np.array([0, 1, 0, 0, 0, 0, 1, 0, 0]))
+        self.assertEqual(seq.kmer_counts(3).shape, (27,))
+        npt.assert_equal(seq.kmer_counts(10), np.zeros(3 ** 10, dtype=int))
+
+    def test_kmer_counts_empty(self):
+        seq = ExampleGrammaredSequence('')
+        npt.assert_equal(seq.kmer_counts(2), np.zeros(9, dtype=int))
+
+    def test_kmer_counts_sparse(self):
+        seq = ExampleGrammaredSequence('ABCAXB-CC')
+        for k in 1, 2, 3, 5:
+            obs = seq.kmer_counts(k, sparse=True)
+            self.assertEqual(obs.shape, (1, 3 ** k))
+            npt.assert_equal(obs.toarray().ravel(), seq.kmer_counts(k))
+
+    def test_kmer_counts_invalid_k(self):
+        seq = ExampleGrammaredSequence('ABC')
+        with self.assertRaisesRegex(ValueError, 'k must be greater than 0'):
+            seq.kmer_counts(0)
+        with self.assertRaisesRegex(ValueError, 'too many possible kmers'):
+            seq.kmer_counts(40, sparse=True)
+
+    def test_kmer_counts_canonical_unsupported(self):
+        seq = ExampleGrammaredSequence('ABC')
+        with self.assertRaisesRegex(TypeError, 'Canonical'):
+            seq.kmer_counts(1, canonical=True)
+
+    def test_kmer_codes(self):
+        seq = ExampleGrammaredSequence('ABCAXB-CC')
+        # AA AB AC BA BB BC CA CB CC
+        codes, starts = seq.kmer_codes(2)
+        npt.assert_equal(codes, np.array([1, 5, 6, 8]))
+        npt.assert_equal(starts, np.array([0, 1, 2, 7]))
+        codes, starts = seq.kmer_codes(2, overlap=False)
+        npt.assert_equal(codes, np.array([1, 6]))
+        npt.assert_equal(starts, np.array([0, 2]))
+        codes, starts = seq.kmer_codes(1)
+        npt.assert_equal(codes, np.array([0, 1, 2, 0, 1, 2, 2]))
+        npt.assert_equal(starts, np.array([0, 1, 2, 3, 5, 7, 8]))
+
+        for k in 1, 2, 3:
+            codes, _ = seq.kmer_codes(k)
+            npt.assert_equal(np.bincount(codes, minlength=3 ** k),
+                             seq.kmer_counts(k))
+
+    def test_kmer_codes_empty(self):
+        codes, starts = ExampleGrammaredSequence('').kmer_codes(2)
+        self.assertEqual(codes.shape, (0,))
+        self.assertEqual(codes.dtype, np.int64)
+        self.assertEqual(starts.shape, (0,))
+
+    def test_kmer_codes_invalid(self):
+        seq = ExampleGrammaredSequence('ABC')
+        with self.assertRaisesRegex(ValueError, 'k must be greater than 0'):
+            seq.kmer_codes(0)
+        with self.assertRaisesRegex(ValueError,
+                                    'Cannot encode.*too many possible kmers'):
+            seq.kmer_codes(40)
+        with self.assertRaisesRegex(TypeError, 'Canonical'):
+            seq.kmer_codes(1, canonical=True)
+
     def test_repr(self):
         # basic sanity checks for custom repr stats. more extensive testing is
         # performed on Sequence.__repr__
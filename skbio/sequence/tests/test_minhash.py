@@ -0,0 +1,241 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+from unittest import TestCase, main, mock
+
+import numpy as np
+import numpy.testing as npt
+
+from skbio import Sequence, DNA, RNA, Protein
+from skbio.sequence import MinHashSketch, SequenceBatch, GrammaredSequence
+from skbio.util import classproperty
+
+
+class NoComplementSequence(GrammaredSequence):
+    # a complement lookup of None means there is no complement
+    _complement_lookup = None
+
+    @classproperty
+    def degenerate_map(cls):
+        return {"X": set("AB")}
+
+    @classproperty
+    def definite_chars(cls):
+        return set("ABC")
+
+    @classproperty
+    def default_gap_char(cls):
+        return '-'
+
+    @classproperty
+    def gap_chars(cls):
+        return set('-')
+
+
+class TestMinHashSketch(TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.genome = DNA(''.join(rng.choice(list('ACGT'), 20000)),
+                          metadata={'id': 'g'})
+        mutated = self.genome.values.copy()
+        mutated[rng.rand(len(mutated)) < 0.02] = b'A'
+        self.mutated = DNA(mutated, metadata={'id': 'm'})
+
+    def exact_jaccard(self, seq1, seq2, k):
+        def kmers(seq):
+            return {min(str(kmer), str(kmer.reverse_complement()))
+                    for kmer in seq.iter_kmers(k)}
+        kmers1, kmers2 = kmers(seq1), kmers(seq2)
+        return len(kmers1 & kmers2) / len(kmers1 | kmers2)
+
+    def test_init(self):
+        sketch = MinHashSketch([5, 1, 3, 1, 9], 4, num_hashes=3, id='a')
+        npt.assert_array_equal(sketch.hashes, [1, 3, 5])
+        self.assertEqual(sketch.hashes.dtype, np.uint64)
+        self.assertFalse(sketch.hashes.flags.writeable)
+        self.assertEqual(len(sketch), 3)
+        self.assertEqual(sketch.k, 4)
+        self.assertEqual(sketch.num_hashes, 3)
+        self.assertEqual(sketch.seed, 42)
+        self.assertTrue(sketch.canonical)
+        self.assertEqual(sketch.id, 'a')
+
+    def test_init_invalid(self):
+        with self.assertRaisesRegex(ValueError, 'k must be greater than 0'):
+            MinHashSketch([1], 0)
+        with self.assertRaisesRegex(ValueError, 'num_hashes.*0'):
+            MinHashSketch([1], 3, num_hashes=0)
+
+    def test_from_sequence(self):
+        sketch = MinHashSketch.from_sequence(self.genome, num_hashes=100)
+        self.assertEqual(len(sketch), 100)
+        self.assertEqual(sketch.k, 21)
+        self.assertEqual(sketch.id, 'g')
+        self.assertTrue(sketch.canonical)
+
+        # a sketch is the bottom of the sketch of a larger sketch
+        larger = MinHashSketch.from_sequence(self.genome, num_hashes=500)
+        npt.assert_array_equal(sketch.hashes, larger.hashes[:100])
+
+        # reverse complement and RNA have the same canonical kmers
+        self.assertEqual(
+            MinHashSketch.from_sequence(self.genome.reverse_complement(),
+                                        num_hashes=100, id='g'),
+            sketch)
+        self.assertEqual(
+            MinHashSketch.from_sequence(self.genome.transcribe(),
+                                        num_hashes=100, id='g'),
+            sketch)
+
+        # a different seed gives different hash values
+        other = MinHashSketch.from_sequence(self.genome, num_hashes=100,
+                                            seed=1)
+        self.assertFalse(np.array_equal(sketch.hashes, other.hashes))
+
+    def test_from_sequence_short_and_degenerate(self):
+        self.assertEqual(len(MinHashSketch.from_sequence(DNA('ACGT'))), 0)
+
+        # kmers with degenerate or gap characters are skipped
+        sketch = MinHashSketch.from_sequence(DNA('ACGTN-ACGTA'), k=4)
+        expected = MinHashSketch.from_sequence(DNA('ACGTA'), k=4)
+        self.assertEqual(sketch, expected)
+
+        sketch = MinHashSketch.from_sequence(DNA('ACGTN-ACGTA'), k=4,
+                                             canonical=False)
+        self.assertEqual(len(sketch), 2)
+        self.assertFalse(sketch.canonical)
+
+    def test_from_sequence_protein(self):
+        protein = Protein('MKVLAAGIVALLLAAGC')
+        sketch = MinHashSketch.from_sequence(protein, k=3)
+        self.assertFalse(sketch.canonical)
+        self.assertEqual(len(sketch),
+                         len(set(map(str, protein.iter_kmers(3)))))
+
+        with self.assertRaisesRegex(TypeError, 'complement.*Protein'):
+            MinHashSketch.from_sequence(Protein('MKV'), k=2, canonical=True)
+        with self.assertRaisesRegex(ValueError, '64-bit'):
+            MinHashSketch.from_sequence(Protein('MKV'), k=21)
+
+    def test_from_sequence_without_complement(self):
+        sketch = MinHashSketch.from_sequence(NoComplementSequence('ABCAB'),
+                                             k=2)
+        self.assertFalse(sketch.canonical)
+        self.assertEqual(len(sketch), 3)
+
+    def test_from_sequences(self):
+        contigs = [self.genome[:7000], self.genome[7000:]]
+        sketch = MinHashSketch.from_sequences(contigs, num_hashes=50)
+        self.assertIsNone(sketch.id)
+
+        batch = SequenceBatch.from_sequences(contigs)
+        self.assertEqual(MinHashSketch.from_sequences(batch, num_hashes=50),
+                         sketch)
+
+        # kmers spanning contigs are missing, so the sketch is only similar
+        whole = MinHashSketch.from_sequence(self.genome, num_hashes=50)
+        self.assertGreater(sketch.jaccard(whole), 0.9)
+
+        empty = MinHashSketch.from_sequences([], k=5, id='e')
+        self.assertEqual(len(empty), 0)
+        self.assertTrue(empty.canonical)
+
+        with self.assertRaisesRegex(TypeError, 'GrammaredSequence.*Sequence'):
+            MinHashSketch.from_sequences([DNA('ACGT'), Sequence('ACGT')])
+        with self.assertRaisesRegex(ValueError, 'k must be greater than 0'):
+            MinHashSketch.from_sequences([DNA('ACGT')], k=0)
+
+    def test_from_sequence_chunked(self):
+        sketch = MinHashSketch.from_sequence(self.genome, num_hashes=200)
+        with mock.patch('skbio.sequence._minhash._chunk_size', 1000):
+            chunked = MinHashSketch.from_sequence(self.genome,
+                                                  num_hashes=200)
+        self.assertEqual(chunked, sketch)
+
+    def test_jaccard_and_mash_distance(self):
+        sketch1 = MinHashSketch.from_sequence(self.genome, k=15,
+                                              num_hashes=1000)
+        sketch2 = MinHashSketch.from_sequence(self.mutated, k=15,
+                                              num_hashes=1000)
+        exact = self.exact_jaccard(self.genome, self.mutated, 15)
+        self.assertAlmostEqual(sketch1.jaccard(sketch2), exact, delta=0.05)
+        self.assertEqual(sketch1.jaccard(sketch2), sketch2.jaccard(sketch1))
+        self.assertEqual(sketch1.jaccard(sketch1), 1.0)
+
+        jaccard = sketch1.jaccard(sketch2)
+        self.assertAlmostEqual(sketch1.mash_distance(sketch2),
+                               -np.log(2 * jaccard / (1 + jaccard)) / 15)
+        self.assertEqual(sketch1.mash_distance(sketch1), 0.0)
+
+    def test_no_shared_hashes(self):
+        sketch1 = MinHashSketch([1, 2, 3], 5)
+        sketch2 = MinHashSketch([4, 5, 6], 5)
+        empty = MinHashSketch([], 5)
+        for other in sketch2, empty:
+            self.assertEqual(sketch1.jaccard(other), 0.0)
+            self.assertEqual(sketch1.containment(other), 0.0)
+            self.assertEqual(other.containment(sketch1), 0.0)
+            self.assertEqual(sketch1.mash_distance(other), 1.0)
+
+    def test_jaccard_threshold(self):
+        # only hash values up to the smaller maximum (5) are compared
+        sketch1 = MinHashSketch([1, 2, 3, 5], 5, num_hashes=4)
+        sketch2 = MinHashSketch([2, 3, 4, 9], 5, num_hashes=4)
+        self.assertEqual(sketch1.jaccard(sketch2), 2 / 5)
+
+    def test_containment(self):
+        half = MinHashSketch.from_sequence(self.genome[:10000], num_hashes=500)
+        whole = MinHashSketch.from_sequence(self.genome, num_hashes=500)
+        self.assertEqual(half.containment(whole), 1.0)
+        self.assertAlmostEqual(whole.containment(half), 0.5, delta=0.1)
+
+    def test_incompatible(self):
+        sketch = MinHashSketch([1, 2], 5)
+        with self.assertRaisesRegex(TypeError, 'MinHashSketch.*list'):
+            sketch.jaccard([1, 2])
+        for other, name in ((MinHashSketch([1, 2], 6), 'k'),
+                            (MinHashSketch([1, 2], 5, seed=1), 'seed'),
+                            (MinHashSketch([1, 2], 5, canonical=False),
+                             'canonical')):
+            for method in (sketch.jaccard, sketch.containment,
+                           sketch.mash_distance):
+                with self.assertRaisesRegex(ValueError, '`%s`' % name):
+                    method(other)
+
+    def test_eq(self):
+        sketch = MinHashSketch([1, 2], 5, id='a')
+        self.assertTrue(sketch == MinHashSketch([2, 1], 5, id='a'))
+        self.assertFalse(sketch != MinHashSketch([2, 1], 5, id='a'))
+        for other in (MinHashSketch([1, 3], 5, id='a'),
+                      MinHashSketch([1, 2], 5),
+                      MinHashSketch([1, 2], 6, id='a'),
+                      MinHashSketch([1, 2], 5, num_hashes=2, id='a'),
+                      MinHashSketch([1, 2], 5, seed=0, id='a'),
+                      MinHashSketch([1, 2], 5, canonical=False, id='a'),
+                      [1, 2]):
+            self.assertFalse(sketch == other)
+            self.assertTrue(sketch != other)
+
+    def test_repr_and_str(self):
+        sketch = MinHashSketch([3, 1], 5, num_hashes=10, id='a')
+        obs = repr(sketch)
+        self.assertTrue(obs.startswith('MinHashSketch\n'))
+        self.assertIn("id: 'a'", obs)
+        self.assertIn('hashes: 2 (of 10)', obs)
+        self.assertIn('canonical: True', obs)
+        self.assertEqual(str(sketch), '1 3')
+        self.assertEqual(str(MinHashSketch([], 5)), '')
+
+    def test_rna_and_dna_sketches_compatible(self):
+        rna = MinHashSketch.from_sequence(RNA('ACGUACGUUGCA'), k=4)
+        dna = MinHashSketch.from_sequence(DNA('ACGTACGTTGCA'), k=4)
+        self.assertEqual(rna.jaccard(dna), 1.0)
+
+
+if __name__ == '__main__':
+    main()
@@ -6,9 +6,12 @@
 # The full license is in the file COPYING.txt, distributed with this software.
 # ----------------------------------------------------------------------------
 
+import collections
+import itertools
 import unittest
 
 import numpy as np
+import numpy.testing as npt
 
 from skbio import DNA, RNA, Protein, GeneticCode
 from skbio.sequence._nucleotide_mixin import NucleotideMixin
@@ -497,6 +500,87 @@ class TestNucleotideSequence(unittest.TestCase):
                                                   ignore=seq.gaps())),
                              [slice(4, 9)])
 
+    def degenerate_match_starts(self, seq, sub, max_mismatches):
+        def chars(c):
+            return set(seq.degenerate_map.get(c, c)) - set(seq.gap_chars)
+        starts = []
+        for start in range(len(seq) - len(sub) + 1):
+            mismatches = sum(not chars(a) & chars(b)
+                             for a, b in zip(str(seq)[start:], sub))
+            if mismatches <= max_mismatches:
+                starts.append(start)
+        return starts
+
+    def test_find_degenerate_matches(self):
+        rng = np.random.RandomState(0)
+        for constructor in (DNA, RNA):
+            alphabet = sorted(constructor.alphabet)
+            seq = constructor(''.join(rng.choice(alphabet, 300)))
+            for length in 1, 3, 6:
+                sub = ''.join(rng.choice(alphabet, length))
+                for max_mismatches in 0, 1, 2:
+                    obs = [s.start for s in seq.find_degenerate_matches(
+                        sub, max_mismatches=max_mismatches)]
+                    exp = self.degenerate_match_starts(seq, sub,
+                                                       max_mismatches)
+                    self.assertEqual(obs, exp)
+
+    def test_find_degenerate_matches_start_end(self):
+        for constructor in (DNA, RNA):
+            seq = constructor('AANAAGA')
+            obs = list(seq.find_degenerate_matches('AR', start=2, end=-1))
+            self.assertEqual(obs, [slice(2, 4), slice(3, 5), slice(4, 6)])
+            self.assertEqual(list(seq.find_degenerate_matches('ANNNNNNNN')),
+                             [])
+
+    def test_find_degenerate_matches_gaps_and_types(self):
+        seq = DNA('AC-GT')
+        self.assertEqual(list(seq.find_degenerate_matches('CNG')), [])
+        self.assertEqual(list(seq.find_degenerate_matches('C-G')), [])
+        self.assertEqual(
+            list(seq.find_degenerate_matches('CNG', max_mismatches=1)),
+            [slice(1, 4)])
+        self.assertEqual(list(seq.find_degenerate_matches(DNA('GT'))),
+                         [slice(3, 5)])
+
+        with self.assertRaisesRegex(TypeError, 'DNA.*RNA'):
+            list(seq.find_degenerate_matches(RNA('GU')))
+        with self.assertRaisesRegex(ValueError, 'Invalid character'):
+            list(seq.find_degenerate_matches('GU'))
+        with self.assertRaisesRegex(ValueError, 'empty'):
+            list(seq.find_degenerate_matches(''))
+        with self.assertRaisesRegex(ValueError, '`max_mismatches`.*-1'):
+            list(seq.find_degenerate_matches('A', max_mismatches=-1))
+
+    def test_degenerate_contains(self):
+        for constructor in (DNA, RNA):
+            seq = constructor('GAGAAC')
+            self.assertTrue(seq.degenerate_contains('RRM'))
+            self.assertTrue(seq.degenerate_contains('GAGAAC'))
+            self.assertFalse(seq.degenerate_contains('CC'))
+            self.assertTrue(seq.degenerate_contains('CC', max_mismatches=1))
+            self.assertFalse(seq.degenerate_contains('GAGAACA'))
+
+    def test_degenerate_index(self):
+        for constructor in (DNA, RNA):
+            seq = constructor('GAGAAC')
+            self.assertEqual(seq.degenerate_index('RRM'), 1)
+            self.assertEqual(seq.degenerate_index('RRM', start=2), 2)
+            self.assertEqual(seq.degenerate_index('CNA', max_mismatches=1),
+                             1)
+            with self.assertRaisesRegex(ValueError, 'does not match'):
+                seq.degenerate_index('RRC', end=5)
+
+    def test_degenerate_count(self):
+        for constructor in (DNA, RNA):
+            seq = constructor('AAGAANAA')
+            self.assertEqual(seq.degenerate_count('AR'), 3)
+            self.assertEqual(seq.degenerate_count('NN'), 4)
+            self.assertEqual(seq.degenerate_count('NN', start=1), 3)
+            self.assertEqual(seq.degenerate_count('CC'), 0)
+            self.assertEqual(seq.degenerate_count('CC', max_mismatches=1), 1)
+            self.assertEqual(seq.degenerate_count('CA', max_mismatches=1), 4)
+
     def test_gc_frequency_and_gc_content(self):
         universal_sets = (('', 0, 0.0), ('ADDDH', 0, 0.0), ('ACGA', 2, 0.5),
                           ('ACGS', 3, 0.75), ('AAAAAAAG', 1, 0.125),
@@ -513,6 +597,98 @@ class TestNucleotideSequence(unittest.TestCase):
                 self.assertEqual(ratio, seq.gc_frequency(relative=True))
                 self.assertEqual(ratio, seq.gc_content())
 
+    def test_window_gc_content_and_gc_skew(self):
+        for constructor in DNA, RNA:
+            seq = constructor('GGSCAT--..CCGCNGAGN'.replace(
+                'T', 'U' if constructor is RNA else 'T'))
+            for window, step in itertools.product(range(1, 21), range(1, 4)):
+                content = seq.window_gc_content(window, step=step)
+                skew = seq.window_gc_skew(window, step=step)
+                starts = list(range(0, len(seq) - window + 1, step))
+                self.assertEqual(content.index.tolist(), starts)
+                self.assertEqual(skew.index.tolist(), starts)
+                for start in starts:
+                    subseq = seq[start:start + window]
+                    self.assertAlmostEqual(content[start],
+                                           subseq.gc_content())
+                    g, c = str(subseq).count('G'), str(subseq).count('C')
+                    self.assertAlmostEqual(
+                        skew[start], (g - c) / (g + c) if g + c else 0)
+
+    def test_window_gc_content_empty(self):
+        for constructor in DNA, RNA:
+            self.assertEqual(constructor('').window_gc_content(1).shape, (0,))
+            self.assertEqual(constructor('AC').window_gc_skew(3).shape, (0,))
+
+    def test_extract_regions(self):
+        for constructor in DNA, RNA:
+            seq = constructor('ACGGTNAC-GTAAC'.replace(
+                'T', 'U' if constructor is RNA else 'T'))
+            starts = [0, 3, 5, 8, 2, 0]
+            stops = [4, 9, 5, 14, 3, 14]
+            strands = ['+', '-', '-', '-', '+', '-']
+            exp = [seq[start:stop].reverse_complement() if strand == '-'
+                   else seq[start:stop]
+                   for start, stop, strand in zip(starts, stops, strands)]
+            self.assertEqual(seq.extract_regions(starts, stops, strands), exp)
+
+            batch = seq.extract_regions(starts, stops, strands,
+                                        as_batch=True)
+            self.assertIs(batch.dtype, constructor)
+            self.assertEqual(list(batch), exp)
+
+    def test_extract_intervals(self):
+        for constructor in DNA, RNA:
+            seq = constructor('AACCGGTTAACCGGTT'.replace(
+                'T', 'U' if constructor is RNA else 'T'))
+            exons = [(1, 4), (6, 9), (12, 14)]
+            intervals = [
+                seq.interval_metadata.add(exons, metadata={'strand': '-'}),
+                seq.interval_metadata.add(exons, metadata={'strand': '+'})]
+            joined = constructor.concat([seq[a:b] for a, b in exons])
+            obs = seq.extract_intervals(intervals)
+            self.assertEqual(obs, [joined.reverse_complement(), joined])
+
+    def test_kmer_frequencies_canonical(self):
+        for constructor in DNA, RNA:
+            seq = constructor('AACGTTNA-CG'.replace(
+                'T', 'U' if constructor is RNA else 'T'))
+            obs = seq.kmer_frequencies(2, canonical=True)
+            expected = collections.Counter()
+            for kmer, count in seq.kmer_frequencies(2).items():
+                rc = str(constructor(kmer).reverse_complement())
+                expected[min(kmer, rc)] += count
+            self.assertEqual(obs, dict(expected))
+
+    def test_kmer_frequencies_canonical_long_kmers(self):
+        seq = DNA('ACGTACGTACGTACGTACGTACGTACGTACGTACGTAAAA')
+        kmer = 'ACGTACGTACGTACGTACGTACGTACGTACGTACGTA'
+        rc = str(DNA(kmer).reverse_complement())
+        obs = seq.kmer_frequencies(len(kmer), canonical=True,
+                                   overlap=False)
+        self.assertEqual(obs, {min(kmer, rc): 1})
+
+    def test_kmer_counts_canonical(self):
+        for constructor in DNA, RNA:
+            seq = constructor('AACGTTNA-CG'.replace(
+                'T', 'U' if constructor is RNA else 'T'))
+            # AA AC AG AT CA CC CG CT GA GC GG GT TA TC TG TT
+            npt.assert_equal(
+                seq.kmer_counts(2, canonical=True),
+                np.array([2, 2, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0]))
+            npt.assert_equal(
+                seq.kmer_counts(2),
+                np.array([1, 1, 0, 0, 0, 0, 2, 0, 0, 0, 0, 1, 0, 0, 0, 1]))
+
+    def test_kmer_codes_canonical(self):
+        for constructor in DNA, RNA:
+            seq = constructor('AACGTTNA-CG'.replace(
+                'T', 'U' if constructor is RNA else 'T'))
+            # AA AC AG AT CA CC CG CT GA GC GG GT TA TC TG TT
+            codes, starts = seq.kmer_codes(2, canonical=True)
+            npt.assert_equal(codes, np.array([0, 1, 6, 1, 0, 6]))
+            npt.assert_equal(starts, np.array([0, 1, 2, 3, 4, 9]))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,191 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+import copy
+from unittest import TestCase, main, mock
+
+import numpy as np
+
+from skbio import DNA, RNA, Protein
+from skbio.sequence import PackedSequence
+
+
+class TestPackedSequence(TestCase):
+    def setUp(self):
+        self.seqs = [
+            DNA(''),
+            DNA('A'),
+            DNA('ACGTA'),
+            DNA('NNNN'),
+            DNA('ACGTNNNNACGTRYSW-.ACG', metadata={'id': 'x'}),
+            DNA('GGGGCCCCNNNNNNNNAAAATTTT-'),
+            RNA('ACGUUNAC-G'),
+        ]
+
+    def test_init_from_sequence(self):
+        for seq in self.seqs:
+            packed = PackedSequence(seq)
+            self.assertIs(packed.dtype, type(seq))
+            self.assertEqual(len(packed), len(seq))
+            self.assertEqual(packed.unpack(), seq)
+            self.assertEqual(str(packed), str(seq))
+            self.assertEqual(packed.has_metadata(), seq.has_metadata())
+
+    def test_init_from_str_and_bytes(self):
+        for data in ('ACGN', b'ACGN', np.array([65, 67, 71, 78],
+                                               dtype=np.uint8)):
+            packed = PackedSequence(data, metadata={'id': 'a'})
+            self.assertEqual(packed.unpack(), DNA('ACGN',
+                                                  metadata={'id': 'a'}))
+
+        packed = PackedSequence('ACGU', dtype=RNA)
+        self.assertEqual(packed.unpack(), RNA('ACGU'))
+
+    def test_init_invalid(self):
+        with self.assertRaisesRegex(ValueError, 'Invalid character'):
+            PackedSequence('ACGU')
+        with self.assertRaisesRegex(TypeError, 'DNA or RNA'):
+            PackedSequence('ACGT', dtype=Protein)
+        with self.assertRaisesRegex(TypeError, 'does not match'):
+            PackedSequence(DNA('ACGT'), dtype=RNA)
+        with self.assertRaisesRegex(TypeError, 'np.uint8'):
+            PackedSequence(np.array([1, 2, 3]))
+
+    def test_chunked_packing(self):
+        # runs of side table characters split across chunks are merged
+        seq = DNA('ACNNNNNNNNGTNNRRAC')
+        with mock.patch('skbio.sequence._packed._chunk_size', 4):
+            packed = PackedSequence(seq)
+            self.assertEqual(packed.unpack(), seq)
+            self.assertEqual(list(packed.iter_kmers(3)),
+                             list(seq.iter_kmers(3)))
+            self.assertEqual(packed.kmer_frequencies(3),
+                             seq.kmer_frequencies(3))
+            self.assertEqual(packed.gc_frequency(), seq.gc_frequency())
+        self.assertEqual(packed, PackedSequence(seq))
+        self.assertEqual(repr(packed).count('side table runs: 3'), 1)
+
+    def test_nbytes(self):
+        packed = PackedSequence(DNA('ACGT' * 100 + 'N' * 1000))
+        # 350 bytes of packed data plus a single side table run
+        self.assertEqual(packed.nbytes, 350 + 8 + 8 + 1)
+
+    def test_getitem(self):
+        for seq in self.seqs:
+            packed = PackedSequence(seq)
+            for i in range(-len(seq), len(seq)):
+                self.assertEqual(packed[i], seq[i])
+            for indexable in (slice(None), slice(1, 7), slice(3, None, 2),
+                              slice(None, None, -1), slice(9, 2, -3),
+                              slice(4, 4), slice(100, 200)):
+                self.assertEqual(packed[indexable], seq[indexable])
+
+    def test_getitem_invalid(self):
+        packed = PackedSequence(DNA('ACGT'))
+        for i in 4, -5:
+            with self.assertRaises(IndexError):
+                packed[i]
+        with self.assertRaisesRegex(TypeError, 'int or a slice'):
+            packed[[0, 1]]
+
+    def test_complement(self):
+        for seq in self.seqs:
+            packed = PackedSequence(seq)
+            self.assertEqual(packed.complement(),
+                             PackedSequence(seq.complement()))
+            self.assertEqual(packed.complement(reverse=True),
+                             PackedSequence(seq.reverse_complement()))
+            self.assertEqual(packed.reverse_complement(),
+                             PackedSequence(seq.reverse_complement()))
+            self.assertEqual(packed.reverse_complement().unpack(),
+                             seq.reverse_complement())
+            self.assertEqual(
+                packed.reverse_complement().reverse_complement(), packed)
+
+    def test_gc(self):
+        for seq in self.seqs:
+            packed = PackedSequence(seq)
+            self.assertEqual(packed.gc_frequency(), seq.gc_frequency())
+            self.assertAlmostEqual(packed.gc_frequency(relative=True),
+                                   seq.gc_frequency(relative=True))
+            self.assertAlmostEqual(packed.gc_content(), seq.gc_content())
+            # side table positions are never counted after complementing
+            self.assertEqual(packed.reverse_complement().gc_frequency(),
+                             seq.gc_frequency())
+
+        self.assertEqual(PackedSequence(DNA('--')).gc_content(), 0.0)
+
+    def test_kmer_frequencies(self):
+        for seq in self.seqs:
+            packed = PackedSequence(seq)
+            for k in 1, 2, 3, 7:
+                for overlap in True, False:
+                    for relative in True, False:
+                        self.assertEqual(
+                            packed.kmer_frequencies(k, overlap=overlap,
+                                                    relative=relative),
+                            seq.kmer_frequencies(k, overlap=overlap,
+                                                 relative=relative))
+                    self.assertEqual(
+                        packed.kmer_frequencies(k, overlap=overlap,
+                                                canonical=True),
+                        seq.kmer_frequencies(k, overlap=overlap,
+                                             canonical=True))
+
+        with self.assertRaisesRegex(ValueError, 'k must be greater than 0'):
+            PackedSequence(DNA('ACGT')).kmer_frequencies(0)
+
+    def test_iter_kmers(self):
+        for seq in self.seqs:
+            packed = PackedSequence(seq)
+            for k in 1, 2, 3, 7:
+                for overlap in True, False:
+                    self.assertEqual(
+                        list(packed.iter_kmers(k, overlap=overlap)),
+                        list(seq.iter_kmers(k, overlap=overlap)))
+
+        with self.assertRaisesRegex(ValueError, 'k must be greater than 0'):
+            list(PackedSequence(DNA('ACGT')).iter_kmers(0))
+
+    def test_eq(self):
+        packed = PackedSequence(DNA('ACGTN', metadata={'id': 'a'}))
+        self.assertTrue(packed == PackedSequence(DNA('ACGTN',
+                                                     metadata={'id': 'a'})))
+        self.assertFalse(packed != PackedSequence(DNA('ACGTN',
+                                                      metadata={'id': 'a'})))
+
+        for other in (PackedSequence(DNA('ACGTN')),
+                      PackedSequence(DNA('ACGTA', metadata={'id': 'a'})),
+                      PackedSequence(DNA('ACGAN', metadata={'id': 'a'})),
+                      PackedSequence(DNA('ACGTNA', metadata={'id': 'a'})),
+                      PackedSequence(RNA('ACGUN', metadata={'id': 'a'})),
+                      DNA('ACGTN', metadata={'id': 'a'})):
+            self.assertFalse(packed == other)
+            self.assertTrue(packed != other)
+
+    def test_copy(self):
+        packed = PackedSequence(DNA('ACGTN', metadata={'id': ['a']}))
+        for copy_method in copy.copy, copy.deepcopy:
+            duplicate = copy_method(packed)
+            self.assertEqual(duplicate, packed)
+            self.assertIsNot(duplicate.metadata, packed.metadata)
+
+        self.assertIs(copy.copy(packed).metadata['id'], packed.metadata['id'])
+        self.assertIsNot(copy.deepcopy(packed).metadata['id'],
+                         packed.metadata['id'])
+
+    def test_repr(self):
+        obs = repr(PackedSequence(DNA('ACGTN' * 20)))
+        self.assertTrue(obs.startswith('PackedSequence[DNA]\n'))
+        self.assertIn('length: 100', obs)
+        self.assertIn('side table runs: 20', obs)
+        self.assertTrue(obs.endswith('ACGTN' * 10 + '...'))
+
+
+if __name__ == '__main__':
+    main()
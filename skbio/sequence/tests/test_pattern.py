@@ -0,0 +1,152 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+import re
+from unittest import TestCase, main
+
+import numpy as np
+import pandas as pd
+import pandas.util.testing as pdt
+
+from skbio import Sequence, DNA, RNA, Protein
+from skbio.sequence import PatternMatcher, SequenceBatch
+
+
+class TestPatternMatcher(TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.sequences = [
+            DNA(''.join(rng.choice(list('ACGT'), n)))
+            for n in (0, 3, 50, 2000, 17, 400)]
+        self.patterns = ['ACG', 'CGTA', 'A', 'GGNNC', 'TTRYA', 'ACGTACG',
+                         'ACG']
+
+    def brute_force(self, patterns, sequence, dtype=DNA):
+        hits = []
+        for i, pattern in enumerate(patterns):
+            regex = ''.join(
+                '[%s]' % ''.join(sorted(dtype.degenerate_map[c]))
+                if c in dtype.degenerate_map else c for c in pattern)
+            for match in re.finditer('(?=%s)' % regex, str(sequence)):
+                hits.append((i, match.start(), match.start() + len(pattern)))
+        return sorted(hits, key=lambda hit: (hit[1], hit[0]))
+
+    def test_search_sequence(self):
+        matcher = PatternMatcher(self.patterns, dtype=DNA)
+        for sequence in self.sequences:
+            obs = matcher.search(sequence)
+            self.assertEqual(list(obs.columns), ['pattern', 'start', 'stop'])
+            self.assertEqual(
+                list(obs.itertuples(index=False, name=None)),
+                self.brute_force(self.patterns, sequence))
+
+    def test_search_batch(self):
+        matcher = PatternMatcher(self.patterns, dtype=DNA)
+        batch = SequenceBatch.from_sequences(self.sequences)
+        obs = matcher.search(batch)
+        self.assertEqual(list(obs.columns),
+                         ['sequence', 'pattern', 'start', 'stop'])
+
+        exp = [(i,) + hit for i, sequence in enumerate(self.sequences)
+               for hit in self.brute_force(self.patterns, sequence)]
+        self.assertEqual(list(obs.itertuples(index=False, name=None)), exp)
+
+    def test_search_matches_spanning_segments(self):
+        # a long sequence of repeats is split into many overlapping segments
+        sequence = DNA('ACGTAC' * 5000)
+        patterns = ['GTACACG', 'TACA', 'CGTACGTA']
+        matcher = PatternMatcher(patterns, dtype=DNA)
+        obs = matcher.search(sequence)
+        self.assertEqual(len(obs), 2 * 4999)
+        self.assertEqual(list(obs.itertuples(index=False, name=None)),
+                         self.brute_force(patterns, sequence))
+
+    def test_search_no_matches(self):
+        matcher = PatternMatcher(['GGG'], dtype=DNA)
+        obs = matcher.search(DNA('ACGTACGT'))
+        exp = pd.DataFrame({'pattern': np.array([], dtype=np.int64),
+                            'start': np.array([], dtype=np.int64),
+                            'stop': np.array([], dtype=np.int64)},
+                           columns=['pattern', 'start', 'stop'])
+        pdt.assert_frame_equal(obs, exp)
+
+        self.assertEqual(len(matcher.search(DNA(''))), 0)
+        self.assertEqual(len(matcher.search(SequenceBatch.from_sequences(
+            [], dtype=DNA))), 0)
+
+    def test_ids(self):
+        matcher = PatternMatcher([DNA('AC'), DNA('CG')], ids=['x', 'y'])
+        np.testing.assert_array_equal(matcher.ids, ['x', 'y'])
+        obs = matcher.search(DNA('ACGAC'))
+        exp = pd.DataFrame({'pattern': ['x', 'y', 'x'], 'start': [0, 1, 3],
+                            'stop': [2, 3, 5]},
+                           columns=['pattern', 'start', 'stop'])
+        pdt.assert_frame_equal(obs, exp)
+
+        np.testing.assert_array_equal(PatternMatcher(['A', 'C']).ids, [0, 1])
+
+    def test_dtype_inferred_from_patterns(self):
+        matcher = PatternMatcher([RNA('ANU')])
+        self.assertIn('PatternMatcher[RNA]', repr(matcher))
+        self.assertEqual(len(matcher.search(RNA('ACUAGU'))), 2)
+
+    def test_not_degenerate(self):
+        matcher = PatternMatcher(['ANA'], dtype=DNA, degenerate=False)
+        obs = matcher.search(DNA('ACAANA'))
+        self.assertEqual(list(obs.itertuples(index=False, name=None)),
+                         [(0, 3, 6)])
+
+        # generic sequences don't have degenerate characters
+        obs = PatternMatcher(['NN']).search(Sequence('NNAN'))
+        self.assertEqual(list(obs.itertuples(index=False, name=None)),
+                         [(0, 0, 2)])
+
+    def test_protein(self):
+        matcher = PatternMatcher(['NXS', 'NXT'], dtype=Protein)
+        sequence = Protein('MNASKNKTANSS')
+        self.assertEqual(
+            list(matcher.search(sequence).itertuples(index=False, name=None)),
+            self.brute_force(['NXS', 'NXT'], sequence, dtype=Protein))
+
+    def test_search_invalid_type(self):
+        matcher = PatternMatcher(['A'])
+        with self.assertRaisesRegex(TypeError, 'Sequence.*str'):
+            matcher.search('AAA')
+
+    def test_init_invalid(self):
+        with self.assertRaisesRegex(ValueError, 'empty'):
+            PatternMatcher(['A', ''])
+        with self.assertRaisesRegex(ValueError, r'IDs \(1\).*\(2\)'):
+            PatternMatcher(['A', 'C'], ids=['a'])
+        with self.assertRaisesRegex(TypeError, 'DNA.*RNA'):
+            PatternMatcher([DNA('A'), RNA('A')])
+        with self.assertRaisesRegex(ValueError, 'Invalid character'):
+            PatternMatcher(['AXA'], dtype=DNA)
+        with self.assertRaisesRegex(ValueError, "'big'.*1000"):
+            PatternMatcher(['NNNNNN'], ids=['big'], dtype=DNA,
+                           max_expansions=1000)
+
+    def test_len_and_repr(self):
+        matcher = PatternMatcher(['AC', 'ACGT'], dtype=DNA)
+        self.assertEqual(len(matcher), 2)
+        self.assertEqual(matcher.num_states, 5)
+        obs = repr(matcher)
+        self.assertTrue(obs.startswith('PatternMatcher[DNA]\n'))
+        self.assertIn('pattern count: 2', obs)
+        self.assertIn('automaton states: 5', obs)
+        self.assertIn('min length: 2', obs)
+        self.assertIn('max length: 4', obs)
+        self.assertEqual(str(matcher), obs)
+
+        empty = PatternMatcher([], dtype=DNA)
+        self.assertEqual(len(empty), 0)
+        self.assertEqual(len(empty.search(DNA('ACGT'))), 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -10,8 +10,9 @@ import copy
 import functools
 import itertools
 import re
+import tempfile
 from types import GeneratorType
-from collections import Hashable
+from collections import Counter, Hashable
 from unittest import TestCase, main
 
 import numpy as np
@@ -145,6 +146,33 @@ class TestSequence(TestSequenceBase, ReallyEqualMixin):
             [(9, 11)], [(False, True)], {'gene': 'sagB'})
         self.assertEqual(exp, obs)
 
+    def test_concat_interval_metadata_not_created_on_inputs(self):
+        seq1 = DNA('ACGT')
+        seq2 = DNA('AC')
+        seq2.interval_metadata.add([(0, 1)], metadata={'gene': 'sagA'})
+        seq3 = DNA('GGT')
+        obs = DNA.concat([seq1, seq2, seq3, seq2])
+        self.assertIsNone(seq1._interval_metadata)
+        self.assertIsNone(seq3._interval_metadata)
+        self.assertEqual(obs.interval_metadata.upper_bound, 11)
+        self.assertEqual([i.bounds for i in obs.interval_metadata.query(
+            metadata={'gene': 'sagA'})], [[(4, 5)], [(9, 10)]])
+        # the concatenated interval metadata is independent of the inputs
+        obs.interval_metadata.add([(0, 11)])
+        self.assertEqual(seq2.interval_metadata.num_interval_features, 1)
+
+    def test_concat_interval_metadata_independent_of_inputs(self):
+        seq1 = DNA('ACGT')
+        seq1.interval_metadata.add([(0, 2)], metadata={'gene': 'x'})
+        obs = DNA.concat([seq1, DNA('GG'), seq1])
+        for intvl in list(obs.interval_metadata.query(
+                metadata={'gene': 'x'})):
+            intvl.metadata['gene'] = 'CHANGED'
+            intvl.bounds = [(1, 3)]
+        intvl, = seq1.interval_metadata.query(metadata={'gene': 'x'})
+        self.assertEqual(intvl.bounds, [(0, 2)])
+        self.assertEqual(seq1.interval_metadata.num_interval_features, 1)
+
     def test_concat_default_how(self):
         seq1 = Sequence("1234", positional_metadata={'a': [1]*4})
         seq2 = Sequence("5678", positional_metadata={'a': [2]*4})
@@ -234,6 +262,52 @@ class TestSequence(TestSequenceBase, ReallyEqualMixin):
         self.assertEqual(result, expected)
         self.assertFalse(result.metadata)
 
+    def test_concat_outer_mixed_dtypes(self):
+        seqs = [Sequence("12", positional_metadata={
+                    'a': [1, 2], 'b': [True, False]}),
+                Sequence(""),
+                Sequence("3", positional_metadata={'a': [0.5]}),
+                Sequence("45"),
+                Sequence("6", positional_metadata={
+                    'b': [True], 'c': np.array([7], np.int32)})]
+        result = Sequence.concat(seqs, how='outer')
+        expected = pd.concat([seq.positional_metadata for seq in seqs],
+                             ignore_index=True)
+        assert_data_frame_almost_equal(result.positional_metadata, expected)
+        self.assertEqual(list(result.positional_metadata.dtypes),
+                         list(expected.dtypes))
+        self.assertEqual(str(result), '123456')
+
+    def test_concat_categorical_positional_metadata(self):
+        seq1 = Sequence("12", positional_metadata={
+            'a': pd.Categorical(['x', 'y'])})
+        seq2 = Sequence("3", positional_metadata={
+            'a': pd.Categorical(['x'], categories=['x', 'y'])})
+        result = Sequence.concat([seq1, seq2])
+        self.assertEqual(str(result), '123')
+        self.assertEqual(result.positional_metadata['a'].dtype.name,
+                         'category')
+        self.assertEqual(list(result.positional_metadata['a']),
+                         ['x', 'y', 'x'])
+
+    def test_concat_many(self):
+        seqs = [Sequence(str(i % 10) * (i % 3), metadata={'id': str(i)},
+                         positional_metadata={'a': [i] * (i % 3)})
+                for i in range(1000)]
+        result = Sequence.concat(seqs)
+        self.assertEqual(str(result), ''.join(str(s) for s in seqs))
+        npt.assert_array_equal(result.positional_metadata['a'].values,
+                               np.repeat(np.arange(1000),
+                                         np.arange(1000) % 3))
+        self.assertFalse(result.has_interval_metadata())
+
+    def test_concat_does_not_add_metadata_to_inputs(self):
+        seqs = [Sequence("12"), Sequence("34")]
+        Sequence.concat(seqs, how='outer')
+        for seq in seqs:
+            self.assertIsNone(seq._positional_metadata)
+            self.assertIsNone(seq._interval_metadata)
+
     def test_init_default_parameters(self):
         seq = Sequence('.ABC123xyz-')
 
@@ -447,6 +521,114 @@ class TestSequence(TestSequenceBase, ReallyEqualMixin):
         with self.assertRaises(ValueError):
             bytes[1] = 42
 
+    def test_init_from_bytes_shares_memory(self):
+        data = b'ACGT'
+        seq = Sequence(data)
+        self.assertEqual(seq, Sequence('ACGT'))
+        self.assertFalse(seq._owns_bytes)
+        self.assertFalse(seq._bytes.flags.writeable)
+        self.assertTrue(np.may_share_memory(seq._bytes,
+                                            np.frombuffer(data, np.uint8)))
+
+    def test_init_from_bytes_lowercase(self):
+        data = b'AcgT'
+        seq = Sequence(data, lowercase=True)
+        self.assertEqual(seq, Sequence('ACGT'))
+        self.assertEqual(data, b'AcgT')
+
+    def test_init_from_memmap(self):
+        with tempfile.NamedTemporaryFile() as f:
+            f.write(b'ACGTACGGA')
+            f.flush()
+            mm = np.memmap(f.name, dtype=np.uint8, mode='r')
+            seq = Sequence(mm)
+            self.assertIs(type(seq._bytes), np.ndarray)
+            self.assertTrue(np.may_share_memory(seq._bytes, mm))
+            self.assertIs(type(seq[2:5]._bytes), np.ndarray)
+            self.assertEqual(seq[2:5], Sequence('GTA'))
+            del seq, mm
+
+    def test_from_buffer(self):
+        data = bytearray(b'>s1\nACGTACGGA\n')
+        seq = Sequence.from_buffer(data, offset=4, length=9,
+                                   metadata={'id': 's1'})
+        self.assertEqual(seq, Sequence('ACGTACGGA', metadata={'id': 's1'}))
+        self.assertFalse(seq._owns_bytes)
+        self.assertFalse(seq._bytes.flags.writeable)
+
+        # the buffer is shared, not copied
+        data[4] = ord('T')
+        self.assertEqual(str(seq), 'TCGTACGGA')
+
+        # slicing returns views of the buffer
+        sliced = seq[2:6]
+        self.assertEqual(str(sliced), 'GTAC')
+        self.assertFalse(sliced._owns_bytes)
+        data[6] = ord('C')
+        self.assertEqual(str(sliced), 'CTAC')
+
+        # modifying characters makes a copy
+        data = bytearray(b'acgt')
+        seq = Sequence.from_buffer(data, lowercase=True)
+        self.assertEqual(str(seq), 'ACGT')
+        self.assertEqual(data, bytearray(b'acgt'))
+
+    def test_from_buffer_defaults(self):
+        self.assertEqual(Sequence.from_buffer(b'ACGT'), Sequence('ACGT'))
+        self.assertEqual(Sequence.from_buffer(b'ACGT', offset=4), Sequence(''))
+        self.assertEqual(Sequence.from_buffer(b''), Sequence(''))
+        self.assertEqual(Sequence.from_buffer(memoryview(b'ACGT'), offset=1,
+                                              length=2), Sequence('CG'))
+        self.assertIs(type(SequenceSubclass.from_buffer(b'AC')),
+                      SequenceSubclass)
+
+    def test_from_buffer_ndarray(self):
+        data = np.array([65, 67, 71, 84], dtype=np.uint8)
+        seq = Sequence.from_buffer(data, offset=1)
+        self.assertEqual(seq, Sequence('CGT'))
+        self.assertTrue(np.may_share_memory(seq._bytes, data))
+        # the caller's array is not made read-only
+        self.assertTrue(data.flags.writeable)
+
+        data = np.array(list('ACGT'), dtype='|S1')
+        seq = Sequence.from_buffer(data, length=2)
+        self.assertEqual(seq, Sequence('AC'))
+        self.assertTrue(np.may_share_memory(seq._bytes, data))
+
+        with tempfile.NamedTemporaryFile() as f:
+            f.write(b'ACGTACGGA')
+            f.flush()
+            mm = np.memmap(f.name, dtype=np.uint8, mode='r')
+            seq = DNA.from_buffer(mm, offset=2)
+            self.assertEqual(seq, DNA('GTACGGA'))
+            self.assertIs(type(seq._bytes), np.ndarray)
+            self.assertTrue(np.may_share_memory(seq._bytes, mm))
+            del seq, mm
+
+    def test_from_buffer_validates(self):
+        with self.assertRaisesRegex(ValueError, 'Invalid character.*X'):
+            DNA.from_buffer(b'ACGX')
+        seq = DNA.from_buffer(b'ACGX', validate=False)
+        self.assertEqual(str(seq), 'ACGX')
+
+    def test_from_buffer_invalid(self):
+        with self.assertRaisesRegex(TypeError, 'int64'):
+            Sequence.from_buffer(np.array([1, 2, 3]))
+        with self.assertRaisesRegex(ValueError, 'C-contiguous'):
+            Sequence.from_buffer(np.array([65, 66, 67], dtype=np.uint8)[::2])
+        with self.assertRaisesRegex(ValueError, '1D'):
+            Sequence.from_buffer(np.zeros((2, 2), dtype=np.uint8))
+        with self.assertRaisesRegex(ValueError, '`offset`.*-1'):
+            Sequence.from_buffer(b'ACGT', offset=-1)
+        with self.assertRaisesRegex(ValueError, '`length`.*-1'):
+            Sequence.from_buffer(b'ACGT', length=-1)
+        with self.assertRaisesRegex(ValueError, r'`offset` \(5\).*\(4\)'):
+            Sequence.from_buffer(b'ACGT', offset=5)
+        with self.assertRaisesRegex(ValueError, r'\+ `length` \(5\).*\(4\)'):
+            Sequence.from_buffer(b'ACGT', offset=2, length=3)
+        with self.assertRaisesRegex(TypeError, 'str'):
+            Sequence.from_buffer('ACGT')
+
     def test_init_invalid_sequence(self):
         # invalid dtype (numpy.ndarray input)
         with self.assertRaises(TypeError):
@@ -709,8 +891,9 @@ class TestSequence(TestSequenceBase, ReallyEqualMixin):
 
     def test_slice_positional_metadata(self):
         seq = Sequence('ABCDEFGHIJ',
-                       positional_metadata={'foo': np.arange(10),
-                                            'bar': np.arange(100, 110)})
+                       positional_metadata=pd.DataFrame(
+                           {'foo': np.arange(10),
+                            'bar': np.arange(100, 110)}))
         self.assertTrue(pd.DataFrame({'foo': [0], 'bar': [100]}).equals(
                         seq._slice_positional_metadata(0)))
         self.assertTrue(pd.DataFrame({'foo': [0], 'bar': [100]}).equals(
@@ -722,6 +905,78 @@ class TestSequence(TestSequenceBase, ReallyEqualMixin):
             {'foo': [9], 'bar': [109]}, index=[9]).equals(
                 seq._slice_positional_metadata(9)))
 
+    def test_slice_positional_metadata_columns(self):
+        seq = Sequence('ABCDEFGHIJ',
+                       positional_metadata={'foo': np.arange(10),
+                                            'bar': np.arange(100, 110)})
+        for index, exp_foo in ((0, [0]), (slice(0, 2), [0, 1]), (9, [9]),
+                               (np.array([True, False] * 5), [0, 2, 4, 6, 8]),
+                               (np.array([3, 1]), [3, 1])):
+            obs = seq._slice_positional_metadata(index)
+            self.assertIsInstance(obs, dict)
+            self.assertEqual(list(obs), ['foo', 'bar'])
+            npt.assert_array_equal(obs['foo'], exp_foo)
+            npt.assert_array_equal(obs['bar'], np.asarray(exp_foo) + 100)
+
+    def test_positional_metadata_column_store(self):
+        quality = np.array([3, 20, 11, 40, 2], dtype=np.uint8)
+        seq = DNA('ACGTA', metadata={'id': 'r1'},
+                  positional_metadata={'quality': quality})
+        # The arrays are copied, and no DataFrame is created until needed.
+        self.assertIsInstance(seq._positional_metadata, dict)
+        self.assertIsNot(seq._positional_metadata['quality'], quality)
+        self.assertTrue(seq.has_positional_metadata())
+
+        # Slicing, copying, and comparing keep the column store.
+        sliced = [seq[1:4], seq[[0, 2, 4]], seq[np.array([1, 3])],
+                  seq[[slice(0, 1), slice(3, 5)]], seq[3],
+                  copy.copy(seq), copy.deepcopy(seq), DNA(seq), seq[::-1]]
+        self.assertEqual(seq, copy.copy(seq))
+        self.assertNotEqual(seq, DNA('ACGTA', metadata={'id': 'r1'},
+                                     positional_metadata={
+                                         'quality': quality[::-1]}))
+        for obj in sliced + [seq]:
+            self.assertIsInstance(obj._positional_metadata, dict)
+
+        exp = [[20, 11, 40], [3, 11, 2], [20, 40], [3, 40, 2], [40],
+               quality, quality, quality, quality[::-1]]
+        for obs, exp_quality in zip(sliced, exp):
+            self.assertEqual(obs.positional_metadata['quality'].tolist(),
+                             list(exp_quality))
+            self.assertEqual(obs.positional_metadata['quality'].dtype,
+                             np.uint8)
+            self.assertIsInstance(obs.positional_metadata.index,
+                                  pd.RangeIndex)
+
+        # Objects don't share memory: the DataFrame of a slice or copy can be
+        # modified in place.
+        self.assertEqual(seq[:3].positional_metadata.loc[0, 'quality'], 3)
+        view = seq[:3]
+        view.positional_metadata.loc[0, 'quality'] = 99
+        self.assertEqual(seq.positional_metadata.loc[0, 'quality'], 3)
+        self.assertIsInstance(seq._positional_metadata, pd.DataFrame)
+
+    def test_positional_metadata_column_store_eq(self):
+        def make(**columns):
+            return Sequence('ACG', positional_metadata=columns)
+
+        ints = np.array([1, 2, 3])
+        self.assertEqual(make(a=ints), make(a=ints.copy()))
+        self.assertEqual(make(a=ints), Sequence('ACG', positional_metadata={
+            'a': [1, 2, 3]}))
+        self.assertNotEqual(make(a=ints), make(b=ints))
+        self.assertNotEqual(make(a=ints), make(a=ints, b=ints))
+        self.assertNotEqual(make(a=ints), make(a=ints.astype(np.int8)))
+        floats = np.array([1.5, np.nan, 3])
+        self.assertEqual(make(a=floats), make(a=floats.copy()))
+        self.assertNotEqual(make(a=floats), make(a=np.array([1.5, 2, 3])))
+        objs = np.array([[], 'x', None], dtype=object)
+        self.assertEqual(make(a=objs, b=ints), make(a=objs.copy(), b=ints))
+        self.assertEqual(Sequence('ACG', positional_metadata={'a': ints,
+                                                              'b': floats}),
+                         Sequence('ACG', positional_metadata={'b': floats,
+                                                              'a': ints}))
+
     def test_getitem_with_int_no_positional_metadata(self):
         seq = Sequence("Sequence string !1@2#3?.,",
                        metadata={'id': 'id2', 'description': 'no_qual'})
@@ -1817,6 +2072,94 @@ class TestSequence(TestSequenceBase, ReallyEqualMixin):
         expected = []
         self._compare_kmers_results(seq.iter_kmers(3, overlap=False), expected)
 
+    def test_kmer_windows(self):
+        seq = Sequence('GATTACA', positional_metadata={'quality': range(7)})
+        for k, overlap in itertools.product(range(1, 9), (True, False)):
+            windows, starts = seq.kmer_windows(k, overlap=overlap)
+            exp = list(seq.iter_kmers(k, overlap=overlap))
+            self.assertEqual(windows.shape, (len(exp), k))
+            self.assertEqual(windows.dtype, np.uint8)
+            self.assertFalse(windows.flags.writeable)
+            if len(exp):
+                self.assertTrue(np.may_share_memory(windows, seq._bytes))
+            self.assertEqual([Sequence(w) for w in windows],
+                             [Sequence(str(kmer)) for kmer in exp])
+            npt.assert_array_equal(
+                starts, np.arange(len(exp)) * (1 if overlap else k))
+
+    def test_kmer_windows_empty_sequence(self):
+        windows, starts = Sequence('').kmer_windows(3)
+        self.assertEqual(windows.shape, (0, 3))
+        self.assertEqual(starts.shape, (0,))
+
+    def test_kmer_windows_invalid_k(self):
+        with self.assertRaisesRegex(ValueError, 'k must be greater than 0'):
+            Sequence('GATTACA').kmer_windows(0)
+
+    def test_window_frequencies(self):
+        seq = Sequence('AAGAGGCCAT')
+        for window, step in itertools.product(range(1, 12), range(1, 4)):
+            obs = seq.window_frequencies(window, step=step)
+            starts = list(range(0, len(seq) - window + 1, step))
+            self.assertEqual(obs.index.tolist(), starts)
+            self.assertEqual(obs.index.name, 'start')
+            self.assertEqual(obs.columns.tolist(), ['A', 'C', 'G', 'T'])
+            for start in starts:
+                freqs = seq[start:start + window].frequencies()
+                self.assertEqual(
+                    {c: n for c, n in obs.loc[start].items() if n},
+                    freqs)
+
+    def test_window_frequencies_specified_chars(self):
+        seq = Sequence('AAGAGGCC')
+        obs = seq.window_frequencies(4, step=4, chars={'G', 'A', 'T'})
+        exp = pd.DataFrame([[3, 1, 0], [0, 2, 0]],
+                           index=pd.RangeIndex(0, 8, 4, name='start'),
+                           columns=['A', 'G', 'T'])
+        assert_data_frame_almost_equal(obs, exp)
+
+        obs = seq.window_frequencies(3, step=2, chars=b'G', relative=True)
+        exp = pd.DataFrame([[1 / 3], [2 / 3], [2 / 3]],
+                           index=pd.RangeIndex(0, 6, 2, name='start'),
+                           columns=['G'])
+        assert_data_frame_almost_equal(obs, exp)
+
+    def test_window_frequencies_empty(self):
+        obs = Sequence('').window_frequencies(3)
+        self.assertEqual(obs.shape, (0, 0))
+        obs = Sequence('ACGT').window_frequencies(5, chars='A')
+        self.assertEqual(obs.shape, (0, 1))
+
+    def test_window_frequencies_invalid(self):
+        seq = Sequence('ACGT')
+        with self.assertRaisesRegex(ValueError, '`window`.*0'):
+            seq.window_frequencies(0)
+        with self.assertRaisesRegex(ValueError, '`step`.*-1'):
+            seq.window_frequencies(2, step=-1)
+        with self.assertRaisesRegex(TypeError, '`chars`.*list'):
+            seq.window_frequencies(2, chars=['A'])
+
+    def test_window_entropy(self):
+        seq = Sequence('AAAAACGTACAC')
+        obs = seq.window_entropy(4, step=4)
+        exp = pd.Series([0.0, 2.0, 1.0], index=pd.Index([0, 4, 8]))
+        npt.assert_almost_equal(obs.values, exp.values)
+        npt.assert_array_equal(obs.index, exp.index)
+
+        obs = seq.window_entropy(4, base=4)
+        self.assertEqual(len(obs), 9)
+        for start, entropy in obs.items():
+            counts = np.array(list(
+                seq[start:start + 4].frequencies().values()))
+            probs = counts / 4
+            self.assertAlmostEqual(
+                entropy, -(probs * np.log(probs) / np.log(4)).sum())
+
+    def test_window_entropy_empty(self):
+        obs = Sequence('').window_entropy(1)
+        self.assertEqual(obs.shape, (0,))
+        self.assertEqual(obs.dtype, np.float64)
+
     def test_kmer_frequencies_empty_sequence(self):
         seq = Sequence('')
 
@@ -1897,6 +2240,45 @@ class TestSequence(TestSequenceBase, ReallyEqualMixin):
         seq = Sequence('AAAAAAAAAA')
         self.assertEqual(seq.kmer_frequencies(1, relative=True), {'A': 1.0})
 
+    def test_kmer_frequencies_k_longer_than_sequence(self):
+        seq = Sequence('AC')
+        self.assertEqual(seq.kmer_frequencies(5), {})
+        self.assertEqual(seq.kmer_frequencies(5, overlap=False), {})
+
+    def test_kmer_frequencies_invalid_k(self):
+        seq = Sequence('GATTACA')
+        with self.assertRaisesRegex(ValueError, 'k must be greater than 0'):
+            seq.kmer_frequencies(0)
+
+    def test_kmer_frequencies_matches_iter_kmers(self):
+        seq = Sequence('ACGTN-.acgtxyzACGTACGTTTTAGC' * 7 + 'A')
+        for k in 1, 2, 3, 7, 30:
+            for overlap in True, False:
+                expected = Counter(
+                    str(kmer) for kmer in seq.iter_kmers(k, overlap=overlap))
+                self.assertEqual(seq.kmer_frequencies(k, overlap=overlap),
+                                 dict(expected))
+
+    def test_kmer_frequencies_long_kmers(self):
+        # too many possible kmers to be encoded as 64-bit integers
+        seq = Sequence('ABCDEFGHIJKLMNOPQRSTUVWXYZ' * 2)
+        self.assertEqual(seq.kmer_frequencies(26, overlap=False),
+                         {'ABCDEFGHIJKLMNOPQRSTUVWXYZ': 2})
+        obs = seq.kmer_frequencies(26)
+        self.assertEqual(len(obs), 26)
+        self.assertEqual(obs['ABCDEFGHIJKLMNOPQRSTUVWXYZ'], 2)
+        self.assertEqual(obs['ZABCDEFGHIJKLMNOPQRSTUVWXY'], 1)
+
+    def test_kmer_frequencies_nul_characters(self):
+        seq = Sequence(np.array([65, 0, 0, 65, 0], dtype=np.uint8))
+        self.assertEqual(seq.kmer_frequencies(2),
+                         {'A\x00': 2, '\x00\x00': 1, '\x00A': 1})
+
+    def test_kmer_frequencies_canonical_unsupported(self):
+        seq = Sequence('ACGT')
+        with self.assertRaisesRegex(TypeError, 'Canonical.*Sequence'):
+            seq.kmer_frequencies(2, canonical=True)
+
     def test_find_with_regex(self):
         seq = Sequence('GATTACA', positional_metadata={'quality': range(7)})
         pat = re.compile('(T+A)(CA)')
@@ -2021,6 +2403,77 @@ class TestSequence(TestSequenceBase, ReallyEqualMixin):
             obs = s.iter_contiguous(c(contiguous()), invert=True)
             self.assertEqual(list(obs), exp)
 
+    def test_extract_regions(self):
+        seq = Sequence('ABCDEFGHIJ', metadata={'id': 'x'},
+                       positional_metadata={'quality': range(10)})
+        starts, stops = [2, 0, 5, 9, 0], [4, 10, 5, 10, 1]
+        obs = seq.extract_regions(starts, stops)
+        self.assertEqual(obs, [Sequence('CD'), Sequence('ABCDEFGHIJ'),
+                               Sequence(''), Sequence('J'), Sequence('A')])
+
+        batch = seq.extract_regions(np.array(starts), np.array(stops),
+                                    strands=['+'] * 5, as_batch=True)
+        self.assertIs(batch.dtype, Sequence)
+        self.assertEqual(list(batch), obs)
+
+    def test_extract_regions_subclass(self):
+        seq = SequenceSubclass('ABCDEF')
+        obs = seq.extract_regions([1], [3])
+        self.assertEqual(obs, [SequenceSubclass('BC')])
+
+    def test_extract_regions_empty(self):
+        self.assertEqual(Sequence('ABC').extract_regions([], []), [])
+        batch = Sequence('ABC').extract_regions([], [], as_batch=True)
+        self.assertEqual(len(batch), 0)
+
+    def test_extract_regions_invalid(self):
+        seq = Sequence('ABCDEF')
+        for starts, stops in ([-1], [2]), ([3], [2]), ([0], [7]):
+            with self.assertRaisesRegex(ValueError, 'start <= stop <= 6'):
+                seq.extract_regions(starts, stops)
+        with self.assertRaisesRegex(ValueError, 'same length'):
+            seq.extract_regions([0, 1], [2])
+        with self.assertRaisesRegex(ValueError, 'same length'):
+            seq.extract_regions([0], [2], strands=['+', '+'])
+        with self.assertRaisesRegex(ValueError, "'\\+' or '-'"):
+            seq.extract_regions([0], [2], strands=['.'])
+        with self.assertRaisesRegex(TypeError, 'complement.*Sequence'):
+            seq.extract_regions([0], [2], strands=['-'])
+
+    def test_extract_regions_non_integer(self):
+        seq = Sequence('ABCDEF')
+        for starts, stops, name in (([0.5], [2], 'starts'),
+                                    ([0], np.array([2.0]), 'stops'),
+                                    (['0'], [2], 'starts'),
+                                    ([0], [True], 'stops')):
+            with self.assertRaisesRegex(TypeError, '`%s`.*integers' % name):
+                seq.extract_regions(starts, stops)
+        obs = seq.extract_regions(np.array([1], dtype=np.uint8),
+                                  np.array([3], dtype=np.int32))
+        self.assertEqual(obs, [Sequence('BC')])
+
+    def test_extract_intervals(self):
+        seq = Sequence('ABCDEFGHIJ')
+        im = IntervalMetadata(10)
+        intervals = [im.add([(0, 2), (5, 7)], metadata={'strand': '+'}),
+                     im.add([(8, 10)]),
+                     im.add([(3, 4)], metadata={'strand': '.'})]
+        obs = seq.extract_intervals(intervals)
+        self.assertEqual([str(s) for s in obs], ['ABFG', 'IJ', 'D'])
+
+        batch = seq.extract_intervals(iter(intervals), as_batch=True)
+        self.assertEqual([str(s) for s in batch], ['ABFG', 'IJ', 'D'])
+
+        obs = seq.extract_intervals(im.query(bounds=[(0, 3)]))
+        self.assertEqual([str(s) for s in obs], ['ABFG'])
+
+        self.assertEqual(seq.extract_intervals([]), [])
+        with self.assertRaisesRegex(ValueError, 'start <= stop <= 10'):
+            seq.extract_intervals([IntervalMetadata(20).add([(9, 11)])])
+        with self.assertRaisesRegex(TypeError, 'complement'):
+            seq.extract_intervals(
+                [im.add([(0, 1)], metadata={'strand': '-'})])
+
     def test_copy_without_metadata(self):
         # shallow vs deep copy with sequence only should be equivalent
         for copy_method in copy.copy, copy.deepcopy: